@@ -68,6 +68,9 @@ class LLMCallResult(BaseModel):
     cache_discount: float | None = Field(
         default=None, description="Cost discount from prompt caching."
     )
+    prompt_cache_key: str | None = Field(
+        default=None, description="Hash of the stable system prefix sent with the call."
+    )
     models_attempted: list[tuple[str, str]] = Field(
         default_factory=list,
         description=(
@@ -381,6 +381,9 @@ class AttachmentContentService:
                 min_image_dimension=attachment_cfg.pdf_min_image_dimension,
                 max_embedded_images=attachment_cfg.pdf_max_embedded_images,
                 vector_draw_threshold=attachment_cfg.pdf_vector_draw_threshold,
+                parallel_min_pages=attachment_cfg.pdf_parallel_min_pages,
+                max_workers=attachment_cfg.pdf_worker_processes,
+                max_inflight_renders=attachment_cfg.pdf_max_inflight_renders,
                 on_progress=lambda text: asyncio.run_coroutine_threadsafe(
                     on_pdf_progress(text),
                     loop,
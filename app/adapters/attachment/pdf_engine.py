@@ -0,0 +1,441 @@
+"""Process-pool PDF engine shared by attachment and scraped-PDF extraction.
+
+Large documents are split into page ranges that run in worker processes; each
+worker opens the file itself, so nothing heavier than a path crosses the
+process boundary. Results stream back as ranges finish and feed the caller's
+progress callback. Page rendering is submitted through a bounded window so at
+most ``max_inflight`` pixmaps exist at any time. Small documents stay in
+process, where pool start-up would cost more than it saves.
+
+Outputs are memoized by content hash, so a re-sent PDF is not re-extracted.
+The memo is bounded by entry count and by approximate size, since a result
+can carry several rendered page images.
+
+The pool is shared by every caller in the process and sized on first use, so
+all callers pass the same ``ATTACHMENT_PDF_WORKER_PROCESSES`` value. Call
+``shutdown_pool`` when the application closes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from app.adapters.attachment.image_extractor import ImageContent, ImageExtractor
+from app.core.logging_utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+RENDER_DPI = 200
+PAGES_PER_TASK = 8
+DEFAULT_PARALLEL_MIN_PAGES = 24
+DEFAULT_MAX_INFLIGHT_RENDERS = 4
+_MAX_AUTO_WORKERS = 4
+_CACHE_MAX_ENTRIES = 16
+_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
+class ScanOptions:
+    """Per-page classification thresholds (see ``PDFExtractor.extract``)."""
+
+    sparse_threshold: int
+    min_image_dimension: int
+    vector_draw_threshold: int
+
+
+@dataclass(frozen=True, slots=True)
+class PageScan:
+    """Text, links and figure signals of one page; picklable for pool transport."""
+
+    page_idx: int
+    text: str
+    links: tuple[str, ...]
+    image_candidates: tuple[tuple[int, int, int], ...]  # (xref, width, height)
+    sparse: bool
+    figure: bool
+
+
+# ---------------------------------------------------------------------------
+# Page-level work (runs in workers or in process)
+# ---------------------------------------------------------------------------
+
+
+def scan_page(page: Any, page_idx: int, options: ScanOptions) -> PageScan:
+    blocks = page.get_text("blocks")
+    blocks.sort(key=lambda b: (b[1], b[0]))
+    page_text = "\n".join(b[4].strip() for b in blocks if b[4].strip())
+
+    # Inline detected tables as Markdown so the LLM gets structured data
+    try:
+        finder = page.find_tables()
+        for t_idx, table in enumerate(finder.tables, 1):
+            try:
+                md = table.to_markdown()
+                if md.strip():
+                    sep = "\n\n" if page_text else ""
+                    page_text = f"{page_text}{sep}[Table {t_idx}]\n{md}"
+            except AttributeError:
+                pass  # to_markdown() absent in this PyMuPDF build
+    except Exception as exc:
+        logger.warning(
+            "pdf_table_detection_failed",
+            extra={"page": page_idx, "error": str(exc)},
+        )
+
+    links = tuple(link["uri"] for link in page.get_links() if "uri" in link)
+
+    candidates: list[tuple[int, int, int]] = []
+    seen_xrefs: set[int] = set()
+    for img in page.get_images():
+        xref, width, height = img[0], img[2], img[3]
+        if xref in seen_xrefs:
+            continue
+        if width < options.min_image_dimension or height < options.min_image_dimension:
+            continue
+        seen_xrefs.add(xref)
+        candidates.append((xref, width, height))
+
+    # Detect vector-drawn figures (charts, diagrams) on text-rich pages.
+    # page.get_drawings() returns path/fill operations; a high count indicates
+    # a chart drawn from PDF primitives rather than an embedded raster.
+    has_vector_figure = False
+    if not candidates:
+        try:
+            has_vector_figure = len(page.get_drawings()) >= options.vector_draw_threshold
+        except Exception:
+            pass
+
+    sparse = len(page_text) < options.sparse_threshold
+    return PageScan(
+        page_idx=page_idx,
+        text=page_text,
+        links=links,
+        image_candidates=tuple(candidates),
+        sparse=sparse,
+        # Text-rich page with a figure: needs vision rendering
+        figure=not sparse and (bool(candidates) or has_vector_figure),
+    )
+
+
+def render_page(doc: Any, page_idx: int, image_max_dimension: int) -> ImageContent:
+    pix = doc[page_idx].get_pixmap(dpi=RENDER_DPI)
+    png_bytes = pix.tobytes("png")
+    del pix  # release the raw pixmap before encoding
+    return ImageExtractor.extract_from_bytes(png_bytes, max_dimension=image_max_dimension)
+
+
+def _open(path: str) -> Any:
+    import fitz  # PyMuPDF
+
+    return fitz.open(path)
+
+
+def _scan_range_worker(path: str, start: int, stop: int, options: ScanOptions) -> list[PageScan]:
+    doc = _open(path)
+    try:
+        return [scan_page(doc[idx], idx, options) for idx in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _render_worker(path: str, page_idx: int, image_max_dimension: int) -> ImageContent:
+    doc = _open(path)
+    try:
+        return render_page(doc, page_idx, image_max_dimension)
+    finally:
+        doc.close()
+
+
+def _text_range_worker(path: str, start: int, stop: int) -> list[str]:
+    doc = _open(path)
+    try:
+        return [doc[idx].get_text() for idx in range(start, stop)]
+    finally:
+        doc.close()
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = max_workers or min(_MAX_AUTO_WORKERS, os.cpu_count() or 1)
+            # spawn: forking a threaded event-loop process is unsafe
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool() -> None:
+    """Stop the worker pool, cancelling queued work; the next caller starts a new one."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        _discard_pool(pool)
+
+
+def _page_ranges(page_count: int) -> list[tuple[int, int]]:
+    return [
+        (start, min(start + PAGES_PER_TASK, page_count))
+        for start in range(0, page_count, PAGES_PER_TASK)
+    ]
+
+
+def _run_ranges(
+    pool: ProcessPoolExecutor,
+    futures: dict[Future[Any], tuple[int, int]],
+    on_range_done: Callable[[tuple[int, int], Any], None],
+) -> None:
+    try:
+        for future in as_completed(futures):
+            on_range_done(futures[future], future.result())
+    except BrokenProcessPool as exc:
+        _discard_pool(pool)
+        msg = "PDF worker process crashed while reading the document"
+        raise ValueError(msg) from exc
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Engine entry points
+# ---------------------------------------------------------------------------
+
+
+def scan_pages(
+    doc: Any,
+    path: Path,
+    *,
+    page_count: int,
+    options: ScanOptions,
+    parallel: bool,
+    max_workers: int = 0,
+    on_progress: Callable[[str], Any] | None = None,
+) -> list[PageScan]:
+    """Scan the first ``page_count`` pages, in page order."""
+    if not parallel:
+        scans: list[PageScan] = []
+        for page_idx in range(page_count):
+            if on_progress and page_idx % 10 == 0:
+                on_progress(f"Extracting content: page {page_idx + 1}/{page_count}...")
+            scans.append(scan_page(doc[page_idx], page_idx, options))
+        return scans
+
+    pool = _get_pool(max_workers)
+    futures = {
+        pool.submit(_scan_range_worker, str(path), start, stop, options): (start, stop)
+        for start, stop in _page_ranges(page_count)
+    }
+    by_page: dict[int, PageScan] = {}
+
+    def _collect(_range: tuple[int, int], range_scans: list[PageScan]) -> None:
+        by_page.update((scan.page_idx, scan) for scan in range_scans)
+        if on_progress:
+            on_progress(f"Extracting content: {len(by_page)}/{page_count} pages done...")
+
+    _run_ranges(pool, futures, _collect)
+    return [by_page[idx] for idx in range(page_count)]
+
+
+def render_pages(
+    doc: Any,
+    path: Path,
+    *,
+    page_indices: list[int],
+    image_max_dimension: int,
+    parallel: bool,
+    max_workers: int = 0,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT_RENDERS,
+    on_progress: Callable[[str], Any] | None = None,
+) -> list[ImageContent]:
+    """Render pages for vision models, keeping ``page_indices`` order; failures are skipped."""
+    rendered: dict[int, ImageContent] = {}
+
+    def _failed(page_idx: int, exc: BaseException) -> None:
+        logger.warning(
+            "pdf_page_render_failed",
+            extra={"page": page_idx, "error": str(exc), "file": str(path)},
+        )
+
+    if not parallel:
+        for i, page_idx in enumerate(page_indices):
+            if on_progress:
+                on_progress(f"Rendering page {i + 1}/{len(page_indices)} for vision...")
+            try:
+                rendered[page_idx] = render_page(doc, page_idx, image_max_dimension)
+            except Exception as exc:
+                _failed(page_idx, exc)
+        return [rendered[idx] for idx in page_indices if idx in rendered]
+
+    pool = _get_pool(max_workers)
+    pending: dict[Future[ImageContent], int] = {}
+    queue = list(reversed(page_indices))
+    done_count = 0
+    try:
+        while queue or pending:
+            # Bounded window: at most ``max_inflight`` pages rendered at once.
+            while queue and len(pending) < max(1, max_inflight):
+                page_idx = queue.pop()
+                future = pool.submit(_render_worker, str(path), page_idx, image_max_dimension)
+                pending[future] = page_idx
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                page_idx = pending.pop(future)
+                done_count += 1
+                try:
+                    rendered[page_idx] = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as exc:
+                    _failed(page_idx, exc)
+            if on_progress:
+                on_progress(f"Rendered {done_count}/{len(page_indices)} pages for vision...")
+    except BrokenProcessPool as exc:
+        _discard_pool(pool)
+        msg = "PDF worker process crashed while rendering pages"
+        raise ValueError(msg) from exc
+    finally:
+        for future in pending:
+            future.cancel()
+    return [rendered[idx] for idx in page_indices if idx in rendered]
+
+
+def extract_text(
+    pdf_bytes: bytes,
+    *,
+    parallel_min_pages: int = DEFAULT_PARALLEL_MIN_PAGES,
+    max_workers: int = 0,
+) -> str:
+    """Plain text of every page, joined by blank lines; cached by content hash."""
+    cache_key = ("text", hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest())
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        page_count = len(doc)
+        if not parallel_min_pages or page_count < parallel_min_pages:
+            pages = [page.get_text() for page in doc]
+        else:
+            pages = _extract_text_parallel(pdf_bytes, page_count, max_workers)
+    finally:
+        doc.close()
+
+    text = "\n\n".join(pages).strip()
+    result_cache.put(cache_key, text, size=len(text))
+    return text
+
+
+def _extract_text_parallel(pdf_bytes: bytes, page_count: int, max_workers: int) -> list[str]:
+    # Workers read from a temp file rather than receiving the bytes per task.
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+        tmp.write(pdf_bytes)
+        tmp.flush()
+        pool = _get_pool(max_workers)
+        futures = {
+            pool.submit(_text_range_worker, tmp.name, start, stop): (start, stop)
+            for start, stop in _page_ranges(page_count)
+        }
+        pages: list[str] = [""] * page_count
+
+        def _collect(page_range: tuple[int, int], texts: list[str]) -> None:
+            pages[page_range[0] : page_range[1]] = texts
+
+        _run_ranges(pool, futures, _collect)
+    return pages
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as fh:
+        while chunk := fh.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _ResultCache:
+    """Thread-safe LRU of extraction results keyed by content hash and options.
+
+    Callers pass each value's approximate size in bytes; the oldest entries are
+    evicted once either the entry cap or the byte budget is exceeded, and a
+    value larger than the whole budget is not cached.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, *, size: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if size > self._max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+result_cache = _ResultCache(_CACHE_MAX_ENTRIES, _CACHE_MAX_BYTES)
+
+
+def clear_pdf_cache() -> None:
+    result_cache.clear()
@@ -11,6 +11,9 @@ from app.core.logging_utils import get_logger
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from app.adapters.attachment.pdf_engine import PageScan
+
+from app.adapters.attachment import pdf_engine as _pdf_engine
 from app.adapters.attachment.image_extractor import ImageContent, ImageExtractor
 
 logger = get_logger(__name__)
@@ -47,101 +50,31 @@ class PDFExtractor:
     """Stateless utility for extracting text and images from PDF files."""
 
     @staticmethod
-    def _extract_page_content(
-        *,
-        doc: Any,
-        pages_to_process: int,
-        sparse_threshold: int,
-        min_image_dimension: int,
-        image_max_dimension: int,
-        max_embedded_images: int,
-        vector_draw_threshold: int,
-        on_progress: Callable[[str], Any] | None,
-        fitz_module: Any,
-    ) -> tuple[list[str], list[int], list[int], list[str], list[ImageContent]]:
-        """Extract per-page text, sparse/figure-page indices, links, and embedded images."""
-        text_parts: list[str] = []
-        sparse_page_indices: list[int] = []
-        figure_page_indices: list[int] = []
+    def _collect_page_content(
+        scans: list[PageScan],
+    ) -> tuple[list[str], list[int], list[int], list[str], list[_EmbeddedImageCandidate]]:
+        """Merge per-page scans into text, sparse/figure indices, links and image candidates."""
         links: list[str] = []
-        embedded_image_candidates: list[_EmbeddedImageCandidate] = []
+        candidates: list[_EmbeddedImageCandidate] = []
         seen_image_xrefs: set[int] = set()
-
-        for page_idx in range(pages_to_process):
-            if on_progress and page_idx % 10 == 0:
-                on_progress(f"Extracting content: page {page_idx + 1}/{pages_to_process}...")
-
-            page = doc[page_idx]
-            blocks = page.get_text("blocks")
-            blocks.sort(key=lambda b: (b[1], b[0]))
-            page_text = "\n".join(b[4].strip() for b in blocks if b[4].strip())
-
-            # Inline detected tables as Markdown so the LLM gets structured data
-            try:
-                finder = page.find_tables()
-                for t_idx, table in enumerate(finder.tables, 1):
-                    try:
-                        md = table.to_markdown()
-                        if md.strip():
-                            sep = "\n\n" if page_text else ""
-                            page_text = f"{page_text}{sep}[Table {t_idx}]\n{md}"
-                    except AttributeError:
-                        pass  # to_markdown() absent in this PyMuPDF build
-            except Exception as exc:
-                logger.warning(
-                    "pdf_table_detection_failed",
-                    extra={"page": page_idx, "error": str(exc)},
-                )
-
-            text_parts.append(page_text)
-
-            for link in page.get_links():
-                if "uri" in link:
-                    links.append(link["uri"])
-
-            page_has_raster = False
-            for img in page.get_images():
-                xref = img[0]
-                width, height = img[2], img[3]
+        for scan in scans:
+            links.extend(scan.links)
+            for xref, width, height in scan.image_candidates:
                 if xref in seen_image_xrefs:
                     continue
-                if width < min_image_dimension or height < min_image_dimension:
-                    continue
                 seen_image_xrefs.add(xref)
-                page_has_raster = True
-                embedded_image_candidates.append(
+                candidates.append(
                     _EmbeddedImageCandidate(
-                        xref=xref,
-                        page_idx=page_idx,
-                        width=width,
-                        height=height,
+                        xref=xref, page_idx=scan.page_idx, width=width, height=height
                     )
                 )
-
-            # Detect vector-drawn figures (charts, diagrams) on text-rich pages.
-            # page.get_drawings() returns path/fill operations; a high count indicates
-            # a chart drawn from PDF primitives rather than an embedded raster.
-            page_has_vector_figure = False
-            if not page_has_raster:
-                try:
-                    page_has_vector_figure = len(page.get_drawings()) >= vector_draw_threshold
-                except Exception:
-                    pass
-
-            if len(page_text) < sparse_threshold:
-                sparse_page_indices.append(page_idx)
-            elif page_has_raster or page_has_vector_figure:
-                # Text-rich page with a figure: needs vision rendering
-                figure_page_indices.append(page_idx)
-
-        embedded_images = PDFExtractor._extract_top_embedded_images(
-            doc=doc,
-            candidates=embedded_image_candidates,
-            max_embedded_images=max_embedded_images,
-            image_max_dimension=image_max_dimension,
-            fitz_module=fitz_module,
+        return (
+            [scan.text for scan in scans],
+            [scan.page_idx for scan in scans if scan.sparse],
+            [scan.page_idx for scan in scans if scan.figure],
+            links,
+            candidates,
         )
-        return text_parts, sparse_page_indices, figure_page_indices, links, embedded_images
 
     @staticmethod
     def _extract_top_embedded_images(
@@ -181,35 +114,6 @@ class PDFExtractor:
         embedded_images.sort(key=lambda img: img.file_size_bytes, reverse=True)
         return embedded_images
 
-    @staticmethod
-    def _render_sparse_pages(
-        *,
-        doc: Any,
-        vision_pages: list[int],
-        image_max_dimension: int,
-        file_path: Path,
-        on_progress: Callable[[str], Any] | None,
-    ) -> list[ImageContent]:
-        """Render sparse pages to PNG for vision models."""
-        image_pages: list[ImageContent] = []
-        for i, page_idx in enumerate(vision_pages):
-            if on_progress:
-                on_progress(f"Rendering page {i + 1}/{len(vision_pages)} for vision...")
-            try:
-                page = doc[page_idx]
-                pix = page.get_pixmap(dpi=200)
-                img_bytes = pix.tobytes("png")
-                image_content = ImageExtractor.extract_from_bytes(
-                    img_bytes, max_dimension=image_max_dimension
-                )
-                image_pages.append(image_content)
-            except Exception as exc:
-                logger.warning(
-                    "pdf_page_render_failed",
-                    extra={"page": page_idx, "error": str(exc), "file": str(file_path)},
-                )
-        return image_pages
-
     @staticmethod
     def extract(
         file_path: str | Path,
@@ -222,6 +126,9 @@ class PDFExtractor:
         max_embedded_images: int = 8,
         vector_draw_threshold: int = 30,
         on_progress: Callable[[str], Any] | None = None,
+        parallel_min_pages: int = _pdf_engine.DEFAULT_PARALLEL_MIN_PAGES,
+        max_workers: int = 0,
+        max_inflight_renders: int = _pdf_engine.DEFAULT_MAX_INFLIGHT_RENDERS,
     ) -> PDFContent:
         """Extract text and optionally render sparse/scanned pages from a PDF.
 
@@ -232,6 +139,12 @@ class PDFExtractor:
             max_vision_pages: Maximum number of sparse pages to render as images for vision LLM.
             image_max_dimension: Maximum dimension for rendered page images.
             on_progress: Optional callback for progress updates.
+            parallel_min_pages: Documents with at least this many pages are scanned and
+                rendered in the PDF worker pool (0 disables the pool).
+            max_workers: Worker pool size; 0 picks one from the CPU count.
+            max_inflight_renders: Maximum pages rendered concurrently in the pool.
+
+        Results are cached by file hash and options, so a re-sent PDF is not re-extracted.
 
         Returns:
             PDFContent with extracted text and optional page images.
@@ -253,6 +166,22 @@ class PDFExtractor:
             msg = f"PDF file not found: {file_path}"
             raise ValueError(msg)
 
+        cache_key = (
+            "content",
+            _pdf_engine.file_digest(file_path),
+            max_pages,
+            sparse_threshold,
+            max_vision_pages,
+            image_max_dimension,
+            min_image_dimension,
+            max_embedded_images,
+            vector_draw_threshold,
+        )
+        cached = _pdf_engine.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("pdf_extraction_cache_hit", extra={"file": str(file_path)})
+            return cached
+
         try:
             doc = fitz.open(str(file_path))
         except Exception as exc:
@@ -273,18 +202,29 @@ class PDFExtractor:
             if on_progress:
                 on_progress(f"Reading {pages_to_process} pages...")
 
-            text_parts, sparse_page_indices, figure_page_indices, links, embedded_images = (
-                PDFExtractor._extract_page_content(
-                    doc=doc,
-                    pages_to_process=pages_to_process,
+            parallel = 0 < parallel_min_pages <= pages_to_process
+            scans = _pdf_engine.scan_pages(
+                doc,
+                file_path,
+                page_count=pages_to_process,
+                options=_pdf_engine.ScanOptions(
                     sparse_threshold=sparse_threshold,
                     min_image_dimension=min_image_dimension,
-                    image_max_dimension=image_max_dimension,
-                    max_embedded_images=max_embedded_images,
                     vector_draw_threshold=vector_draw_threshold,
-                    on_progress=on_progress,
-                    fitz_module=fitz,
-                )
+                ),
+                parallel=parallel,
+                max_workers=max_workers,
+                on_progress=on_progress,
+            )
+            text_parts, sparse_page_indices, figure_page_indices, links, candidates = (
+                PDFExtractor._collect_page_content(scans)
+            )
+            embedded_images = PDFExtractor._extract_top_embedded_images(
+                doc=doc,
+                candidates=candidates,
+                max_embedded_images=max_embedded_images,
+                image_max_dimension=image_max_dimension,
+                fitz_module=fitz,
             )
 
             # De-duplicate links while preserving order
@@ -312,11 +252,14 @@ class PDFExtractor:
             ]
             figure_page_count = sum(1 for p in vision_pages if p in figure_page_indices)
 
-            image_pages = PDFExtractor._render_sparse_pages(
-                doc=doc,
-                vision_pages=vision_pages,
+            image_pages = _pdf_engine.render_pages(
+                doc,
+                file_path,
+                page_indices=vision_pages,
                 image_max_dimension=image_max_dimension,
-                file_path=file_path,
+                parallel=parallel,
+                max_workers=max_workers,
+                max_inflight=max_inflight_renders,
                 on_progress=on_progress,
             )
 
@@ -330,7 +273,7 @@ class PDFExtractor:
                     },
                 )
 
-            return PDFContent(
+            content = PDFContent(
                 text=full_text,
                 page_count=total_pages,
                 image_pages=image_pages,
@@ -343,3 +286,8 @@ class PDFExtractor:
             )
         finally:
             doc.close()
+
+        images = (*content.image_pages, *content.embedded_images)
+        size = len(content.text) + sum(len(image.data_uri) for image in images)
+        _pdf_engine.result_cache.put(cache_key, content, size=size)
+        return content
@@ -8,15 +8,17 @@ from typing import TYPE_CHECKING, Any
 
 from app.core.async_utils import raise_if_cancelled
 from app.core.call_status import CallStatus
-from app.core.html_utils import chunk_sentences, split_sentences
+from app.core.html_utils import split_sentences
 from app.core.lang import LANG_RU
 from app.core.logging_utils import get_logger
 from app.core.summary_aggregate import aggregate_chunk_summaries
 from app.core.summary_contract import validate_and_shape_summary
+from app.core.token_utils import acount_tokens_batch
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
+    from app.adapter_models.llm.llm_models import LLMCallResult
     from app.adapters.external.formatting.protocols import (
         ResponseFormatterFacade as ResponseFormatter,
     )
@@ -25,6 +27,36 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Chunk size bounds in tokens (~4k-12k chars of English prose).
+_MIN_CHUNK_TOKENS = 1000
+_MAX_CHUNK_TOKENS = 3000
+# Chunk summaries merged per intermediate synthesis when an article has more chunks.
+_REDUCE_FAN_IN = 6
+
+
+async def chunk_sentences_by_tokens(
+    sentences: list[str], max_tokens: int, model: str | None = None
+) -> list[str]:
+    """Group sentences into chunks of at most ``max_tokens`` tokens, preserving boundaries.
+
+    A single sentence longer than the budget becomes its own chunk. Sentences are
+    counted in one batch with the tokenizer of ``model``, off the event loop.
+    """
+    stripped = [s for s in ((sent or "").strip() for sent in sentences) if s]
+    counts = await acount_tokens_batch(stripped, model)
+    chunks: list[str] = []
+    buf: list[str] = []
+    size = 0
+    for s, tokens in zip(stripped, counts, strict=True):
+        if buf and size + tokens > max_tokens:
+            chunks.append(" ".join(buf))
+            buf, size = [], 0
+        buf.append(s)
+        size += tokens
+    if buf:
+        chunks.append(" ".join(buf))
+    return chunks
+
 
 def build_chunk_synthesis_user_content(aggregated: dict[str, Any], chosen_lang: str) -> str:
     """Build synthesis prompt user content from aggregated chunk drafts."""
@@ -89,7 +121,7 @@ class ContentChunker:
             raise_if_cancelled(exc)
             return int(base_default)
 
-    def should_chunk_content(
+    async def should_chunk_content(
         self, content_text: str, chosen_lang: str
     ) -> tuple[bool, int, list[str] | None]:
         """Determine if content should be chunked and return chunking parameters."""
@@ -116,12 +148,15 @@ class ContentChunker:
             )
             try:
                 sentences = split_sentences(content_text, "ru" if chosen_lang == LANG_RU else "en")
-                chunk_size = max(4000, min(12000, max_chars // 10))
-                chunk_size = min(chunk_size, max_chars)
-                chunks = chunk_sentences(sentences, max_chars=chunk_size)
+                # max_chars is a character budget; size chunks by real tokens instead.
+                chunk_tokens = max(_MIN_CHUNK_TOKENS, min(_MAX_CHUNK_TOKENS, max_chars // 40))
+                chunk_tokens = min(chunk_tokens, max(1, max_chars // 4))
+                chunks = await chunk_sentences_by_tokens(
+                    sentences, chunk_tokens, self.cfg.openrouter.model
+                )
                 logger.info(
                     "chunking_chunk_size",
-                    extra={"chunk_size": chunk_size, "chunks": len(chunks)},
+                    extra={"chunk_tokens": chunk_tokens, "chunks": len(chunks)},
                 )
             except Exception as exc:
                 raise_if_cancelled(exc)
@@ -136,93 +171,235 @@ class ContentChunker:
         chosen_lang: str,
         req_id: int,
         correlation_id: str | None = None,
+        *,
+        on_draft: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
     ) -> dict[str, Any] | None:
-        """Process chunks and aggregate summaries."""
-        chunk_summaries: list[dict[str, Any]] = []
-
-        async def _process_chunk(idx: int, chunk: str) -> dict[str, Any] | None:
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": (
-                        f"Analyze this part {idx}/{len(chunks)} and output ONLY a valid JSON object matching the schema. "
-                        f"Respond in {'Russian' if chosen_lang == LANG_RU else 'English'}.\n\n"
-                        f"CONTENT START\n{chunk}\nCONTENT END"
-                    ),
-                },
-            ]
-            async with self._sem():
-                # Use structured output format
-                response_format_cf = self._build_structured_response_format()
-                # Use dynamic token budget based on chunk size
-                chunk_tokens = max(1024, min(4096, len(chunk) // 4 + 1024))
-                resp = await self.openrouter.chat(
-                    messages,
-                    temperature=self.cfg.openrouter.temperature,
-                    max_tokens=chunk_tokens,
-                    top_p=self.cfg.openrouter.top_p,
-                    request_id=req_id,
-                    response_format=response_format_cf,
-                )
-            if resp.status != CallStatus.OK:
-                logger.warning(
-                    "chunk_summary_llm_error",
-                    extra={
-                        "cid": correlation_id,
-                        "status": resp.status,
-                        "error": resp.error_text,
-                        "chunk_index": idx,
-                    },
+        """Summarize chunks and reduce them into one summary as they complete.
+
+        Every chunk summary that arrives refreshes the interim draft (all summaries
+        so far, merged in document order) passed to ``on_draft``. Articles with more than
+        ``_REDUCE_FAN_IN`` chunks are reduced hierarchically: each group of
+        chunks is synthesized as soon as its last chunk finishes, while later
+        chunks are still running, and the final synthesis merges the groups.
+        """
+        total = len(chunks)
+        summaries: dict[int, dict[str, Any]] = {}
+        hierarchical = total > _REDUCE_FAN_IN
+        group_remaining = [
+            min(_REDUCE_FAN_IN, total - start) for start in range(0, total, _REDUCE_FAN_IN)
+        ]
+        group_tasks: dict[int, asyncio.Task[dict[str, Any] | None]] = {}
+        # One batched count off the event loop sizes every chunk's token budget
+        token_counts = await acount_tokens_batch(chunks, self.cfg.openrouter.model)
+        chunk_tasks = {
+            asyncio.create_task(
+                self._summarize_chunk(
+                    idx,
+                    chunk,
+                    total=total,
+                    token_count=token_counts[idx],
+                    system_prompt=system_prompt,
+                    chosen_lang=chosen_lang,
+                    req_id=req_id,
+                    correlation_id=correlation_id,
                 )
-                return None
+            ): idx
+            for idx, chunk in enumerate(chunks)
+        }
 
-            parsed = self._parse_llm_response_to_dict(resp)
-            if parsed is not None:
+        try:
+            async for task in asyncio.as_completed(chunk_tasks):
+                idx = chunk_tasks[task]
                 try:
-                    return validate_and_shape_summary(parsed)
+                    result = task.result()
                 except Exception as exc:
                     raise_if_cancelled(exc)
+                    logger.error(
+                        "chunk_summary_processing_failed",
+                        extra={"cid": correlation_id, "chunk_index": idx + 1, "error": str(exc)},
+                    )
+                    result = None
+                if result is not None:
+                    summaries[idx] = result
+                    if on_draft is not None:
+                        await self._publish_draft(on_draft, summaries, correlation_id)
+
+                if hierarchical:
+                    group = idx // _REDUCE_FAN_IN
+                    group_remaining[group] -= 1
+                    if group_remaining[group] == 0:
+                        members = range(group * _REDUCE_FAN_IN, (group + 1) * _REDUCE_FAN_IN)
+                        group_tasks[group] = asyncio.create_task(
+                            self._reduce_group(
+                                [summaries[i] for i in members if i in summaries],
+                                system_prompt,
+                                chosen_lang,
+                                req_id,
+                                correlation_id,
+                            )
+                        )
+
+            if hierarchical:
+                reduced = await asyncio.gather(*(group_tasks[g] for g in sorted(group_tasks)))
+                drafts = [draft for draft in reduced if draft]
+            else:
+                drafts = [summaries[i] for i in sorted(summaries)]
+        finally:
+            pending = [t for t in (*chunk_tasks, *group_tasks.values()) if not t.done()]
+            for pending_task in pending:
+                pending_task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if not drafts:
             return None
+        if len(drafts) == 1 and hierarchical:
+            return drafts[0]
 
-        _chunk_concurrency = self.cfg.runtime.max_concurrent_calls
-        _chunk_sem = asyncio.Semaphore(_chunk_concurrency)
+        # Aggregate chunk summaries into final draft
+        aggregated = aggregate_chunk_summaries(drafts)
+
+        # Recursive Summarization: Synthesize the final summary from the aggregated chunks
+        # This ensures the final output is cohesive and not just a concatenation of parts
+        synthesized = await self._synthesize_chunks(
+            aggregated, system_prompt, chosen_lang, req_id, correlation_id
+        )
+        if synthesized:
+            return validate_and_shape_summary(synthesized)
 
-        async def _bounded_process(idx: int, chunk: str) -> dict[str, Any] | None:
-            async with _chunk_sem:
-                return await _process_chunk(idx, chunk)
+        # Fallback to aggregated if synthesis fails
+        return validate_and_shape_summary(aggregated)
 
-        tasks = [
-            asyncio.create_task(_bounded_process(idx, chunk))
-            for idx, chunk in enumerate(chunks, start=1)
+    async def _summarize_chunk(
+        self,
+        idx: int,
+        chunk: str,
+        *,
+        total: int,
+        token_count: int,
+        system_prompt: str,
+        chosen_lang: str,
+        req_id: int,
+        correlation_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {
+                "role": "user",
+                "content": (
+                    f"Analyze this part {idx + 1}/{total} and output ONLY a valid JSON object matching the schema. "
+                    f"Respond in {'Russian' if chosen_lang == LANG_RU else 'English'}.\n\n"
+                    f"CONTENT START\n{chunk}\nCONTENT END"
+                ),
+            },
         ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for result in results:
-            if isinstance(result, BaseException):
-                raise_if_cancelled(result)
-                logger.error(
-                    "chunk_summary_processing_failed",
-                    extra={"cid": correlation_id, "error": str(result)},
-                )
-                continue
-            if isinstance(result, dict):
-                chunk_summaries.append(result)
+        # Use dynamic token budget based on chunk size
+        chunk_tokens = max(1024, min(4096, token_count + 1024))
+        async with self._sem():
+            resp = await self._chat_chunk(
+                messages,
+                max_tokens=chunk_tokens,
+                req_id=req_id,
+                chunk_index=idx + 1,
+                correlation_id=correlation_id,
+            )
+        if resp.status != CallStatus.OK:
+            logger.warning(
+                "chunk_summary_llm_error",
+                extra={
+                    "cid": correlation_id,
+                    "status": resp.status,
+                    "error": resp.error_text,
+                    "chunk_index": idx + 1,
+                },
+            )
+            return None
 
-        # Aggregate chunk summaries into final draft
-        if chunk_summaries:
-            aggregated = aggregate_chunk_summaries(chunk_summaries)
+        parsed = self._parse_llm_response_to_dict(resp)
+        if parsed is not None:
+            try:
+                return validate_and_shape_summary(parsed)
+            except Exception as exc:
+                raise_if_cancelled(exc)
+        return None
 
-            # Recursive Summarization: Synthesize the final summary from the aggregated chunks
-            # This ensures the final output is cohesive and not just a concatenation of parts
-            synthesized = await self._synthesize_chunks(
-                aggregated, system_prompt, chosen_lang, req_id, correlation_id
+    async def _chat_chunk(
+        self,
+        messages: list[dict[str, Any]],
+        *,
+        max_tokens: int,
+        req_id: int,
+        chunk_index: int,
+        correlation_id: str | None,
+    ) -> LLMCallResult:
+        """Run one chunk call; a call over the latency budget is retried on the flash model."""
+        kwargs: dict[str, Any] = {
+            "temperature": self.cfg.openrouter.temperature,
+            "max_tokens": max_tokens,
+            "top_p": self.cfg.openrouter.top_p,
+            "request_id": req_id,
+            "response_format": self._build_structured_response_format(),
+        }
+        budget = float(getattr(self.cfg.runtime, "chunk_latency_budget_sec", 0) or 0)
+        fallback_model = getattr(self.cfg.openrouter, "flash_model", None)
+        if budget <= 0 or not fallback_model:
+            return await self.openrouter.chat(messages, **kwargs)
+
+        try:
+            return await asyncio.wait_for(self.openrouter.chat(messages, **kwargs), budget)
+        except TimeoutError:
+            logger.warning(
+                "chunk_summary_straggler_retry",
+                extra={
+                    "cid": correlation_id,
+                    "chunk_index": chunk_index,
+                    "budget_sec": budget,
+                    "fallback_model": fallback_model,
+                },
             )
-            if synthesized:
-                return validate_and_shape_summary(synthesized)
+        return await self.openrouter.chat(
+            messages,
+            model_override=fallback_model,
+            fallback_models_override=tuple(
+                getattr(self.cfg.openrouter, "flash_fallback_models", ()) or ()
+            ),
+            **kwargs,
+        )
+
+    async def _reduce_group(
+        self,
+        group_summaries: list[dict[str, Any]],
+        system_prompt: str,
+        chosen_lang: str,
+        req_id: int,
+        correlation_id: str | None,
+    ) -> dict[str, Any] | None:
+        """Synthesize one group of chunk summaries into an intermediate summary."""
+        if len(group_summaries) <= 1:
+            return group_summaries[0] if group_summaries else None
+        aggregated = aggregate_chunk_summaries(group_summaries)
+        synthesized = await self._synthesize_chunks(
+            aggregated, system_prompt, chosen_lang, req_id, correlation_id
+        )
+        try:
+            return validate_and_shape_summary(synthesized or aggregated)
+        except Exception as exc:
+            raise_if_cancelled(exc)
+            return aggregated
 
-            # Fallback to aggregated if synthesis fails
-            return validate_and_shape_summary(aggregated)
-        return None
+    @staticmethod
+    async def _publish_draft(
+        on_draft: Callable[[dict[str, Any]], Awaitable[None]],
+        summaries: dict[int, dict[str, Any]],
+        correlation_id: str | None,
+    ) -> None:
+        try:
+            await on_draft(aggregate_chunk_summaries([summaries[i] for i in sorted(summaries)]))
+        except Exception as exc:
+            raise_if_cancelled(exc)
+            logger.debug(
+                "chunk_draft_publish_failed", extra={"cid": correlation_id, "error": str(exc)}
+            )
 
     async def _synthesize_chunks(
         self,
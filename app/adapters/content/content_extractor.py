@@ -115,6 +115,19 @@ class ContentExtractor(
             route_version=URL_ROUTE_VERSION,
         )
         self._platform_router: PlatformExtractionRouter | None = None
+        # Shared with the router so startup/shutdown reach its archive jobs.
+        self._youtube_platform_extractor: Any = None
+
+    async def resume_youtube_archives(self) -> int:
+        """Requeue YouTube archival downloads interrupted by the last shutdown."""
+        if not self.cfg.youtube.enabled:
+            return 0
+        return cast(int, await self._build_youtube_platform_extractor().resume_archives())
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """Stop background archival downloads started by the YouTube extractor."""
+        if self._youtube_platform_extractor is not None:
+            await self._youtube_platform_extractor.aclose(timeout=timeout)
 
     async def clear_cache(self) -> int:
         """Clear the extraction cache."""
@@ -169,12 +182,15 @@ class ContentExtractor(
         return router
 
     def _build_youtube_platform_extractor(self) -> Any:
+        if self._youtube_platform_extractor is not None:
+            return self._youtube_platform_extractor
+
         from app.adapters.youtube.platform_extractor import YouTubePlatformExtractor
         from app.infrastructure.persistence.repositories.video_download_repository import (
             VideoDownloadRepositoryAdapter,
         )
 
-        return YouTubePlatformExtractor(
+        self._youtube_platform_extractor = YouTubePlatformExtractor(
             cfg=self.cfg,
             db=self.db,
             response_formatter=self.response_formatter,
@@ -183,6 +199,7 @@ class ContentExtractor(
             request_repo=self.message_persistence.request_repo,
             video_repo=VideoDownloadRepositoryAdapter(self.db),
         )
+        return self._youtube_platform_extractor
 
     def _build_twitter_platform_extractor(self) -> Any:
         from app.adapters.twitter.platform_extractor import TwitterPlatformExtractor
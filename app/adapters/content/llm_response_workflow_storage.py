@@ -46,6 +46,9 @@ class LLMWorkflowStorageMixin:
                 if getattr(llm, "error_context", None) is not None
                 else None
             ),
+            "cache_read_tokens": getattr(llm, "cache_read_tokens", None),
+            "cache_creation_tokens": getattr(llm, "cache_creation_tokens", None),
+            "prompt_cache_key": getattr(llm, "prompt_cache_key", None),
         }
         if attempt_trigger is not None:
             payload["attempt_trigger"] = attempt_trigger
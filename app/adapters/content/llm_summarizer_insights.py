@@ -10,6 +10,7 @@ from app.core.call_status import CallStatus
 from app.core.json_utils import extract_json
 from app.core.lang import LANG_RU
 from app.core.logging_utils import get_logger
+from app.core.token_utils import count_tokens
 
 logger = get_logger(__name__)
 
@@ -95,7 +96,7 @@ class LLMInsightsGenerator:
         configured = self._cfg.openrouter.max_tokens
 
         # Insights typically need more tokens than summaries for detailed analysis
-        approx_input_tokens = max(1, len(content_text) // 4)
+        approx_input_tokens = count_tokens(content_text, self._cfg.openrouter.model)
         # Much higher budget for insights: comprehensive facts, analysis, and research details
         dynamic_budget = max(3072, min(12288, approx_input_tokens // 2 + 3072))
 
@@ -308,7 +308,7 @@ class PureSummaryService:
     def select_max_tokens(self, content_text: str) -> int | None:
         """Choose a cost-aware output token budget."""
         configured = self._runtime.cfg.openrouter.max_tokens
-        approx_input_tokens = count_tokens(content_text)
+        approx_input_tokens = count_tokens(content_text, self._runtime.cfg.openrouter.model)
         dynamic_budget = max(4096, min(12288, approx_input_tokens // 2 + 2048))
 
         if configured is None:
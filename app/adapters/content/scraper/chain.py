@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import re
+import statistics
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 from app.adapters.content.quality_filters import best_content_text, detect_low_value_content
+from app.adapters.content.scraper.attempt_log import ScraperAttemptEntry
 from app.adapters.external.firecrawl.models import FirecrawlResult
 from app.core.call_status import CallStatus
 from app.core.logging_utils import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from app.adapters.content.scraper.protocol import ContentScraperProtocol
+    from app.adapters.content.scraper.provider_ordering import ProviderOrderingEngine
 
 logger = get_logger(__name__)
 
@@ -36,6 +43,11 @@ _ERROR_PAGE_PATTERNS = re.compile(
 # Only flag as error page if content is suspiciously short.
 _ERROR_PAGE_MAX_LENGTH = 1500
 
+# Recent latencies kept per provider, and how many are needed before the p50
+# is trusted as a hedge trigger.
+_LATENCY_WINDOW_SIZE = 64
+_LATENCY_MIN_SAMPLES = 5
+
 
 def _is_error_page(text: str) -> bool:
     """Detect if extracted text is an HTTP error page rather than article content."""
@@ -44,8 +56,40 @@ def _is_error_page(text: str) -> bool:
     return bool(_ERROR_PAGE_PATTERNS.search(text))
 
 
+class _LatencyWindow:
+    """Rolling per-provider latencies used to pick hedge delays."""
+
+    def __init__(self, size: int = _LATENCY_WINDOW_SIZE) -> None:
+        self._size = size
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, provider: str, seconds: float) -> None:
+        window = self._samples.get(provider)
+        if window is None:
+            window = self._samples[provider] = deque(maxlen=self._size)
+        window.append(seconds)
+
+    def p50(self, provider: str) -> float | None:
+        window = self._samples.get(provider)
+        if window is None or len(window) < _LATENCY_MIN_SAMPLES:
+            return None
+        return statistics.median(window)
+
+
 class ContentScraperChain:
-    """Try each provider in order, return the first successful result."""
+    """Try each provider in order, return the first successful result.
+
+    With ``race=True`` the chain hedges instead of waiting: while a provider
+    is still running, the next one is started once ``hedge_delay_sec`` has
+    passed or the running provider has exceeded its own p50 latency,
+    whichever is sooner. A failed provider starts the next one immediately.
+    The first result that passes the content checks wins and the providers
+    still running are cancelled. ``provider_concurrency`` caps in-flight calls
+    per provider name across all chain calls (e.g. for browser providers).
+
+    With an ``ordering`` engine every attempt is fed back into it, and the
+    provider order for a URL follows what the engine learned for its domain.
+    """
 
     def __init__(
         self,
@@ -54,14 +98,30 @@ class ContentScraperChain:
         *,
         min_content_length: int = 0,
         js_heavy_hosts: tuple[str, ...] = (),
+        race: bool = False,
+        hedge_delay_sec: float = 2.0,
+        provider_concurrency: Mapping[str, int] | None = None,
+        ordering: ProviderOrderingEngine | None = None,
     ) -> None:
         if not providers:
             msg = "ContentScraperChain requires at least one provider"
             raise ValueError(msg)
+        if hedge_delay_sec < 0:
+            msg = "hedge_delay_sec must be non-negative"
+            raise ValueError(msg)
         self._providers = list(providers)
         self._audit = audit
         self._min_content_length = min_content_length
         self._js_heavy_hosts = js_heavy_hosts
+        self._race = race
+        self._hedge_delay_sec = hedge_delay_sec
+        self._provider_slots = {
+            name: asyncio.Semaphore(limit)
+            for name, limit in (provider_concurrency or {}).items()
+            if limit > 0
+        }
+        self._latencies = _LatencyWindow()
+        self._ordering = ordering
 
     @property
     def providers(self) -> list[ContentScraperProtocol]:
@@ -73,6 +133,19 @@ class ContentScraperChain:
         return "chain"
 
     def _effective_providers(self, url: str) -> list[ContentScraperProtocol]:
+        """Provider order for ``url``: JS-heavy hosts first, then learned per-domain order."""
+        providers = self._js_heavy_order(url)
+        if self._ordering is None or len(providers) < 2:
+            return providers
+        learned = self._ordering.order(url, providers)
+        if learned != providers:
+            logger.debug(
+                "scraper_chain_learned_reorder",
+                extra={"url": url, "order": [p.provider_name for p in learned]},
+            )
+        return learned
+
+    def _js_heavy_order(self, url: str) -> list[ContentScraperProtocol]:
         """Reorder providers for JS-heavy URLs: browser providers first."""
         if not self._js_heavy_hosts:
             return self._providers
@@ -89,6 +162,12 @@ class ContentScraperChain:
             )
         return browser + non_browser
 
+    def _hedge_delay(self, provider: str) -> float:
+        p50 = self._latencies.p50(provider)
+        if p50 is None:
+            return self._hedge_delay_sec
+        return min(self._hedge_delay_sec, p50)
+
     async def scrape_markdown(
         self,
         url: str,
@@ -103,145 +182,50 @@ class ContentScraperChain:
 
         with _tracer.start_as_current_span(
             "scraper.chain",
-            attributes={"scraper.url": url},
+            attributes={"scraper.url": url, "scraper.race": self._race},
         ) as chain_span:
-            for provider in self._effective_providers(url):
-                name = provider.provider_name
-                with _tracer.start_as_current_span(
-                    f"scraper.{name}",
-                    attributes={"scraper.provider": name, "scraper.url": url},
-                ) as provider_span:
-                    try:
-                        result = await provider.scrape_markdown(
-                            url, mobile=mobile, request_id=request_id
-                        )
-                    except Exception as exc:
-                        error_msg = f"{name}: {exc}"
-                        errors.append(error_msg)
-                        provider_span.set_attribute("scraper.outcome", "error")
-                        provider_span.set_attribute("error.type", type(exc).__name__)
-                        logger.warning(
-                            "scraper_chain_provider_exception",
-                            extra={
-                                "provider": name,
-                                "url": url,
-                                "error": str(exc),
-                                "error_type": type(exc).__name__,
-                                "request_id": request_id,
-                            },
-                        )
-                        continue
-
-                    has_content = result.status == CallStatus.OK and (
-                        bool(result.content_markdown and result.content_markdown.strip())
-                        or bool(result.content_html and result.content_html.strip())
+            providers = self._effective_providers(url)
+            if self._race and len(providers) > 1:
+                winner = await self._race_providers(
+                    providers, url, mobile=mobile, request_id=request_id, errors=errors
+                )
+            else:
+                winner = None
+                for provider in providers:
+                    result, error_msg = await self._attempt(
+                        provider, url, mobile=mobile, request_id=request_id
                     )
-
-                    if has_content:
-                        text = best_content_text(result)
-
-                        if _is_error_page(text):
-                            error_msg = f"{name}: error page detected ({len(text)} chars)"
-                            errors.append(error_msg)
-                            provider_span.set_attribute("scraper.outcome", "error_page")
-                            logger.info(
-                                "scraper_chain_error_page",
-                                extra={
-                                    "provider": name,
-                                    "url": url,
-                                    "content_len": len(text),
-                                    "preview": text[:200],
-                                    "request_id": request_id,
-                                },
-                            )
-                            continue
-
-                        if self._min_content_length > 0 and len(text) < self._min_content_length:
-                            error_msg = (
-                                f"{name}: content too short"
-                                f" ({len(text)} < {self._min_content_length} chars)"
-                            )
-                            errors.append(error_msg)
-                            provider_span.set_attribute("scraper.outcome", "too_short")
-                            logger.info(
-                                "scraper_chain_thin_content",
-                                extra={
-                                    "provider": name,
-                                    "url": url,
-                                    "content_len": len(text),
-                                    "threshold": self._min_content_length,
-                                    "request_id": request_id,
-                                },
-                            )
-                            continue
-
-                        quality_issue = (
-                            detect_low_value_content(result)
-                            if self._min_content_length > 0
-                            else None
-                        )
-                        if quality_issue is not None:
-                            reason = quality_issue["reason"]
-                            metrics = quality_issue["metrics"]
-                            error_msg = (
-                                f"{name}: low-value content detected"
-                                f" ({reason}, chars={metrics['char_length']},"
-                                f" words={metrics['word_count']})"
-                            )
-                            errors.append(error_msg)
-                            provider_span.set_attribute("scraper.outcome", "low_value")
-                            logger.info(
-                                "scraper_chain_low_value_content",
-                                extra={
-                                    "provider": name,
-                                    "url": url,
-                                    "reason": reason,
-                                    "metrics": metrics,
-                                    "preview": quality_issue["preview"],
-                                    "request_id": request_id,
-                                },
-                            )
-                            continue
-
-                    if has_content:
-                        provider_span.set_attribute("scraper.outcome", "success")
-                        chain_span.set_attribute("scraper.winner", name)
-                        chain_span.set_attribute("scraper.attempts", len(errors) + 1)
-                        logger.info(
-                            "scraper_chain_success",
-                            extra={
-                                "provider": name,
-                                "url": url,
-                                "latency_ms": result.latency_ms,
-                                "request_id": request_id,
-                                "tried": len(errors) + 1,
-                            },
-                        )
-                        if self._audit:
-                            self._audit(
-                                "INFO",
-                                "scraper_chain_success",
-                                {
-                                    "provider": name,
-                                    "url": url,
-                                    "latency_ms": result.latency_ms,
-                                    "request_id": request_id,
-                                },
-                            )
-                        return result
-
-                    error_msg = f"{name}: {result.error_text or 'no content'}"
+                    if result is not None:
+                        winner = (provider.provider_name, result)
+                        break
                     errors.append(error_msg)
-                    provider_span.set_attribute("scraper.outcome", "no_content")
-                    logger.info(
-                        "scraper_chain_provider_failed",
-                        extra={
+
+            if winner is not None:
+                name, result = winner
+                chain_span.set_attribute("scraper.winner", name)
+                chain_span.set_attribute("scraper.attempts", len(errors) + 1)
+                logger.info(
+                    "scraper_chain_success",
+                    extra={
+                        "provider": name,
+                        "url": url,
+                        "latency_ms": result.latency_ms,
+                        "request_id": request_id,
+                        "tried": len(errors) + 1,
+                    },
+                )
+                if self._audit:
+                    self._audit(
+                        "INFO",
+                        "scraper_chain_success",
+                        {
                             "provider": name,
                             "url": url,
-                            "error": result.error_text,
+                            "latency_ms": result.latency_ms,
                             "request_id": request_id,
                         },
                     )
+                return result
 
             # All providers failed
             chain_span.set_attribute("scraper.attempts", len(errors))
@@ -262,7 +246,237 @@ class ContentScraperChain:
                 endpoint="chain",
             )
 
+    async def _race_providers(
+        self,
+        providers: list[ContentScraperProtocol],
+        url: str,
+        *,
+        mobile: bool,
+        request_id: int | None,
+        errors: list[str],
+    ) -> tuple[str, FirecrawlResult] | None:
+        """Run providers hedged; return the first accepted ``(name, result)``."""
+        loop = asyncio.get_running_loop()
+        running: dict[asyncio.Task[tuple[FirecrawlResult | None, str]], int] = {}
+        next_index = 0
+        hedge_at = 0.0
+
+        def start_next() -> None:
+            nonlocal next_index, hedge_at
+            provider = providers[next_index]
+            task = asyncio.create_task(
+                self._attempt(provider, url, mobile=mobile, request_id=request_id)
+            )
+            running[task] = next_index
+            next_index += 1
+            hedge_at = loop.time() + self._hedge_delay(provider.provider_name)
+
+        start_next()
+        try:
+            while running:
+                can_hedge = next_index < len(providers)
+                timeout = max(0.0, hedge_at - loop.time()) if can_hedge else None
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    logger.info(
+                        "scraper_chain_hedge",
+                        extra={
+                            "url": url,
+                            "started": providers[next_index].provider_name,
+                            "running": [providers[i].provider_name for i in running.values()],
+                            "request_id": request_id,
+                        },
+                    )
+                    start_next()
+                    continue
+
+                accepted: list[tuple[int, FirecrawlResult]] = []
+                for task in sorted(done, key=running.__getitem__):
+                    index = running.pop(task)
+                    result, error_msg = task.result()
+                    if result is not None:
+                        accepted.append((index, result))
+                    else:
+                        errors.append(error_msg)
+                if accepted:
+                    index, result = accepted[0]
+                    return providers[index].provider_name, result
+                if next_index < len(providers):
+                    start_next()
+            return None
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _attempt(
+        self,
+        provider: ContentScraperProtocol,
+        url: str,
+        *,
+        mobile: bool,
+        request_id: int | None,
+    ) -> tuple[FirecrawlResult | None, str]:
+        """Run one provider; return ``(result, "")`` if accepted, else ``(None, error)``."""
+        started = time.perf_counter()
+        result, error_msg, error_class = await self._try_provider(
+            provider, url, mobile=mobile, request_id=request_id
+        )
+        if self._ordering is not None:
+            if result is not None:
+                status = "success"
+            elif error_class == "TimeoutError":
+                status = "timeout"
+            else:
+                status = "error"
+            self._ordering.observe(
+                url,
+                ScraperAttemptEntry(
+                    provider=provider.provider_name,
+                    status=status,
+                    latency_ms=int((time.perf_counter() - started) * 1000),
+                    error_class=error_class or None,
+                ),
+            )
+            if self._ordering.save_due():
+                await self._ordering.asave()
+        return result, error_msg
+
+    async def _try_provider(
+        self,
+        provider: ContentScraperProtocol,
+        url: str,
+        *,
+        mobile: bool,
+        request_id: int | None,
+    ) -> tuple[FirecrawlResult | None, str, str]:
+        """Run one provider through the content checks.
+
+        Returns ``(result, "", "")`` when accepted, else ``(None, error, error_class)``
+        where ``error_class`` is the exception type or the rejection reason.
+        """
+        from app.observability.otel import get_tracer
+
+        name = provider.provider_name
+        slot = self._provider_slots.get(name)
+        with get_tracer(__name__).start_as_current_span(
+            f"scraper.{name}",
+            attributes={"scraper.provider": name, "scraper.url": url},
+        ) as provider_span:
+            try:
+                async with slot if slot is not None else contextlib.nullcontext():
+                    started = time.perf_counter()
+                    result = await provider.scrape_markdown(
+                        url, mobile=mobile, request_id=request_id
+                    )
+                    self._latencies.record(name, time.perf_counter() - started)
+            except asyncio.CancelledError:
+                provider_span.set_attribute("scraper.outcome", "cancelled")
+                raise
+            except Exception as exc:
+                provider_span.set_attribute("scraper.outcome", "error")
+                provider_span.set_attribute("error.type", type(exc).__name__)
+                logger.warning(
+                    "scraper_chain_provider_exception",
+                    extra={
+                        "provider": name,
+                        "url": url,
+                        "error": str(exc),
+                        "error_type": type(exc).__name__,
+                        "request_id": request_id,
+                    },
+                )
+                return None, f"{name}: {exc}", type(exc).__name__
+
+            has_content = result.status == CallStatus.OK and (
+                bool(result.content_markdown and result.content_markdown.strip())
+                or bool(result.content_html and result.content_html.strip())
+            )
+
+            if not has_content:
+                provider_span.set_attribute("scraper.outcome", "no_content")
+                logger.info(
+                    "scraper_chain_provider_failed",
+                    extra={
+                        "provider": name,
+                        "url": url,
+                        "error": result.error_text,
+                        "request_id": request_id,
+                    },
+                )
+                return None, f"{name}: {result.error_text or 'no content'}", "no_content"
+
+            text = best_content_text(result)
+
+            if _is_error_page(text):
+                provider_span.set_attribute("scraper.outcome", "error_page")
+                logger.info(
+                    "scraper_chain_error_page",
+                    extra={
+                        "provider": name,
+                        "url": url,
+                        "content_len": len(text),
+                        "preview": text[:200],
+                        "request_id": request_id,
+                    },
+                )
+                return None, f"{name}: error page detected ({len(text)} chars)", "error_page"
+
+            if self._min_content_length > 0 and len(text) < self._min_content_length:
+                provider_span.set_attribute("scraper.outcome", "too_short")
+                logger.info(
+                    "scraper_chain_thin_content",
+                    extra={
+                        "provider": name,
+                        "url": url,
+                        "content_len": len(text),
+                        "threshold": self._min_content_length,
+                        "request_id": request_id,
+                    },
+                )
+                return (
+                    None,
+                    f"{name}: content too short ({len(text)} < {self._min_content_length} chars)",
+                    "too_short",
+                )
+
+            quality_issue = (
+                detect_low_value_content(result) if self._min_content_length > 0 else None
+            )
+            if quality_issue is not None:
+                reason = quality_issue["reason"]
+                metrics = quality_issue["metrics"]
+                provider_span.set_attribute("scraper.outcome", "low_value")
+                logger.info(
+                    "scraper_chain_low_value_content",
+                    extra={
+                        "provider": name,
+                        "url": url,
+                        "reason": reason,
+                        "metrics": metrics,
+                        "preview": quality_issue["preview"],
+                        "request_id": request_id,
+                    },
+                )
+                return (
+                    None,
+                    (
+                        f"{name}: low-value content detected"
+                        f" ({reason}, chars={metrics['char_length']},"
+                        f" words={metrics['word_count']})"
+                    ),
+                    "low_value",
+                )
+
+            provider_span.set_attribute("scraper.outcome", "success")
+            return result, "", ""
+
     async def aclose(self) -> None:
+        if self._ordering is not None:
+            await self._ordering.asave()
         for provider in self._providers:
             try:
                 await provider.aclose()
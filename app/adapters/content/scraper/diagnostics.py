@@ -190,6 +190,10 @@ def build_scraper_diagnostics(cfg: AppConfig) -> dict[str, Any]:
         "provider_order_effective": provider_order_effective,
         "min_content_length": scraper_cfg.min_content_length,
         "js_heavy_hosts": list(scraper_cfg.js_heavy_hosts),
+        "race_enabled": scraper_cfg.race_enabled,
+        "race_hedge_delay_ms": scraper_cfg.race_hedge_delay_ms,
+        "browser_max_concurrency": scraper_cfg.browser_max_concurrency,
+        "adaptive_order_enabled": scraper_cfg.adaptive_order_enabled,
         "providers": providers,
         "twitter": twitter,
     }
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import io
 import time
+from functools import partial
 from urllib.parse import urljoin
 
 from app.adapters.external.firecrawl.models import FirecrawlResult
@@ -17,6 +17,7 @@ logger = get_logger(__name__)
 _DEFAULT_TIMEOUT_SEC = 60
 _DEFAULT_MAX_PDF_MB = 20
 _MIN_EXTRACTED_CHARS = 100
+_DEFAULT_PARALLEL_MIN_PAGES = 24  # ATTACHMENT_PDF_PARALLEL_MIN_PAGES default
 _PDF_MAGIC = b"%PDF-"
 
 _HEADERS = {
@@ -35,27 +36,27 @@ def _is_pdf_url(url: str) -> bool:
     return path.endswith(".pdf")
 
 
-def _extract_text_sync(pdf_bytes: bytes) -> str:
-    """CPU-bound: extract text from PDF bytes via PyMuPDF."""
+def _extract_text_sync(pdf_bytes: bytes, *, parallel_min_pages: int, max_workers: int) -> str:
+    """CPU-bound: extract text from PDF bytes via PyMuPDF (pooled for long documents)."""
     try:
-        import fitz
+        import fitz  # noqa: F401
     except ImportError as exc:
         msg = "PyMuPDF (fitz) is not installed"
         raise RuntimeError(msg) from exc
 
-    doc = fitz.open(stream=io.BytesIO(pdf_bytes), filetype="pdf")
-    try:
-        pages: list[str] = [page.get_text() for page in doc]
-        return "\n\n".join(pages).strip()
-    finally:
-        doc.close()
+    from app.adapters.attachment import pdf_engine
+
+    return pdf_engine.extract_text(
+        pdf_bytes, parallel_min_pages=parallel_min_pages, max_workers=max_workers
+    )
 
 
 class DirectPDFProvider:
     """Scraper chain provider that downloads and extracts PDF URLs using PyMuPDF.
 
     Fast-fails for any URL whose path does not end with .pdf so it adds
-    negligible overhead for normal HTML pages.
+    negligible overhead for normal HTML pages. Long documents use the PDF
+    worker pool shared with attachments, with the same attachment settings.
     """
 
     def __init__(
@@ -64,10 +65,14 @@ class DirectPDFProvider:
         *,
         max_pdf_mb: int = _DEFAULT_MAX_PDF_MB,
         min_text_length: int = _MIN_EXTRACTED_CHARS,
+        parallel_min_pages: int = _DEFAULT_PARALLEL_MIN_PAGES,
+        worker_processes: int = 0,
     ) -> None:
         self._timeout_sec = timeout_sec
         self._max_pdf_bytes = max_pdf_mb * 1024 * 1024
         self._min_text_length = min_text_length
+        self._parallel_min_pages = parallel_min_pages
+        self._worker_processes = worker_processes
 
     @property
     def provider_name(self) -> str:
@@ -118,7 +123,15 @@ class DirectPDFProvider:
 
         loop = asyncio.get_running_loop()
         try:
-            text = await loop.run_in_executor(None, _extract_text_sync, pdf_bytes)
+            text = await loop.run_in_executor(
+                None,
+                partial(
+                    _extract_text_sync,
+                    pdf_bytes,
+                    parallel_min_pages=self._parallel_min_pages,
+                    max_workers=self._worker_processes,
+                ),
+            )
         except Exception as exc:
             latency = int((time.perf_counter() - started) * 1000)
             logger.debug(
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from app.adapters.content.scraper.protocol import ContentScraperProtocol
+    from app.adapters.content.scraper.provider_ordering import ProviderOrderingEngine
     from app.config import AppConfig
 
 logger = get_logger(__name__)
@@ -54,7 +55,7 @@ class ContentScraperFactory:
             "playwright": lambda: _build_playwright(scraper_cfg),
             "crawlee": lambda: _build_crawlee(scraper_cfg),
             "direct_html": lambda: _build_direct_html(scraper_cfg),
-            "direct_pdf": lambda: _build_direct_pdf(scraper_cfg),
+            "direct_pdf": lambda: _build_direct_pdf(scraper_cfg, getattr(cfg, "attachment", None)),
             "crawl4ai": lambda: _build_crawl4ai(scraper_cfg, audit),
             "scrapegraph_ai": lambda: _build_scrapegraph(cfg),
         }
@@ -102,9 +103,29 @@ class ContentScraperFactory:
             audit=audit,
             min_content_length=getattr(scraper_cfg, "min_content_length", 400),
             js_heavy_hosts=getattr(scraper_cfg, "js_heavy_hosts", ()),
+            race=getattr(scraper_cfg, "race_enabled", False),
+            hedge_delay_sec=getattr(scraper_cfg, "race_hedge_delay_ms", 2000) / 1000.0,
+            provider_concurrency=dict.fromkeys(
+                BROWSER_PROVIDERS, getattr(scraper_cfg, "browser_max_concurrency", 2)
+            ),
+            ordering=_build_ordering(scraper_cfg),
         )
 
 
+def _build_ordering(scraper_cfg: object) -> ProviderOrderingEngine | None:
+    if not getattr(scraper_cfg, "adaptive_order_enabled", False):
+        return None
+    from app.adapters.content.scraper.provider_ordering import ProviderOrderingEngine
+
+    engine = ProviderOrderingEngine(
+        max_domains=getattr(scraper_cfg, "adaptive_order_max_domains", 2048),
+        half_life_sec=getattr(scraper_cfg, "adaptive_order_half_life_hours", 168) * 3600.0,
+        state_path=getattr(scraper_cfg, "adaptive_order_state_path", "") or None,
+    )
+    engine.load()
+    return engine
+
+
 def _build_scrapling(scraper_cfg: object) -> ContentScraperProtocol | None:
     if not getattr(scraper_cfg, "scrapling_enabled", True):
         return None
@@ -247,7 +268,9 @@ def _build_direct_html(scraper_cfg: object) -> ContentScraperProtocol | None:
     )
 
 
-def _build_direct_pdf(scraper_cfg: object) -> ContentScraperProtocol | None:
+def _build_direct_pdf(
+    scraper_cfg: object, attachment_cfg: object | None = None
+) -> ContentScraperProtocol | None:
     if not getattr(scraper_cfg, "direct_pdf_enabled", True):
         return None
 
@@ -268,6 +291,10 @@ def _build_direct_pdf(scraper_cfg: object) -> ContentScraperProtocol | None:
         timeout_sec=timeout_sec,
         max_pdf_mb=getattr(scraper_cfg, "direct_pdf_max_size_mb", 20),
         min_text_length=getattr(scraper_cfg, "min_content_length", 400),
+        # The PDF worker pool is shared with attachments and sized by its first
+        # user, so both take their pool settings from the attachment config.
+        parallel_min_pages=getattr(attachment_cfg, "pdf_parallel_min_pages", 24),
+        worker_processes=getattr(attachment_cfg, "pdf_worker_processes", 0),
     )
 
 
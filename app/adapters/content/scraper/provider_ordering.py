@@ -0,0 +1,369 @@
+"""Per-domain learned provider ordering for the scraper chain.
+
+The static chain order is a global guess. Per domain it is often wrong: some
+sites always serve Scrapling a consent wall, others only render in a browser.
+:class:`ProviderOrderingEngine` learns from the chain's own attempts, one
+:class:`ScraperAttemptEntry` at a time, and reorders providers per URL.
+
+For every ``(domain, provider)`` pair it keeps exponentially decayed counts of
+attempts, successes and low-value results (error pages, thin or boilerplate
+content) plus a decayed mean latency. Providers are ranked by
+
+    smoothed success rate - latency penalty
+
+with the static position as tie-break. Smoothing pulls providers with little
+evidence towards a neutral prior, so a domain only departs from the static
+order once it has real history. Providers that keep returning low-value
+content on a domain are demoted behind every other provider.
+
+Domains live in an LRU bounded by ``max_domains`` and each holds one small
+slotted record per provider, so memory stays bounded. State is persisted as a
+JSON snapshot (written atomically) and reloaded on start. Processes may share
+one state file: each save merges what is already on disk, keeping the more
+recently updated record per ``(domain, provider)``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import math
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import urlparse
+
+from app.core.logging_utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from app.adapters.content.scraper.attempt_log import ScraperAttemptEntry
+    from app.adapters.content.scraper.protocol import ContentScraperProtocol
+
+logger = get_logger(__name__)
+
+P = TypeVar("P", bound="ContentScraperProtocol")
+
+# ``error_class`` values the chain uses for content that arrived but was rejected.
+LOW_VALUE_ERROR_CLASSES = frozenset({"error_page", "too_short", "low_value"})
+
+_STATE_VERSION = 1
+# Beta prior: a provider with no history scores 0.5.
+_PRIOR_SUCCESSES = 1.0
+_PRIOR_ATTEMPTS = 2.0
+# A provider whose successes are worth this much of a 30s+ latency difference.
+_LATENCY_WEIGHT = 0.15
+_LATENCY_SCALE_MS = 30_000.0
+# Below this many (decayed) attempts a provider is ranked as if it had no history.
+_MIN_EVIDENCE = 2.0
+# Demote after this many (decayed) attempts if most results were low-value.
+_DEMOTE_MIN_ATTEMPTS = 3.0
+_DEMOTE_LOW_VALUE_RATIO = 0.8
+
+
+@dataclass(slots=True)
+class ProviderDomainStats:
+    """Decayed outcome counters for one provider on one domain."""
+
+    attempts: float = 0.0
+    successes: float = 0.0
+    low_value: float = 0.0
+    latency_ms: float = 0.0
+    updated_at: float = 0.0
+
+    def decay_to(self, now: float, half_life_sec: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0 and self.updated_at > 0:
+            factor = math.pow(0.5, elapsed / half_life_sec)
+            self.attempts *= factor
+            self.successes *= factor
+            self.low_value *= factor
+        self.updated_at = max(self.updated_at, now)
+
+    @property
+    def success_rate(self) -> float:
+        return (self.successes + _PRIOR_SUCCESSES) / (self.attempts + _PRIOR_ATTEMPTS)
+
+    @property
+    def demoted(self) -> bool:
+        return (
+            self.attempts >= _DEMOTE_MIN_ATTEMPTS
+            and self.successes < 0.5
+            and self.low_value >= _DEMOTE_LOW_VALUE_RATIO * self.attempts
+        )
+
+
+class ProviderOrderingEngine:
+    """Learn per-domain provider outcomes and reorder the chain per URL."""
+
+    def __init__(
+        self,
+        *,
+        max_domains: int = 2048,
+        half_life_sec: float = 7 * 24 * 3600.0,
+        state_path: Path | str | None = None,
+        save_every: int = 50,
+    ) -> None:
+        if max_domains <= 0:
+            msg = "max_domains must be positive"
+            raise ValueError(msg)
+        if half_life_sec <= 0:
+            msg = "half_life_sec must be positive"
+            raise ValueError(msg)
+        self._max_domains = max_domains
+        self._half_life_sec = half_life_sec
+        self._state_path = Path(state_path) if state_path else None
+        self._save_every = max(1, save_every)
+        self._unsaved = 0
+        self._domains: OrderedDict[str, dict[str, ProviderDomainStats]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    @property
+    def state_path(self) -> Path | None:
+        return self._state_path
+
+    def stats_for(self, domain: str) -> dict[str, ProviderDomainStats]:
+        """Return a copy of the current (undecayed) stats for ``domain``."""
+        return dict(self._domains.get(domain, {}))
+
+    # -- Learning ------------------------------------------------------------
+
+    def observe(self, url: str, entry: ScraperAttemptEntry, *, now: float | None = None) -> None:
+        """Fold one provider attempt for ``url`` into its domain's statistics."""
+        domain = domain_key(url)
+        if domain is None or entry.status == "skipped":
+            return
+        now = time.time() if now is None else now
+        providers = self._domains.get(domain)
+        if providers is None:
+            providers = self._domains[domain] = {}
+            if len(self._domains) > self._max_domains:
+                self._domains.popitem(last=False)
+        else:
+            self._domains.move_to_end(domain)
+
+        stats = providers.get(entry.provider)
+        if stats is None:
+            stats = providers[entry.provider] = ProviderDomainStats(updated_at=now)
+        stats.decay_to(now, self._half_life_sec)
+        stats.attempts += 1.0
+        if entry.status == "success":
+            stats.successes += 1.0
+        elif entry.error_class in LOW_VALUE_ERROR_CLASSES:
+            stats.low_value += 1.0
+        # Decayed mean: recent latencies weigh as much as the decayed history.
+        weight = 1.0 / stats.attempts
+        stats.latency_ms += (max(0, entry.latency_ms) - stats.latency_ms) * weight
+        self._unsaved += 1
+
+    # -- Ordering ------------------------------------------------------------
+
+    def order(self, url: str, providers: Sequence[P], *, now: float | None = None) -> list[P]:
+        """Return ``providers`` reordered by their learned value for ``url``'s domain.
+
+        Without history for the domain the input order is returned unchanged.
+        """
+        domain = domain_key(url)
+        history = self._domains.get(domain or "")
+        if not history or domain is None:
+            return list(providers)
+        self._domains.move_to_end(domain)
+        now = time.time() if now is None else now
+
+        def rank(item: tuple[int, P]) -> tuple[bool, float, int]:
+            position, provider = item
+            stats = history.get(provider.provider_name)
+            if stats is None:
+                return False, -self._score(None), position
+            stats.decay_to(now, self._half_life_sec)
+            return stats.demoted, -self._score(stats), position
+
+        return [provider for _, provider in sorted(enumerate(providers), key=rank)]
+
+    @staticmethod
+    def _score(stats: ProviderDomainStats | None) -> float:
+        if stats is None or stats.attempts < _MIN_EVIDENCE:
+            # Neutral prior and a middling latency penalty.
+            return _PRIOR_SUCCESSES / _PRIOR_ATTEMPTS - _LATENCY_WEIGHT / 2
+        latency = min(stats.latency_ms / _LATENCY_SCALE_MS, 1.0)
+        return stats.success_rate - _LATENCY_WEIGHT * latency
+
+    # -- Persistence ---------------------------------------------------------
+
+    def save_due(self) -> bool:
+        return self._state_path is not None and self._unsaved >= self._save_every
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable copy of the learned state (LRU order preserved)."""
+        return {
+            "version": _STATE_VERSION,
+            "domains": {
+                domain: {
+                    name: [
+                        round(stats.attempts, 4),
+                        round(stats.successes, 4),
+                        round(stats.low_value, 4),
+                        round(stats.latency_ms, 1),
+                        round(stats.updated_at, 1),
+                    ]
+                    for name, stats in providers.items()
+                }
+                for domain, providers in self._domains.items()
+            },
+        }
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Replace the learned state with ``snapshot`` (see :meth:`snapshot`)."""
+        if snapshot.get("version") != _STATE_VERSION:
+            msg = f"Unsupported provider ordering state version: {snapshot.get('version')!r}"
+            raise ValueError(msg)
+        domains: OrderedDict[str, dict[str, ProviderDomainStats]] = OrderedDict()
+        for domain, providers in dict(snapshot.get("domains") or {}).items():
+            domains[str(domain)] = {
+                str(name): ProviderDomainStats(*(float(value) for value in values))
+                for name, values in dict(providers).items()
+            }
+        while len(domains) > self._max_domains:
+            domains.popitem(last=False)
+        self._domains = domains
+        self._unsaved = 0
+
+    def save(self) -> None:
+        """Atomically write the snapshot to ``state_path`` (no-op without one)."""
+        if self._state_path is None:
+            return
+        self._unsaved = 0
+        self._write(self.snapshot())
+
+    async def asave(self) -> None:
+        """Like :meth:`save`, but skips clean state and writes in a worker thread."""
+        if self._state_path is None or self._unsaved == 0:
+            return
+        self._unsaved = 0
+        await asyncio.to_thread(self._write, self.snapshot())
+
+    def _write(self, snapshot: dict[str, Any]) -> None:
+        path = self._state_path
+        if path is None:
+            return
+        tmp: str | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps(self._merge_with_disk(snapshot), separators=(",", ":"))
+            # A unique temp name keeps concurrent writers from clobbering each
+            # other's half-written file before the atomic rename.
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp, path)
+        except OSError as exc:
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+            logger.warning(
+                "scraper_provider_ordering_save_failed",
+                extra={"path": str(path), "error": str(exc)},
+            )
+
+    def _merge_with_disk(self, snapshot: dict[str, Any]) -> dict[str, Any]:
+        """Fold the state another process saved into ``snapshot``.
+
+        Per ``(domain, provider)`` the record with the later ``updated_at``
+        wins; domains only on disk go to the cold end of the LRU order.
+        """
+        if self._state_path is None:
+            return snapshot
+        try:
+            disk = json.loads(self._state_path.read_text(encoding="utf-8"))
+            if disk.get("version") != _STATE_VERSION:
+                return snapshot
+            disk_domains = {
+                str(domain): {str(name): list(values) for name, values in dict(providers).items()}
+                for domain, providers in dict(disk.get("domains") or {}).items()
+            }
+        except FileNotFoundError:
+            return snapshot
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            logger.warning(
+                "scraper_provider_ordering_merge_skipped",
+                extra={"path": str(self._state_path), "error": str(exc)},
+            )
+            return snapshot
+
+        ours: dict[str, dict[str, list[float]]] = snapshot["domains"]
+        merged = {domain: stats for domain, stats in disk_domains.items() if domain not in ours}
+        for domain, providers in ours.items():
+            combined = disk_domains.get(domain, {})
+            for name, values in providers.items():
+                theirs = combined.get(name)
+                if theirs is None or len(theirs) != len(values) or values[4] >= theirs[4]:
+                    combined[name] = values
+            merged[domain] = combined
+        overflow = len(merged) - self._max_domains
+        for domain in list(merged)[: max(0, overflow)]:
+            del merged[domain]
+        return {"version": _STATE_VERSION, "domains": merged}
+
+    def load(self) -> bool:
+        """Restore state from ``state_path``; returns whether anything was loaded."""
+        if self._state_path is None:
+            return False
+        try:
+            snapshot = json.loads(self._state_path.read_text(encoding="utf-8"))
+            self.restore(snapshot)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning(
+                "scraper_provider_ordering_load_failed",
+                extra={"path": str(self._state_path), "error": str(exc)},
+            )
+            return False
+        logger.info(
+            "scraper_provider_ordering_loaded",
+            extra={"path": str(self._state_path), "domains": len(self._domains)},
+        )
+        return True
+
+
+def domain_key(url: str) -> str | None:
+    """Registrable-ish domain for ``url``: the host without a leading ``www.``."""
+    try:
+        host = (urlparse(url.strip()).hostname or "").strip().lower()
+    except ValueError:
+        return None
+    return host.removeprefix("www.") or None
+
+
+def replay_attempt_logs(
+    engine: ProviderOrderingEngine,
+    records: Iterable[tuple[str, Sequence[ScraperAttemptEntry], float]],
+) -> int:
+    """Feed recorded ``(url, attempts, timestamp)`` chain runs into ``engine``.
+
+    Returns the number of attempts observed. Used to warm the engine from
+    ``crawl_results.attempt_log`` history and by the offline replay benchmark.
+    """
+    observed = 0
+    for url, attempts, timestamp in records:
+        for entry in attempts:
+            engine.observe(url, entry, now=timestamp)
+            observed += 1
+    return observed
+
+
+__all__ = [
+    "LOW_VALUE_ERROR_CLASSES",
+    "ProviderDomainStats",
+    "ProviderOrderingEngine",
+    "domain_key",
+    "replay_attempt_logs",
+]
@@ -6,6 +6,7 @@ from datetime import UTC
 from typing import TYPE_CHECKING
 
 from app.core.logging_utils import get_logger
+from app.core.token_utils import count_tokens
 
 if TYPE_CHECKING:
     from app.application.services.topic_search import TopicArticle
@@ -148,9 +149,10 @@ class SearchContextBuilder:
         return "\n".join(parts)
 
     def estimate_token_count(self, text: str) -> int:
-        """Estimate token count for text (rough approximation).
+        """Estimate token count for text.
 
-        Uses a simple heuristic of ~4 characters per token for English text.
+        Uses the shared memoized tokenizer; falls back to ~4 characters per token
+        when no encoder is available.
 
         Args:
             text: Text to estimate
@@ -158,4 +160,4 @@ class SearchContextBuilder:
         Returns:
             Estimated token count
         """
-        return max(1, len(text) // 4)
+        return count_tokens(text)
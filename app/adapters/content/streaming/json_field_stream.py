@@ -0,0 +1,314 @@
+"""Resumable JSON tokenizer that follows selected top-level fields of a stream.
+
+The parser consumes text in arbitrary chunks and keeps its position in the
+document between calls, so every character is scanned exactly once no matter
+how many deltas arrive. Only the requested fields are materialised: string
+fields accumulate their decoded text, array fields their items. Everything
+else is walked structurally and dropped.
+
+It is lenient in the same places ``extract_json`` is: prose or code fences
+around the object, stray closers and junk between tokens are ignored, and a
+later top-level object overrides values from an earlier one.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from string import hexdigits
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_PLAIN_RUN = re.compile(r'[^"\\]+')
+_LITERAL_RUN = re.compile(r'[^\s,\]}"]+')
+_WHITESPACE = frozenset(" \t\r\n")
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+# Lexer modes.
+_STRUCT = 0
+_STRING = 1
+_ESCAPE = 2
+_UNICODE = 3
+_LITERAL = 4
+
+# Container states.
+_KEY = 0
+_COLON = 1
+_VALUE = 2
+_AFTER = 3
+
+
+def _without_split_pair(text: str) -> str:
+    # A high surrogate at the end is half of a pair whose low half has not
+    # streamed in yet; it is not encodable on its own.
+    if text and 0xD800 <= ord(text[-1]) <= 0xDBFF:
+        return text[:-1]
+    return text
+
+
+class _Frame:
+    __slots__ = ("field", "kind", "state")
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.state = _KEY if kind == "{" else _VALUE
+        # Key of the member being parsed (top-level object) or the tracked
+        # field this array belongs to (arrays directly under it).
+        self.field: str | None = None
+
+
+class StreamingJSONFieldParser:
+    """Incrementally extract string and string-array fields from streamed JSON."""
+
+    def __init__(self, *, string_fields: Iterable[str], array_fields: Iterable[str]) -> None:
+        self._string_fields = frozenset(string_fields)
+        self._array_fields = frozenset(array_fields)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all input and extracted values."""
+        self._stack: list[_Frame] = []
+        self._mode = _STRUCT
+        self._strings: dict[str, list[str]] = {}
+        self._arrays: dict[str, list[str]] = {}
+        self._touched: set[str] = set()
+        # Destination of the string being lexed (None = discard).
+        self._sink: list[str] | None = None
+        self._sink_field: str | None = None
+        self._string_is_key = False
+        self._open_item: list[str] | None = None
+        self._hex = ""
+        # Raw text of a non-string item inside a tracked array.
+        self._raw_parts: list[str] | None = None
+        self._raw_start = 0
+        self._raw_depth = 0
+        self._raw_field: str | None = None
+
+    def value(self, field: str) -> str | list[str] | None:
+        """Current (possibly still streaming) value of ``field``."""
+        parts = self._strings.get(field)
+        if parts is not None:
+            return _without_split_pair("".join(parts))
+        items = self._arrays.get(field)
+        if items is None:
+            return None
+        if self._open_item is not None and self._sink_field == field:
+            return [*items, _without_split_pair("".join(self._open_item))]
+        return list(items)
+
+    def feed(self, chunk: str) -> set[str]:
+        """Consume ``chunk``; return the fields whose value may have changed."""
+        touched = self._touched = set()
+        if self._sink_field is not None and self._mode in (_STRING, _ESCAPE, _UNICODE):
+            touched.add(self._sink_field)
+        self._raw_start = 0
+
+        i, n = 0, len(chunk)
+        while i < n:
+            mode = self._mode
+            if mode == _STRING:
+                run = _PLAIN_RUN.match(chunk, i)
+                if run is not None:
+                    if self._sink is not None:
+                        self._sink.append(run.group())
+                    i = run.end()
+                    continue
+                if chunk[i] == '"':
+                    self._close_string()
+                else:
+                    self._mode = _ESCAPE
+                i += 1
+            elif mode == _ESCAPE:
+                esc = chunk[i]
+                i += 1
+                if esc == "u":
+                    self._mode = _UNICODE
+                    self._hex = ""
+                    continue
+                self._mode = _STRING
+                if self._sink is not None:
+                    self._sink.append(_SIMPLE_ESCAPES.get(esc, "\\" + esc))
+            elif mode == _UNICODE:
+                piece = chunk[i : i + 4 - len(self._hex)]
+                self._hex += piece
+                i += len(piece)
+                if len(self._hex) == 4:
+                    self._mode = _STRING
+                    if self._sink is not None:
+                        self._append_unicode(self._sink, self._hex)
+            elif mode == _LITERAL:
+                run = _LITERAL_RUN.match(chunk, i)
+                if run is not None:
+                    i = run.end()
+                    continue
+                self._mode = _STRUCT
+                if self._raw_parts is not None and len(self._stack) == self._raw_depth:
+                    self._finish_raw(chunk, i)
+            else:
+                self._structural(chunk, i)
+                i += 1
+
+        if self._raw_parts is not None:
+            self._raw_parts.append(chunk[self._raw_start :])
+        return touched
+
+    # ------------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------------
+
+    def _structural(self, chunk: str, pos: int) -> None:
+        ch = chunk[pos]
+        if ch in _WHITESPACE:
+            return
+        stack = self._stack
+        if not stack:
+            if ch == "{":
+                stack.append(_Frame("{"))
+            return
+
+        frame = stack[-1]
+        if frame.kind == "{":
+            if ch == "}":
+                self._pop(chunk, pos)
+            elif frame.state == _KEY:
+                if ch == '"':
+                    self._open_string(key_parts=[] if len(stack) == 1 else None)
+            elif frame.state == _COLON:
+                if ch == ":":
+                    frame.state = _VALUE
+            elif frame.state == _AFTER:
+                if ch == ",":
+                    frame.state = _KEY
+                    frame.field = None
+            else:
+                self._begin_value(frame, chunk, pos)
+            return
+
+        if ch == "]":
+            self._pop(chunk, pos)
+        elif frame.state == _AFTER:
+            if ch == ",":
+                frame.state = _VALUE
+        elif ch not in ",}":
+            self._begin_value(frame, chunk, pos)
+
+    def _begin_value(self, frame: _Frame, chunk: str, pos: int) -> None:
+        ch = chunk[pos]
+        frame.state = _AFTER
+        member = frame.field if len(self._stack) == 1 else None
+        # Item of a tracked array (outside any raw capture already running).
+        item_field = frame.field if frame.kind == "[" and self._raw_parts is None else None
+
+        if ch == '"':
+            if member is not None and member in self._string_fields:
+                sink: list[str] = []
+                self._strings[member] = sink
+                self._open_string(value_parts=sink, field=member)
+            elif item_field is not None:
+                self._open_item = []
+                self._open_string(value_parts=self._open_item, field=item_field)
+            else:
+                self._open_string()
+            return
+
+        if ch in "{[":
+            if item_field is not None:
+                self._start_raw(item_field, pos)
+            child = _Frame(ch)
+            self._stack.append(child)
+            if ch == "[" and member is not None and member in self._array_fields:
+                child.field = member
+                self._arrays[member] = []
+                self._touched.add(member)
+            return
+
+        self._mode = _LITERAL
+        if item_field is not None:
+            self._start_raw(item_field, pos)
+
+    def _pop(self, chunk: str, pos: int) -> None:
+        self._stack.pop()
+        if self._raw_parts is not None and len(self._stack) == self._raw_depth:
+            self._finish_raw(chunk, pos + 1)
+
+    # ------------------------------------------------------------------
+    # Strings
+    # ------------------------------------------------------------------
+
+    def _open_string(
+        self,
+        *,
+        key_parts: list[str] | None = None,
+        value_parts: list[str] | None = None,
+        field: str | None = None,
+    ) -> None:
+        self._mode = _STRING
+        self._string_is_key = key_parts is not None
+        self._sink = key_parts if key_parts is not None else value_parts
+        self._sink_field = field
+        if field is not None:
+            self._touched.add(field)
+
+    def _close_string(self) -> None:
+        self._mode = _STRUCT
+        if self._string_is_key:
+            frame = self._stack[-1]
+            # Only top-level member names are collected; deeper keys are skipped.
+            frame.field = "".join(self._sink) if self._sink is not None else None
+            frame.state = _COLON
+        elif self._open_item is not None and self._sink_field is not None:
+            self._arrays[self._sink_field].append("".join(self._open_item))
+            self._open_item = None
+        self._sink = None
+        self._sink_field = None
+        self._string_is_key = False
+
+    @staticmethod
+    def _append_unicode(sink: list[str], hex_digits: str) -> None:
+        if not all(c in hexdigits for c in hex_digits):
+            sink.append("\\u" + hex_digits)
+            return
+        code = int(hex_digits, 16)
+        if 0xDC00 <= code <= 0xDFFF and sink and sink[-1]:
+            high = ord(sink[-1][-1])
+            if 0xD800 <= high <= 0xDBFF:
+                sink[-1] = sink[-1][:-1]
+                sink.append(chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00)))
+                return
+        sink.append(chr(code))
+
+    # ------------------------------------------------------------------
+    # Non-string array items
+    # ------------------------------------------------------------------
+
+    def _start_raw(self, field: str, pos: int) -> None:
+        self._raw_parts = []
+        self._raw_start = pos
+        self._raw_depth = len(self._stack)
+        self._raw_field = field
+
+    def _finish_raw(self, chunk: str, end: int) -> None:
+        parts = self._raw_parts or []
+        parts.append(chunk[self._raw_start : end])
+        field = self._raw_field
+        self._raw_parts = None
+        self._raw_field = None
+        if field is None:
+            return
+        try:
+            item = json.loads("".join(parts))
+        except ValueError:
+            return
+        self._arrays[field].append(str(item))
+        self._touched.add(field)
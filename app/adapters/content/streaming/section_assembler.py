@@ -1,25 +1,19 @@
-"""Incremental section assembler for streamed summary JSON tokens."""
+"""Incremental section assembler for streamed summary JSON tokens.
+
+Deltas go through a resumable tokenizer, so each one costs time proportional
+to its own length rather than to everything streamed so far.
+"""
 
 from __future__ import annotations
 
-import json
-import re
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import Any
 
-from app.core.json_utils import extract_json
+from app.adapters.content.streaming.json_field_stream import StreamingJSONFieldParser
 
 _SECTION_ORDER = ("summary_250", "tldr", "key_ideas", "topic_tags")
-
-_STRING_FIELD_PATTERNS = {
-    "summary_250": re.compile(r'"summary_250"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL),
-    "tldr": re.compile(r'"tldr"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL),
-}
-
-_ARRAY_FIELD_PATTERNS = {
-    "key_ideas": re.compile(r'"key_ideas"\s*:\s*\[(.*?)\]', re.DOTALL),
-    "topic_tags": re.compile(r'"topic_tags"\s*:\s*\[(.*?)\]', re.DOTALL),
-}
+_STRING_SECTIONS = ("summary_250", "tldr")
+_ARRAY_SECTIONS = ("key_ideas", "topic_tags")
 
 
 @dataclass(frozen=True)
@@ -32,7 +26,9 @@ class SummarySectionStreamAssembler:
     """Converts streamed token deltas into ordered summary section snapshots."""
 
     def __init__(self) -> None:
-        self._buffer = ""
+        self._parser = StreamingJSONFieldParser(
+            string_fields=_STRING_SECTIONS, array_fields=_ARRAY_SECTIONS
+        )
         self._sections: dict[str, str | list[str]] = {}
 
     @property
@@ -43,12 +39,13 @@ class SummarySectionStreamAssembler:
         if not delta:
             return []
 
-        self._buffer += delta
-        parsed = self._extract_sections()
+        changed = self._parser.feed(delta)
         emitted: list[SummarySectionSnapshot] = []
 
         for section in _SECTION_ORDER:
-            value = parsed.get(section)
+            if section not in changed:
+                continue
+            value = self._clean(self._parser.value(section))
             if not self._is_meaningful_value(value):
                 continue
             if self._sections.get(section) == value:
@@ -58,6 +55,11 @@ class SummarySectionStreamAssembler:
 
         return emitted
 
+    def replace_draft(self, draft: str) -> list[SummarySectionSnapshot]:
+        """Re-assemble sections from a complete draft document instead of a delta."""
+        self._parser.reset()
+        return self.add_delta(draft)
+
     def render_preview(self, *, finalizing: bool = False) -> str:
         lines = ["⏳ Summary is being generated..."]
 
@@ -84,89 +86,13 @@ class SummarySectionStreamAssembler:
 
         return "\n".join(lines)
 
-    def _extract_sections(self) -> dict[str, str | list[str]]:
-        # 1) Fast path: complete JSON extraction from accumulated text.
-        result: dict[str, str | list[str]] = {}
-        fast = self._extract_from_json_object(self._buffer)
-        if fast:
-            result.update(fast)
-
-        # 2) Tolerant partial extraction for still-incomplete JSON payloads.
-        tolerant = self._extract_tolerant(self._buffer)
-        for key, value in tolerant.items():
-            result.setdefault(key, value)
-
-        return result
-
-    def _extract_from_json_object(self, raw_text: str) -> dict[str, str | list[str]]:
-        try:
-            obj = extract_json(raw_text)
-        except Exception:
-            return {}
-        if not isinstance(obj, dict):
-            return {}
-
-        extracted: dict[str, str | list[str]] = {}
-        for key in _SECTION_ORDER:
-            value = obj.get(key)
-            if key in ("summary_250", "tldr") and isinstance(value, str):
-                cleaned = value.strip()
-                if cleaned:
-                    extracted[key] = cleaned
-            elif key in ("key_ideas", "topic_tags") and isinstance(value, list):
-                cleaned_list = [str(item).strip() for item in value if str(item).strip()]
-                if cleaned_list:
-                    extracted[key] = cleaned_list
-        return extracted
-
-    def _extract_tolerant(self, raw_text: str) -> dict[str, str | list[str]]:
-        extracted: dict[str, str | list[str]] = {}
-
-        for key, pattern in _STRING_FIELD_PATTERNS.items():
-            match = pattern.search(raw_text)
-            if not match:
-                continue
-            value = self._decode_json_string(match.group(1)).strip()
-            if value:
-                extracted[key] = value
-
-        for key, pattern in _ARRAY_FIELD_PATTERNS.items():
-            match = pattern.search(raw_text)
-            if match:
-                parsed = self._parse_array_inner(match.group(1))
-                if parsed:
-                    extracted[key] = parsed
-                    continue
-
-            # Incomplete array fallback: extract quoted items after key marker.
-            marker_idx = raw_text.find(f'"{key}"')
-            if marker_idx >= 0:
-                tail = raw_text[marker_idx:]
-                quoted = re.findall(r'"((?:[^"\\]|\\.)*)"', tail)
-                # The first quoted item is usually the key itself.
-                values = [self._decode_json_string(item).strip() for item in quoted[1:]]
-                values = [item for item in values if item]
-                if values:
-                    extracted[key] = values[:8]
-
-        return extracted
-
-    def _parse_array_inner(self, raw_inner: str) -> list[str]:
-        raw = f"[{raw_inner}]"
-        try:
-            parsed = json.loads(raw)
-        except Exception:
-            return []
-        if not isinstance(parsed, list):
-            return []
-        return [str(item).strip() for item in parsed if str(item).strip()]
-
     @staticmethod
-    def _decode_json_string(value: str) -> str:
-        try:
-            return cast("str", json.loads(f'"{value}"'))
-        except Exception:
-            return value
+    def _clean(value: str | list[str] | None) -> str | list[str] | None:
+        if isinstance(value, str):
+            return value.strip()
+        if isinstance(value, list):
+            return [item.strip() for item in value if item.strip()]
+        return None
 
     @staticmethod
     def _is_meaningful_value(value: Any) -> bool:
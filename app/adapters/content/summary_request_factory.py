@@ -535,26 +535,43 @@ class SummaryRequestFactory:
             return True
         return provider_name == scope
 
-    def _configure_streaming(
+    def build_stream_coordinator(
         self,
         *,
-        requests: list[LLMRequestConfig],
         message: Any,
         correlation_id: str | None,
         silent: bool,
         request_id: str | None = None,
     ) -> Any | None:
+        """Return a draft stream coordinator when section streaming applies, else None."""
         if not self._summary_streaming_enabled(silent=silent):
             return None
         if self._stream_coordinator_factory is None:
             return None
-
-        stream_coordinator = self._stream_coordinator_factory(
+        return self._stream_coordinator_factory(
             response_formatter=self._runtime.response_formatter,
             message=message,
             correlation_id=correlation_id,
             request_id=request_id,
         )
+
+    def _configure_streaming(
+        self,
+        *,
+        requests: list[LLMRequestConfig],
+        message: Any,
+        correlation_id: str | None,
+        silent: bool,
+        request_id: str | None = None,
+    ) -> Any | None:
+        stream_coordinator = self.build_stream_coordinator(
+            message=message,
+            correlation_id=correlation_id,
+            silent=silent,
+            request_id=request_id,
+        )
+        if stream_coordinator is None:
+            return None
         for request in requests:
             request.stream = True
             request.on_stream_delta = stream_coordinator.on_delta
@@ -128,7 +128,7 @@ class URLFlowContextBuilder:
                 silent=request.silent,
             )
 
-        should_chunk, max_chars, chunks = self._compute_chunk_strategy(
+        should_chunk, max_chars, chunks = await self._compute_chunk_strategy(
             content_text=content_text,
             chosen_lang=chosen_lang,
             correlation_id=request.correlation_id,
@@ -158,14 +158,14 @@ class URLFlowContextBuilder:
             chunks=chunks,
         )
 
-    def _compute_chunk_strategy(
+    async def _compute_chunk_strategy(
         self,
         *,
         content_text: str,
         chosen_lang: str,
         correlation_id: str | None,
     ) -> tuple[bool, int, list[str] | None]:
-        should_chunk, max_chars, chunks = self._content_chunker.should_chunk_content(
+        should_chunk, max_chars, chunks = await self._content_chunker.should_chunk_content(
             content_text,
             chosen_lang,
         )
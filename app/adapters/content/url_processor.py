@@ -174,6 +174,7 @@ class URLProcessor:
             summary_repo=self.summary_repo,
             audit_func=audit_func,
             request_repo=self.request_repo,
+            db_write_queue=db_write_queue,
         )
         self.post_summary_tasks = URLPostSummaryTaskService(
             response_formatter=response_formatter,
@@ -194,6 +195,7 @@ class URLProcessor:
         await self.summarization_runtime.aclose(timeout=timeout)
         await self.summary_delivery.aclose(timeout=timeout)
         await self.post_summary_tasks.aclose(timeout=timeout)
+        await self.content_extractor.aclose(timeout=timeout)
 
     async def handle_url_flow(
         self,
@@ -276,17 +278,30 @@ class URLProcessor:
             if getattr(self.cfg.runtime, "url_flow_streaming_enabled", True):
                 get_stream_hub().publish(
                     str(context.req_id),
-                    StreamEvent.now("stage", {"stage": "summarizing"}, request.correlation_id or ""),
+                    StreamEvent.now(
+                        "stage", {"stage": "summarizing"}, request.correlation_id or ""
+                    ),
                 )
 
             if context.should_chunk and context.chunks:
-                summary_json = await self.content_chunker.process_chunks(
-                    context.chunks,
-                    context.system_prompt,
-                    context.chosen_lang,
-                    context.req_id,
-                    request.correlation_id,
+                stream_coordinator = self.summary_request_factory.build_stream_coordinator(
+                    message=request.message,
+                    correlation_id=request.correlation_id,
+                    silent=request.effective_silent,
+                    request_id=str(context.req_id),
                 )
+                try:
+                    summary_json = await self.content_chunker.process_chunks(
+                        context.chunks,
+                        context.system_prompt,
+                        context.chosen_lang,
+                        context.req_id,
+                        request.correlation_id,
+                        on_draft=stream_coordinator.on_draft if stream_coordinator else None,
+                    )
+                finally:
+                    if stream_coordinator is not None:
+                        await stream_coordinator.finalize()
                 if summary_json:
                     summary_json = (
                         await self.summarization_runtime.semantic_helper.enrich_with_rag_fields(
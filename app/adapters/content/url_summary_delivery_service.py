@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from app.adapters.external.formatting.protocols import (
         ResponseFormatterFacade as ResponseFormatter,
     )
+    from app.db.write_queue import DbWriteQueue
 
 
 class URLSummaryDeliveryService:
@@ -36,6 +37,7 @@ class URLSummaryDeliveryService:
         summary_repo: Any,
         audit_func: Any,
         request_repo: Any = None,
+        db_write_queue: DbWriteQueue | None = None,
     ) -> None:
         self._cfg = cfg
         self._db = db
@@ -43,6 +45,7 @@ class URLSummaryDeliveryService:
         self._summary_repo = summary_repo
         self._audit = audit_func
         self._request_repo = request_repo
+        self._db_write_queue = db_write_queue
         self._tracked_tasks: set[asyncio.Task[Any]] = set()
 
     async def aclose(self, timeout: float = 5.0) -> None:
@@ -288,9 +291,29 @@ class URLSummaryDeliveryService:
         if self._request_repo is None:
             return
         try:
+            if self._db_write_queue is not None:
+                # A later reply id for the same request supersedes a queued one.
+                await self._db_write_queue.enqueue_batch(
+                    (req_id, bot_reply_msg_id),
+                    batch_key=f"bot_reply_message_id:{id(self._request_repo)}",
+                    execute_batch=self._persist_bot_reply_message_ids_batch,
+                    operation_name="persist_bot_reply_message_id",
+                    correlation_id=correlation_id or "",
+                    coalesce_key=req_id,
+                )
+                return
             await self._request_repo.async_update_bot_reply_message_id(req_id, bot_reply_msg_id)
         except Exception as exc:
             logger.warning(
                 "bot_reply_msg_id_persist_failed",
                 extra={"cid": correlation_id, "error": str(exc)},
             )
+
+    async def _persist_bot_reply_message_ids_batch(self, updates: list[tuple[int, int]]) -> None:
+        try:
+            await self._request_repo.async_update_bot_reply_message_ids_batch(updates)
+        except Exception as exc:
+            logger.warning(
+                "bot_reply_msg_id_persist_failed",
+                extra={"count": len(updates), "error": str(exc)},
+            )
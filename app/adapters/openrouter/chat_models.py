@@ -65,6 +65,7 @@ class AttemptRequestPayload:
     rf_mode_current: str | None
     response_format_current: dict[str, Any] | None
     structured_output_state: StructuredOutputState
+    prompt_cache_key: str | None = None
 
 
 @dataclass
@@ -107,6 +107,7 @@ class ChatResponseHandler:
                     "cache_creation_tokens": cache_metrics.cache_creation_tokens,
                     "cache_discount": cache_metrics.cache_discount,
                     "cache_hit": cache_metrics.cache_hit,
+                    "prompt_cache_key": payload.prompt_cache_key,
                     "request_id": request_id,
                 },
             )
@@ -168,6 +169,7 @@ class ChatResponseHandler:
                 else None
             ),
             cache_discount=cache_metrics.cache_discount,
+            prompt_cache_key=payload.prompt_cache_key,
         )
         return AttemptOutcome(
             success=True,
@@ -189,6 +189,7 @@ class ChatTransport:
             rf_mode_current=rf_mode_current,
             response_format_current=response_format_current,
             structured_output_state=structured_output_state,
+            prompt_cache_key=self._client.request_builder.prompt_cache_key(sanitized_messages),
         )
 
     async def _attempt_non_stream_request(
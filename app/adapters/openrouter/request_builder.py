@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -12,12 +13,17 @@ from app.adapters.openrouter.model_capabilities import (
     supports_explicit_caching,
 )
 from app.core.logging_utils import get_logger
+from app.core.token_utils import estimate_tokens
 
 if TYPE_CHECKING:
     from app.adapter_models.llm.llm_models import ChatRequest
 
 logger = get_logger(__name__)
 
+# Smallest prefix (estimated tokens) a provider will actually cache; a breakpoint
+# on a shorter prefix is ignored upstream and only burns one of the few allowed.
+_MIN_CACHEABLE_PREFIX_TOKENS = {"anthropic": 1024, "google": 1024}
+
 
 class RequestBuilder:
     """Builds and validates HTTP requests for OpenRouter API."""
@@ -372,8 +378,9 @@ class RequestBuilder:
     ) -> list[dict[str, Any]]:
         """Convert messages to cacheable format for supported providers.
 
-        For Anthropic and Google providers, adds cache_control breakpoints to
-        system messages and large content blocks to enable prompt caching.
+        For Anthropic and Google providers, adds a cache_control breakpoint at
+        the end of the leading system-message prefix (once it is long enough for
+        the provider to cache) and to large content blocks.
 
         For providers with automatic caching (OpenAI, DeepSeek, Qwen, Moonshot),
         no modification is needed - caching happens server-side.
@@ -418,7 +425,7 @@ class RequestBuilder:
                 )
             return messages
 
-        result: list[dict[str, Any]] = []
+        result = list(messages)
         breakpoints_added = 0
         max_breakpoints = 4 if provider == "anthropic" else 1  # Gemini only uses last breakpoint
         # Anthropic supports a 1h TTL (2x write, 0.10x read) that amortizes well
@@ -428,25 +435,35 @@ class RequestBuilder:
             self._prompt_cache_ttl_anthropic if provider == "anthropic" else self._prompt_cache_ttl
         )
 
-        for i, msg in enumerate(messages):
-            if self._should_cache_message(msg, provider, i, len(messages)):
-                # Only add breakpoints up to the limit
-                if breakpoints_added < max_breakpoints:
-                    result.append(self._add_cache_control(msg, effective_ttl))
-                    breakpoints_added += 1
-                    logger.debug(
-                        "cache_control_added",
-                        extra={
-                            "message_index": i,
-                            "role": msg.get("role"),
-                            "provider": provider,
-                            "breakpoints": breakpoints_added,
-                        },
-                    )
-                else:
-                    result.append(msg)
-            else:
-                result.append(msg)
+        # The leading system messages are the stable prefix shared by every call
+        # of a prompt; one breakpoint at its end caches all of it.
+        prefix_len = self._stable_prefix_length(messages)
+        candidates: list[int] = []
+        if self._cache_system_prompt and prefix_len:
+            prefix_tokens = sum(
+                self.estimate_content_tokens(msg.get("content", ""))
+                for msg in messages[:prefix_len]
+            )
+            if prefix_tokens >= _MIN_CACHEABLE_PREFIX_TOKENS.get(provider, 0):
+                candidates.append(prefix_len - 1)
+        candidates.extend(
+            i
+            for i in range(prefix_len, len(messages))
+            if self._should_cache_message(messages[i], provider, i, len(messages))
+        )
+
+        for i in candidates[:max_breakpoints]:
+            result[i] = self._add_cache_control(messages[i], effective_ttl)
+            breakpoints_added += 1
+            logger.debug(
+                "cache_control_added",
+                extra={
+                    "message_index": i,
+                    "role": messages[i].get("role"),
+                    "provider": provider,
+                    "breakpoints": breakpoints_added,
+                },
+            )
 
         if breakpoints_added > 0:
             logger.info(
@@ -460,6 +477,38 @@ class RequestBuilder:
 
         return result
 
+    @staticmethod
+    def _stable_prefix_length(messages: list[dict[str, Any]]) -> int:
+        """Return how many leading messages are system messages."""
+        count = 0
+        for msg in messages:
+            if msg.get("role") != "system":
+                break
+            count += 1
+        return count
+
+    def prompt_cache_key(self, messages: list[dict[str, Any]]) -> str | None:
+        """Return a short stable hash of the system prefix, or None without one.
+
+        Calls sharing a key share a cacheable prefix, so the key groups LLM call
+        rows for cache-hit reporting per prompt and model.
+        """
+        prefix_len = self._stable_prefix_length(messages)
+        if not prefix_len:
+            return None
+        digest = hashlib.sha256()
+        for msg in messages[:prefix_len]:
+            content = msg.get("content", "")
+            if isinstance(content, list):
+                content = "".join(
+                    part["text"]
+                    for part in content
+                    if isinstance(part, dict) and isinstance(part.get("text"), str)
+                )
+            digest.update(str(content).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()[:16]
+
     def _should_cache_message(
         self,
         msg: dict[str, Any],
@@ -485,10 +534,10 @@ class RequestBuilder:
         if role == "system" and self._cache_system_prompt:
             return True
 
-        # Cache large content blocks
-        content_length = len(content) if isinstance(content, str) else 0
-        # Rough estimate: ~4 chars per token
-        estimated_tokens = content_length // 4
+        # Cache large content blocks. A rough estimate is enough for a threshold
+        # and keeps the tokenizer off the request path.
+        text = content if isinstance(content, str) else ""
+        estimated_tokens = estimate_tokens(text)
 
         # For Gemini, must meet minimum token threshold (4096)
         if provider == "google" and estimated_tokens < self._cache_large_content_threshold:
@@ -545,14 +594,14 @@ class RequestBuilder:
             content: String or list of content parts
 
         Returns:
-            Estimated token count (rough: ~4 chars per token)
+            Estimated token count (see ``estimate_tokens``; never runs the tokenizer)
         """
         if isinstance(content, str):
-            return len(content) // 4
+            return estimate_tokens(content)
         if isinstance(content, list):
-            total = 0
-            for part in content:
-                if isinstance(part, dict) and isinstance(part.get("text"), str):
-                    total += len(part["text"]) // 4
-            return total
+            return sum(
+                estimate_tokens(part["text"])
+                for part in content
+                if isinstance(part, dict) and isinstance(part.get("text"), str)
+            )
         return 0
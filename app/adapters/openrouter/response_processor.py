@@ -237,8 +237,10 @@ class ResponseProcessor:
         """Extract cache metrics from OpenRouter response.
 
         OpenRouter includes cache metrics in the usage object:
-        - cache_read_input_tokens: Tokens read from cache (cache hit)
-        - cache_creation_input_tokens: Tokens added to cache (cache miss/write)
+        - prompt_tokens_details.cached_tokens / cache_read_input_tokens:
+          Tokens read from cache (cache hit)
+        - prompt_tokens_details.cache_write_tokens / cache_creation_input_tokens:
+          Tokens added to cache (cache miss/write)
         - cache_discount: Cost discount from caching (if available)
 
         Args:
@@ -255,13 +257,25 @@ class ResponseProcessor:
         cache_creation = 0
         cache_discount = None
 
+        # OpenRouter normalizes provider accounting into prompt_tokens_details;
+        # the Anthropic-style top-level fields are kept as a fallback.
+        details = usage.get("prompt_tokens_details")
+        if not isinstance(details, dict):
+            details = {}
+
         try:
-            cache_read = int(usage.get("cache_read_input_tokens", 0) or 0)
+            cache_read = int(
+                details.get("cached_tokens") or usage.get("cache_read_input_tokens", 0) or 0
+            )
         except (TypeError, ValueError):
             cache_read = 0
 
         try:
-            cache_creation = int(usage.get("cache_creation_input_tokens", 0) or 0)
+            cache_creation = int(
+                details.get("cache_write_tokens")
+                or usage.get("cache_creation_input_tokens", 0)
+                or 0
+            )
         except (TypeError, ValueError):
             cache_creation = 0
 
@@ -1,10 +1,27 @@
-"""RSS feed polling service."""
+"""RSS feed polling service.
+
+Feeds are fetched concurrently through one pooled, SSRF-safe async client,
+capped globally and per host so a slow or rate-limiting host only delays its
+own feeds. Parsing runs off the event loop. Fetched feeds are handed to a
+single persister that writes whatever has finished so far in batches: one
+statement each for source upserts, new feed items and mirrored signal items,
+with the per-feed path as the fallback when a batch statement fails.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+import httpx
 
-from app.adapters.rss.feed_fetcher import fetch_feed
+from app.adapters.rss.feed_fetcher import fetch_feed_async
 from app.adapters.rss.signal_ingester import RssSignalIngester
 from app.adapters.rss.substack import is_substack_url
 from app.core.logging_utils import get_logger
@@ -14,14 +31,22 @@ from app.infrastructure.persistence.repositories.rss_feed_repository import (
 from app.infrastructure.persistence.repositories.signal_source_repository import (
     SignalSourceRepositoryAdapter,
 )
+from app.observability.metrics import record_rss_feed_poll_latency
+from app.security.ssrf import make_safe_async_client
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from app.application.ports.source_ingestors import SourceFetchResult
     from app.db.session import Database
 
 logger = get_logger(__name__)
 
 MAX_FETCH_ERRORS = 10
 SIGNAL_SOURCE_BASE_BACKOFF_SECONDS = 300
+DEFAULT_POLL_CONCURRENCY = 16
+DEFAULT_PER_HOST_CONCURRENCY = 2
+PERSIST_BATCH_SIZE = 50
 
 
 def _feed_item_payload(item_result: Any) -> dict[str, Any]:
@@ -35,6 +60,19 @@ def _feed_item_payload(item_result: Any) -> dict[str, Any]:
     }
 
 
+def _signal_item_payload(item: dict[str, Any], item_result: Any) -> dict[str, Any]:
+    return {
+        "external_id": item_result.external_id,
+        "canonical_url": item_result.canonical_url,
+        "title": item_result.title,
+        "content_text": item_result.content_text,
+        "author": item_result.author,
+        "published_at": item_result.published_at,
+        "engagement": item_result.engagement,
+        "metadata": {**item_result.metadata, "legacy_rss_item_id": item["id"]},
+    }
+
+
 async def _create_feed_items(
     repo: RSSFeedRepositoryAdapter,
     *,
@@ -88,19 +126,7 @@ async def _mirror_signal_feed_items(
     source_id: int,
     feed_items: list[tuple[dict[str, Any], Any]],
 ) -> None:
-    payloads = [
-        {
-            "external_id": item_result.external_id,
-            "canonical_url": item_result.canonical_url,
-            "title": item_result.title,
-            "content_text": item_result.content_text,
-            "author": item_result.author,
-            "published_at": item_result.published_at,
-            "engagement": item_result.engagement,
-            "metadata": {**item_result.metadata, "legacy_rss_item_id": item["id"]},
-        }
-        for item, item_result in feed_items
-    ]
+    payloads = [_signal_item_payload(item, item_result) for item, item_result in feed_items]
     try:
         await signal_repo.async_upsert_feed_items(source_id=source_id, items=payloads)
     except Exception:
@@ -178,105 +204,365 @@ async def _sync_signal_subscriptions(
                 )
 
 
-async def poll_all_feeds(db: Database) -> dict:
-    """Poll all active RSS feeds for new items."""
-    repo = RSSFeedRepositoryAdapter(db)
-    signal_repo = SignalSourceRepositoryAdapter(db)
-    feeds = await repo.async_list_active_feeds()
+@dataclass
+class _FeedPoll:
+    """One feed's progress through a poll cycle."""
+
+    feed: dict[str, Any]
+    signal_source: dict[str, Any] | None = None
+    result: SourceFetchResult | None = None
+    error: Exception | None = None
+    started_at: float = 0.0
+    fetch_ms: int = 0
+
+    @property
+    def feed_id(self) -> int:
+        return int(self.feed["id"])
+
+
+def _initial_source_payload(feed: dict[str, Any]) -> dict[str, Any]:
+    feed_url = str(feed.get("url") or "")
+    return {
+        "kind": "substack" if is_substack_url(feed_url) else "rss",
+        "external_id": feed_url,
+        "url": feed.get("url"),
+        "title": feed.get("title"),
+        "description": feed.get("description"),
+        "site_url": feed.get("site_url"),
+        "metadata": {
+            "etag": feed.get("etag"),
+            "last_modified": feed.get("last_modified"),
+            "legacy_rss_feed_id": feed.get("id"),
+        },
+    }
+
+
+def _result_source_payload(result: SourceFetchResult) -> dict[str, Any]:
+    return {
+        "kind": result.source.kind,
+        "external_id": result.source.external_id,
+        "url": result.source.url,
+        "title": result.source.title,
+        "description": result.source.description,
+        "site_url": result.source.site_url,
+        "metadata": result.source.metadata,
+    }
 
-    new_item_ids: list[int] = []
-    stats: dict = {"polled": 0, "new_items": 0, "errors": 0, "skipped": 0}
 
-    for feed in feeds:
-        signal_source: dict | None = None
+async def _upsert_sources(
+    signal_repo: SignalSourceRepositoryAdapter,
+    payloads: list[dict[str, Any]],
+) -> list[dict[str, Any] | Exception]:
+    """Upsert sources in one statement, falling back to one upsert per source."""
+    bulk_upsert = getattr(signal_repo, "async_upsert_sources", None)
+    if bulk_upsert is not None and payloads:
         try:
-            feed_url = str(feed.get("url") or "")
-            signal_source = await signal_repo.async_upsert_source(
-                kind="substack" if is_substack_url(feed_url) else "rss",
-                external_id=feed_url,
-                url=feed.get("url"),
-                title=feed.get("title"),
-                description=feed.get("description"),
-                site_url=feed.get("site_url"),
-                metadata={
-                    "etag": feed.get("etag"),
-                    "last_modified": feed.get("last_modified"),
-                    "legacy_rss_feed_id": feed.get("id"),
-                },
+            return list(await bulk_upsert(payloads))
+        except Exception:
+            logger.warning(
+                "rss_bulk_source_upsert_failed",
+                extra={"source_count": len(payloads)},
+                exc_info=True,
             )
-            ingester = RssSignalIngester(feed, fetcher=fetch_feed)
-            result = await ingester.fetch()
-            signal_source = await signal_repo.async_upsert_source(
-                kind=result.source.kind,
-                external_id=result.source.external_id,
-                url=result.source.url,
-                title=result.source.title,
-                description=result.source.description,
-                site_url=result.source.site_url,
-                metadata=result.source.metadata,
+
+    sources: list[dict[str, Any] | Exception] = []
+    for payload in payloads:
+        try:
+            sources.append(await signal_repo.async_upsert_source(**payload))
+        except Exception as exc:
+            sources.append(exc)
+    return sources
+
+
+async def _create_feed_items_batch(
+    repo: RSSFeedRepositoryAdapter,
+    item_results_by_feed: dict[int, list[Any]],
+) -> dict[int, list[tuple[dict[str, Any], Any]]]:
+    """Insert new items for many feeds at once; per-feed inserts on failure."""
+    bulk_create = getattr(repo, "async_create_feed_items_batch", None)
+    if bulk_create is not None and item_results_by_feed:
+        try:
+            created = await bulk_create(
+                {
+                    feed_id: [_feed_item_payload(item_result) for item_result in item_results]
+                    for feed_id, item_results in item_results_by_feed.items()
+                }
             )
+        except Exception:
+            logger.warning(
+                "rss_batch_item_create_failed",
+                extra={"feed_count": len(item_results_by_feed)},
+                exc_info=True,
+            )
+        else:
+            paired: dict[int, list[tuple[dict[str, Any], Any]]] = {}
+            for feed_id, item_results in item_results_by_feed.items():
+                by_guid: dict[str, Any] = {}
+                for item_result in item_results:
+                    by_guid.setdefault(item_result.external_id, item_result)
+                paired[feed_id] = [
+                    (item, by_guid[str(item["guid"])])
+                    for item in created.get(feed_id, [])
+                    if str(item["guid"]) in by_guid
+                ]
+            return paired
+
+    return {
+        feed_id: await _create_feed_items(repo, feed_id=feed_id, item_results=item_results)
+        for feed_id, item_results in item_results_by_feed.items()
+    }
+
+
+async def _mirror_signal_feed_items_batch(
+    signal_repo: SignalSourceRepositoryAdapter,
+    feed_items_by_source: dict[int, list[tuple[dict[str, Any], Any]]],
+) -> None:
+    """Mirror new items for many sources at once; per-source upserts on failure."""
+    feed_items_by_source = {
+        source_id: feed_items
+        for source_id, feed_items in feed_items_by_source.items()
+        if feed_items
+    }
+    if not feed_items_by_source:
+        return
 
-            if result.not_modified:
+    bulk_upsert = getattr(signal_repo, "async_upsert_feed_items_batch", None)
+    if bulk_upsert is not None:
+        try:
+            await bulk_upsert(
+                {
+                    source_id: [
+                        _signal_item_payload(item, item_result) for item, item_result in feed_items
+                    ]
+                    for source_id, feed_items in feed_items_by_source.items()
+                }
+            )
+            return
+        except Exception:
+            logger.warning(
+                "rss_batch_signal_item_upsert_failed",
+                extra={"source_count": len(feed_items_by_source)},
+                exc_info=True,
+            )
+
+    for source_id, feed_items in feed_items_by_source.items():
+        await _mirror_signal_feed_items(signal_repo, source_id=source_id, feed_items=feed_items)
+
+
+async def _record_poll_error(
+    repo: RSSFeedRepositoryAdapter,
+    signal_repo: SignalSourceRepositoryAdapter,
+    poll: _FeedPoll,
+    exc: Exception,
+    stats: dict[str, Any],
+) -> None:
+    stats["errors"] += 1
+    await repo.async_record_feed_fetch_error(
+        feed_id=poll.feed_id,
+        error=str(exc),
+        max_fetch_errors=MAX_FETCH_ERRORS,
+    )
+    if poll.signal_source is not None:
+        await signal_repo.async_record_source_fetch_error(
+            source_id=int(poll.signal_source["id"]),
+            error=str(exc),
+            max_errors=MAX_FETCH_ERRORS,
+            base_backoff_seconds=SIGNAL_SOURCE_BASE_BACKOFF_SECONDS,
+        )
+    logger.warning(
+        "rss_feed_poll_error",
+        extra={
+            "feed_id": poll.feed.get("id"),
+            "url": poll.feed.get("url"),
+            "error": str(exc)[:200],
+        },
+    )
+    _observe_poll(poll, "error")
+
+
+def _observe_poll(poll: _FeedPoll, outcome: str) -> None:
+    latency_seconds = time.perf_counter() - poll.started_at if poll.started_at else 0.0
+    record_rss_feed_poll_latency(outcome=outcome, latency_seconds=latency_seconds)
+    logger.debug(
+        "rss_feed_polled",
+        extra={
+            "feed_id": poll.feed.get("id"),
+            "outcome": outcome,
+            "fetch_ms": poll.fetch_ms,
+            "latency_ms": int(latency_seconds * 1000),
+        },
+    )
+
+
+async def _persist_batch(
+    repo: RSSFeedRepositoryAdapter,
+    signal_repo: SignalSourceRepositoryAdapter,
+    polls: list[_FeedPoll],
+    stats: dict[str, Any],
+    new_item_ids: list[int],
+) -> None:
+    fetched: list[_FeedPoll] = []
+    for poll in polls:
+        if poll.error is not None:
+            await _record_poll_error(repo, signal_repo, poll, poll.error, stats)
+        elif poll.result is not None:
+            fetched.append(poll)
+
+    sources = await _upsert_sources(
+        signal_repo, [_result_source_payload(poll.result) for poll in fetched if poll.result]
+    )
+    updated: list[_FeedPoll] = []
+    for poll, source in zip(fetched, sources, strict=True):
+        if isinstance(source, Exception):
+            await _record_poll_error(repo, signal_repo, poll, source, stats)
+            continue
+        poll.signal_source = source
+        if poll.result is not None and poll.result.not_modified:
+            try:
                 stats["skipped"] += 1
-                await signal_repo.async_record_source_fetch_success(int(signal_source["id"]))
-                continue
+                await signal_repo.async_record_source_fetch_success(int(source["id"]))
+                _observe_poll(poll, "not_modified")
+            except Exception as exc:
+                await _record_poll_error(repo, signal_repo, poll, exc, stats)
+            continue
+        updated.append(poll)
 
-            # Store new items
-            created_items = await _create_feed_items(
-                repo,
-                feed_id=int(feed["id"]),
-                item_results=list(result.items),
+    created_by_feed = await _create_feed_items_batch(
+        repo,
+        {poll.feed_id: list(poll.result.items) for poll in updated if poll.result is not None},
+    )
+    feed_items_by_source: dict[int, list[tuple[dict[str, Any], Any]]] = defaultdict(list)
+    for poll in updated:
+        if poll.signal_source is not None:
+            feed_items_by_source[int(poll.signal_source["id"])].extend(
+                created_by_feed.get(poll.feed_id, [])
             )
+    await _mirror_signal_feed_items_batch(signal_repo, dict(feed_items_by_source))
+
+    for poll in updated:
+        if poll.result is None or poll.signal_source is None:
+            continue
+        result = poll.result
+        source_id = int(poll.signal_source["id"])
+        created_items = created_by_feed.get(poll.feed_id, [])
+        try:
             created_item_ids = [int(item["id"]) for item, _item_result in created_items]
             new_item_ids.extend(created_item_ids)
-            await _mirror_signal_feed_items(
-                signal_repo,
-                source_id=int(signal_source["id"]),
-                feed_items=created_items,
-            )
             await _sync_signal_subscriptions(
                 repo,
                 signal_repo,
-                source_id=int(signal_source["id"]),
+                source_id=source_id,
                 item_ids=created_item_ids,
             )
-
-            # Update feed metadata
             await repo.async_update_feed_fetch_success(
-                feed_id=int(feed["id"]),
+                feed_id=poll.feed_id,
                 title=result.source.title,
                 description=result.source.description,
                 site_url=result.source.site_url,
                 etag=result.source.metadata.get("etag"),
                 last_modified=result.source.metadata.get("last_modified"),
             )
-            await signal_repo.async_record_source_fetch_success(int(signal_source["id"]))
-
+            await signal_repo.async_record_source_fetch_success(source_id)
             stats["polled"] += 1
             stats["new_items"] += len(created_items)
-
+            _observe_poll(poll, "updated")
         except Exception as exc:
-            stats["errors"] += 1
-            await repo.async_record_feed_fetch_error(
-                feed_id=int(feed["id"]),
-                error=str(exc),
-                max_fetch_errors=MAX_FETCH_ERRORS,
-            )
-            if signal_source is not None:
-                await signal_repo.async_record_source_fetch_error(
-                    source_id=int(signal_source["id"]),
-                    error=str(exc),
-                    max_errors=MAX_FETCH_ERRORS,
-                    base_backoff_seconds=SIGNAL_SOURCE_BASE_BACKOFF_SECONDS,
-                )
-            logger.warning(
-                "rss_feed_poll_error",
-                extra={
-                    "feed_id": feed.get("id"),
-                    "url": feed.get("url"),
-                    "error": str(exc)[:200],
-                },
-            )
+            await _record_poll_error(repo, signal_repo, poll, exc, stats)
+
+
+async def poll_all_feeds(
+    db: Database,
+    *,
+    concurrency: int = DEFAULT_POLL_CONCURRENCY,
+    per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+    parse_workers: int = 0,
+    batch_size: int = PERSIST_BATCH_SIZE,
+    client: httpx.AsyncClient | None = None,
+) -> dict:
+    """Poll all active RSS feeds for new items.
+
+    Args:
+        db: Database used by the feed and signal-source repositories.
+        concurrency: Feeds fetched at once across all hosts.
+        per_host_concurrency: Feeds fetched at once from a single host.
+        parse_workers: Size of a process pool for feed parsing; ``0`` parses
+            on the event loop's default thread pool.
+        batch_size: Most fetched feeds persisted per batch.
+        client: Async HTTP client to reuse; a pooled SSRF-safe client is
+            created for the cycle when omitted.
+    """
+    repo = RSSFeedRepositoryAdapter(db)
+    signal_repo = SignalSourceRepositoryAdapter(db)
+    feeds = await repo.async_list_active_feeds()
+
+    new_item_ids: list[int] = []
+    stats: dict = {"polled": 0, "new_items": 0, "errors": 0, "skipped": 0}
+
+    polls = [_FeedPoll(feed=feed) for feed in feeds]
+    ready: list[_FeedPoll] = []
+    for start in range(0, len(polls), batch_size):
+        chunk = polls[start : start + batch_size]
+        sources = await _upsert_sources(
+            signal_repo, [_initial_source_payload(poll.feed) for poll in chunk]
+        )
+        for poll, source in zip(chunk, sources, strict=True):
+            if isinstance(source, Exception):
+                await _record_poll_error(repo, signal_repo, poll, source, stats)
+            else:
+                poll.signal_source = source
+                ready.append(poll)
+
+    owns_client = client is None
+    if client is None:
+        client = make_safe_async_client(
+            follow_redirects=False,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+    parse_executor: Executor | None = (
+        ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+    )
+    fetcher = partial(fetch_feed_async, client=client, parse_executor=parse_executor)
+    global_slots = asyncio.Semaphore(concurrency)
+    host_slots: dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(per_host_concurrency)
+    )
+    done: asyncio.Queue[_FeedPoll] = asyncio.Queue()
+
+    async def fetch(poll: _FeedPoll) -> None:
+        host = urlparse(str(poll.feed.get("url") or "")).hostname or ""
+        # Take the host slot first so feeds queued behind a slow host do not
+        # hold global slots other hosts could use.
+        async with host_slots[host], global_slots:
+            poll.started_at = time.perf_counter()
+            try:
+                poll.result = await RssSignalIngester(poll.feed, fetcher=fetcher).fetch()
+            except Exception as exc:
+                poll.error = exc
+            poll.fetch_ms = int((time.perf_counter() - poll.started_at) * 1000)
+        done.put_nowait(poll)
+
+    async def persist() -> None:
+        remaining = len(ready)
+        while remaining:
+            batch = [await done.get()]
+            while len(batch) < batch_size and not done.empty():
+                batch.append(done.get_nowait())
+            remaining -= len(batch)
+            await _persist_batch(repo, signal_repo, batch, stats, new_item_ids)
+
+    tasks = [asyncio.create_task(persist())]
+    tasks.extend(asyncio.create_task(fetch(poll)) for poll in ready)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # If persisting fails, stop the fetches before the client they use closes.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if parse_executor is not None:
+            parse_executor.shutdown(wait=False, cancel_futures=True)
+        if owns_client:
+            await client.aclose()
 
     stats["new_item_ids"] = new_item_ids
     logger.info("rss_poll_complete", extra={k: v for k, v in stats.items() if k != "new_item_ids"})
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import inspect
 from typing import Any
 
 from app.adapters.rss.feed_fetcher import FeedResult, fetch_feed
@@ -30,6 +31,8 @@ class RssSignalIngester:
             etag=self.feed.get("etag"),
             last_modified=self.feed.get("last_modified"),
         )
+        if inspect.isawaitable(result):
+            result = await result
         return self.normalize_result(result)
 
     def normalize_result(self, result: FeedResult) -> SourceFetchResult:
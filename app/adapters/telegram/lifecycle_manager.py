@@ -51,6 +51,7 @@ class TelegramLifecycleManager:
         await self._validate_digest_session()
         await self._warm_adaptive_timeout_cache()
         await self._clear_startup_cache()
+        await self._resume_youtube_archives()
 
     async def on_shutdown(self) -> None:
         await self._cancel_task(self._backup_task)
@@ -92,6 +93,17 @@ class TelegramLifecycleManager:
             raise_if_cancelled(exc)
             logger.warning("startup_cache_clear_failed", extra={"error": str(exc)})
 
+    async def _resume_youtube_archives(self) -> None:
+        url_processor = getattr(self._bot, "url_processor", None)
+        if url_processor is None:
+            return
+        try:
+            resumed = await url_processor.content_extractor.resume_youtube_archives()
+            logger.info("youtube_archives_resumed_on_startup", extra={"count": resumed})
+        except Exception as exc:
+            raise_if_cancelled(exc)
+            logger.warning("youtube_archive_resume_failed", extra={"error": str(exc)})
+
     async def _cancel_task(self, task: asyncio.Task[None] | None) -> None:
         if task is None:
             return
@@ -15,7 +15,7 @@ from app.core.logging_utils import get_logger
 from app.observability.metrics import record_draft_stream_event
 
 if TYPE_CHECKING:
-    from app.adapters.content.streaming import StreamHub
+    from app.adapters.content.streaming import StreamHub, SummarySectionSnapshot
     from app.adapters.external.formatting.protocols import (
         ResponseFormatterFacade as ResponseFormatter,
     )
@@ -43,7 +43,13 @@ class SummaryDraftStreamCoordinator:
         return self._section_emit_count
 
     async def on_delta(self, delta: str) -> None:
-        snapshots = self._assembler.add_delta(delta)
+        await self._publish(self._assembler.add_delta(delta))
+
+    async def on_draft(self, draft: dict[str, Any]) -> None:
+        """Show a complete interim summary, e.g. chunk summaries merged so far."""
+        await self._publish(self._assembler.replace_draft(json.dumps(draft, ensure_ascii=False)))
+
+    async def _publish(self, snapshots: list[SummarySectionSnapshot]) -> None:
         if not snapshots:
             return
 
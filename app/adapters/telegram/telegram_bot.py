@@ -162,6 +162,15 @@ class TelegramBot:
                 raise_if_cancelled(e)
                 logger.warning("shutdown_scraper_chain_close_failed", exc_info=True)
 
+        # 1b. Stop the PDF worker pool shared by attachments and scraped PDFs
+        try:
+            from app.adapters.attachment.pdf_engine import shutdown_pool
+
+            shutdown_pool()
+        except Exception as e:
+            raise_if_cancelled(e)
+            logger.warning("shutdown_pdf_pool_failed", exc_info=True)
+
         # 2. Close LLM client
         llm_client = getattr(_core, "llm_client", None)
         if llm_client is not None and hasattr(llm_client, "aclose"):
@@ -28,7 +28,7 @@ from app.adapters.telegram.batch_sender_utils import (
 )
 from app.core.async_utils import raise_if_cancelled
 from app.core.logging_utils import generate_correlation_id
-from app.core.url_utils import compute_dedupe_hash, normalize_url
+from app.core.url_utils import compute_dedupe_hash, dns_cache_scope, normalize_url
 from app.db.user_interactions import async_safe_update_user_interaction
 from app.domain.models.request import RequestStatus
 from app.utils.progress_tracker import ProgressTracker
@@ -97,6 +97,8 @@ class URLBatchProcessor:
 
     _DOMAIN_FAILFAST_THRESHOLD = 2
     _EDIT_CIRCUIT_BREAKER_THRESHOLD = 3
+    # Recent pending/processing/error rows younger than this block re-registration.
+    _IN_FLIGHT_GRACE_SEC = 60
 
     def __init__(
         self,
@@ -189,6 +191,125 @@ class URLBatchProcessor:
         return result
 
     async def _pre_register_urls(self, state: _BatchRunState) -> None:
+        # URL validation resolves each host; batches usually share a few hosts.
+        with dns_cache_scope():
+            if self._supports_bulk_pre_registration():
+                try:
+                    await self._pre_register_urls_bulk(state)
+                    return
+                except Exception as exc:
+                    raise_if_cancelled(exc)
+                    logger.warning(
+                        "batch_url_bulk_pre_registration_failed",
+                        extra={"error": str(exc), "uid": state.request.uid},
+                    )
+            await self._pre_register_urls_sequential(state)
+
+    def _supports_bulk_pre_registration(self) -> bool:
+        return all(
+            callable(getattr(repo, name, None))
+            for repo, name in (
+                (self._request_repo, "async_get_requests_by_dedupe_hashes"),
+                (self._request_repo, "async_find_recent_requests_by_dedupe_hashes"),
+                (self._request_repo, "async_create_minimal_requests"),
+                (self._summary_repo, "async_get_summaries_by_request_ids"),
+            )
+        )
+
+    async def _pre_register_urls_bulk(self, state: _BatchRunState) -> None:
+        """Resolve cache hits, in-flight duplicates and new requests in a few bulk queries.
+
+        All lookups and the insert run before ``state`` is touched, so a failure
+        leaves it clean for the per-URL fallback.
+        """
+        uid = state.request.uid
+        keys: dict[str, tuple[str, str]] = {}
+        for url in state.request.urls:
+            try:
+                keys[url] = (normalize_url(url), compute_dedupe_hash(url))
+            except Exception as exc:
+                logger.warning(
+                    "batch_url_pre_registration_failed",
+                    extra={"url": url, "error": str(exc), "uid": uid},
+                )
+        hashes = list(dict.fromkeys(dedupe_hash for _, dedupe_hash in keys.values()))
+        if not hashes:
+            return
+
+        existing = await _await_if_needed(
+            self._request_repo.async_get_requests_by_dedupe_hashes(hashes)
+        )
+        completed = {
+            dedupe_hash: row["id"]
+            for dedupe_hash, row in existing.items()
+            if row.get("status") == RequestStatus.COMPLETED
+        }
+        summaries: dict[int, dict[str, Any]] = {}
+        if completed:
+            summaries = await _await_if_needed(
+                self._summary_repo.async_get_summaries_by_request_ids(list(completed.values()))
+            )
+        cached = {
+            dedupe_hash: request_id
+            for dedupe_hash, request_id in completed.items()
+            if summaries.get(request_id)
+        }
+
+        uncached = [dedupe_hash for dedupe_hash in hashes if dedupe_hash not in cached]
+        in_flight: dict[str, dict[str, Any]] = {}
+        if uncached:
+            in_flight = await _await_if_needed(
+                self._request_repo.async_find_recent_requests_by_dedupe_hashes(
+                    uncached, max_age_sec=self._IN_FLIGHT_GRACE_SEC
+                )
+            )
+
+        chat_id = getattr(state.request.message.chat, "id", None)
+        to_create: dict[str, tuple[str, str]] = {}
+        for url, (normalized, dedupe_hash) in keys.items():
+            if dedupe_hash not in cached and dedupe_hash not in in_flight:
+                to_create.setdefault(dedupe_hash, (url, normalized))
+        rows = [
+            {
+                "type_": "url",
+                "status": "pending",
+                "correlation_id": generate_correlation_id(),
+                "chat_id": chat_id,
+                "user_id": uid,
+                "input_url": url,
+                "normalized_url": normalized,
+                "dedupe_hash": dedupe_hash,
+            }
+            for dedupe_hash, (url, normalized) in to_create.items()
+        ]
+        created: dict[str, tuple[int, bool]] = {}
+        if rows:
+            created = await _await_if_needed(self._request_repo.async_create_minimal_requests(rows))
+
+        registered: set[str] = set()
+        for url, (_, dedupe_hash) in keys.items():
+            if dedupe_hash in cached:
+                request_id = cached[dedupe_hash]
+                self._record_cached_summary(state, url, request_id, summaries[request_id])
+                continue
+            if dedupe_hash in in_flight:
+                self._log_in_flight_skip(state, url, in_flight[dedupe_hash])
+                continue
+            if dedupe_hash in registered:
+                # Another URL of this batch normalizes to the same request.
+                self._log_in_flight_skip(
+                    state, url, {"id": created[dedupe_hash][0], "status": "pending"}
+                )
+                continue
+            request_id, is_new = created[dedupe_hash]
+            registered.add(dedupe_hash)
+            state.url_to_request_id[url] = request_id
+            logger.debug(
+                "pre_registered_batch_url",
+                extra={"url": url, "request_id": request_id, "is_new": is_new, "uid": uid},
+            )
+
+    async def _pre_register_urls_sequential(self, state: _BatchRunState) -> None:
         chat_id = getattr(state.request.message.chat, "id", None)
         for url in state.request.urls:
             try:
@@ -199,35 +320,13 @@ class URLBatchProcessor:
 
                 # In-flight dedupe: skip URLs with a recent processing/pending/error row.
                 if hasattr(self._request_repo, "async_find_recent_request_by_dedupe"):
-                    grace_sec = 60
                     existing = await _await_if_needed(
                         self._request_repo.async_find_recent_request_by_dedupe(
-                            dedupe_hash, max_age_sec=grace_sec
+                            dedupe_hash, max_age_sec=self._IN_FLIGHT_GRACE_SEC
                         )
                     )
-                    if existing:
-                        existing_status = existing.get("status")
-                        existing_id = existing.get("id")
-                        if existing_status in ("processing", "pending"):
-                            logger.info(
-                                "batch_url_dedupe_skip_in_flight",
-                                extra={
-                                    "url": url,
-                                    "existing_request_id": existing_id,
-                                    "uid": state.request.uid,
-                                },
-                            )
-                            continue
-                        if existing_status == "error":
-                            logger.info(
-                                "batch_url_dedupe_skip_recent_failure",
-                                extra={
-                                    "url": url,
-                                    "existing_request_id": existing_id,
-                                    "uid": state.request.uid,
-                                },
-                            )
-                            continue
+                    if existing and self._log_in_flight_skip(state, url, existing):
+                        continue
 
                 request_id, is_new = await _await_if_needed(
                     self._request_repo.async_create_minimal_request(
@@ -257,6 +356,22 @@ class URLBatchProcessor:
                     extra={"url": url, "error": str(exc), "uid": state.request.uid},
                 )
 
+    @staticmethod
+    def _log_in_flight_skip(state: _BatchRunState, url: str, existing: dict[str, Any]) -> bool:
+        """Log why ``url`` is skipped; returns False if ``existing`` is not a reason to skip."""
+        existing_status = existing.get("status")
+        if existing_status in ("processing", "pending"):
+            event = "batch_url_dedupe_skip_in_flight"
+        elif existing_status == "error":
+            event = "batch_url_dedupe_skip_recent_failure"
+        else:
+            return False
+        logger.info(
+            event,
+            extra={"url": url, "existing_request_id": existing.get("id"), "uid": state.request.uid},
+        )
+        return True
+
     async def _load_cached_summary(
         self,
         state: _BatchRunState,
@@ -275,7 +390,16 @@ class URLBatchProcessor:
         )
         if not summary:
             return False
+        self._record_cached_summary(state, url, request_id, summary)
+        return True
 
+    def _record_cached_summary(
+        self,
+        state: _BatchRunState,
+        url: str,
+        request_id: int,
+        summary: dict[str, Any],
+    ) -> None:
         from app.adapters.content.url_processor import URLProcessingFlowResult
 
         payload = summary.get("json_payload")
@@ -302,7 +426,6 @@ class URLBatchProcessor:
                 "batch_url_cache_hit",
                 {"url": url, "request_id": request_id, "uid": state.request.uid},
             )
-        return True
 
     async def _ensure_initial_progress_message(self, state: _BatchRunState) -> None:
         if state.initial_message_id is not None or state.draft_enabled:
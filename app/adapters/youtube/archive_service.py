@@ -0,0 +1,278 @@
+"""Background archival downloads for YouTube platform extraction."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import yt_dlp
+
+from app.adapters.youtube.youtube_downloader_parts import yt_dlp_client as _yt_dlp_client
+from app.core.async_utils import raise_if_cancelled
+from app.core.logging_utils import get_logger
+from app.core.urls.youtube import extract_youtube_video_id
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from app.adapters.youtube.session_service import YouTubeDownloadSessionService
+
+logger = get_logger(__name__)
+
+ARCHIVE_QUEUED = "queued"
+ARCHIVE_DOWNLOADING = "downloading"
+ARCHIVE_COMPLETED = "completed"
+ARCHIVE_ERROR = "error"
+
+_WATCH_URL = "https://www.youtube.com/watch?v={video_id}"
+
+
+@dataclass(slots=True)
+class YouTubeArchiveProgress:
+    """Live progress of one archival download, fed by yt-dlp progress hooks."""
+
+    download_id: int
+    video_id: str
+    status: str = ARCHIVE_QUEUED
+    downloaded_bytes: int = 0
+    total_bytes: int | None = None
+    speed_bps: float | None = None
+    error: str | None = None
+    # Set from the event loop to stop the download thread at its next hook call.
+    cancelled: bool = False
+
+    @property
+    def fraction(self) -> float | None:
+        if not self.total_bytes:
+            return None
+        return min(1.0, self.downloaded_bytes / self.total_bytes)
+
+    def record(self, event: dict[str, Any]) -> None:
+        """yt-dlp progress hook; runs in the download thread."""
+        if self.cancelled:
+            raise yt_dlp.utils.DownloadCancelled("archive download cancelled")
+        if event.get("status") != "downloading":
+            return
+        self.downloaded_bytes = int(event.get("downloaded_bytes") or 0)
+        total = event.get("total_bytes") or event.get("total_bytes_estimate")
+        self.total_bytes = int(total) if total else None
+        self.speed_bps = event.get("speed")
+
+
+class YouTubeArchiveService:
+    """Download full videos for archival, off the summarization path.
+
+    Jobs run as tracked background tasks. A semaphore bounds how many downloads
+    run at once and yt-dlp's ``ratelimit`` caps the bandwidth of each one. The
+    ``archive_status`` column records queued/downloading/completed/error, and
+    :meth:`progress` exposes byte-level progress of in-flight jobs.
+
+    Jobs live only in this process: :meth:`aclose` cancels them and leaves their
+    rows queued/downloading, and :meth:`resume_interrupted` requeues such rows
+    on the next start.
+    """
+
+    def __init__(
+        self,
+        *,
+        cfg: Any,
+        audit_func: Any,
+        session_service: YouTubeDownloadSessionService,
+    ) -> None:
+        self._cfg = cfg
+        self._audit = audit_func
+        self._session_service = session_service
+        self._semaphore = asyncio.Semaphore(max(1, int(cfg.youtube.archive_max_concurrent)))
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._progress: dict[int, YouTubeArchiveProgress] = {}
+
+    def progress(self, download_id: int) -> YouTubeArchiveProgress | None:
+        return self._progress.get(download_id)
+
+    def schedule(
+        self,
+        *,
+        url: str,
+        video_id: str,
+        req_id: int,
+        download_id: int,
+        correlation_id: str | None,
+    ) -> asyncio.Task[None] | None:
+        """Queue an archival download; the caller's row must already be ``queued``."""
+        state = YouTubeArchiveProgress(download_id=download_id, video_id=video_id)
+        try:
+            task = asyncio.create_task(
+                self._run(state=state, url=url, req_id=req_id, correlation_id=correlation_id)
+            )
+        except RuntimeError as exc:
+            logger.error(
+                "youtube_archive_schedule_failed",
+                extra={"video_id": video_id, "error": str(exc), "cid": correlation_id},
+            )
+            return None
+        self._progress[download_id] = state
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def resume_interrupted(self) -> int:
+        """Requeue archive jobs a previous process left queued or downloading.
+
+        yt-dlp continues from the ``.part`` file an interrupted download left
+        behind. Returns the number of jobs scheduled.
+        """
+        rows = await self._session_service.video_repo.async_list_video_downloads_by_archive_status(
+            [ARCHIVE_QUEUED, ARCHIVE_DOWNLOADING]
+        )
+        scheduled = 0
+        for row in rows:
+            download_id = int(row["id"])
+            if download_id in self._progress:
+                continue
+            if row.get("archive_status") == ARCHIVE_DOWNLOADING:
+                await self._session_service.update_archive_state(
+                    download_id, archive_status=ARCHIVE_QUEUED
+                )
+            video_id = str(row["video_id"])
+            if self.schedule(
+                url=_WATCH_URL.format(video_id=video_id),
+                video_id=video_id,
+                req_id=int(row["request_id"]),
+                download_id=download_id,
+                correlation_id=None,
+            ):
+                scheduled += 1
+        return scheduled
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """Cancel in-flight jobs and wait for their download threads to stop."""
+        tasks = list(self._tasks)
+        if not tasks:
+            return
+        for task in tasks:
+            task.cancel()
+        _done, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            logger.warning("youtube_archive_shutdown_timeout", extra={"pending": len(pending)})
+
+    def build_ydl_opts(
+        self,
+        video_id: str,
+        output_path: Path,
+        *,
+        progress: YouTubeArchiveProgress | None = None,
+    ) -> dict[str, Any]:
+        ydl_opts = _yt_dlp_client.build_ydl_opts(
+            video_id=video_id,
+            output_path=output_path,
+            preferred_quality=self._cfg.youtube.preferred_quality,
+            subtitle_languages=self._cfg.youtube.subtitle_languages,
+            max_video_size_mb=self._cfg.youtube.max_video_size_mb,
+        )
+        if progress is not None:
+            rate_limit_kbps = int(self._cfg.youtube.archive_rate_limit_kbps)
+            if rate_limit_kbps > 0:
+                ydl_opts["ratelimit"] = rate_limit_kbps * 1024
+            ydl_opts["progress_hooks"] = [progress.record]
+        return ydl_opts
+
+    def download_video_sync(
+        self,
+        url: str,
+        ydl_opts: dict[str, Any],
+        correlation_id: str | None,
+    ) -> dict[str, Any]:
+        return _yt_dlp_client.download_video_sync(
+            url=url,
+            ydl_opts=ydl_opts,
+            subtitle_languages=self._cfg.youtube.subtitle_languages,
+            correlation_id=correlation_id,
+            extract_youtube_video_id=extract_youtube_video_id,
+            yt_dlp_module=yt_dlp,
+        )
+
+    async def _run(
+        self,
+        *,
+        state: YouTubeArchiveProgress,
+        url: str,
+        req_id: int,
+        correlation_id: str | None,
+    ) -> None:
+        download_id, video_id = state.download_id, state.video_id
+        output_dir = self._session_service.storage_path / datetime.now(UTC).strftime("%Y%m%d")
+        try:
+            async with self._semaphore:
+                await self._session_service.check_storage_limits()
+                state.status = ARCHIVE_DOWNLOADING
+                await self._session_service.update_archive_state(
+                    download_id, archive_status=ARCHIVE_DOWNLOADING
+                )
+                output_dir.mkdir(parents=True, exist_ok=True)
+                ydl_opts = self.build_ydl_opts(video_id, output_dir, progress=state)
+                video_metadata = await self._download(state, url, ydl_opts, correlation_id)
+                self._session_service.record_stored_files(video_metadata)
+            await self._session_service.update_archive_state(
+                download_id,
+                archive_status=ARCHIVE_COMPLETED,
+                video_metadata=video_metadata,
+            )
+            state.status = ARCHIVE_COMPLETED
+            self._audit(
+                "INFO",
+                "youtube_archive_complete",
+                {
+                    "video_id": video_id,
+                    "request_id": req_id,
+                    "download_id": download_id,
+                    "file_size_mb": (video_metadata.get("file_size") or 0) / (1024 * 1024),
+                    "cid": correlation_id,
+                },
+            )
+        except Exception as exc:
+            raise_if_cancelled(exc)
+            state.status = ARCHIVE_ERROR
+            state.error = str(exc)
+            logger.warning(
+                "youtube_archive_failed",
+                extra={"video_id": video_id, "error": str(exc), "cid": correlation_id},
+            )
+            self._session_service.cleanup_partial_download_files(
+                output_dir=output_dir,
+                video_id=video_id,
+                correlation_id=correlation_id,
+            )
+            try:
+                await self._session_service.update_archive_state(
+                    download_id, archive_status=ARCHIVE_ERROR, error_text=str(exc)
+                )
+            except Exception as persist_exc:
+                raise_if_cancelled(persist_exc)
+                logger.warning("youtube_archive_state_persist_failed", exc_info=True)
+        finally:
+            self._progress.pop(download_id, None)
+
+    async def _download(
+        self,
+        state: YouTubeArchiveProgress,
+        url: str,
+        ydl_opts: dict[str, Any],
+        correlation_id: str | None,
+    ) -> dict[str, Any]:
+        # The download thread cannot be interrupted from here. On timeout or
+        # cancellation the progress hook aborts it instead, and the thread is
+        # awaited so the semaphore and partial-file cleanup wait for it to stop.
+        download = asyncio.ensure_future(
+            asyncio.to_thread(self.download_video_sync, url, ydl_opts, correlation_id)
+        )
+        try:
+            async with asyncio.timeout(float(self._cfg.youtube.archive_timeout_sec)):
+                return await asyncio.shield(download)
+        except (TimeoutError, asyncio.CancelledError):
+            state.cancelled = True
+            with contextlib.suppress(Exception):
+                await download
+            raise
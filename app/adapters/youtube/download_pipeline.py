@@ -21,6 +21,11 @@ from app.adapters.video.source_extractor import (
     VideoSourceRequest,
     build_video_controls_from_config,
 )
+from app.adapters.youtube.archive_service import (
+    ARCHIVE_COMPLETED,
+    ARCHIVE_QUEUED,
+    YouTubeArchiveService,
+)
 from app.adapters.youtube.youtube_downloader_parts import (
     metadata as _metadata,
     transcript_api as _transcript_api,
@@ -47,9 +52,15 @@ _KNOWN_LANG_CODES = _vtt.KNOWN_LANG_CODES
 
 
 class YouTubeDownloadPipeline:
-    """Run transcript extraction, video download, VTT fallback, and persistence."""
+    """Run transcript extraction, VTT fallback, persistence, and archival scheduling.
+
+    With an API transcript the request completes after a metadata-only lookup and
+    the full video download is handed to :class:`YouTubeArchiveService`. Only the
+    VTT fallback downloads inline, because the subtitles are needed to summarize.
+    """
 
     _MAX_TRANSCRIPT_CHARS = 500_000
+    _METADATA_TIMEOUT_SEC = 60.0
 
     def __init__(
         self,
@@ -64,6 +75,19 @@ class YouTubeDownloadPipeline:
         self._feedback_service = feedback_service
         self._session_service = session_service
         self._video_source_extractor = MetadataDrivenVideoSourceExtractor()
+        self._archive_service = YouTubeArchiveService(
+            cfg=cfg,
+            audit_func=audit_func,
+            session_service=session_service,
+        )
+
+    async def resume_archives(self) -> int:
+        """Requeue archival downloads interrupted by a previous shutdown."""
+        return await self._archive_service.resume_interrupted()
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """Stop in-flight archival downloads."""
+        await self._archive_service.aclose(timeout=timeout)
 
     async def run(
         self,
@@ -90,23 +114,34 @@ class YouTubeDownloadPipeline:
                 video_id=video_id,
             )
 
-            output_dir = self._session_service.storage_path / datetime.now(UTC).strftime("%Y%m%d")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            ydl_opts = self._get_ydl_opts(video_id, output_dir)
-            async with asyncio.timeout(600.0):
-                video_metadata = await asyncio.to_thread(
-                    self._download_video_sync,
-                    request.url_text,
-                    ydl_opts,
-                    request.correlation_id,
+            if transcript_text:
+                # Summarization only needs the transcript and metadata; the full video
+                # download is archived in the background instead of blocking the reply.
+                video_metadata = await self._fetch_video_metadata(
+                    request.url_text, video_id, request.correlation_id
+                )
+                archive_status = ARCHIVE_QUEUED
+            else:
+                output_dir = self._session_service.storage_path / datetime.now(UTC).strftime(
+                    "%Y%m%d"
                 )
+                output_dir.mkdir(parents=True, exist_ok=True)
+                ydl_opts = self._get_ydl_opts(video_id, output_dir)
+                async with asyncio.timeout(600.0):
+                    video_metadata = await asyncio.to_thread(
+                        self._download_video_sync,
+                        request.url_text,
+                        ydl_opts,
+                        request.correlation_id,
+                    )
+                self._session_service.record_stored_files(video_metadata)
+                archive_status = ARCHIVE_COMPLETED
 
-            if feedback_state.updater is not None:
-                stage_duration = time.time() - feedback_state.stage_start
-                feedback_state.completed_stages.append(("Video downloaded", stage_duration))
-                feedback_state.stage_start = time.time()
+                if feedback_state.updater is not None:
+                    stage_duration = time.time() - feedback_state.stage_start
+                    feedback_state.completed_stages.append(("Video downloaded", stage_duration))
+                    feedback_state.stage_start = time.time()
 
-            if not transcript_text:
                 await self._feedback_service.mark_subtitle_fallback(
                     state=feedback_state,
                     request=request,
@@ -140,6 +175,7 @@ class YouTubeDownloadPipeline:
                 auto_generated=auto_generated,
                 transcript_source=transcript_source,
                 detected_lang=detected_lang,
+                archive_status=archive_status,
             )
             await self._feedback_service.finalize_success(
                 state=feedback_state,
@@ -154,10 +190,19 @@ class YouTubeDownloadPipeline:
                     "request_id": req_id,
                     "download_id": download_id,
                     "file_size_mb": video_metadata["file_size"] / (1024 * 1024),
+                    "archive_status": archive_status,
                     "cid": request.correlation_id,
                 },
             )
             download_succeeded = True
+            if archive_status == ARCHIVE_QUEUED:
+                self._archive_service.schedule(
+                    url=request.url_text,
+                    video_id=video_id,
+                    req_id=req_id,
+                    download_id=download_id,
+                    correlation_id=request.correlation_id,
+                )
             source_item = SourceItem.create(
                 kind=SourceKind.YOUTUBE_VIDEO,
                 original_value=request.url_text,
@@ -179,6 +224,7 @@ class YouTubeDownloadPipeline:
                     )
                 )
             thumbnail_file_path = str(video_metadata.get("thumbnail_file_path") or "").strip()
+            thumbnail_url = None if thumbnail_file_path else video_metadata.get("thumbnail_url")
             if thumbnail_file_path:
                 existing_media.append(
                     SourceMediaAsset(
@@ -202,6 +248,7 @@ class YouTubeDownloadPipeline:
                     detected_language=detected_lang,
                     duration_sec=float(video_metadata.get("duration") or 0) or None,
                     existing_media=tuple(existing_media),
+                    poster_image_urls=(thumbnail_url,) if thumbnail_url else (),
                     metadata=video_metadata,
                     controls=build_video_controls_from_config(self._cfg),
                 )
@@ -294,26 +341,54 @@ class YouTubeDownloadPipeline:
             )
         return "", ""
 
+    async def _fetch_video_metadata(
+        self,
+        url: str,
+        video_id: str,
+        correlation_id: str | None,
+    ) -> dict[str, Any]:
+        """Resolve metadata without downloading media; degrade to a stub on failure."""
+        ydl_opts = self._get_ydl_opts(video_id, self._session_service.storage_path)
+        try:
+            async with asyncio.timeout(self._METADATA_TIMEOUT_SEC):
+                return await asyncio.to_thread(
+                    self._fetch_video_info_sync, url, ydl_opts, correlation_id
+                )
+        except Exception as exc:
+            raise_if_cancelled(exc)
+            logger.warning(
+                "youtube_metadata_fetch_failed",
+                extra={"video_id": video_id, "error": str(exc), "cid": correlation_id},
+            )
+            return {
+                "video_id": video_id,
+                "title": "Unknown",
+                "channel": "Unknown",
+                "resolution": "?p",
+                "file_size": 0,
+            }
+
     def _get_ydl_opts(self, video_id: str, output_path: Path) -> dict[str, Any]:
-        return _yt_dlp_client.build_ydl_opts(
-            video_id=video_id,
-            output_path=output_path,
-            preferred_quality=self._cfg.youtube.preferred_quality,
-            subtitle_languages=self._cfg.youtube.subtitle_languages,
-            max_video_size_mb=self._cfg.youtube.max_video_size_mb,
-        )
+        return self._archive_service.build_ydl_opts(video_id, output_path)
 
-    def _download_video_sync(
+    def _fetch_video_info_sync(
         self,
         url: str,
         ydl_opts: dict[str, Any],
         correlation_id: str | None,
     ) -> dict[str, Any]:
-        return _yt_dlp_client.download_video_sync(
+        return _yt_dlp_client.fetch_video_info_sync(
             url=url,
             ydl_opts=ydl_opts,
-            subtitle_languages=self._cfg.youtube.subtitle_languages,
             correlation_id=correlation_id,
             extract_youtube_video_id=extract_youtube_video_id,
             yt_dlp_module=yt_dlp,
         )
+
+    def _download_video_sync(
+        self,
+        url: str,
+        ydl_opts: dict[str, Any],
+        correlation_id: str | None,
+    ) -> dict[str, Any]:
+        return self._archive_service.download_video_sync(url, ydl_opts, correlation_id)
@@ -58,6 +58,14 @@ class YouTubePlatformExtractor(PlatformExtractor):
             session_service=self._session_service,
         )
 
+    async def resume_archives(self) -> int:
+        """Requeue archival downloads interrupted by a previous shutdown."""
+        return await self._pipeline.resume_archives()
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """Stop in-flight archival downloads."""
+        await self._pipeline.aclose(timeout=timeout)
+
     def supports(self, normalized_url: str) -> bool:
         return is_youtube_url(normalized_url)
 
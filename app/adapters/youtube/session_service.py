@@ -19,7 +19,11 @@ from app.adapters.video.source_extractor import (
     VideoSourceRequest,
     build_video_controls_from_config,
 )
-from app.adapters.youtube.youtube_downloader_parts import metadata as _metadata, storage as _storage
+from app.adapters.youtube.youtube_downloader_parts import (
+    metadata as _metadata,
+    storage as _storage,
+    storage_ledger as _storage_ledger,
+)
 from app.application.dto.aggregation import (
     SourceMediaAsset,
     SourceMediaKind,
@@ -81,18 +85,17 @@ class YouTubeDownloadSessionService:
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self._url_locks: dict[str, asyncio.Lock] = {}
         self._video_source_extractor = MetadataDrivenVideoSourceExtractor()
+        self._ledger = _storage_ledger.StorageLedger(self.storage_path)
+        self._reconcile_task: asyncio.Task[int] | None = None
 
     async def check_storage_limits(self) -> None:
+        await self._reconcile_storage_ledger_if_due()
         current_usage = self.calculate_storage_usage()
         max_storage = self._cfg.youtube.max_storage_gb * 1024 * 1024 * 1024
         threshold = max_storage * 0.9
 
         if current_usage > threshold and self._cfg.youtube.auto_cleanup_enabled:
-            reclaimed = await asyncio.to_thread(
-                self.auto_cleanup_storage,
-                current_usage,
-                max_storage,
-            )
+            reclaimed = await asyncio.to_thread(self.auto_cleanup_storage, max_storage)
             current_usage = self.calculate_storage_usage()
             logger.info(
                 "youtube_storage_cleanup_attempted",
@@ -109,17 +112,45 @@ class YouTubeDownloadSessionService:
             )
 
     def calculate_storage_usage(self) -> int:
-        return _storage.calculate_storage_usage(self.storage_path)
+        return self._ledger.total_bytes
 
-    def auto_cleanup_storage(self, current_usage: int, max_storage: int) -> int:
-        return _storage.auto_cleanup_storage(
-            self.storage_path,
-            current_usage=current_usage,
-            max_storage=max_storage,
+    def auto_cleanup_storage(self, max_storage: int) -> int:
+        return self._ledger.evict(
+            target_bytes=int(max_storage * 0.9),
             retention_days=self._cfg.youtube.cleanup_after_days,
             now=datetime.now(UTC),
         )
 
+    def record_stored_files(self, video_metadata: dict[str, Any]) -> None:
+        """Add the files of a finished download to the storage ledger."""
+        try:
+            self._ledger.record(self._media_file_fields(video_metadata).values())
+        except Exception as exc:
+            raise_if_cancelled(exc)
+            logger.warning("youtube_storage_ledger_record_failed", exc_info=True)
+
+    async def _reconcile_storage_ledger_if_due(self) -> None:
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            return
+        if self._ledger.last_reconciled_at() is None:
+            # First run against this storage directory: quota checks need a real total.
+            await asyncio.to_thread(self._ledger.reconcile)
+            return
+        interval_sec = float(self._cfg.youtube.storage_reconcile_interval_hours) * 3600
+        if not self._ledger.reconcile_due(interval_sec):
+            return
+        task = asyncio.create_task(asyncio.to_thread(self._ledger.reconcile))
+
+        def _log_err(t: asyncio.Task[int]) -> None:
+            if not t.cancelled() and t.exception():
+                logger.warning(
+                    "youtube_storage_ledger_reconcile_failed",
+                    extra={"error": str(t.exception())},
+                )
+
+        task.add_done_callback(_log_err)
+        self._reconcile_task = task
+
     async def prepare(
         self,
         *,
@@ -330,9 +361,12 @@ class YouTubeDownloadSessionService:
         auto_generated: bool,
         transcript_source: str,
         detected_lang: str,
+        archive_status: str | None = None,
     ) -> None:
         await self.video_repo.async_update_video_download(
             download_id,
+            **self._media_file_fields(video_metadata),
+            archive_status=archive_status,
             title=video_metadata.get("title"),
             channel=video_metadata.get("channel"),
             channel_id=video_metadata.get("channel_id"),
@@ -354,6 +388,40 @@ class YouTubeDownloadSessionService:
         await self.request_repo.async_update_request_status(req_id, RequestStatus.COMPLETED)
         await self.request_repo.async_update_request_lang_detected(req_id, detected_lang)
 
+    async def update_archive_state(
+        self,
+        download_id: int,
+        *,
+        archive_status: str,
+        error_text: str | None = None,
+        video_metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Record progress of the background archival download for a completed request."""
+        fields: dict[str, Any] = {"archive_status": archive_status}
+        if error_text is not None:
+            fields["archive_error_text"] = error_text
+        if video_metadata is not None:
+            fields.update(self._media_file_fields(video_metadata))
+            fields.update(
+                resolution=video_metadata.get("resolution"),
+                file_size_bytes=video_metadata.get("file_size"),
+                video_codec=video_metadata.get("vcodec"),
+                audio_codec=video_metadata.get("acodec"),
+                format_id=video_metadata.get("format_id"),
+                download_completed_at=datetime.now(UTC),
+            )
+        await self.video_repo.async_update_video_download(download_id, **fields)
+
+    @staticmethod
+    def _media_file_fields(video_metadata: dict[str, Any]) -> dict[str, Any]:
+        keys = (
+            "video_file_path",
+            "subtitle_file_path",
+            "metadata_file_path",
+            "thumbnail_file_path",
+        )
+        return {key: video_metadata[key] for key in keys if video_metadata.get(key)}
+
     async def handle_failure(
         self,
         *,
@@ -393,10 +461,13 @@ class YouTubeDownloadSessionService:
     ) -> None:
         try:
             if output_dir.exists():
+                partials = list(output_dir.glob(f"{video_id}_*"))
                 deleted_count = _storage.cleanup_partial_download_files(
                     output_dir=output_dir,
                     video_id=video_id,
+                    paths=partials,
                 )
+                self._ledger.forget(path for path in partials if not path.exists())
                 if deleted_count > 0:
                     logger.info(
                         "youtube_partial_download_cleaned",
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 from app.core.logging_utils import get_logger
@@ -14,78 +13,6 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-def calculate_storage_usage(
-    storage_path: Path, *, eligible_suffixes: set[str] = ELIGIBLE_SUFFIXES
-) -> int:
-    total = 0
-    try:
-        for file_path in storage_path.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in eligible_suffixes:
-                total += file_path.stat().st_size
-    except Exception as exc:
-        logger.warning("youtube_storage_calculation_failed", extra={"error": str(exc)})
-        return total
-    return total
-
-
-def auto_cleanup_storage(
-    storage_path: Path,
-    *,
-    current_usage: int,
-    max_storage: int,
-    retention_days: int,
-    eligible_suffixes: set[str] = ELIGIBLE_SUFFIXES,
-    now: datetime | None = None,
-) -> int:
-    """Remove old files until under budget or no candidates remain. Returns reclaimed bytes."""
-    reclaimed = 0
-    if now is None:
-        now = datetime.now(UTC)
-    cutoff = now - timedelta(days=retention_days)
-
-    candidates: list[tuple[Path, int, float]] = []
-    for file_path in storage_path.rglob("*"):
-        if not file_path.is_file():
-            continue
-        if file_path.suffix.lower() not in eligible_suffixes:
-            continue
-        try:
-            stat = file_path.stat()
-        except OSError:
-            logger.debug(
-                "youtube_cleanup_stat_failed", extra={"path": str(file_path)}, exc_info=True
-            )
-            continue
-        modified = datetime.fromtimestamp(stat.st_mtime, UTC)
-        if modified < cutoff:
-            candidates.append((file_path, stat.st_size, stat.st_mtime))
-
-    candidates.sort(key=lambda x: x[2])  # oldest first
-
-    for path, size, _ in candidates:
-        if current_usage - reclaimed <= max_storage * 0.9:
-            break
-        try:
-            path.unlink()
-            reclaimed += size
-        except OSError as exc:
-            logger.warning(
-                "youtube_cleanup_delete_failed",
-                extra={"path": str(path), "error": str(exc)},
-            )
-            continue
-
-    logger.info(
-        "youtube_cleanup_completed",
-        extra={
-            "candidates": len(candidates),
-            "reclaimed_bytes": reclaimed,
-            "retention_days": retention_days,
-        },
-    )
-    return reclaimed
-
-
 def cleanup_partial_download_files(
     *,
     output_dir: Path,
@@ -0,0 +1,247 @@
+"""Persistent index of archived YouTube files for O(1) quota checks.
+
+The ledger is a SQLite sidecar inside the storage directory with one row per
+tracked file. Its running byte total is cached in memory, and the ``mtime``
+index lets eviction read the oldest files first, touching only the rows it
+deletes. Downloads and deletes update the ledger as they happen; a periodic
+:meth:`StorageLedger.reconcile` rescans the tree to correct drift from files
+changed outside the bot.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.adapters.youtube.youtube_downloader_parts.storage import ELIGIBLE_SUFFIXES
+from app.core.logging_utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = get_logger(__name__)
+
+LEDGER_FILENAME = ".storage_ledger.sqlite3"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime REAL)",
+    "CREATE INDEX IF NOT EXISTS ix_files_mtime ON files (mtime)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL NOT NULL)",
+)
+
+
+class StorageLedger:
+    """Track size and mtime of every eligible file under ``storage_path``."""
+
+    def __init__(
+        self,
+        storage_path: Path,
+        *,
+        eligible_suffixes: set[str] = ELIGIBLE_SUFFIXES,
+    ) -> None:
+        self._storage_path = storage_path
+        self._eligible_suffixes = eligible_suffixes
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._total_bytes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self._storage_path / LEDGER_FILENAME,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()
+            self._total_bytes = int(row[0])
+            self._conn = conn
+        return self._conn
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._connection()
+            return self._total_bytes
+
+    def last_reconciled_at(self) -> float | None:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT value FROM meta WHERE key = 'reconciled_at'")
+                .fetchone()
+            )
+        return float(row[0]) if row else None
+
+    def reconcile_due(self, interval_sec: float) -> bool:
+        reconciled_at = self.last_reconciled_at()
+        return reconciled_at is None or time.time() - reconciled_at >= interval_sec
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def record(self, paths: Iterable[Path | str]) -> None:
+        """Add or refresh entries for files that were just written."""
+        rows: list[tuple[str, int, float]] = []
+        for raw in paths:
+            path = Path(raw)
+            if not self._is_eligible(path):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            rows.append((str(path), stat.st_size, stat.st_mtime))
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                for path_str, size, mtime in rows:
+                    previous = conn.execute(
+                        "SELECT size FROM files WHERE path = ?", (path_str,)
+                    ).fetchone()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO files (path, size, mtime) VALUES (?, ?, ?)",
+                        (path_str, size, mtime),
+                    )
+                    self._total_bytes += size - (previous[0] if previous else 0)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                self._reload_total(conn)
+                raise
+
+    def forget(self, paths: Iterable[Path | str]) -> None:
+        """Drop entries for files that were deleted."""
+        keys = [str(Path(raw)) for raw in paths]
+        if not keys:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                for key in keys:
+                    row = conn.execute("SELECT size FROM files WHERE path = ?", (key,)).fetchone()
+                    if row:
+                        conn.execute("DELETE FROM files WHERE path = ?", (key,))
+                        self._total_bytes -= row[0]
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                self._reload_total(conn)
+                raise
+
+    def evict(
+        self,
+        *,
+        target_bytes: int,
+        retention_days: int,
+        now: datetime | None = None,
+    ) -> int:
+        """Delete files older than the retention window, oldest first, until the
+        total drops to ``target_bytes``. Returns reclaimed bytes.
+        """
+        cutoff = ((now or datetime.now(UTC)) - timedelta(days=retention_days)).timestamp()
+        reclaimed = 0
+        removed = 0
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT path, size FROM files WHERE mtime < ? ORDER BY mtime", (cutoff,)
+            )
+            evicted: list[str] = []
+            for path_str, size in rows:
+                if self._total_bytes - reclaimed <= target_bytes:
+                    break
+                try:
+                    Path(path_str).unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    pass  # already gone; drop the stale entry
+                except OSError as exc:
+                    logger.warning(
+                        "youtube_cleanup_delete_failed",
+                        extra={"path": path_str, "error": str(exc)},
+                    )
+                    continue
+                evicted.append(path_str)
+                reclaimed += size
+            rows.close()
+            if evicted:
+                conn.execute("BEGIN")
+                conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in evicted])
+                conn.execute("COMMIT")
+                self._total_bytes -= reclaimed
+
+        logger.info(
+            "youtube_cleanup_completed",
+            extra={
+                "files_removed": removed,
+                "reclaimed_bytes": reclaimed,
+                "retention_days": retention_days,
+            },
+        )
+        return reclaimed
+
+    # ------------------------------------------------------------------
+    # Reconciliation
+    # ------------------------------------------------------------------
+
+    def reconcile(self) -> int:
+        """Rebuild the ledger from a full scan. Returns the corrected drift in bytes."""
+        rows: list[tuple[str, int, float]] = []
+        for file_path in self._storage_path.rglob("*"):
+            if not self._is_eligible(file_path):
+                continue
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            rows.append((str(file_path), stat.st_size, stat.st_mtime))
+        scanned_total = sum(size for _, size, _ in rows)
+
+        with self._lock:
+            conn = self._connection()
+            drift = scanned_total - self._total_bytes
+            conn.execute("BEGIN")
+            try:
+                conn.execute("DELETE FROM files")
+                conn.executemany("INSERT INTO files (path, size, mtime) VALUES (?, ?, ?)", rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('reconciled_at', ?)",
+                    (time.time(),),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._total_bytes = scanned_total
+
+        logger.info(
+            "youtube_storage_ledger_reconciled",
+            extra={"files": len(rows), "total_bytes": scanned_total, "drift_bytes": drift},
+        )
+        return drift
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _is_eligible(self, path: Path) -> bool:
+        return path.suffix.lower() in self._eligible_suffixes and path.is_file()
+
+    def _reload_total(self, conn: sqlite3.Connection) -> None:
+        row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()
+        self._total_bytes = int(row[0])
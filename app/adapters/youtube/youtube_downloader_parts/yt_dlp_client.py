@@ -128,28 +128,82 @@ def download_video_sync(
                 "ffmpeg may have failed to merge video/audio streams."
             )
 
-        uploader = metadata.get("uploader")
         return {
             "video_file_path": str(video_file),
             "subtitle_file_path": subtitle_file,
             "metadata_file_path": str(metadata_file) if metadata_file.exists() else None,
             "thumbnail_file_path": thumbnail_file,
-            "video_id": metadata.get("id", video_id),
-            "title": metadata.get("title", "Unknown"),
-            "channel": uploader if uploader is not None else metadata.get("channel", "Unknown"),
-            "channel_id": metadata.get("channel_id"),
-            "duration": metadata.get("duration"),
-            "resolution": f"{metadata.get('height', '?')}p",
-            "file_size": actual_size,
-            "upload_date": metadata.get("upload_date"),
-            "view_count": metadata.get("view_count"),
-            "like_count": metadata.get("like_count"),
-            "vcodec": metadata.get("vcodec"),
-            "acodec": metadata.get("acodec"),
-            "format_id": metadata.get("format_id"),
+            **_video_metadata(metadata, video_id=video_id, file_size=actual_size),
         }
 
 
+def fetch_video_info_sync(
+    *,
+    url: str,
+    ydl_opts: dict[str, Any],
+    correlation_id: str | None,
+    extract_youtube_video_id: Callable[[str], str | None],
+    yt_dlp_module: Any,
+) -> dict[str, Any]:
+    """Resolve video metadata without downloading any media; designed to run in a thread."""
+    video_id = extract_youtube_video_id(url)
+    info_opts = {**ydl_opts, "skip_download": True}
+    for key in ("writesubtitles", "writeautomaticsub", "writeinfojson", "writethumbnail"):
+        info_opts[key] = False
+
+    with yt_dlp_module.YoutubeDL(info_opts) as ydl:
+        try:
+            info = ydl.extract_info(url, download=False)
+        except yt_dlp_module.utils.DownloadError as exc:
+            logger.error(
+                "yt_dlp_extract_info_failed",
+                extra={"url": url, "error": str(exc), "cid": correlation_id},
+            )
+            _raise_extract_info_error(exc)
+        except Exception as exc:
+            logger.error(
+                "yt_dlp_extract_info_failed",
+                extra={"url": url, "error": str(exc), "cid": correlation_id},
+            )
+            raise ValueError(
+                f"❌ Unexpected error extracting video info: {str(exc)[:200]}"
+            ) from exc
+
+    return {
+        "video_file_path": None,
+        "subtitle_file_path": None,
+        "metadata_file_path": None,
+        "thumbnail_file_path": None,
+        "thumbnail_url": info.get("thumbnail"),
+        **_video_metadata(
+            info,
+            video_id=video_id,
+            file_size=int(info.get("filesize") or info.get("filesize_approx") or 0),
+        ),
+    }
+
+
+def _video_metadata(
+    metadata: dict[str, Any], *, video_id: str | None, file_size: int
+) -> dict[str, Any]:
+    uploader = metadata.get("uploader")
+    return {
+        "video_id": metadata.get("id", video_id),
+        "title": metadata.get("title", "Unknown"),
+        "channel": uploader if uploader is not None else metadata.get("channel", "Unknown"),
+        "channel_id": metadata.get("channel_id"),
+        "duration": metadata.get("duration"),
+        "resolution": f"{metadata.get('height', '?')}p",
+        "file_size": file_size,
+        "upload_date": metadata.get("upload_date"),
+        "view_count": metadata.get("view_count"),
+        "like_count": metadata.get("like_count"),
+        "vcodec": metadata.get("vcodec"),
+        "acodec": metadata.get("acodec"),
+        "format_id": metadata.get("format_id"),
+    }
+
+
 def _raise_extract_info_error(exc: Exception) -> None:
     error_msg = str(exc).lower()
     if "sign in to confirm your age" in error_msg or "age-restricted" in error_msg:
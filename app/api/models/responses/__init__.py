@@ -59,6 +59,7 @@ from .summaries import (
     SummaryDetailRequest,
     SummaryDetailSource,
     SummaryDetailSummary,
+    SummaryListPagination,
     SummaryListResponse,
     SummaryListStats,
     ToggleFavoriteResponse,
@@ -152,6 +153,7 @@ __all__ = [
     "SummaryDetailRequest",
     "SummaryDetailSource",
     "SummaryDetailSummary",
+    "SummaryListPagination",
     "SummaryListResponse",
     "SummaryListStats",
     "SyncApplyItemResult",
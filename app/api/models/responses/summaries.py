@@ -1,4 +1,3 @@
-# ruff: noqa: TC001
 """Summary and search API response models."""
 
 from __future__ import annotations
@@ -142,9 +141,17 @@ class SummaryListStats(BaseModel):
     unread_count: int = Field(serialization_alias="unreadCount")
 
 
+class SummaryListPagination(PaginationInfo):
+    next_cursor: str | None = Field(
+        default=None,
+        serialization_alias="nextCursor",
+        description="Opaque cursor for the next page; pass back as `cursor`",
+    )
+
+
 class SummaryListResponse(BaseModel):
     summaries: list[SummaryCompact]
-    pagination: PaginationInfo
+    pagination: SummaryListPagination
     stats: SummaryListStats
 
 
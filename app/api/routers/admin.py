@@ -153,3 +153,23 @@ async def audit_log(
             offset=offset,
         )
     )
+
+
+# ---------------------------------------------------------------------------
+# 6. GET /metrics/prompt-cache -- Prompt cache effectiveness
+# ---------------------------------------------------------------------------
+
+
+@router.get("/metrics/prompt-cache")
+async def prompt_cache_report(
+    request: Request,
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> Any:
+    """Cache-hit ratio and cached prompt tokens per prompt and model (last 7 days)."""
+    await AuthService.require_owner(user)
+    user_id = _extract_user_id(user)
+
+    audit = build_async_audit_sink(_resolve_db(request))
+    audit("INFO", "admin.prompt_cache", {"user_id": user_id})
+    service = AdminReadService(_resolve_db(request))
+    return success_response(await service.prompt_cache_report(since=_seven_days_ago()))
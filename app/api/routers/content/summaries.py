@@ -4,6 +4,9 @@ Summary management endpoints.
 Provides CRUD operations for summaries.
 """
 
+import base64
+import binascii
+import json
 from datetime import datetime
 from hashlib import sha256
 from typing import Any, Literal, cast
@@ -21,7 +24,6 @@ from app.api.models.requests import (
 from app.api.models.responses import (
     DeleteSummaryResponse,
     FeedbackResponse,
-    PaginationInfo,
     SummaryCompact,
     SummaryContent,
     SummaryContentData,
@@ -30,6 +32,7 @@ from app.api.models.responses import (
     SummaryDetailRequest,
     SummaryDetailSource,
     SummaryDetailSummary,
+    SummaryListPagination,
     SummaryListResponse,
     SummaryListStats,
     ToggleFavoriteResponse,
@@ -110,6 +113,27 @@ def _build_summary_compact(summary_dict: dict[str, Any]) -> SummaryCompact:
     )
 
 
+def _encode_list_cursor(card: dict[str, Any]) -> str:
+    """Opaque keyset cursor for the card after which the next page starts."""
+    request_data = card.get("request") or {}
+    created_at = request_data.get("created_at")
+    position = [
+        created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+        request_data.get("id"),
+    ]
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_list_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, request_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(request_id)
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise ValidationError("Invalid pagination cursor", details={"field": "cursor"}) from exc
+
+
 def _resolve_content(
     crawl_result: dict[str, Any],
     request_data: dict[str, Any],
@@ -164,6 +188,12 @@ def _resolve_content(
 async def get_summaries(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    *,
+    cursor: str | None = Query(
+        None,
+        max_length=200,
+        description="Opaque cursor from pagination.nextCursor; takes precedence over offset.",
+    ),
     is_read: bool | None = Query(None),
     is_favorited: bool | None = Query(None),
     lang: str | None = Query(None, pattern="^(en|ru|auto)$"),
@@ -184,19 +214,25 @@ async def get_summaries(
     Query Parameters:
     - limit: Items per page (1-100, default 20)
     - offset: Pagination offset (default 0)
+    - cursor: Keyset cursor from the previous page's nextCursor (preferred over offset)
     - is_read: Filter by read status (optional)
     - lang: Filter by language (en/ru/auto)
     - start_date: Filter by creation date (ISO 8601)
     - end_date: Filter by creation date (ISO 8601)
     - sort: Sort order (created_at_desc/created_at_asc)
     - search: Case-insensitive substring match on the article title
+
+    ``total`` and ``unread_count`` are cached per process for up to 30 seconds.
+    Writes handled by the same process refresh them at once; writes made by
+    another worker or process can take up to 30 seconds to show up.
     """
 
-    # Use service layer for business logic
-    summaries, total, unread_count = await use_case.get_user_summaries(
+    after = _decode_list_cursor(cursor) if cursor else None
+    summaries, has_more, total, unread_count = await use_case.get_user_summary_page(
         user_id=user["user_id"],
         limit=limit,
         offset=offset,
+        after=after,
         is_read=is_read,
         is_favorited=is_favorited,
         lang=lang,
@@ -209,11 +245,12 @@ async def get_summaries(
     # Build response from dictionary data
     summary_list = [_build_summary_compact(s) for s in summaries]
 
-    pagination = PaginationInfo(
+    pagination = SummaryListPagination(
         total=total,
         limit=limit,
-        offset=offset,
-        has_more=(offset + limit) < total,
+        offset=0 if after is not None else offset,
+        has_more=has_more,
+        next_cursor=_encode_list_cursor(summaries[-1]) if has_more and summaries else None,
     )
 
     return success_response(
@@ -20,7 +20,7 @@ from app.domain.services.import_export import (
     JsonExporter,
     NetscapeHtmlExporter,
 )
-from app.domain.services.import_parsers import PARSER_REGISTRY
+from app.domain.services.import_parsers import PARSER_REGISTRY, ImportParseError
 from app.tasks.import_tasks import process_import_job
 
 logger = get_logger(__name__)
@@ -111,21 +111,33 @@ async def import_bookmarks(
             status_code=400,
         )
 
-    # Parse bookmarks
+    # Parse bookmarks; past the limit entries are only counted, not kept.
     parser_cls = PARSER_REGISTRY[source_format]
     parser = parser_cls()
-    bookmarks = parser.parse(content)
+    bookmarks: list[Any] = []
+    total_items = 0
+    try:
+        for bookmark in parser.iter_parse(content):
+            total_items += 1
+            if total_items <= cfg.max_items:
+                bookmarks.append(bookmark)
+    except ImportParseError as err:
+        raise APIException(
+            message=f"Import file is truncated or corrupt: {err}",
+            error_code=ErrorCode.VALIDATION_ERROR,
+            status_code=400,
+        ) from err
 
-    if not bookmarks:
+    if not total_items:
         raise APIException(
             message="No bookmarks found in uploaded file",
             error_code=ErrorCode.VALIDATION_ERROR,
             status_code=400,
         )
 
-    if len(bookmarks) > cfg.max_items:
+    if total_items > cfg.max_items:
         raise APIException(
-            message=(f"Import contains {len(bookmarks)} items; maximum allowed is {cfg.max_items}"),
+            message=(f"Import contains {total_items} items; maximum allowed is {cfg.max_items}"),
             error_code=ErrorCode.VALIDATION_ERROR,
             status_code=400,
         )
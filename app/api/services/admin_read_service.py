@@ -36,6 +36,9 @@ class AdminReadService:
         metrics["database"] = await SystemMaintenanceService(database=self._db).get_db_info()
         return metrics
 
+    async def prompt_cache_report(self, *, since: _dt.datetime) -> dict[str, Any]:
+        return await self._admin_repo.async_prompt_cache_report(since=since)
+
     async def audit_log(
         self,
         *,
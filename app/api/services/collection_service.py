@@ -13,9 +13,9 @@ from app.api.exceptions import (
 )
 from app.core.logging_utils import get_logger
 from app.core.time_utils import UTC
+from app.domain.services.rule_compiler import compile_conditions
 from app.domain.services.smart_collection import (
     MAX_SMART_COLLECTIONS_PER_USER,
-    evaluate_summary,
     validate_smart_conditions,
 )
 from app.domain.services.summary_context import build_summary_context
@@ -543,16 +543,19 @@ class CollectionService:
 
         match_mode = collection.get("query_match_mode", "all")
 
-        # Load all user summaries with request data
-        summaries = await repo.async_list_user_summaries_with_request(user_id)
+        # Narrow the user's summaries in SQL, then run the compiled matcher
+        # over the candidates; the result equals evaluating every summary.
+        summaries = await repo.async_list_smart_collection_candidates(
+            user_id, conditions, match_mode
+        )
+        compiled = compile_conditions(conditions, match_mode)
 
-        # Evaluate each summary against conditions
         matching_ids: list[int] = []
         for entry in summaries:
             s_dict = entry.get("summary", {})
             r_dict = entry.get("request", {})
             context = build_summary_context(s_dict, r_dict)
-            if evaluate_summary(conditions, context, match_mode):
+            if compiled.matches(context):
                 summary_id = s_dict.get("id")
                 if summary_id is not None:
                     matching_ids.append(summary_id)
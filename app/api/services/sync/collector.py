@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Callable, Iterable
 
     from app.api.models.responses import SyncEntityEnvelope
 
     from .serializer import SyncEnvelopeSerializer
 
+    _RowSerializer = Callable[[dict[str, Any]], SyncEntityEnvelope]
+    _MergeEntry = tuple[int, str, dict[str, Any], _RowSerializer]
+
 
 class SyncAuxReadPort(Protocol):
     async def get_highlights_for_user(self, user_id: int) -> list[dict[str, Any]]: ...
@@ -19,6 +25,18 @@ class SyncAuxReadPort(Protocol):
 
     async def get_summary_tags_for_user(self, user_id: int) -> list[dict[str, Any]]: ...
 
+    async def get_highlights_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]: ...
+
+    async def get_tags_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]: ...
+
+    async def get_summary_tags_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]: ...
+
 
 class SyncRecordCollector:
     def __init__(
@@ -78,6 +96,132 @@ class SyncRecordCollector:
         records.sort(key=lambda r: (r.server_version, str(r.id)))
         return records
 
+    async def collect_page(
+        self, user_id: int, *, since: int, limit: int
+    ) -> tuple[list[SyncEntityEnvelope], bool, int | None]:
+        """Return one sync page without loading the user's whole archive.
+
+        Each entity query is bounded by ``server_version > since`` and
+        ``limit + 1`` rows, so no stream can contribute more than the page
+        needs. The already-ordered streams are k-way merged on
+        ``(server_version, id)`` and the merge stops once the page plus one
+        look-ahead row is known; only the rows that make it onto the page are
+        serialized. Results and ``has_more``/``next_since`` match
+        ``paginate_records`` over ``collect_records``, except when more than
+        ``limit`` rows of one entity share the page's last ``server_version``:
+        which of those tied rows are returned then follows the database id
+        order. Either way the remaining ties are skipped by the next
+        ``since`` cursor, as before.
+        """
+        fetch = limit + 1
+        serializer = self._serializer
+        sources: list[tuple[Any, str, str, _RowSerializer]] = [
+            (
+                self._request_repo,
+                "async_get_for_user_since",
+                "async_get_all_for_user",
+                serializer.serialize_request,
+            ),
+            (
+                self._summary_repo,
+                "async_get_for_user_since",
+                "async_get_all_for_user",
+                serializer.serialize_summary,
+            ),
+            (
+                self._crawl_repo,
+                "async_get_for_user_since",
+                "async_get_all_for_user",
+                serializer.serialize_crawl_result,
+            ),
+            (
+                self._llm_repo,
+                "async_get_for_user_since",
+                "async_get_all_for_user",
+                serializer.serialize_llm_call,
+            ),
+            (
+                self._aux_read_port,
+                "get_highlights_for_user_since",
+                "get_highlights_for_user",
+                serializer.serialize_highlight,
+            ),
+            (
+                self._aux_read_port,
+                "get_tags_for_user_since",
+                "get_tags_for_user",
+                serializer.serialize_tag,
+            ),
+            (
+                self._aux_read_port,
+                "get_summary_tags_for_user_since",
+                "get_summary_tags_for_user",
+                serializer.serialize_summary_tag,
+            ),
+        ]
+        user, *row_sets = await asyncio.gather(
+            self._user_repo.async_get_user_by_telegram_id(user_id),
+            *(
+                self._rows_since(
+                    source, since_method, full_method, user_id, since=since, limit=fetch
+                )
+                for source, since_method, full_method, _ in sources
+            ),
+        )
+
+        streams: list[list[_MergeEntry]] = []
+        if user and int(user.get("server_version") or 0) > since:
+            streams.append(
+                [
+                    (
+                        int(user.get("server_version") or 0),
+                        str(user.get("telegram_user_id")),
+                        user,
+                        serializer.serialize_user,
+                    )
+                ]
+            )
+        for rows, (*_, serialize) in zip(row_sets, sources, strict=True):
+            streams.append(self._merge_entries(rows, serialize))
+
+        merged = list(islice(heapq.merge(*streams, key=lambda entry: entry[:2]), fetch))
+        page = [serialize(row) for _, _, row, serialize in merged[:limit]]
+        has_more = len(merged) > limit
+        next_since = page[-1].server_version if page else since
+        return page, has_more, next_since
+
+    @staticmethod
+    async def _rows_since(
+        source: Any,
+        since_method: str,
+        full_method: str,
+        user_id: int,
+        *,
+        since: int,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        method: Callable[..., Awaitable[list[dict[str, Any]]]] | None = getattr(
+            source, since_method, None
+        )
+        if method is not None:
+            return await method(user_id, since=since, limit=limit)
+        # Sources without a cursor query fall back to a full read filtered here.
+        rows = await getattr(source, full_method)(user_id)
+        return [row for row in rows if int(row.get("server_version") or 0) > since]
+
+    @staticmethod
+    def _merge_entries(
+        rows: Iterable[dict[str, Any]], serialize: _RowSerializer
+    ) -> list[_MergeEntry]:
+        # Sort on the envelope key rather than trusting the SQL order: envelope
+        # ids compare as strings, so ``heapq.merge`` needs each stream in that order.
+        entries = [
+            (int(row.get("server_version") or 0), str(row.get("id")), row, serialize)
+            for row in rows
+        ]
+        entries.sort(key=lambda entry: entry[:2])
+        return entries
+
     @staticmethod
     def paginate_records(
         records: Iterable[SyncEntityEnvelope], since: int, limit: int
@@ -128,9 +128,8 @@ class SyncFacade:
     ) -> FullSyncResponseData:
         session = await self._load_session(session_id, user_id, client_id)
         resolved_limit = self._resolve_limit(limit or session.get("chunk_limit"))
-        records = await self._collector.collect_records(user_id)
-        page, has_more, next_since = self._collector.paginate_records(
-            records,
+        page, has_more, next_since = await self._collector.collect_page(
+            user_id,
             since=0,
             limit=resolved_limit,
         )
@@ -159,9 +158,8 @@ class SyncFacade:
     ) -> DeltaSyncResponseData:
         session = await self._load_session(session_id, user_id, client_id)
         resolved_limit = self._resolve_limit(limit or session.get("chunk_limit"))
-        records = await self._collector.collect_records(user_id)
-        page, has_more, next_since = self._collector.paginate_records(
-            records,
+        page, has_more, next_since = await self._collector.collect_page(
+            user_id,
             since=since,
             limit=resolved_limit,
         )
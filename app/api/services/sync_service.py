@@ -60,6 +60,11 @@ class _NullRepository:
     async def async_get_all_for_user(self, _user_id: int) -> list[dict[str, Any]]:
         return []
 
+    async def async_get_for_user_since(
+        self, _user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return []
+
     async def async_get_summary_for_sync_apply(
         self, _summary_id: int, _user_id: int
     ) -> dict[str, Any] | None:
@@ -79,6 +84,21 @@ class _NullSyncAuxReadPort:
     async def get_summary_tags_for_user(self, _user_id: int) -> list[dict[str, Any]]:
         return []
 
+    async def get_highlights_for_user_since(
+        self, _user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return []
+
+    async def get_tags_for_user_since(
+        self, _user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return []
+
+    async def get_summary_tags_for_user_since(
+        self, _user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return []
+
 
 class SyncService:
     """Sync protocol service implementing sessions, retrieval, and apply."""
@@ -286,13 +306,19 @@ class SyncService:
     ) -> tuple[list[SyncEntityEnvelope], bool, int | None]:
         return self._collector.paginate_records(records, since, limit)
 
+    async def _collect_page(
+        self, user_id: int, *, since: int, limit: int
+    ) -> tuple[list[SyncEntityEnvelope], bool, int | None]:
+        return await self._collector.collect_page(user_id, since=since, limit=limit)
+
     async def get_full(
         self, *, session_id: str, user_id: int, client_id: str | None, limit: int | None
     ) -> FullSyncResponseData:
         session = await self._load_session(session_id, user_id, client_id)
         resolved_limit = self._resolve_limit(limit or session.get("chunk_limit"))
-        records = await self._collect_records(user_id)
-        page, has_more, next_since = self._paginate_records(records, since=0, limit=resolved_limit)
+        page, has_more, next_since = await self._collect_page(
+            user_id, since=0, limit=resolved_limit
+        )
         return self._build_full(session_id, page, has_more, next_since, resolved_limit)
 
     async def get_delta(
@@ -300,9 +326,8 @@ class SyncService:
     ) -> DeltaSyncResponseData:
         session = await self._load_session(session_id, user_id, client_id)
         resolved_limit = self._resolve_limit(limit or session.get("chunk_limit"))
-        records = await self._collect_records(user_id)
-        page, has_more, next_since = self._paginate_records(
-            records, since=since, limit=resolved_limit
+        page, has_more, next_since = await self._collect_page(
+            user_id, since=since, limit=resolved_limit
         )
         return self._build_delta(session_id, since, page, has_more, next_since, resolved_limit)
 
@@ -6,13 +6,15 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from app.domain.services.import_parsers.base import ImportedBookmark
 
 
 @dataclass(frozen=True, slots=True)
 class ImportBookmarksCommand:
     job_id: int
-    bookmarks: list[ImportedBookmark]
+    bookmarks: Iterable[ImportedBookmark]
     user_id: int
     options: dict[str, Any] = field(default_factory=dict)
 
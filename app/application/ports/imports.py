@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from app.application.dto.import_bookmarks import BookmarkImportItemResult
     from app.domain.services.import_parsers.base import ImportedBookmark
 
@@ -20,6 +22,15 @@ class BookmarkImportPort(Protocol):
     ) -> BookmarkImportItemResult:
         """Import a single bookmark transactionally."""
 
+    async def async_import_bookmarks(
+        self,
+        bookmarks: Sequence[ImportedBookmark],
+        *,
+        user_id: int,
+        options: dict[str, Any],
+    ) -> list[BookmarkImportItemResult]:
+        """Import a chunk of bookmarks in one transaction, results in input order."""
+
 
 @runtime_checkable
 class ImportJobRepositoryPort(Protocol):
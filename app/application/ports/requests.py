@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Protocol, TypedDict, runtime_checkable
 from app.domain.models.request import RequestStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import datetime
 
 
@@ -30,6 +31,9 @@ class LLMCallRecord(TypedDict, total=False):
     structured_output_used: bool | None
     structured_output_mode: str | None
     error_context_json: Any
+    cache_read_tokens: int | None
+    cache_creation_tokens: int | None
+    prompt_cache_key: str | None
     # Attempt-tracking fields (improvement #6).
     # attempt_index: when omitted the repository computes max(attempt_index)+1
     # for the same request_id within the same transaction.
@@ -165,6 +169,11 @@ class RequestRepositoryPort(Protocol):
     async def async_get_all_for_user(self, user_id: int) -> list[dict[str, Any]]:
         """Return all request rows for sync operations."""
 
+    async def async_get_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """Return up to *limit* request rows with ``server_version > since`` in version order."""
+
     async def async_get_max_server_version(self, user_id: int) -> int | None:
         """Return the maximum server_version for requests owned by *user_id*."""
 
@@ -173,6 +182,11 @@ class RequestRepositoryPort(Protocol):
     ) -> None:
         """Persist the Telegram message-id of the bot's reply for a request."""
 
+    async def async_update_bot_reply_message_ids_batch(
+        self, updates: list[tuple[int, int]]
+    ) -> None:
+        """Persist ``(request_id, bot_reply_message_id)`` pairs; the last pair per id wins."""
+
 
 @runtime_checkable
 class CrawlResultRepositoryPort(Protocol):
@@ -184,6 +198,11 @@ class CrawlResultRepositoryPort(Protocol):
     async def async_get_all_for_user(self, user_id: int) -> list[dict[str, Any]]:
         """Return all crawl rows for sync operations."""
 
+    async def async_get_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """Return up to *limit* crawl rows with ``server_version > since`` in version order."""
+
     async def async_get_max_server_version(self, user_id: int) -> int | None:
         """Return the maximum server_version for crawl results owned by *user_id*."""
 
@@ -210,6 +229,11 @@ class LLMRepositoryPort(Protocol):
     async def async_get_all_for_user(self, user_id: int) -> list[dict[str, Any]]:
         """Return all LLM rows for sync operations."""
 
+    async def async_get_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """Return up to *limit* LLM rows with ``server_version > since`` in version order."""
+
     async def async_get_max_server_version(self, user_id: int) -> int | None:
         """Return the maximum server_version for LLM calls owned by *user_id*."""
 
@@ -236,6 +260,12 @@ class VideoDownloadRepositoryPort(Protocol):
     async def async_update_video_download(self, download_id: int, **kwargs: Any) -> None:
         """Update a video-download row."""
 
+    async def async_list_video_downloads_by_archive_status(
+        self,
+        archive_statuses: Sequence[str],
+    ) -> list[dict[str, Any]]:
+        """Return video-download rows whose archive status is one of ``archive_statuses``."""
+
     async def async_update_video_download_status(
         self,
         download_id: int,
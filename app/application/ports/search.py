@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    import datetime as dt
     from collections.abc import Iterable
 
     from app.application.dto.vector_search import VectorSearchHitDTO
@@ -108,6 +109,15 @@ class EmbeddingRepositoryPort(Protocol):
     async def async_get_recent_embeddings(self, *, limit: int) -> list[dict[str, Any]]:
         """Return recent embeddings."""
 
+    async def async_get_embeddings_updated_since(
+        self,
+        since: dt.datetime,
+        *,
+        after_id: int,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Return embeddings written after ``(since, after_id)``, oldest write first."""
+
     async def async_create_or_update_summary_embedding(
         self,
         summary_id: int,
@@ -33,6 +33,41 @@ class SummaryRepositoryPort(Protocol):
         ``Request.title`` matches the term case-insensitively.
         """
 
+    async def async_get_user_summary_cards(
+        self,
+        user_id: int,
+        *,
+        limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        offset: int = 0,
+        is_read: bool | None = None,
+        is_favorited: bool | None = None,
+        lang: str | None = None,
+        start_date: Any | None = None,
+        end_date: Any | None = None,
+        sort: str = "created_at_desc",
+        search: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return one keyset page of list-view cards (projected columns only)."""
+
+    async def async_get_user_summary_counts(
+        self,
+        user_id: int,
+        *,
+        is_read: bool | None = None,
+        is_favorited: bool | None = None,
+        lang: str | None = None,
+        start_date: Any | None = None,
+        end_date: Any | None = None,
+        search: str | None = None,
+        cached: bool = True,
+    ) -> tuple[int, int]:
+        """Return ``(filtered_total, unread_count)`` for the list view.
+
+        Counters may be served from a short-lived per-process cache; pass
+        ``cached=False`` to read them from the database.
+        """
+
     async def async_get_user_summaries_for_insights(
         self,
         user_id: int,
@@ -77,6 +112,11 @@ class SummaryRepositoryPort(Protocol):
     async def async_get_all_for_user(self, user_id: int) -> list[dict[str, Any]]:
         """Return all summaries for sync operations."""
 
+    async def async_get_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """Return up to *limit* summaries with ``server_version > since`` in version order."""
+
     async def async_get_summary_for_sync_apply(
         self, summary_id: int, user_id: int
     ) -> dict[str, Any] | None:
@@ -0,0 +1,205 @@
+"""MinHash signatures and LSH band index for signal near-duplicate detection.
+
+Each shingle is hashed once (32-bit blake2b); the ``num_perm`` permutations are
+derived from that base hash with universal hashing
+``((a * x + b) mod 2**64) mod (2**61 - 1)``, truncated to 32 bits. With NumPy
+available the permutations for a whole batch run as one vectorized
+expression; without it the same arithmetic runs in pure Python, so signatures
+are identical either way.
+
+``MinHashLSHIndex`` buckets signatures by band so a near-duplicate lookup only
+compares against signatures that share at least one band instead of every
+signature seen so far.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+MINHASH_SIGNATURE_SIZE = 64
+# Band width of the persisted ``minhash:`` dedupe key (16 bands of 4 rows).
+MINHASH_KEY_BAND_WIDTH = 4
+# Version of the signature scheme behind ``minhash:`` keys; recorded in signal
+# evidence so rows written before the universal-hashing engine can be told apart.
+MINHASH_SCHEME_VERSION = 2
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_UINT64_MASK = (1 << 64) - 1
+_MAX_HASH = 0xFFFFFFFF
+
+
+def _seeded_int(label: str, index: int) -> int:
+    digest = hashlib.blake2b(f"{label}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, byteorder="big")
+
+
+def _permutation_params(num_perm: int) -> tuple[list[int], list[int]]:
+    # Derived from blake2b rather than a seeded RNG so signatures do not depend
+    # on the NumPy version or bit generator in use.
+    a = [(_seeded_int("minhash-a", i) % (_MERSENNE_PRIME - 1)) + 1 for i in range(num_perm)]
+    b = [_seeded_int("minhash-b", i) % _MERSENNE_PRIME for i in range(num_perm)]
+    return a, b
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=4).digest(), "big")
+
+
+def _load_numpy() -> Any | None:
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+class MinHasher:
+    """Compute MinHash signatures for shingle sets, batched when NumPy is available."""
+
+    def __init__(self, num_perm: int = MINHASH_SIGNATURE_SIZE, *, use_numpy: bool = True) -> None:
+        if num_perm <= 0:
+            msg = "num_perm must be positive"
+            raise ValueError(msg)
+        self._num_perm = num_perm
+        self._a, self._b = _permutation_params(num_perm)
+        self._np = _load_numpy() if use_numpy else None
+        if self._np is not None:
+            self._a_arr = self._np.asarray(self._a, dtype=self._np.uint64)
+            self._b_arr = self._np.asarray(self._b, dtype=self._np.uint64)
+
+    @property
+    def num_perm(self) -> int:
+        return self._num_perm
+
+    def signature(self, shingles: Iterable[str]) -> tuple[int, ...] | None:
+        """Return the signature for one shingle set, or ``None`` when it is empty."""
+        return self.signatures([shingles])[0]
+
+    def signatures(self, shingle_sets: Sequence[Iterable[str]]) -> list[tuple[int, ...] | None]:
+        """Return signatures for many shingle sets, hashing every shingle exactly once."""
+        hashed = [[_shingle_hash(shingle) for shingle in shingles] for shingles in shingle_sets]
+        if self._np is None:
+            return [self._signature_python(values) if values else None for values in hashed]
+        return self._signatures_numpy(hashed)
+
+    def _signature_python(self, values: list[int]) -> tuple[int, ...]:
+        return tuple(
+            min(((((a * x) + b) & _UINT64_MASK) % _MERSENNE_PRIME) & _MAX_HASH for x in values)
+            for a, b in zip(self._a, self._b, strict=True)
+        )
+
+    def _signatures_numpy(self, hashed: list[list[int]]) -> list[tuple[int, ...] | None]:
+        np = self._np
+        non_empty = [idx for idx, values in enumerate(hashed) if values]
+        result: list[tuple[int, ...] | None] = [None] * len(hashed)
+        if not non_empty:
+            return result
+
+        lengths = np.asarray([len(hashed[idx]) for idx in non_empty], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        flat = np.fromiter(
+            (value for idx in non_empty for value in hashed[idx]),
+            dtype=np.uint64,
+            count=int(lengths.sum()),
+        )
+        # uint64 multiply/add wrap modulo 2**64, matching the pure-Python mask.
+        with np.errstate(over="ignore"):
+            permuted = (flat[:, None] * self._a_arr + self._b_arr) % np.uint64(_MERSENNE_PRIME)
+        permuted &= np.uint64(_MAX_HASH)
+        minima = np.minimum.reduceat(permuted, offsets, axis=0)
+        for idx, row in zip(non_empty, minima.tolist(), strict=True):
+            result[idx] = tuple(row)
+        return result
+
+
+def signature_similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimate Jaccard similarity as the fraction of matching signature slots."""
+    if not left or not right or len(left) != len(right):
+        return 0.0
+    matches = sum(1 for lvalue, rvalue in zip(left, right, strict=True) if lvalue == rvalue)
+    return matches / len(left)
+
+
+def minhash_band_key(
+    signature: Sequence[int], *, band_width: int = MINHASH_KEY_BAND_WIDTH
+) -> str | None:
+    """Return the stable ``minhash:`` bucket key (lowest band hash) for a signature."""
+    bands = [
+        tuple(signature[idx : idx + band_width])
+        for idx in range(0, len(signature), band_width)
+        if len(signature[idx : idx + band_width]) == band_width
+    ]
+    if not bands:
+        return None
+    band_hashes = [hash(band) & 0xFFFFFFFF for band in bands]
+    return f"minhash:{min(band_hashes):08x}"
+
+
+class MinHashLSHIndex:
+    """In-memory LSH band index over MinHash signatures.
+
+    With the defaults (32 bands of 2 rows over a 64-slot signature) a pair at
+    Jaccard 0.55 shares at least one band with probability > 0.9999, so
+    band candidates plus an exact signature check reproduce the all-pairs scan
+    while unrelated signatures are never compared.
+    """
+
+    def __init__(
+        self,
+        *,
+        bands: int = 32,
+        rows: int = 2,
+        threshold: float = 0.55,
+    ) -> None:
+        if bands <= 0 or rows <= 0:
+            msg = "bands and rows must be positive"
+            raise ValueError(msg)
+        self._bands = bands
+        self._rows = rows
+        self._threshold = threshold
+        self._buckets: list[dict[tuple[int, ...], list[int]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self._signatures: dict[int, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_slices(self, signature: Sequence[int]) -> Iterable[tuple[int, tuple[int, ...]]]:
+        if len(signature) < self._bands * self._rows:
+            msg = (
+                f"signature of length {len(signature)} is shorter than "
+                f"{self._bands} bands x {self._rows} rows"
+            )
+            raise ValueError(msg)
+        for band in range(self._bands):
+            start = band * self._rows
+            yield band, tuple(signature[start : start + self._rows])
+
+    def add(self, key: int, signature: Sequence[int]) -> None:
+        """Index ``signature`` under ``key``."""
+        stored = tuple(signature)
+        self._signatures[key] = stored
+        for band, chunk in self._band_slices(stored):
+            self._buckets[band][chunk].append(key)
+
+    def candidates(self, signature: Sequence[int]) -> set[int]:
+        """Return keys sharing at least one band with ``signature``."""
+        found: set[int] = set()
+        for band, chunk in self._band_slices(signature):
+            bucket = self._buckets[band].get(chunk)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def find_near_duplicate(self, signature: Sequence[int]) -> int | None:
+        """Return an indexed key whose signature similarity meets the threshold."""
+        for key in sorted(self.candidates(signature)):
+            if signature_similarity(signature, self._signatures[key]) >= self._threshold:
+                return key
+        return None
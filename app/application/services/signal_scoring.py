@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
-import hashlib
 import math
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Protocol
-
+from typing import TYPE_CHECKING, Protocol
+
+from app.application.services.signal_minhash import (
+    MINHASH_SCHEME_VERSION,
+    MINHASH_SIGNATURE_SIZE,
+    MinHasher,
+    MinHashLSHIndex,
+    minhash_band_key,
+)
 from app.core.time_utils import UTC
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 LLM_JUDGE_CAP_FRACTION = 0.10
-MINHASH_SIGNATURE_SIZE = 64
 MINHASH_NEAR_DUPLICATE_THRESHOLD = 0.55
+_MIN_SHINGLES = 3
 _TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 
@@ -31,6 +40,9 @@ class TopicSimilarityPort(Protocol):
     async def score_item(self, candidate: SignalCandidate) -> float:
         """Return a normalized topic similarity score for a candidate."""
 
+    async def score_items(self, candidates: Sequence[SignalCandidate]) -> list[float]:
+        """Return topic similarity scores for candidates, in input order."""
+
 
 @dataclass(slots=True, frozen=True)
 class SignalCandidate:
@@ -63,6 +75,7 @@ class SignalScoringService:
 
     def __init__(self, *, topic_similarity: TopicSimilarityPort) -> None:
         self._topic_similarity = topic_similarity
+        self._minhasher = MinHasher(MINHASH_SIGNATURE_SIZE)
 
     async def score(
         self,
@@ -76,15 +89,16 @@ class SignalScoringService:
             )
 
         now = now or datetime.now(UTC)
-        deduped = self._dedupe(candidates)
+        minhash_keys = self._minhash_keys(candidates)
+        deduped = self._dedupe(candidates, minhash_keys)
         source_counts: dict[int, int] = defaultdict(int)
         raw_scores: list[ScoredSignal] = []
+        topic_scores = await self._score_topic_similarity(deduped)
 
-        for candidate in deduped:
+        for candidate, topic_similarity in zip(deduped, topic_scores, strict=True):
             source_counts[candidate.source_id] += 1
             recency = self._recency_score(candidate, now)
             engagement = self._engagement_score(candidate)
-            topic_similarity = await self._topic_similarity.score_item(candidate)
             diversity_penalty = max(0.0, 1.0 - ((source_counts[candidate.source_id] - 1) * 0.12))
             score = (
                 (0.35 * recency)
@@ -101,8 +115,11 @@ class SignalScoringService:
                         "engagement_score": engagement,
                         "topic_similarity_score": topic_similarity,
                         "source_diversity_multiplier": diversity_penalty,
-                        "dedupe_key": self._dedupe_key(candidate),
-                        "minhash_key": _minhash_dedupe_key(candidate),
+                        "dedupe_key": self._dedupe_key(
+                            candidate, minhash_keys[candidate.feed_item_id][0]
+                        ),
+                        "minhash_key": minhash_keys[candidate.feed_item_id][0],
+                        "minhash_version": MINHASH_SCHEME_VERSION,
                         "llm_cap_fraction": LLM_JUDGE_CAP_FRACTION,
                     },
                 )
@@ -123,31 +140,57 @@ class SignalScoringService:
             for item in raw_scores
         ]
 
-    def _dedupe(self, candidates: list[SignalCandidate]) -> list[SignalCandidate]:
+    async def _score_topic_similarity(self, candidates: list[SignalCandidate]) -> list[float]:
+        if not candidates:
+            return []
+        # Prefer the batch API (one embedding call + one vector search-batch);
+        # ports that only implement ``score_item`` keep the per-candidate path.
+        score_items = getattr(self._topic_similarity, "score_items", None)
+        if callable(score_items):
+            return list(await score_items(candidates))
+        return [await self._topic_similarity.score_item(candidate) for candidate in candidates]
+
+    def _minhash_keys(
+        self, candidates: list[SignalCandidate]
+    ) -> dict[int, tuple[str | None, tuple[int, ...] | None]]:
+        """Return ``(minhash key, signature)`` per feed item, hashed in one batch."""
+        shingle_sets = [_word_shingles(_candidate_text(candidate)) for candidate in candidates]
+        signatures = self._minhasher.signatures(
+            [shingles if len(shingles) >= _MIN_SHINGLES else () for shingles in shingle_sets]
+        )
+        return {
+            candidate.feed_item_id: (
+                minhash_band_key(signature) if signature else None,
+                signature,
+            )
+            for candidate, signature in zip(candidates, signatures, strict=True)
+        }
+
+    def _dedupe(
+        self,
+        candidates: list[SignalCandidate],
+        minhash_keys: dict[int, tuple[str | None, tuple[int, ...] | None]],
+    ) -> list[SignalCandidate]:
         seen: set[str] = set()
-        seen_signatures: list[tuple[int, ...]] = []
+        index = MinHashLSHIndex(threshold=MINHASH_NEAR_DUPLICATE_THRESHOLD)
         result: list[SignalCandidate] = []
-        for candidate in candidates:
-            key = self._dedupe_key(candidate)
+        for position, candidate in enumerate(candidates):
+            minhash_key, signature = minhash_keys[candidate.feed_item_id]
+            key = self._dedupe_key(candidate, minhash_key)
             if key in seen:
                 continue
-            signature = _candidate_minhash_signature(candidate)
-            if signature and any(
-                _signature_similarity(signature, existing) >= MINHASH_NEAR_DUPLICATE_THRESHOLD
-                for existing in seen_signatures
-            ):
+            if signature and index.find_near_duplicate(signature) is not None:
                 continue
             seen.add(key)
             if signature:
-                seen_signatures.append(signature)
+                index.add(position, signature)
             result.append(candidate)
         return result
 
     @staticmethod
-    def _dedupe_key(candidate: SignalCandidate) -> str:
+    def _dedupe_key(candidate: SignalCandidate, minhash_key: str | None = None) -> str:
         if candidate.canonical_url:
             return f"url:{candidate.canonical_url.strip().lower()}"
-        minhash_key = _minhash_dedupe_key(candidate)
         if minhash_key:
             return minhash_key
         if candidate.title:
@@ -173,31 +216,6 @@ class SignalScoringService:
         return min(1.0, math.log10(weighted + 1) / 4.0)
 
 
-def _minhash_dedupe_key(candidate: SignalCandidate) -> str | None:
-    signature = _candidate_minhash_signature(candidate)
-    if not signature:
-        return None
-    band_width = 4
-    bands = [
-        signature[idx : idx + band_width]
-        for idx in range(0, len(signature), band_width)
-        if len(signature[idx : idx + band_width]) == band_width
-    ]
-    if not bands:
-        return None
-    # Use the lowest band hash as a stable near-duplicate bucket.
-    band_hashes = [hash(tuple(band)) & 0xFFFFFFFF for band in bands]
-    return f"minhash:{min(band_hashes):08x}"
-
-
-def _candidate_minhash_signature(candidate: SignalCandidate) -> tuple[int, ...] | None:
-    text = _candidate_text(candidate)
-    shingles = _word_shingles(text)
-    if len(shingles) < 3:
-        return None
-    return _minhash_signature(shingles)
-
-
 def _candidate_text(candidate: SignalCandidate) -> str:
     metadata_text = candidate.metadata.get("content_text") or candidate.metadata.get("text") or ""
     return " ".join(
@@ -215,26 +233,3 @@ def _word_shingles(text: str, *, width: int = 4) -> set[str]:
     if len(tokens) < width:
         return set(tokens)
     return {" ".join(tokens[idx : idx + width]) for idx in range(len(tokens) - width + 1)}
-
-
-def _minhash_signature(shingles: set[str]) -> tuple[int, ...]:
-    values: list[int] = []
-    for seed in range(MINHASH_SIGNATURE_SIZE):
-        minimum: int | None = None
-        for shingle in shingles:
-            digest = hashlib.blake2b(
-                f"{seed}:{shingle}".encode(),
-                digest_size=8,
-            ).digest()
-            value = int.from_bytes(digest, byteorder="big")
-            if minimum is None or value < minimum:
-                minimum = value
-        values.append(minimum or 0)
-    return tuple(values)
-
-
-def _signature_similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
-    if not left or not right or len(left) != len(right):
-        return 0.0
-    matches = sum(1 for lvalue, rvalue in zip(left, right, strict=True) if lvalue == rvalue)
-    return matches / len(left)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from app.application.dto.import_bookmarks import (
@@ -11,13 +14,51 @@ from app.application.dto.import_bookmarks import (
 from app.core.logging_utils import get_logger
 
 if TYPE_CHECKING:
+    from app.application.dto.import_bookmarks import BookmarkImportItemResult
     from app.application.ports.imports import BookmarkImportPort, ImportJobRepositoryPort
+    from app.domain.services.import_parsers.base import ImportedBookmark
 
 logger = get_logger(__name__)
 
+_DEFAULT_CHUNK_SIZE = 200
+_DEFAULT_MAX_CONCURRENT_CHUNKS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class _ChunkOutcome:
+    """Per-bookmark results of one chunk; an exception marks a failed bookmark."""
+
+    start: int
+    results: list[tuple[ImportedBookmark, BookmarkImportItemResult | Exception]]
+
+
+@dataclass(slots=True)
+class _ImportCounters:
+    processed: int = 0
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def snapshot(self, status: str | None = None) -> ImportProgressSnapshot:
+        return ImportProgressSnapshot(
+            processed=self.processed,
+            created=self.created,
+            skipped=self.skipped,
+            failed=self.failed,
+            errors=list(self.errors),
+            status=status,
+        )
+
 
 class ImportBookmarksUseCase:
-    """Run a bookmark import job through dedicated application ports."""
+    """Run a bookmark import job through dedicated application ports.
+
+    Bookmarks are consumed lazily in chunks of ``chunk_size``; each chunk is one
+    bulk transaction and at most ``max_concurrent_chunks`` run at once. A chunk
+    whose bulk import fails is retried bookmark by bookmark so one bad row only
+    fails itself.
+    """
 
     def __init__(
         self,
@@ -25,70 +66,37 @@ class ImportBookmarksUseCase:
         import_job_repository: ImportJobRepositoryPort,
         bookmark_import_repository: BookmarkImportPort,
         progress_flush_interval: int = 10,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        max_concurrent_chunks: int = _DEFAULT_MAX_CONCURRENT_CHUNKS,
     ) -> None:
         self._import_job_repo = import_job_repository
         self._bookmark_import_repo = bookmark_import_repository
         self._flush_interval = max(1, progress_flush_interval)
+        self._chunk_size = max(1, chunk_size)
+        self._max_concurrent_chunks = max(1, max_concurrent_chunks)
 
     async def execute(self, command: ImportBookmarksCommand) -> ImportProgressSnapshot:
         """Process the uploaded bookmarks and keep the ImportJob row in sync."""
-        processed = 0
-        created = 0
-        skipped = 0
-        failed = 0
-        errors: list[str] = []
+        counters = _ImportCounters()
+        in_flight: set[asyncio.Task[_ChunkOutcome]] = set()
 
         try:
             await self._import_job_repo.async_set_status(command.job_id, "processing")
-            for index, bookmark in enumerate(command.bookmarks, start=1):
-                try:
-                    result = await self._bookmark_import_repo.async_import_bookmark(
-                        bookmark,
-                        user_id=command.user_id,
-                        options=command.options,
-                    )
-                    if result.outcome == "created":
-                        created += 1
-                    elif result.outcome == "skipped":
-                        skipped += 1
-                    else:
-                        failed += 1
-                        errors.append(result.error or f"{result.url}: import failed")
-                except Exception as exc:
-                    failed += 1
-                    errors.append(f"{bookmark.url}: {exc}")
-                    logger.warning(
-                        "import_bookmark_failed",
-                        extra={
-                            "job_id": command.job_id,
-                            "url": bookmark.url[:200],
-                            "error": str(exc),
-                        },
-                    )
-                finally:
-                    processed = index
-
-                if processed % self._flush_interval == 0:
-                    await self._flush_progress(
-                        command.job_id,
-                        ImportProgressSnapshot(
-                            processed=processed,
-                            created=created,
-                            skipped=skipped,
-                            failed=failed,
-                            errors=list(errors),
-                        ),
+            start = 0
+            for chunk in itertools.batched(command.bookmarks, self._chunk_size, strict=False):
+                if len(in_flight) >= self._max_concurrent_chunks:
+                    await self._collect(
+                        command, in_flight, counters, return_when=asyncio.FIRST_COMPLETED
                     )
+                in_flight.add(asyncio.create_task(self._import_chunk(command, start, chunk)))
+                start += len(chunk)
+            if in_flight:
+                await self._collect(command, in_flight, counters, return_when=asyncio.ALL_COMPLETED)
 
-            final_status = "failed" if created == 0 and failed > 0 else "completed"
-            snapshot = ImportProgressSnapshot(
-                processed=processed,
-                created=created,
-                skipped=skipped,
-                failed=failed,
-                errors=list(errors),
-                status=final_status,
+            final_status = (
+                "failed" if counters.created == 0 and counters.failed > 0 else "completed"
             )
+            snapshot = counters.snapshot(final_status)
             await self._flush_progress(command.job_id, snapshot)
             await self._import_job_repo.async_set_status(command.job_id, final_status)
             logger.info(
@@ -96,26 +104,112 @@ class ImportBookmarksUseCase:
                 extra={
                     "job_id": command.job_id,
                     "status": final_status,
-                    "created": created,
-                    "skipped": skipped,
-                    "failed": failed,
+                    "created": counters.created,
+                    "skipped": counters.skipped,
+                    "failed": counters.failed,
                 },
             )
             return snapshot
         except Exception as exc:
             logger.exception("import_job_crashed", extra={"job_id": command.job_id})
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
             snapshot = ImportProgressSnapshot(
-                processed=processed,
-                created=created,
-                skipped=skipped,
-                failed=failed + 1,
-                errors=[*errors, str(exc)],
+                processed=counters.processed,
+                created=counters.created,
+                skipped=counters.skipped,
+                failed=counters.failed + 1,
+                errors=[*counters.errors, str(exc)],
                 status="failed",
             )
             await self._flush_progress(command.job_id, snapshot)
             await self._import_job_repo.async_set_status(command.job_id, "failed")
             return snapshot
 
+    async def _import_chunk(
+        self,
+        command: ImportBookmarksCommand,
+        start: int,
+        chunk: tuple[ImportedBookmark, ...],
+    ) -> _ChunkOutcome:
+        try:
+            results = await self._bookmark_import_repo.async_import_bookmarks(
+                chunk,
+                user_id=command.user_id,
+                options=command.options,
+            )
+            return _ChunkOutcome(start, list(zip(chunk, results, strict=True)))
+        except Exception as exc:
+            logger.warning(
+                "import_chunk_failed",
+                extra={
+                    "job_id": command.job_id,
+                    "start": start,
+                    "size": len(chunk),
+                    "error": str(exc),
+                },
+            )
+
+        outcomes: list[tuple[ImportedBookmark, BookmarkImportItemResult | Exception]] = []
+        for bookmark in chunk:
+            try:
+                result = await self._bookmark_import_repo.async_import_bookmark(
+                    bookmark,
+                    user_id=command.user_id,
+                    options=command.options,
+                )
+            except Exception as exc:
+                outcomes.append((bookmark, exc))
+            else:
+                outcomes.append((bookmark, result))
+        return _ChunkOutcome(start, outcomes)
+
+    async def _collect(
+        self,
+        command: ImportBookmarksCommand,
+        in_flight: set[asyncio.Task[_ChunkOutcome]],
+        counters: _ImportCounters,
+        *,
+        return_when: str,
+    ) -> None:
+        """Wait for chunk tasks, fold their outcomes into *counters* and flush progress."""
+        done, _ = await asyncio.wait(in_flight, return_when=return_when)
+        in_flight.difference_update(done)
+        before = counters.processed
+        for outcome in sorted((task.result() for task in done), key=lambda o: o.start):
+            for bookmark, result in outcome.results:
+                self._record(command, counters, bookmark, result)
+        if counters.processed // self._flush_interval > before // self._flush_interval:
+            await self._flush_progress(command.job_id, counters.snapshot())
+
+    @staticmethod
+    def _record(
+        command: ImportBookmarksCommand,
+        counters: _ImportCounters,
+        bookmark: ImportedBookmark,
+        result: BookmarkImportItemResult | Exception,
+    ) -> None:
+        counters.processed += 1
+        if isinstance(result, Exception):
+            counters.failed += 1
+            counters.errors.append(f"{bookmark.url}: {result}")
+            logger.warning(
+                "import_bookmark_failed",
+                extra={
+                    "job_id": command.job_id,
+                    "url": bookmark.url[:200],
+                    "error": str(result),
+                },
+            )
+        elif result.outcome == "created":
+            counters.created += 1
+        elif result.outcome == "skipped":
+            counters.skipped += 1
+        else:
+            counters.failed += 1
+            counters.errors.append(result.error or f"{result.url}: import failed")
+
     async def _flush_progress(self, job_id: int, snapshot: ImportProgressSnapshot) -> None:
         await self._import_job_repo.async_update_progress(
             job_id,
@@ -12,7 +12,8 @@ from app.application.dto.rule_execution import (
     RuleExecutionResultDTO,
 )
 from app.core.logging_utils import get_logger
-from app.domain.services.rule_engine import MAX_EXECUTIONS_PER_MINUTE, RuleConditionEvaluator
+from app.domain.services.rule_compiler import compile_conditions
+from app.domain.services.rule_engine import MAX_EXECUTIONS_PER_MINUTE
 from app.domain.services.tag_service import normalize_tag_name
 
 if TYPE_CHECKING:
@@ -28,6 +29,12 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 RULE_WINDOW_SECONDS = 60.0
+# Enabled rules per (user, event type) are reused for this long. Rules are
+# edited through the API process while this use case runs in the bot's event
+# handlers, so there is no in-process hook to invalidate on; edits become
+# visible once the entry expires.
+RULE_CACHE_TTL_SECONDS = 10.0
+_RULE_CACHE_MAX_ENTRIES = 1024
 
 
 class RuleActionHandler(Protocol):
@@ -295,6 +302,7 @@ class RuleExecutionUseCase:
         webhook_dispatcher: WebhookDispatchPort,
         rate_limiter: RuleRateLimiterPort,
         handlers: list[RuleActionHandler] | None = None,
+        rules_cache_ttl_seconds: float = RULE_CACHE_TTL_SECONDS,
     ) -> None:
         self._rule_repository = rule_repository
         self._tag_repository = tag_repository
@@ -305,6 +313,27 @@ class RuleExecutionUseCase:
         self._rate_limiter = rate_limiter
         handler_list = handlers or self._build_default_handlers()
         self._handlers = {handler.action_type: handler for handler in handler_list}
+        self._rules_cache_ttl_seconds = rules_cache_ttl_seconds
+        self._rules_cache: dict[tuple[int, str], tuple[float, list[dict[str, Any]]]] = {}
+
+    async def _get_rules(self, user_id: int, event_type: str) -> list[dict[str, Any]]:
+        if self._rules_cache_ttl_seconds <= 0:
+            return await self._rule_repository.async_get_rules_by_event_type(user_id, event_type)
+
+        key = (user_id, event_type)
+        now = time.monotonic()
+        cached = self._rules_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        rules = await self._rule_repository.async_get_rules_by_event_type(user_id, event_type)
+        if len(self._rules_cache) >= _RULE_CACHE_MAX_ENTRIES:
+            for stale in [k for k, (expires, _) in self._rules_cache.items() if expires <= now]:
+                del self._rules_cache[stale]
+            if len(self._rules_cache) >= _RULE_CACHE_MAX_ENTRIES:
+                self._rules_cache.clear()
+        self._rules_cache[key] = (now + self._rules_cache_ttl_seconds, rules)
+        return rules
 
     async def evaluate_and_execute(
         self,
@@ -329,7 +358,7 @@ class RuleExecutionUseCase:
             )
             return []
 
-        rules = await self._rule_repository.async_get_rules_by_event_type(user_id, event_type)
+        rules = await self._get_rules(user_id, event_type)
         if not rules:
             return []
 
@@ -349,11 +378,10 @@ class RuleExecutionUseCase:
 
             started_at = time.monotonic()
             error: str | None = None
-            matched, conditions_result = RuleConditionEvaluator.evaluate_conditions(
+            matched, conditions_result = compile_conditions(
                 rule.get("conditions_json") or [],
-                context,
                 rule.get("match_mode") or "all",
-            )
+            ).evaluate(context)
             actions_taken: list[RuleActionResultDTO] = []
 
             try:
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from app.application.ports.requests import (
         CrawlResultRepositoryPort,
         LLMRepositoryPort,
@@ -13,6 +15,13 @@ if TYPE_CHECKING:
     from app.application.ports.summaries import SummaryRepositoryPort
 
 
+def _clean_search(search: str | None) -> str | None:
+    # Normalise empty / whitespace-only search to None so the repo
+    # does not run a wildcard ILIKE that matches every row.
+    cleaned = search.strip() if search else None
+    return cleaned or None
+
+
 class SummaryReadModelUseCase:
     """Orchestrates summary operations for presentation adapters.
 
@@ -44,11 +53,6 @@ class SummaryReadModelUseCase:
         sort: str = "created_at_desc",
         search: str | None = None,
     ) -> tuple[list[dict[str, Any]], int, int]:
-        # Normalise empty / whitespace-only search to None so the repo
-        # does not run a wildcard ILIKE that matches every row.
-        cleaned_search = search.strip() if search else None
-        if not cleaned_search:
-            cleaned_search = None
         return await self._summary_repo.async_get_user_summaries(
             user_id=user_id,
             limit=limit,
@@ -59,8 +63,44 @@ class SummaryReadModelUseCase:
             start_date=start_date,
             end_date=end_date,
             sort=sort,
-            search=cleaned_search,
+            search=_clean_search(search),
+        )
+
+    async def get_user_summary_page(
+        self,
+        user_id: int,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        after: tuple[datetime, int] | None = None,
+        is_read: bool | None = None,
+        is_favorited: bool | None = None,
+        lang: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        sort: str = "created_at_desc",
+        search: str | None = None,
+    ) -> tuple[list[dict[str, Any]], bool, int, int]:
+        """Return one list-view page as ``(cards, has_more, total, unread_count)``.
+
+        *after* is the ``(request created_at, request id)`` of the previous
+        page's last card; when given, *offset* is ignored.
+        """
+        filters: dict[str, Any] = {
+            "is_read": is_read,
+            "is_favorited": is_favorited,
+            "lang": lang,
+            "start_date": start_date,
+            "end_date": end_date,
+            "search": _clean_search(search),
+        }
+        cards = await self._summary_repo.async_get_user_summary_cards(
+            user_id, limit=limit + 1, after=after, offset=offset, sort=sort, **filters
+        )
+        total, unread_count = await self._summary_repo.async_get_user_summary_counts(
+            user_id, **filters
         )
+        return cards[:limit], len(cards) > limit, total, unread_count
 
     _BULK_MAX_IDS = 500
 
@@ -24,8 +24,9 @@ from app.infrastructure.persistence.repositories.request_repository import (
 from app.infrastructure.persistence.repositories.summary_repository import (
     SummaryRepositoryAdapter,
 )
+from app.infrastructure.vector.async_qdrant_store import AsyncQdrantVectorStore
 from app.infrastructure.vector.metadata_builder import MetadataBuilder
-from app.infrastructure.vector.qdrant_store import QdrantVectorStore
+from app.infrastructure.vector.write_batcher import QdrantWriteBatcher
 
 logger = get_logger(__name__)
 
@@ -119,7 +120,7 @@ async def backfill_vector_store(
     *,
     limit: int | None = None,
     force: bool = False,
-    batch_size: int = 50,
+    batch_size: int = 256,
     dry_run: bool = False,
 ) -> None:
     logger.info(
@@ -147,7 +148,7 @@ async def backfill_vector_store(
             _summary_ids(summaries),
         )
 
-        vector_store = QdrantVectorStore(
+        vector_store = AsyncQdrantVectorStore(
             url=qdrant_cfg.url,
             api_key=qdrant_cfg.api_key,
             environment=qdrant_cfg.environment,
@@ -157,33 +158,16 @@ async def backfill_vector_store(
             embedding_dim=app_cfg.embedding.embedding_dim,
             required=qdrant_cfg.required,
             connection_timeout=qdrant_cfg.connection_timeout,
+            prefer_grpc=qdrant_cfg.prefer_grpc,
         )
+        await vector_store.connect()
+        # Writes from many summaries share one hash lookup and one wait=False
+        # upsert per batch; close() ends with a consistency barrier.
+        writer = QdrantWriteBatcher(vector_store, max_points=batch_size)
 
         processed = 0
         deleted = 0
         skipped = 0
-        pending_requests: list[tuple[int, list[list[float]], list[dict[str, Any]]]] = []
-        pending_vector_count = 0
-
-        def flush_pending() -> None:
-            nonlocal pending_vector_count
-            if dry_run:
-                logger.info(
-                    "vector_backfill_dry_run_flush",
-                    extra={"pending_requests": len(pending_requests)},
-                )
-                pending_requests.clear()
-                pending_vector_count = 0
-                return
-            for pending_request_id, request_vectors, request_metadata in pending_requests:
-                vector_store.replace_request_notes(
-                    pending_request_id,
-                    request_vectors,
-                    request_metadata,
-                )
-            pending_requests.clear()
-            pending_vector_count = 0
-
         generated_summary_ids: list[int] = []
         for summary in summaries:
             summary_id = summary.get("id")
@@ -229,7 +213,7 @@ async def backfill_vector_store(
                     extra={"request_id": request_id, "summary_id": summary_id},
                 )
                 if not dry_run:
-                    vector_store.delete_by_request_id(request_id)
+                    await writer.delete_by_request_id(request_id)
                 deleted += 1
                 continue
 
@@ -278,7 +262,7 @@ async def backfill_vector_store(
                         extra={"request_id": request_id, "summary_id": summary_id},
                     )
                     if not dry_run:
-                        vector_store.delete_by_request_id(request_id)
+                        await writer.delete_by_request_id(request_id)
                     deleted += 1
                     continue
 
@@ -294,23 +278,26 @@ async def backfill_vector_store(
                     extra={"request_id": request_id, "summary_id": summary_id},
                 )
                 if not dry_run:
-                    vector_store.delete_by_request_id(request_id)
+                    await writer.delete_by_request_id(request_id)
                 deleted += 1
                 continue
 
-            pending_requests.append((request_id, request_vectors, request_metadata))
-            pending_vector_count += len(request_vectors)
             processed += len(request_vectors)
+            if dry_run:
+                continue
+            await writer.replace_request_notes(request_id, request_vectors, request_metadata)
 
-            if pending_vector_count >= batch_size:
-                flush_pending()
-
-        if pending_requests:
-            flush_pending()
+        write_stats = await writer.close()
+        await vector_store.aclose()
 
         logger.info(
             "vector_backfill_complete",
-            extra={"processed": processed, "deleted": deleted, "skipped": skipped},
+            extra={
+                "processed": processed,
+                "deleted": deleted,
+                "skipped": skipped,
+                **write_stats.as_dict(),
+            },
         )
     finally:
         await db.dispose()
@@ -333,6 +320,7 @@ def _load_qdrant_config(
         collection_version=collection_version or base_cfg.collection_version,
         required=base_cfg.required,
         connection_timeout=base_cfg.connection_timeout,
+        prefer_grpc=base_cfg.prefer_grpc,
     )
 
 
@@ -345,7 +333,7 @@ def main() -> int:
     qdrant_version = None
     limit = None
     force = False
-    batch_size = 50
+    batch_size = 256
     dry_run = False
     use_cocoindex = False
 
@@ -397,7 +385,7 @@ def main() -> int:
             print("  --limit=N               Process only N summaries")
             print("  --force                 Regenerate embeddings even if they exist")
             print("  --dry-run               Simulate without writing to Qdrant")
-            print("  --batch-size=N          Number of vectors per upsert batch (default: 50)")
+            print("  --batch-size=N          Number of vectors per upsert batch (default: 256)")
             print("  --use-cocoindex         Delegate to CocoIndex flow (requires cocoindex extra)")
             print("  --help, -h              Show this help message")
             return 0
@@ -0,0 +1,177 @@
+"""CLI tool to incrementally rebuild the PostgreSQL topic search index."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func, select
+
+from app.cli._runtime import prepare_config as _prepare_config
+from app.core.logging_utils import get_logger, setup_json_logging
+from app.db.models import Summary
+from app.db.topic_search_manager import REINDEX_CHUNK_SIZE, TopicSearchIndexManager
+from app.di.database import build_runtime_database
+
+if TYPE_CHECKING:
+    from app.db.session import Database
+    from app.db.topic_search_manager import TopicSearchReindexProgress
+
+logger = get_logger(__name__)
+
+__all__ = ["main", "run_reindex_cli"]
+
+DEFAULT_CHECKPOINT = Path("topic_search_reindex.checkpoint.json")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Incrementally rebuild the topic search index. Progress is checkpointed "
+            "after every chunk; rerunning after an interruption resumes from it."
+        ),
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=REINDEX_CHUNK_SIZE,
+        help=f"Summaries rebuilt per transaction (default: {REINDEX_CHUNK_SIZE}).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Rewrite every row even when its content hash is unchanged.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=DEFAULT_CHECKPOINT,
+        help=f"Checkpoint file used to resume interrupted runs (default: {DEFAULT_CHECKPOINT}).",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        default=False,
+        help="Ignore an existing checkpoint and start from the first summary.",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="INFO",
+        help="Override the configured log level for this session.",
+    )
+    parser.add_argument(
+        "--env-file",
+        type=Path,
+        help="Path to a .env file containing environment variables for the run.",
+    )
+    args = parser.parse_args(argv)
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+    return args
+
+
+def read_checkpoint(path: Path) -> int:
+    """Return the last fully indexed request id stored in ``path`` (0 if none)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as exc:
+        logger.warning(
+            "topic_search_reindex_checkpoint_unreadable",
+            extra={"path": str(path), "error": str(exc)},
+        )
+        return 0
+    value = data.get("last_request_id") if isinstance(data, dict) else None
+    return value if isinstance(value, int) and value > 0 else 0
+
+
+def write_checkpoint(path: Path, last_request_id: int) -> None:
+    """Atomically persist the resume point."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps({"last_request_id": last_request_id}), encoding="utf-8")
+    tmp.replace(path)
+
+
+async def _count_summaries(db: Database, after_request_id: int) -> int:
+    async with db.session() as session:
+        total = await session.scalar(
+            select(func.count())
+            .select_from(Summary)
+            .where(Summary.request_id > after_request_id, Summary.json_payload.is_not(None))
+        )
+    return int(total or 0)
+
+
+def _format_progress(progress: TopicSearchReindexProgress, total: int, started: float) -> str:
+    elapsed = max(time.monotonic() - started, 1e-9)
+    percent = 100.0 * progress.scanned / total if total else 100.0
+    return (
+        f"scanned={progress.scanned}/{total} ({percent:.1f}%) "
+        f"written={progress.written} unchanged={progress.unchanged} "
+        f"removed={progress.removed} last_request_id={progress.last_request_id} "
+        f"rate={progress.scanned / elapsed:.0f}/s"
+    )
+
+
+async def run_reindex_cli(args: argparse.Namespace) -> TopicSearchReindexProgress:
+    """Run the incremental reindex described by parsed CLI arguments."""
+    cfg = _prepare_config(args)
+    setup_json_logging(cfg.runtime.log_level)
+
+    after_request_id = 0 if args.restart else read_checkpoint(args.checkpoint)
+    if after_request_id:
+        print(f"resuming_after_request_id={after_request_id}")
+
+    db = build_runtime_database(cfg, migrate=False)
+    try:
+        total = await _count_summaries(db, after_request_id)
+        manager = TopicSearchIndexManager(db, logger)
+        started = time.monotonic()
+
+        def report(progress: TopicSearchReindexProgress) -> None:
+            write_checkpoint(args.checkpoint, progress.last_request_id)
+            print(_format_progress(progress, total, started), flush=True)
+
+        progress = await manager.reindex(
+            after_request_id=after_request_id,
+            chunk_size=args.chunk_size,
+            force=args.force,
+            on_chunk=report,
+        )
+    finally:
+        await db.dispose()
+
+    args.checkpoint.unlink(missing_ok=True)
+    print("reindex_complete=true")
+    return progress
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``python -m app.cli.reindex_topic_search``."""
+    args = parse_args(argv)
+    try:
+        asyncio.run(run_reindex_cli(args))
+    except SystemExit as exc:
+        code = exc.code
+        return int(code) if isinstance(code, int) else 1
+    except KeyboardInterrupt:  # pragma: no cover - user cancelled
+        print(f"interrupted; rerun to resume from {args.checkpoint}", file=sys.stderr)
+        return 130
+    except Exception as exc:
+        logger.exception("cli_reindex_topic_search_failed", exc_info=exc)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
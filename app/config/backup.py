@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_validator
 
 
@@ -28,6 +30,15 @@ class BackupConfig(BaseModel):
         ),
     )
 
+    compression: Literal["deflate", "zstd"] = Field(
+        default="deflate",
+        validation_alias="BACKUP_COMPRESSION",
+        description=(
+            "ZIP entry compression for new backups. 'zstd' needs Python 3.14+; "
+            "older interpreters fall back to deflate."
+        ),
+    )
+
     max_restore_bytes: int = Field(
         default=100 * 1024 * 1024,
         ge=1024,
@@ -340,6 +340,20 @@ class EmbeddingConfig(BaseModel):
     )
     gemini_dimensions: int = Field(default=768, validation_alias="GEMINI_EMBEDDING_DIMENSIONS")
     max_token_length: int = Field(default=512, validation_alias="EMBEDDING_MAX_TOKEN_LENGTH")
+    batch_max_size: int = Field(
+        default=32,
+        ge=1,
+        le=256,
+        validation_alias="EMBEDDING_BATCH_MAX_SIZE",
+        description="Most concurrent single-text requests coalesced into one encode (1 disables).",
+    )
+    batch_max_wait_ms: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=1000.0,
+        validation_alias="EMBEDDING_BATCH_MAX_WAIT_MS",
+        description="How long a single-text request may wait for others to join its batch.",
+    )
 
     @property
     def embedding_dim(self) -> int:
@@ -430,6 +444,11 @@ class QdrantConfig(BaseModel):
         validation_alias="QDRANT_CONNECTION_TIMEOUT",
         description="Connection timeout in seconds for Qdrant HTTP client",
     )
+    prefer_grpc: bool = Field(
+        default=True,
+        validation_alias="QDRANT_PREFER_GRPC",
+        description="Use gRPC for bulk async writes when the server exposes it; falls back to REST",
+    )
 
     @field_validator("url", mode="before")
     @classmethod
@@ -64,6 +64,30 @@ class YouTubeConfig(BaseModel):
         description="Preferred subtitle languages (fallback order)",
     )
 
+    archive_max_concurrent: int = Field(
+        default=1,
+        validation_alias="YOUTUBE_ARCHIVE_MAX_CONCURRENT",
+        description="Maximum concurrent background video archival downloads",
+    )
+
+    archive_rate_limit_kbps: int = Field(
+        default=8192,
+        validation_alias="YOUTUBE_ARCHIVE_RATE_LIMIT_KBPS",
+        description="Per-download bandwidth cap for archival downloads in KiB/s (0 = unlimited)",
+    )
+
+    storage_reconcile_interval_hours: int = Field(
+        default=24,
+        validation_alias="YOUTUBE_STORAGE_RECONCILE_INTERVAL_HOURS",
+        description="How often the storage ledger is rebuilt from a full directory scan",
+    )
+
+    archive_timeout_sec: float = Field(
+        default=1800.0,
+        validation_alias="YOUTUBE_ARCHIVE_TIMEOUT_SEC",
+        description="Timeout for a single background archival download",
+    )
+
     @field_validator("subtitle_languages", mode="before")
     @classmethod
     def _parse_subtitle_languages(cls, value: Any) -> list[str]:
@@ -73,7 +97,15 @@ class YouTubeConfig(BaseModel):
             return [lang.strip() for lang in value.split(",") if lang.strip()]
         return ["en", "ru"]
 
-    @field_validator("max_video_size_mb", "max_storage_gb", "cleanup_after_days", mode="before")
+    @field_validator(
+        "max_video_size_mb",
+        "max_storage_gb",
+        "cleanup_after_days",
+        "archive_max_concurrent",
+        "archive_rate_limit_kbps",
+        "storage_reconcile_interval_hours",
+        mode="before",
+    )
     @classmethod
     def _parse_int_fields(cls, value: Any, info: ValidationInfo) -> int:
         if value in (None, ""):
@@ -229,6 +261,24 @@ class AttachmentConfig(BaseModel):
         description="Minimum vector path count on a page to treat it as a figure page for vision rendering",
     )
 
+    pdf_parallel_min_pages: int = Field(
+        default=24,
+        validation_alias="ATTACHMENT_PDF_PARALLEL_MIN_PAGES",
+        description="PDFs with at least this many pages are processed in the worker pool (0 = never)",
+    )
+
+    pdf_worker_processes: int = Field(
+        default=0,
+        validation_alias="ATTACHMENT_PDF_WORKER_PROCESSES",
+        description="Size of the PDF worker process pool (0 = min(4, CPU count))",
+    )
+
+    pdf_max_inflight_renders: int = Field(
+        default=4,
+        validation_alias="ATTACHMENT_PDF_MAX_INFLIGHT_RENDERS",
+        description="Maximum PDF pages rendered to images concurrently",
+    )
+
     document_processing_enabled: bool = Field(
         default=True,
         validation_alias="ATTACHMENT_DOCUMENT_PROCESSING_ENABLED",
@@ -258,6 +308,9 @@ class AttachmentConfig(BaseModel):
         "pdf_max_embedded_images",
         "pdf_max_image_uris_total",
         "pdf_vector_draw_threshold",
+        "pdf_parallel_min_pages",
+        "pdf_worker_processes",
+        "pdf_max_inflight_renders",
         "video_max_download_size_mb",
         "video_timeout_sec",
         "video_cleanup_after_hours",
@@ -64,6 +64,29 @@ class RedisConfig(BaseModel):
         description="TTL for embedding results cache (default: 24 hours)",
     )
 
+    # In-process tier in front of Redis and value encoding
+    local_cache_max_entries: int = Field(
+        default=2_048,
+        ge=1,
+        le=1_000_000,
+        validation_alias="REDIS_LOCAL_CACHE_MAX_ENTRIES",
+        description="Maximum entries held by the per-process cache tier",
+    )
+    local_cache_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        le=3_600,
+        validation_alias="REDIS_LOCAL_CACHE_TTL_SECONDS",
+        description="Upper bound on per-process cache entry lifetime; 0 disables the tier",
+    )
+    cache_compress_min_bytes: int = Field(
+        default=4_096,
+        ge=0,
+        le=16_777_216,
+        validation_alias="REDIS_CACHE_COMPRESS_MIN_BYTES",
+        description="Compress cached values at least this large; 0 disables compression",
+    )
+
     @field_validator("url", mode="before")
     @classmethod
     def _normalize_url(cls, value: Any) -> str | None:
@@ -44,6 +44,27 @@ class RSSConfig(BaseModel):
         le=10,
         description="Parallel LLM summarization calls",
     )
+    poll_concurrency: int = Field(
+        default=16,
+        validation_alias="RSS_POLL_CONCURRENCY",
+        ge=1,
+        le=128,
+        description="Feeds fetched in parallel per poll cycle",
+    )
+    poll_per_host_concurrency: int = Field(
+        default=2,
+        validation_alias="RSS_POLL_PER_HOST_CONCURRENCY",
+        ge=1,
+        le=16,
+        description="Feeds fetched in parallel from one host",
+    )
+    poll_parse_workers: int = Field(
+        default=0,
+        validation_alias="RSS_POLL_PARSE_WORKERS",
+        ge=0,
+        le=16,
+        description="Process-pool size for feed parsing (0 = default thread pool)",
+    )
     scrape_short_content: bool = Field(
         default=False,
         validation_alias="RSS_SCRAPE_SHORT_CONTENT",
@@ -28,6 +28,9 @@ class RuntimeConfig(BaseModel):
     enable_textacy: bool = Field(default=False, validation_alias="TEXTACY_ENABLED")
     enable_chunking: bool = Field(default=True, validation_alias="CHUNKING_ENABLED")
     chunk_max_chars: int = Field(default=200000, validation_alias="CHUNK_MAX_CHARS")
+    chunk_latency_budget_sec: float = Field(
+        default=90.0, validation_alias="CHUNK_LATENCY_BUDGET_SEC"
+    )
     log_truncate_length: int = Field(default=1000, validation_alias="LOG_TRUNCATE_LENGTH")
     topic_search_max_results: int = Field(default=5, validation_alias="TOPIC_SEARCH_MAX_RESULTS")
     max_concurrent_calls: int = Field(default=4, validation_alias="MAX_CONCURRENT_CALLS")
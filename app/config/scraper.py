@@ -95,6 +95,47 @@ class ScraperConfig(BaseModel):
         validation_alias="SCRAPER_PROVIDER_ORDER",
         description="Ordered list of scraping providers to try",
     )
+    race_enabled: bool = Field(
+        default=False,
+        validation_alias="SCRAPER_RACE_ENABLED",
+        description=(
+            "Hedge the provider chain: start the next provider while the current one "
+            "is still running instead of waiting for it to time out"
+        ),
+    )
+    race_hedge_delay_ms: int = Field(
+        default=2000,
+        validation_alias="SCRAPER_RACE_HEDGE_DELAY_MS",
+        description=(
+            "Delay before the next provider is started in race mode; a provider "
+            "running past its own p50 latency triggers the hedge earlier"
+        ),
+    )
+    adaptive_order_enabled: bool = Field(
+        default=False,
+        validation_alias="SCRAPER_ADAPTIVE_ORDER_ENABLED",
+        description="Reorder providers per domain from learned success, latency and quality",
+    )
+    adaptive_order_state_path: str = Field(
+        default="/data/scraper_provider_stats.json",
+        validation_alias="SCRAPER_ADAPTIVE_ORDER_STATE_PATH",
+        description="JSON file the learned per-domain statistics persist to; empty keeps them in memory",
+    )
+    adaptive_order_half_life_hours: int = Field(
+        default=168,
+        validation_alias="SCRAPER_ADAPTIVE_ORDER_HALF_LIFE_HOURS",
+        description="Half-life of learned per-domain statistics",
+    )
+    adaptive_order_max_domains: int = Field(
+        default=2048,
+        validation_alias="SCRAPER_ADAPTIVE_ORDER_MAX_DOMAINS",
+        description="Most domains kept in the learned ordering state (least recently used evicted)",
+    )
+    browser_max_concurrency: int = Field(
+        default=2,
+        validation_alias="SCRAPER_BROWSER_MAX_CONCURRENCY",
+        description="Most concurrent calls per browser provider (playwright/crawlee)",
+    )
 
     scrapling_enabled: bool = Field(
         default=True,
@@ -365,6 +406,10 @@ class ScraperConfig(BaseModel):
 
     @field_validator(
         "min_content_length",
+        "race_hedge_delay_ms",
+        "browser_max_concurrency",
+        "adaptive_order_half_life_hours",
+        "adaptive_order_max_domains",
         "scrapling_timeout_sec",
         "defuddle_timeout_sec",
         "firecrawl_timeout_sec",
@@ -396,6 +441,10 @@ class ScraperConfig(BaseModel):
 
         bounds: dict[str, tuple[int, int]] = {
             "min_content_length": (50, 20_000),
+            "race_hedge_delay_ms": (0, 60_000),
+            "browser_max_concurrency": (1, 32),
+            "adaptive_order_half_life_hours": (1, 24 * 365),
+            "adaptive_order_max_domains": (16, 1_000_000),
             "scrapling_timeout_sec": (1, 300),
             "defuddle_timeout_sec": (1, 300),
             "firecrawl_timeout_sec": (1, 300),
@@ -1,50 +1,184 @@
-"""Token counting utilities for LLM content budgeting."""
+"""Token counting utilities for LLM content budgeting.
+
+Counts are exact when tiktoken and the encoding for the target model are
+available, and fall back to a ~4 chars/token heuristic otherwise. Exact counts
+are memoized by content hash, so repeated prompt pieces (system prompts, shared
+instructions) are only encoded once per encoding.
+"""
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 from app.core.logging_utils import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = get_logger(__name__)
 
-_encoder = None
-_encoder_loaded = False
+DEFAULT_ENCODING = "cl100k_base"
+
+# Model-name fragments (provider prefix stripped) whose tokenizer is o200k_base.
+# Everything else - including non-OpenAI families, whose tokenizers tiktoken
+# does not ship - is counted with cl100k_base as the closest approximation.
+_O200K_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-4.5", "gpt-5", "gpt-oss", "o1", "o3", "o4")
+
+_COUNT_CACHE_MAX_ENTRIES = 8192
+# Strings shorter than this are cheaper to encode than to hash and cache.
+_MIN_MEMOIZED_CHARS = 64
+_BATCH_THREADS = 4
+
+_encoders: dict[str, Any | None] = {}
+_encoders_lock = threading.Lock()
+_count_cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_count_cache_lock = threading.Lock()
+
+
+def encoding_for_model(model: str | None) -> str:
+    """Return the tiktoken encoding name for an OpenRouter-style model id."""
+    if not model:
+        return DEFAULT_ENCODING
+    name = model.lower().rsplit("/", 1)[-1]
+    if name.startswith(_O200K_MODEL_PREFIXES):
+        return "o200k_base"
+    return DEFAULT_ENCODING
+
+
+def _get_encoder(encoding: str = DEFAULT_ENCODING) -> Any | None:
+    """Lazily load a tiktoken encoder. Returns None if it cannot be loaded."""
+    if encoding in _encoders:
+        return _encoders[encoding]
+    with _encoders_lock:
+        if encoding in _encoders:
+            return _encoders[encoding]
+        try:
+            import tiktoken
+
+            enc = tiktoken.get_encoding(encoding)
+        except (ImportError, AttributeError, ValueError, KeyError, RuntimeError, OSError):
+            # OSError covers the encoding file download failing in offline deployments.
+            logger.debug(
+                "encoder package unavailable, using heuristic budget estimation",
+                extra={"encoding": encoding},
+            )
+            enc = None
+        _encoders[encoding] = enc
+        return enc
+
+
+def _heuristic_count(text: str) -> int:
+    # ~4 chars per token for English text
+    return max(1, len(text) // 4)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for hot paths; never encodes or hashes.
+
+    ASCII text is assumed to average 3 chars/token (real BPE encoders average
+    ~4); every extra UTF-8 byte of non-ASCII text adds half a token. This
+    usually errs high for prose in cl100k_base and o200k_base, but it is not a
+    guaranteed bound: dense symbols or rare scripts can encode to more tokens.
+    """
+    if not text:
+        return 0
+    if text.isascii():
+        return len(text) // 3 + 1
+    extra_bytes = len(text.encode("utf-8")) - len(text)
+    return len(text) // 3 + extra_bytes // 2 + 1
+
+
+def _cache_key(encoding: str, text: str) -> tuple[str, bytes]:
+    return encoding, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
 
 
-def _get_encoder() -> Any | None:
-    """Lazily load tiktoken encoder. Returns None if tiktoken unavailable."""
-    global _encoder, _encoder_loaded
-    if _encoder_loaded:
-        return _encoder
-    _encoder_loaded = True
-    try:
-        import tiktoken
+def _cache_get(key: tuple[str, bytes]) -> int | None:
+    with _count_cache_lock:
+        count = _count_cache.get(key)
+        if count is not None:
+            _count_cache.move_to_end(key)
+        return count
 
-        _encoder = tiktoken.get_encoding("cl100k_base")
-    except (ImportError, AttributeError, ValueError, KeyError, RuntimeError):
-        logger.debug("encoder package unavailable, using heuristic budget estimation")
-        _encoder = None
-    return _encoder
 
+def _cache_put(key: tuple[str, bytes], count: int) -> None:
+    with _count_cache_lock:
+        _count_cache[key] = count
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > _COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.popitem(last=False)
 
-def count_tokens(text: str) -> int:
-    """Count tokens in text using tiktoken if available, else heuristic.
 
-    Uses cl100k_base encoding (GPT-4 / most modern models). Falls back
-    to len(text) // 4 which is more accurate than the previous //3 heuristic.
+def clear_token_count_cache() -> None:
+    """Drop all memoized token counts."""
+    with _count_cache_lock:
+        _count_cache.clear()
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Count tokens in text using the tokenizer for ``model`` if available, else heuristic.
 
     Args:
         text: Input text to count tokens for.
+        model: Target model id; selects the encoder family (cl100k_base by default).
 
     Returns:
-        Estimated token count.
+        Token count (estimated when no encoder is available).
+    """
+    return count_tokens_batch([text], model)[0]
+
+
+def count_tokens_batch(texts: Sequence[str], model: str | None = None) -> list[int]:
+    """Count tokens for many strings at once, in input order.
+
+    Memoized counts are reused; the remaining strings are encoded with tiktoken's
+    ``encode_batch``, which spreads the work over a small thread pool (the BPE
+    core releases the GIL).
     """
-    enc = _get_encoder()
-    if enc is not None:
+    encoding = encoding_for_model(model)
+    enc = _get_encoder(encoding)
+    if enc is None:
+        return [_heuristic_count(text) for text in texts]
+
+    counts: list[int | None] = [None] * len(texts)
+    pending: list[int] = []
+    keys: dict[int, tuple[str, bytes]] = {}
+    for i, text in enumerate(texts):
+        if len(text) >= _MIN_MEMOIZED_CHARS:
+            key = _cache_key(encoding, text)
+            cached = _cache_get(key)
+            if cached is not None:
+                counts[i] = cached
+                continue
+            keys[i] = key
+        pending.append(i)
+
+    if pending:
+        batch = [texts[i] for i in pending]
         try:
-            return len(enc.encode(text))
+            if len(batch) == 1:
+                encoded = [enc.encode(batch[0], disallowed_special=())]
+            else:
+                encoded = enc.encode_batch(batch, num_threads=_BATCH_THREADS, disallowed_special=())
         except (AttributeError, RuntimeError, TypeError, ValueError):
-            return max(1, len(text) // 4)
-    # Fallback: ~4 chars per token for English text
-    return max(1, len(text) // 4)
+            encoded = None
+        for pos, i in enumerate(pending):
+            if encoded is None:
+                counts[i] = _heuristic_count(texts[i])
+                continue
+            count = len(encoded[pos])
+            counts[i] = count
+            if i in keys:
+                _cache_put(keys[i], count)
+
+    return [count or 0 for count in counts]
+
+
+async def acount_tokens_batch(texts: Sequence[str], model: str | None = None) -> list[int]:
+    """Async ``count_tokens_batch`` that encodes off the event loop."""
+    if not texts:
+        return []
+    return await asyncio.to_thread(count_tokens_batch, list(texts), model)
@@ -0,0 +1,60 @@
+"""Add ``server_version`` indexes for keyset sync pages.
+
+``SyncRecordCollector.collect_page`` pushes the delta cursor into every
+per-entity query:
+
+    SELECT ... WHERE <owner> = :user_id AND server_version > :since
+    ORDER BY server_version, id LIMIT :limit + 1
+
+Without an index on ``server_version`` each delta poll scans the user's whole
+archive to find the handful of changed rows. Tables keyed directly by user get
+a composite ``(user_id, server_version)`` index; tables owned through
+``requests`` get a plain ``server_version`` index so the planner can walk new
+rows in version order and probe the request join.
+
+All indexes are built CONCURRENTLY (no table lock) inside an autocommit block
+per the project convention established in migrations 0010 and 0011.
+
+Revision ID: 0018
+Revises: 0017_merge
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0018"
+down_revision: str = "0017_merge"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_requests_user_id_server_version", "requests", "user_id, server_version"),
+    ("ix_summaries_server_version", "summaries", "server_version"),
+    ("ix_crawl_results_server_version", "crawl_results", "server_version"),
+    ("ix_llm_calls_server_version", "llm_calls", "server_version"),
+    (
+        "ix_summary_highlights_user_id_server_version",
+        "summary_highlights",
+        "user_id, server_version",
+    ),
+    ("ix_tags_user_id_server_version", "tags", "user_id, server_version"),
+    ("ix_summary_tags_server_version", "summary_tags", "server_version"),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY must run outside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.execute(
+                sa.text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in reversed(_INDEXES):
+            op.execute(sa.text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
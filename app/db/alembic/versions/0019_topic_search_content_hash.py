@@ -0,0 +1,34 @@
+"""Add ``content_hash`` to ``topic_search_index`` for incremental reindexing.
+
+``TopicSearchIndexManager.ensure_index`` now walks summaries in keyset chunks
+and compares a sha256 of each rebuilt document against the stored hash, so
+unchanged rows are skipped instead of rewritten.
+
+  * ``content_hash`` — text, nullable. Existing rows get NULL and are
+    rewritten (and hashed) by the first incremental reindex.
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0019"
+down_revision: str = "0018"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "topic_search_index",
+        sa.Column("content_hash", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("topic_search_index", "content_hash")
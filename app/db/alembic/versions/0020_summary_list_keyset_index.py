@@ -0,0 +1,45 @@
+"""Add a ``(user_id, created_at, id)`` index for keyset summary list pages.
+
+The summary list view pages with a keyset cursor on the owning request:
+
+    SELECT ... FROM summaries JOIN requests ON ...
+    WHERE requests.user_id = :user_id
+      AND (requests.created_at, requests.id) < (:created_at, :id)
+    ORDER BY requests.created_at DESC, requests.id DESC LIMIT :limit + 1
+
+``ix_requests_user_id_created_at`` covers the first two columns; adding ``id``
+lets the row comparison and the tie-break be answered from the index, so a deep
+page costs the same seek as the first one.
+
+Built CONCURRENTLY inside an autocommit block per the convention of 0018.
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0020"
+down_revision: str = "0019"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY must run outside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            sa.text(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_requests_user_id_created_at_id "
+                "ON requests (user_id, created_at, id)"
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS ix_requests_user_id_created_at_id"))
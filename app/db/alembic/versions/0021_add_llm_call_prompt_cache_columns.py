@@ -0,0 +1,47 @@
+"""Add prompt-cache accounting columns to ``llm_calls``.
+
+The OpenRouter request builder places cache_control breakpoints on the stable
+system-prompt prefix; these columns record what the provider reported back so
+cache-hit ratio and tokens saved can be reported per prompt and model.
+
+  * ``cache_read_tokens`` — integer, nullable. Prompt tokens served from cache.
+  * ``cache_creation_tokens`` — integer, nullable. Prompt tokens written to cache.
+  * ``prompt_cache_key`` — text, nullable. Short hash of the system prefix.
+
+Backfill-safe: existing rows stay NULL.
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0021"
+down_revision: str = "0020"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "llm_calls",
+        sa.Column("cache_read_tokens", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "llm_calls",
+        sa.Column("cache_creation_tokens", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "llm_calls",
+        sa.Column("prompt_cache_key", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("llm_calls", "prompt_cache_key")
+    op.drop_column("llm_calls", "cache_creation_tokens")
+    op.drop_column("llm_calls", "cache_read_tokens")
@@ -0,0 +1,42 @@
+"""Add archival-download state columns to ``video_downloads``.
+
+YouTube requests now complete as soon as the transcript is available; the full
+video download runs afterwards as a background archival job. ``status`` keeps
+tracking the transcript/metadata stage, these columns track the archive:
+
+  * ``archive_status`` — text, nullable. ``queued``, ``downloading``,
+    ``completed`` or ``error``.
+  * ``archive_error_text`` — text, nullable. Failure reason of the archive job.
+
+Backfill-safe: existing rows stay NULL.
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0022"
+down_revision: str = "0021"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "video_downloads",
+        sa.Column("archive_status", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "video_downloads",
+        sa.Column("archive_error_text", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("video_downloads", "archive_error_text")
+    op.drop_column("video_downloads", "archive_status")
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import case, delete, insert, select, update
 
 from app.core.logging_utils import get_logger
 from app.db.models import LLMCall, Request, Summary
@@ -36,21 +36,39 @@ class BatchOperations:
         return call_ids
 
     async def async_update_request_statuses_batch(self, updates: list[tuple[int, str]]) -> int:
-        """Update multiple request statuses in a single transaction."""
-        if not updates:
+        """Update multiple request statuses with one statement; the last update per id wins."""
+        latest = dict(updates)
+        if not latest:
             return 0
 
-        updated = 0
         async with self.database.transaction() as session:
-            for request_id, status in updates:
-                result = await session.execute(
-                    update(Request).where(Request.id == request_id).values(status=status)
-                )
-                updated += int(result.rowcount or 0)  # type: ignore[attr-defined]
+            result = await session.execute(
+                update(Request)
+                .where(Request.id.in_(latest))
+                .values(status=case(latest, value=Request.id))
+            )
+            updated = int(result.rowcount or 0)  # type: ignore[attr-defined]
 
         logger.info("request_statuses_batch_updated", extra={"count": updated})
         return updated
 
+    async def async_update_bot_reply_message_ids_batch(self, updates: list[tuple[int, int]]) -> int:
+        """Persist bot reply message ids for many requests with one statement."""
+        latest = dict(updates)
+        if not latest:
+            return 0
+
+        async with self.database.transaction() as session:
+            result = await session.execute(
+                update(Request)
+                .where(Request.id.in_(latest))
+                .values(bot_reply_message_id=case(latest, value=Request.id))
+            )
+            updated = int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+        logger.info("bot_reply_message_ids_batch_updated", extra={"count": updated})
+        return updated
+
     async def async_mark_summaries_as_read_batch(self, summary_ids: list[int]) -> int:
         """Mark multiple summaries as read in a single query."""
         if not summary_ids:
@@ -280,6 +280,10 @@ class Request(Base):
         Index("ix_requests_status", "status"),
         Index("ix_requests_created_at", "created_at"),
         Index("ix_requests_user_id_created_at", "user_id", "created_at"),
+        # Keyset scan for sync pages (server_version > :since). Added in migration 0018.
+        Index("ix_requests_user_id_server_version", "user_id", "server_version"),
+        # Keyset scan for summary list pages. Added in migration 0020.
+        Index("ix_requests_user_id_created_at_id", "user_id", "created_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -381,6 +385,8 @@ class TelegramMessage(Base):
 
 class CrawlResult(Base):
     __tablename__ = "crawl_results"
+    # Keyset scan for sync pages (server_version > :since). Added in migration 0018.
+    __table_args__ = (Index("ix_crawl_results_server_version", "server_version"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     request_id: Mapped[int] = mapped_column(
@@ -433,6 +439,8 @@ class LLMCall(Base):
             "attempt_index",
             name="uq_llm_calls_request_id_attempt_index",
         ),
+        # Keyset scan for sync pages (server_version > :since). Added in migration 0018.
+        Index("ix_llm_calls_server_version", "server_version"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -482,6 +490,11 @@ class LLMCall(Base):
         Boolean, default=False, server_default="false", nullable=False
     )
     total_latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Provider prompt-cache accounting (migration 0021). ``prompt_cache_key``
+    # hashes the system prefix so hit ratios can be grouped per prompt.
+    cache_read_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cache_creation_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    prompt_cache_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True), default=_utcnow, nullable=False
     )
@@ -510,6 +523,8 @@ class Summary(Base):
             "updated_at",
             postgresql_where="is_deleted = false",
         ),
+        # Keyset scan for sync pages (server_version > :since). Added in migration 0018.
+        Index("ix_summaries_server_version", "server_version"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -686,6 +701,8 @@ class VideoDownload(Base):
     )
     status: Mapped[str] = mapped_column(Text, default="pending", nullable=False)
     error_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    archive_status: Mapped[str | None] = mapped_column(Text, nullable=True)
+    archive_error_text: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     request: Mapped[Request] = relationship(back_populates="video_download")
 
@@ -27,6 +27,9 @@ class TopicSearchIndex(Base):
     published_at: Mapped[str | None] = mapped_column(Text, nullable=True)
     body: Mapped[str | None] = mapped_column(Text, nullable=True)
     tags: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # sha256 of the indexed fields; lets incremental reindexing skip unchanged
+    # rows. Added in migration 0019.
+    content_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
     body_tsv: Mapped[Any] = mapped_column(
         TSVECTOR,
         Computed(
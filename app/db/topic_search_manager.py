@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import delete, select, text
@@ -15,9 +17,35 @@ from app.db.models import Request, Summary, TopicSearchIndex
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Callable, Mapping
 
     from app.db.session import Database
 
+# Summaries rebuilt per keyset chunk; each chunk is its own short transaction.
+REINDEX_CHUNK_SIZE = 500
+
+_INDEXED_FIELDS = ("url", "title", "snippet", "source", "published_at", "body", "tags")
+
+
+def topic_search_content_hash(values: Mapping[str, Any]) -> str:
+    """Return the sha256 of the indexed fields of a topic search row."""
+    digest = hashlib.sha256()
+    for field in _INDEXED_FIELDS:
+        digest.update(str(values.get(field) or "").encode())
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class TopicSearchReindexProgress:
+    """Running totals of an incremental reindex, reported after every chunk."""
+
+    scanned: int = 0
+    written: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    last_request_id: int = 0
+
 
 class TopicSearchIndexManager:
     """Manage PostgreSQL full-text topic search rows."""
@@ -27,27 +55,121 @@ class TopicSearchIndexManager:
         self._logger = logger
 
     async def ensure_index(self) -> None:
-        """Rebuild searchable row content.
+        """Synchronize searchable row content incrementally.
 
         Schema creation and GIN index management belong to Alembic; this method
         only synchronizes denormalized search rows from summaries.
         """
+        progress = await self.reindex()
+        if progress.written or progress.removed:
+            self._logger.info(
+                "topic_search_index_rebuilt",
+                extra={
+                    "rows": progress.written,
+                    "unchanged": progress.unchanged,
+                    "removed": progress.removed,
+                },
+            )
+
+    async def reindex(
+        self,
+        *,
+        after_request_id: int = 0,
+        chunk_size: int = REINDEX_CHUNK_SIZE,
+        force: bool = False,
+        on_chunk: Callable[[TopicSearchReindexProgress], None] | None = None,
+    ) -> TopicSearchReindexProgress:
+        """Rebuild index rows in ``request_id`` keyset chunks.
+
+        Each chunk streams its summaries through a server-side cursor, compares
+        the rebuilt documents with the stored ``content_hash`` and bulk-upserts
+        only the rows that changed (all rows with ``force``). Index rows inside
+        the chunk's key range without an indexable summary are deleted. Every
+        chunk commits on its own, so readers keep seeing the existing index and
+        an interrupted run resumes from ``after_request_id`` (the last
+        ``progress.last_request_id`` reported to ``on_chunk``).
+        """
+        if chunk_size <= 0:
+            msg = "chunk_size must be positive"
+            raise ValueError(msg)
+        progress = TopicSearchReindexProgress(last_request_id=after_request_id)
+        while True:
+            done = await self._reindex_chunk(progress, chunk_size=chunk_size, force=force)
+            if on_chunk is not None:
+                on_chunk(progress)
+            if done:
+                return progress
+
+    async def _reindex_chunk(
+        self,
+        progress: TopicSearchReindexProgress,
+        *,
+        chunk_size: int,
+        force: bool,
+    ) -> bool:
+        lower = progress.last_request_id
+        stmt = (
+            select(
+                Summary.request_id,
+                Summary.json_payload,
+                Request.normalized_url,
+                Request.input_url,
+                Request.content_text,
+            )
+            .join(Request, Summary.request_id == Request.id)
+            .where(Summary.request_id > lower, Summary.json_payload.is_not(None))
+            .order_by(Summary.request_id)
+            .limit(chunk_size)
+            .execution_options(yield_per=chunk_size)
+        )
         async with self._database.transaction() as session:
-            await session.execute(delete(TopicSearchIndex))
-            rows = await session.execute(
-                select(Summary, Request)
-                .join(Request, Summary.request_id == Request.id)
-                .where(Summary.json_payload.is_not(None))
+            values_by_id: dict[int, dict[str, Any]] = {}
+            scanned = 0
+            upper = lower
+            stream = await session.stream(stmt)
+            async for row in stream:
+                scanned += 1
+                upper = row.request_id
+                document = self._document_from_row(row)
+                if document is not None:
+                    values_by_id[row.request_id] = self._index_values(document)
+
+            # The final chunk owns the open-ended tail of the key range.
+            done = scanned < chunk_size
+            in_range = TopicSearchIndex.request_id > lower
+            if not done:
+                in_range = in_range & (TopicSearchIndex.request_id <= upper)
+            stored = dict(
+                (
+                    await session.execute(
+                        select(TopicSearchIndex.request_id, TopicSearchIndex.content_hash).where(
+                            in_range
+                        )
+                    )
+                )
+                .tuples()
+                .all()
             )
-            rebuilt = 0
-            for summary, request in rows.all():
-                document = self._document_from_summary(summary, request)
-                if document is None:
-                    continue
-                await self._write_index(session, document)
-                rebuilt += 1
-        if rebuilt:
-            self._logger.info("topic_search_index_rebuilt", extra={"rows": rebuilt})
+
+            changed = [
+                values
+                for request_id, values in values_by_id.items()
+                if force or stored.get(request_id) != values["content_hash"]
+            ]
+            if changed:
+                await self._write_rows(session, changed)
+            stale = [request_id for request_id in stored if request_id not in values_by_id]
+            if stale:
+                await session.execute(
+                    delete(TopicSearchIndex).where(TopicSearchIndex.request_id.in_(stale))
+                )
+
+        progress.scanned += scanned
+        progress.written += len(changed)
+        progress.unchanged += len(values_by_id) - len(changed)
+        progress.removed += len(stale)
+        progress.last_request_id = upper
+        return done
 
     async def refresh_index(self, request_id: int) -> None:
         try:
@@ -108,40 +230,73 @@ class TopicSearchIndexManager:
 
     @staticmethod
     def _document_from_summary(summary: Summary, request: Request) -> Any | None:
-        payload = ensure_mapping(summary.json_payload)
+        return TopicSearchIndexManager._document_from_values(
+            request_id=request.id,
+            json_payload=summary.json_payload,
+            normalized_url=request.normalized_url,
+            input_url=request.input_url,
+            content_text=request.content_text,
+        )
+
+    @staticmethod
+    def _document_from_row(row: Any) -> Any | None:
+        return TopicSearchIndexManager._document_from_values(
+            request_id=row.request_id,
+            json_payload=row.json_payload,
+            normalized_url=row.normalized_url,
+            input_url=row.input_url,
+            content_text=row.content_text,
+        )
+
+    @staticmethod
+    def _document_from_values(
+        *,
+        request_id: int,
+        json_payload: Any,
+        normalized_url: str | None,
+        input_url: str | None,
+        content_text: str | None,
+    ) -> Any | None:
+        payload = ensure_mapping(json_payload)
         if not payload:
             return None
         request_data = {
-            "normalized_url": request.normalized_url,
-            "input_url": request.input_url,
-            "content_text": request.content_text,
+            "normalized_url": normalized_url,
+            "input_url": input_url,
+            "content_text": content_text,
         }
         return build_topic_search_document(
-            request_id=request.id,
+            request_id=request_id,
             payload=payload,
             request_data=request_data,
         )
 
+    @staticmethod
+    def _index_values(document: Any) -> dict[str, Any]:
+        values = {
+            "request_id": document.request_id,
+            "url": document.url or "",
+            "title": document.title or "",
+            "snippet": document.snippet or "",
+            "source": document.source or "",
+            "published_at": document.published_at or "",
+            "body": document.body,
+            "tags": document.tags_text or "",
+        }
+        values["content_hash"] = topic_search_content_hash(values)
+        return values
+
     @staticmethod
     async def _write_index(session: Any, document: Any) -> None:
-        stmt = insert(TopicSearchIndex).values(
-            request_id=document.request_id,
-            url=document.url or "",
-            title=document.title or "",
-            snippet=document.snippet or "",
-            source=document.source or "",
-            published_at=document.published_at or "",
-            body=document.body,
-            tags=document.tags_text or "",
+        await TopicSearchIndexManager._write_rows(
+            session, [TopicSearchIndexManager._index_values(document)]
         )
+
+    @staticmethod
+    async def _write_rows(session: Any, rows: list[dict[str, Any]]) -> None:
+        stmt = insert(TopicSearchIndex).values(rows)
         update_values = {
-            "url": stmt.excluded.url,
-            "title": stmt.excluded.title,
-            "snippet": stmt.excluded.snippet,
-            "source": stmt.excluded.source,
-            "published_at": stmt.excluded.published_at,
-            "body": stmt.excluded.body,
-            "tags": stmt.excluded.tags,
+            field: getattr(stmt.excluded, field) for field in (*_INDEXED_FIELDS, "content_hash")
         }
         await session.execute(
             stmt.on_conflict_do_update(index_elements=["request_id"], set_=update_values)
@@ -3,24 +3,38 @@
 DB write operations enqueued here are processed sequentially by a dedicated
 asyncio worker task.  Because the worker is bot-scoped (not request-scoped),
 it is never cancelled by URL-processing timeouts -- writes always complete.
+
+Batchable writes (``enqueue_batch``) are collected for a short flush window;
+consecutive payloads with the same ``batch_key`` are handed to their batch
+callback together, so one transaction covers many rows.  Payloads sharing a
+``coalesce_key`` within such a run collapse to the latest one.  Writes are
+never reordered: a different ``batch_key`` or a plain ``enqueue`` operation
+ends the current run.
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
+import time
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from app.core.logging_utils import get_logger
+from app.observability.metrics import record_db_write_flush, record_db_write_queue_depth
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Hashable
 
 logger = get_logger(__name__)
 
 # Sentinel used to signal the worker to shut down.
 _SENTINEL = None
 
+DEFAULT_FLUSH_WINDOW_SECONDS = 0.005
+DEFAULT_MAX_BATCH_SIZE = 100
+
 
 @dataclass(slots=True)
 class _WriteTask:
@@ -36,6 +50,7 @@ class _BatchWriteTask:
     payload: Any
     operation_name: str
     correlation_id: str
+    coalesce_key: Hashable | None = None
 
 
 class DbWriteQueue:
@@ -57,17 +72,31 @@ class DbWriteQueue:
         await queue.stop(timeout=30.0)
     """
 
-    def __init__(self, maxsize: int = 256) -> None:
+    def __init__(
+        self,
+        maxsize: int = 256,
+        *,
+        flush_window_seconds: float = DEFAULT_FLUSH_WINDOW_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
         """Initialize the write queue.
 
         Args:
             maxsize: Maximum number of pending operations before backpressure
                      is applied via ``enqueue`` blocking.
+            flush_window_seconds: How long the worker keeps collecting after
+                     picking up a batchable write, so bursts share a flush.
+            max_batch_size: Upper bound on payloads per batch callback.
         """
+        if max_batch_size <= 0:
+            msg = "max_batch_size must be positive"
+            raise ValueError(msg)
         self._queue: asyncio.Queue[_WriteTask | _BatchWriteTask | None] = asyncio.Queue(
             maxsize=maxsize
         )
         self._worker_task: asyncio.Task[None] | None = None
+        self._flush_window = max(0.0, flush_window_seconds)
+        self._max_batch_size = max_batch_size
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -139,6 +168,7 @@ class DbWriteQueue:
                                this method blocks until space is available).
         """
         await self._queue.put(_WriteTask(operation, operation_name, correlation_id))
+        record_db_write_queue_depth(self._queue.qsize())
         logger.debug(
             "Enqueued %s (correlation_id=%s, pending=%d)",
             operation_name,
@@ -154,8 +184,16 @@ class DbWriteQueue:
         execute_batch: Callable[[list[Any]], Awaitable[None]],
         operation_name: str = "db_write_batch",
         correlation_id: str = "",
+        coalesce_key: Hashable | None = None,
     ) -> None:
-        """Enqueue a batchable write payload for grouped execution."""
+        """Enqueue a batchable write payload for grouped execution.
+
+        Consecutive payloads with the same ``batch_key`` that are queued close
+        together are passed to one ``execute_batch`` call, in enqueue order.
+        When ``coalesce_key`` is set, an earlier payload in the same run with
+        the same key is dropped in favour of this one (e.g. several reply
+        message ids recorded for one request collapse to the last).
+        """
         await self._queue.put(
             _BatchWriteTask(
                 batch_key=batch_key,
@@ -163,8 +201,10 @@ class DbWriteQueue:
                 payload=payload,
                 operation_name=operation_name,
                 correlation_id=correlation_id,
+                coalesce_key=coalesce_key,
             )
         )
+        record_db_write_queue_depth(self._queue.qsize())
         logger.debug(
             "Enqueued batch payload %s (batch_key=%s, pending=%d)",
             operation_name,
@@ -191,7 +231,7 @@ class DbWriteQueue:
         logger.debug("DbWriteQueue worker loop exited")
 
     async def _next_items(self) -> tuple[list[_WriteTask | _BatchWriteTask], bool]:
-        """Pull the next available queue snapshot for ordered processing."""
+        """Pull the next queue snapshot, waiting out the flush window for batch writes."""
         item = await self._queue.get()
         if item is _SENTINEL:
             self._queue.task_done()
@@ -199,12 +239,25 @@ class DbWriteQueue:
 
         items: list[_WriteTask | _BatchWriteTask] = [item]
         stop_requested = False
+        loop = asyncio.get_running_loop()
+        deadline = (
+            loop.time() + self._flush_window
+            if isinstance(item, _BatchWriteTask) and self._flush_window > 0
+            else None
+        )
 
         while True:
             try:
                 queued = self._queue.get_nowait()
             except asyncio.QueueEmpty:
-                break
+                remaining = deadline - loop.time() if deadline is not None else 0.0
+                if remaining <= 0:
+                    break
+                try:
+                    async with asyncio.timeout(remaining):
+                        queued = await self._queue.get()
+                except TimeoutError:
+                    break
 
             if queued is _SENTINEL:
                 self._queue.task_done()
@@ -213,6 +266,7 @@ class DbWriteQueue:
 
             items.append(queued)
 
+        record_db_write_queue_depth(self._queue.qsize())
         return items, stop_requested
 
     async def _drain(self) -> None:
@@ -232,64 +286,50 @@ class DbWriteQueue:
             logger.info("Drained %d remaining items during shutdown", len(drained_items))
 
     async def _process_items(self, items: list[_WriteTask | _BatchWriteTask]) -> None:
-        """Execute a queue snapshot, batching compatible items when possible."""
-        index = 0
-        while index < len(items):
-            item = items[index]
+        """Execute a queue snapshot, grouping batch writes between plain operations."""
+        segment: list[_BatchWriteTask] = []
+        for item in items:
             if isinstance(item, _BatchWriteTask):
-                await self._process_batch_write(items, index)
-                batch_size = self._batch_span(items, index)
-                index += batch_size
+                segment.append(item)
                 continue
-
+            await self._flush_segment(segment)
+            segment = []
             await self._process_item(item)
-            index += 1
-
-    def _batch_span(self, items: list[_WriteTask | _BatchWriteTask], start: int) -> int:
-        """Return the number of consecutive items compatible with a batch task."""
-        first = items[start]
-        if not isinstance(first, _BatchWriteTask):
-            return 1
-
-        size = 1
-        for queued in items[start + 1 :]:
-            if not isinstance(queued, _BatchWriteTask) or queued.batch_key != first.batch_key:
-                break
-            size += 1
-        return size
-
-    async def _process_batch_write(
-        self,
-        items: list[_WriteTask | _BatchWriteTask],
-        start: int,
-    ) -> None:
-        """Execute a consecutive run of batchable items with one callback."""
-        batch_item = items[start]
-        if not isinstance(batch_item, _BatchWriteTask):
-            return
-
-        batch_size = self._batch_span(items, start)
-        payloads = [
-            queued.payload
-            for queued in items[start : start + batch_size]
-            if isinstance(queued, _BatchWriteTask)
-        ]
+        await self._flush_segment(segment)
+
+    async def _flush_segment(self, segment: list[_BatchWriteTask]) -> None:
+        """Run consecutive same-``batch_key`` batch writes together, in enqueue order."""
+        for _, group in itertools.groupby(segment, key=attrgetter("batch_key")):
+            tasks = list(group)
+            kept = _coalesce(tasks)
+            coalesced = len(tasks) - len(kept)
+            for chunk in itertools.batched(kept, self._max_batch_size, strict=False):
+                await self._process_batch_write(list(chunk), coalesced=coalesced)
+                coalesced = 0
+
+    async def _process_batch_write(self, tasks: list[_BatchWriteTask], *, coalesced: int) -> None:
+        """Execute one group of batch writes with a single callback."""
+        first = tasks[0]
+        payloads = [task.payload for task in tasks]
+        started = time.perf_counter()
         try:
-            await batch_item.execute_batch(payloads)
+            await first.execute_batch(payloads)
         except Exception:
             logger.exception(
                 "DbWriteQueue: %s batch failed (batch_key=%s, count=%d)",
-                batch_item.operation_name,
-                batch_item.batch_key,
+                first.operation_name,
+                first.batch_key,
                 len(payloads),
             )
+        record_db_write_flush(
+            operation=first.operation_name,
+            size=len(payloads),
+            coalesced=coalesced,
+            latency_seconds=time.perf_counter() - started,
+        )
 
-    async def _process_item(self, item: _WriteTask | _BatchWriteTask) -> None:
+    async def _process_item(self, item: _WriteTask) -> None:
         """Execute a single non-batched write operation, catching errors."""
-        if isinstance(item, _BatchWriteTask):
-            await self._process_batch_write([item], 0)
-            return
-
         try:
             await self._execute(item.operation)
         except Exception:
@@ -305,3 +345,19 @@ class DbWriteQueue:
         Extracted as a separate method so tests can override or mock it.
         """
         await operation()
+
+
+def _coalesce(tasks: list[_BatchWriteTask]) -> list[_BatchWriteTask]:
+    """Drop batch writes superseded by a later write with the same ``coalesce_key``."""
+    last_index = {
+        task.coalesce_key: index
+        for index, task in enumerate(tasks)
+        if task.coalesce_key is not None
+    }
+    if not last_index:
+        return tasks
+    return [
+        task
+        for index, task in enumerate(tasks)
+        if task.coalesce_key is None or last_index[task.coalesce_key] == index
+    ]
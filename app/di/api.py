@@ -280,6 +280,8 @@ def resolve_api_runtime(request: Request | None = None) -> ApiRuntime:
 
 async def close_api_runtime(runtime: ApiRuntime) -> None:
     """Release resources owned by the API runtime."""
+    from app.adapters.attachment.pdf_engine import shutdown_pool as shutdown_pdf_pool
+
     await close_runtime_resources(
         runtime.background_processor.url_processor,
         runtime.search.vector_store,
@@ -287,5 +289,6 @@ async def close_api_runtime(runtime: ApiRuntime) -> None:
         runtime.core.firecrawl_client,
         runtime.core.llm_client,
     )
+    shutdown_pdf_pool()
     await runtime.db.dispose()
     logger.info("api_runtime_closed")
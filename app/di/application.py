@@ -17,7 +17,10 @@ from app.di.repositories import (
 )
 from app.di.types import ApplicationServices
 from app.infrastructure.messaging.event_bus import EventBus
-from app.infrastructure.messaging.handlers.wiring import wire_event_handlers
+from app.infrastructure.messaging.handlers.wiring import (
+    CONCURRENT_EVENT_GROUPS,
+    wire_event_handlers,
+)
 from app.infrastructure.rules.collection_membership import CollectionMembershipAdapter
 from app.infrastructure.rules.context import RuleContextAdapter
 from app.infrastructure.rules.http_webhook_dispatcher import HttpWebhookDispatchAdapter
@@ -43,7 +46,8 @@ def build_application_services(
 ) -> ApplicationServices:
     summary_repository = build_summary_repository(db)
     request_repository = build_request_repository(db)
-    event_bus = EventBus()
+    # Handlers run in order; only the network side-effect groups run alongside them.
+    event_bus = EventBus(concurrent_groups=CONCURRENT_EVENT_GROUPS)
     wire_event_handlers(
         event_bus=event_bus,
         search_index_repository=build_topic_search_repository(db),
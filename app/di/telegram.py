@@ -57,6 +57,7 @@ from app.infrastructure.persistence.repositories.audio_generation_repository imp
 from app.infrastructure.persistence.repositories.latency_stats_repository import (
     LatencyStatsRepositoryAdapter,
 )
+from app.infrastructure.search.embedding_matrix import EmbeddingMatrix
 from app.infrastructure.search.vector_search_port_adapter import VectorSearchPortAdapter
 from app.infrastructure.search.vector_search_service import VectorSearchService
 from app.security.file_validation import SecureFileValidator
@@ -612,6 +613,7 @@ def _build_related_reads_service(
             embedding_service=search.embedding_service,
             max_results=10,
             min_similarity=0.3,
+            embedding_matrix=EmbeddingMatrix(),
         )
         related_reads_service = RelatedReadsService(
             VectorSearchPortAdapter(vector_search_service),
@@ -1,10 +1,16 @@
 """Bookmark import format parsers.
 
 Each parser is a pure function (no DB, no network) that converts an export
-format into a list of ImportedBookmark dataclasses.
+format into ImportedBookmark dataclasses: ``iter_parse`` yields them one at a
+time, ``parse`` collects them into a list. JSON exports that are truncated or
+corrupt partway through raise ``ImportParseError``.
 """
 
-from app.domain.services.import_parsers.base import BookmarkParser, ImportedBookmark
+from app.domain.services.import_parsers.base import (
+    BookmarkParser,
+    ImportedBookmark,
+    ImportParseError,
+)
 from app.domain.services.import_parsers.csv_parser import CsvBookmarkParser
 from app.domain.services.import_parsers.linkwarden import LinkwardenParser
 from app.domain.services.import_parsers.netscape import NetscapeHTMLParser
@@ -25,6 +31,7 @@ __all__ = [
     "PARSER_REGISTRY",
     "BookmarkParser",
     "CsvBookmarkParser",
+    "ImportParseError",
     "ImportedBookmark",
     "LinkwardenParser",
     "NetscapeHTMLParser",
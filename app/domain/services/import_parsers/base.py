@@ -5,10 +5,12 @@ These are pure data containers and a protocol -- no DB or network access.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from datetime import datetime
 
 
@@ -26,4 +28,61 @@ class ImportedBookmark:
 
 @runtime_checkable
 class BookmarkParser(Protocol):
+    def iter_parse(self, content: str | bytes) -> Iterator[ImportedBookmark]: ...
+
     def parse(self, content: str | bytes) -> list[ImportedBookmark]: ...
+
+
+def decode_content(content: str | bytes) -> str:
+    return content.decode("utf-8", errors="replace") if isinstance(content, bytes) else content
+
+
+_JSON_WHITESPACE = " \t\n\r"
+
+
+class ImportParseError(ValueError):
+    """Raised when an export is truncated or corrupt partway through."""
+
+
+def iter_json_array(text: str) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the element being decoded is materialised. Input that is not a JSON
+    array yields nothing. If the array is truncated, contains a malformed
+    element or is followed by anything but whitespace, the complete elements
+    before the damage are yielded and then :class:`ImportParseError` is raised.
+    """
+    decoder = json.JSONDecoder()
+    length = len(text)
+    pos = _skip_whitespace(text, 0)
+    if pos >= length or text[pos] != "[":
+        return
+    pos = _skip_whitespace(text, pos + 1)
+    if pos < length and text[pos] == "]":
+        pos += 1
+    else:
+        while True:
+            try:
+                element, pos = decoder.raw_decode(text, pos)
+            except json.JSONDecodeError as exc:
+                msg = f"Malformed JSON array element at offset {exc.pos}"
+                raise ImportParseError(msg) from exc
+            yield element
+            pos = _skip_whitespace(text, pos)
+            if pos < length and text[pos] == ",":
+                pos = _skip_whitespace(text, pos + 1)
+                continue
+            if pos < length and text[pos] == "]":
+                pos += 1
+                break
+            msg = f"JSON array is not closed (offset {pos})"
+            raise ImportParseError(msg)
+    if _skip_whitespace(text, pos) < length:
+        msg = f"Unexpected data after JSON array at offset {pos}"
+        raise ImportParseError(msg)
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in _JSON_WHITESPACE:
+        pos += 1
+    return pos
@@ -9,21 +9,25 @@ from __future__ import annotations
 import csv
 import io
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from app.domain.services.import_parsers.base import ImportedBookmark
+from app.domain.services.import_parsers.base import ImportedBookmark, decode_content
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class CsvBookmarkParser:
     """Parse CSV bookmark exports with a header row."""
 
     def parse(self, content: str | bytes) -> list[ImportedBookmark]:
-        text = content.decode("utf-8", errors="replace") if isinstance(content, bytes) else content
+        return list(self.iter_parse(content))
 
-        bookmarks: list[ImportedBookmark] = []
+    def iter_parse(self, content: str | bytes) -> Iterator[ImportedBookmark]:
         try:
-            reader = csv.DictReader(io.StringIO(text))
+            reader = csv.DictReader(io.StringIO(decode_content(content)))
         except Exception:
-            return []
+            return
 
         for row in reader:
             try:
@@ -47,16 +51,13 @@ class CsvBookmarkParser:
                     except (ValueError, TypeError):
                         pass
 
-                bookmarks.append(
-                    ImportedBookmark(
-                        url=url,
-                        title=title,
-                        tags=tags,
-                        notes=notes,
-                        created_at=created_at,
-                    )
+                bookmark = ImportedBookmark(
+                    url=url,
+                    title=title,
+                    tags=tags,
+                    notes=notes,
+                    created_at=created_at,
                 )
             except Exception:
                 continue
-
-        return bookmarks
+            yield bookmark
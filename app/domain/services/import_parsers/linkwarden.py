@@ -5,27 +5,27 @@ Expected format: JSON array of objects with url, name, tags, collection, created
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from app.domain.services.import_parsers.base import ImportedBookmark
+from app.domain.services.import_parsers.base import (
+    ImportedBookmark,
+    decode_content,
+    iter_json_array,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class LinkwardenParser:
     """Parse Linkwarden JSON exports."""
 
     def parse(self, content: str | bytes) -> list[ImportedBookmark]:
-        text = content.decode("utf-8", errors="replace") if isinstance(content, bytes) else content
-        try:
-            data = json.loads(text)
-        except (json.JSONDecodeError, TypeError):
-            return []
-
-        if not isinstance(data, list):
-            return []
+        return list(self.iter_parse(content))
 
-        bookmarks: list[ImportedBookmark] = []
-        for item in data:
+    def iter_parse(self, content: str | bytes) -> Iterator[ImportedBookmark]:
+        for item in iter_json_array(decode_content(content)):
             if not isinstance(item, dict):
                 continue
             url = item.get("url")
@@ -49,16 +49,13 @@ class LinkwardenParser:
 
             created_at = _parse_iso(item.get("createdAt"))
 
-            bookmarks.append(
-                ImportedBookmark(
-                    url=url,
-                    title=item.get("name") if isinstance(item.get("name"), str) else None,
-                    tags=tags,
-                    created_at=created_at,
-                    collection_name=collection_name,
-                )
+            yield ImportedBookmark(
+                url=url,
+                title=item.get("name") if isinstance(item.get("name"), str) else None,
+                tags=tags,
+                created_at=created_at,
+                collection_name=collection_name,
             )
-        return bookmarks
 
 
 def _parse_iso(value: object) -> datetime | None:
@@ -7,8 +7,15 @@ from __future__ import annotations
 
 import html.parser
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
-from app.domain.services.import_parsers.base import ImportedBookmark
+from app.domain.services.import_parsers.base import ImportedBookmark, decode_content
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Characters fed to the HTML parser per step; bookmarks are yielded between steps.
+_FEED_CHUNK_CHARS = 64 * 1024
 
 
 class _NetscapeHandler(html.parser.HTMLParser):
@@ -88,10 +95,18 @@ class NetscapeHTMLParser:
     """Parse Netscape HTML bookmark export files."""
 
     def parse(self, content: str | bytes) -> list[ImportedBookmark]:
-        text = content.decode("utf-8", errors="replace") if isinstance(content, bytes) else content
+        return list(self.iter_parse(content))
+
+    def iter_parse(self, content: str | bytes) -> Iterator[ImportedBookmark]:
+        text = decode_content(content)
         handler = _NetscapeHandler()
-        try:
-            handler.feed(text)
-        except Exception:
-            pass
-        return handler.bookmarks
+        for start in range(0, len(text), _FEED_CHUNK_CHARS):
+            try:
+                handler.feed(text[start : start + _FEED_CHUNK_CHARS])
+                failed = False
+            except Exception:
+                failed = True
+            yield from handler.bookmarks
+            handler.bookmarks.clear()
+            if failed:
+                return
@@ -5,28 +5,27 @@ Expected format: JSON array of objects with url, title, labels, highlights, save
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from app.domain.services.import_parsers.base import ImportedBookmark
+from app.domain.services.import_parsers.base import (
+    ImportedBookmark,
+    decode_content,
+    iter_json_array,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class OmnivoreParser:
     """Parse Omnivore JSON exports."""
 
     def parse(self, content: str | bytes) -> list[ImportedBookmark]:
-        text = content.decode("utf-8", errors="replace") if isinstance(content, bytes) else content
-        try:
-            data = json.loads(text)
-        except (json.JSONDecodeError, TypeError):
-            return []
-
-        if not isinstance(data, list):
-            return []
+        return list(self.iter_parse(content))
 
-        bookmarks: list[ImportedBookmark] = []
-        for item in data:
+    def iter_parse(self, content: str | bytes) -> Iterator[ImportedBookmark]:
+        for item in iter_json_array(decode_content(content)):
             if not isinstance(item, dict):
                 continue
             url = item.get("url")
@@ -48,16 +47,13 @@ class OmnivoreParser:
             if isinstance(raw_highlights, list) and raw_highlights:
                 highlights = [h for h in raw_highlights if isinstance(h, dict)]
 
-            bookmarks.append(
-                ImportedBookmark(
-                    url=url,
-                    title=item.get("title") if isinstance(item.get("title"), str) else None,
-                    tags=tags,
-                    created_at=created_at,
-                    highlights=highlights or None,
-                )
+            yield ImportedBookmark(
+                url=url,
+                title=item.get("title") if isinstance(item.get("title"), str) else None,
+                tags=tags,
+                created_at=created_at,
+                highlights=highlights or None,
             )
-        return bookmarks
 
 
 def _parse_iso(value: object) -> datetime | None:
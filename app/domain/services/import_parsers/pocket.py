@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING
 from app.domain.services.import_parsers.netscape import NetscapeHTMLParser
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from app.domain.services.import_parsers.base import ImportedBookmark
 
 
@@ -18,3 +20,6 @@ class PocketParser:
 
     def parse(self, content: str | bytes) -> list[ImportedBookmark]:
         return NetscapeHTMLParser().parse(content)
+
+    def iter_parse(self, content: str | bytes) -> Iterator[ImportedBookmark]:
+        return NetscapeHTMLParser().iter_parse(content)
@@ -0,0 +1,239 @@
+"""Compile rule and smart-collection conditions into reusable matchers.
+
+``RuleConditionEvaluator`` interprets a condition list from scratch for every
+context: it dispatches on the type string, lowercases the operand, rebuilds
+tag sets and recompiles regexes. ``compile_conditions`` does that work once
+per distinct condition list and caches the result, so evaluating the same
+rule or smart collection against many summaries only runs the comparisons.
+
+Compiled matchers return exactly what the evaluator returns, including the
+exceptions it raises on malformed contexts. Conditions whose operands do not
+have the expected shape fall back to ``RuleConditionEvaluator`` itself.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any
+
+from app.core.logging_utils import get_logger
+from app.domain.services.rule_engine import RuleConditionEvaluator
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = get_logger(__name__)
+
+ConditionMatcher = Callable[[dict[str, Any]], bool]
+
+COMPILED_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CompiledConditions:
+    """A condition list compiled into one matcher per condition."""
+
+    conditions: tuple[dict[str, Any], ...]
+    matchers: tuple[ConditionMatcher, ...]
+    match_mode: str
+
+    def evaluate(self, context: dict[str, Any]) -> tuple[bool, list[dict[str, Any]]]:
+        """Return *(overall_matched, per_condition_results)* like the evaluator."""
+        results = [
+            {"condition": condition, "matched": matcher(context)}
+            for condition, matcher in zip(self.conditions, self.matchers, strict=True)
+        ]
+        if self.match_mode == "any":
+            return any(r["matched"] for r in results), results
+        return all(r["matched"] for r in results), results
+
+    def matches(self, context: dict[str, Any]) -> bool:
+        """Return the overall match for *context*.
+
+        Every matcher runs, as in the evaluator, so a condition that would
+        raise on *context* still raises even when an earlier one decided the
+        result.
+        """
+        matched = [matcher(context) for matcher in self.matchers]
+        if self.match_mode == "any":
+            return any(matched)
+        return all(matched)
+
+
+def compile_conditions(
+    conditions: Sequence[dict[str, Any]], match_mode: str = "all"
+) -> CompiledConditions:
+    """Return compiled matchers for *conditions*, cached by their JSON form.
+
+    Only plain JSON condition lists (what the database stores) are cached;
+    anything else is compiled on every call.
+    """
+    if _is_json_native(list(conditions)):
+        key = json.dumps(list(conditions), sort_keys=True, ensure_ascii=False)
+        return _compile_cached(key, match_mode)
+    return _compile(list(conditions), match_mode)
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def _compile_cached(key: str, match_mode: str) -> CompiledConditions:
+    return _compile(json.loads(key), match_mode)
+
+
+def _compile(conditions: list[Any], match_mode: str) -> CompiledConditions:
+    return CompiledConditions(
+        conditions=tuple(conditions),
+        matchers=tuple(_compile_single(condition) for condition in conditions),
+        match_mode=match_mode,
+    )
+
+
+def _is_json_native(value: Any) -> bool:
+    if value is None or isinstance(value, str | bool | int | float):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_native(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_native(v) for k, v in value.items())
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Per-condition compilation
+# ---------------------------------------------------------------------------
+
+
+def _never(context: dict[str, Any]) -> bool:
+    del context
+    return False
+
+
+def _compile_single(condition: Any) -> ConditionMatcher:
+    reference: ConditionMatcher = partial(RuleConditionEvaluator.evaluate_condition, condition)
+    if not isinstance(condition, dict):
+        return reference
+    cond_type = condition.get("type", "")
+    if not isinstance(cond_type, str):
+        return reference
+    compiler = _COMPILERS.get(cond_type)
+    if compiler is None:
+        return _never
+    return compiler(condition.get("operator", ""), condition) or reference
+
+
+def _compile_regex(pattern: str) -> re.Pattern[str] | None:
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        logger.warning("invalid regex pattern in rule condition", extra={"pattern": pattern})
+        return None
+
+
+def _regex_matcher(field: str, pattern: Any) -> ConditionMatcher | None:
+    if not isinstance(pattern, str):
+        return None
+    try:
+        compiled = _compile_regex(pattern)
+    except Exception:
+        return None
+    if compiled is None:
+        return _never
+    search = compiled.search
+
+    def match(context: dict[str, Any]) -> bool:
+        return bool(search(context.get(field, "")))
+
+    return match
+
+
+def _domain_matches(operator: Any, condition: dict[str, Any]) -> ConditionMatcher | None:
+    value = condition.get("value", "")
+    if operator == "equals":
+        return lambda context: bool(context.get("url", "") == value)
+    if operator == "contains":
+        if not isinstance(value, str):
+            return None
+        return lambda context: bool(value in context.get("url", ""))
+    if operator == "regex":
+        return _regex_matcher("url", value)
+    return _never
+
+
+def _casefold_contains(field: str) -> Callable[[Any, dict[str, Any]], ConditionMatcher | None]:
+    def compile_(operator: Any, condition: dict[str, Any]) -> ConditionMatcher | None:
+        value = condition.get("value", "")
+        if operator == "contains":
+            if not isinstance(value, str):
+                return None
+            needle = value.lower()
+            return lambda context: needle in context.get(field, "").lower()
+        if operator == "regex":
+            return _regex_matcher(field, value)
+        return _never
+
+    return compile_
+
+
+def _has_tag(operator: Any, condition: dict[str, Any]) -> ConditionMatcher | None:
+    value = condition.get("value", [])
+    if not isinstance(value, list):
+        value = [value]
+    try:
+        wanted = frozenset(value)
+    except TypeError:
+        return None
+    if operator == "any":
+        return lambda context: bool(wanted & set(context.get("tags", [])))
+    if operator == "all":
+        return lambda context: wanted.issubset(set(context.get("tags", [])))
+    if operator == "none":
+        return lambda context: not (wanted & set(context.get("tags", [])))
+    return _never
+
+
+def _membership(field: str) -> Callable[[Any, dict[str, Any]], ConditionMatcher | None]:
+    def compile_(operator: Any, condition: dict[str, Any]) -> ConditionMatcher | None:
+        value = condition.get("value", "")
+        if operator == "equals":
+            return lambda context: bool(context.get(field, "") == value)
+        if operator == "in":
+            if isinstance(value, list):
+                options = tuple(value)
+            elif isinstance(value, str):
+                options = tuple(v.strip() for v in value.split(","))
+            else:
+                return None
+            return lambda context: bool(context.get(field, "") in options)
+        return _never
+
+    return compile_
+
+
+def _reading_time(operator: Any, condition: dict[str, Any]) -> ConditionMatcher | None:
+    try:
+        value = int(condition.get("value", 0))
+    except (TypeError, ValueError):
+        return _never
+    except Exception:
+        return None
+    if operator == "gt":
+        return lambda context: bool(context.get("reading_time", 0) > value)
+    if operator == "lt":
+        return lambda context: bool(context.get("reading_time", 0) < value)
+    if operator == "eq":
+        return lambda context: bool(context.get("reading_time", 0) == value)
+    return _never
+
+
+_COMPILERS: dict[str, Callable[[Any, dict[str, Any]], ConditionMatcher | None]] = {
+    "domain_matches": _domain_matches,
+    "title_contains": _casefold_contains("title"),
+    "has_tag": _has_tag,
+    "language_is": _membership("language"),
+    "reading_time": _reading_time,
+    "source_type": _membership("source_type"),
+    "content_contains": _casefold_contains("content"),
+}
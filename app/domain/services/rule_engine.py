@@ -159,6 +159,11 @@ class RuleConditionEvaluator:
             return any(r["matched"] for r in results), results
         return all(r["matched"] for r in results), results
 
+    @staticmethod
+    def evaluate_condition(condition: dict[str, Any], context: dict[str, Any]) -> bool:
+        """Evaluate one condition; the reference semantics for compiled matchers."""
+        return RuleConditionEvaluator._evaluate_single(condition, context)
+
     # -- dispatch -----------------------------------------------------------
 
     @staticmethod
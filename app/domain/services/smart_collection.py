@@ -1,17 +1,15 @@
 """Smart collection domain service.
 
 Validates and evaluates conditions for query-based auto-collections.
-Reuses RuleConditionEvaluator from the rule engine.
+Evaluation uses the rule engine's compiled matchers (see ``rule_compiler``).
 """
 
 from __future__ import annotations
 
 from typing import Any
 
-from app.domain.services.rule_engine import (
-    RuleConditionEvaluator,
-    validate_condition,
-)
+from app.domain.services.rule_compiler import compile_conditions
+from app.domain.services.rule_engine import validate_condition
 
 MAX_SMART_COLLECTIONS_PER_USER = 20
 MAX_SMART_CONDITIONS = 5
@@ -51,5 +49,4 @@ def evaluate_summary(
 
     Returns True if the summary matches.
     """
-    matched, _ = RuleConditionEvaluator.evaluate_conditions(conditions, context, match_mode)
-    return matched
+    return compile_conditions(conditions, match_mode).matches(context)
@@ -0,0 +1,64 @@
+"""Value encoding for the Redis cache.
+
+Values are stored as compact JSON text (orjson when available). Payloads at or
+above a size threshold are zlib-compressed and base64-wrapped behind a ``z:``
+marker, because the shared Redis client runs with ``decode_responses=True``
+and can only hand back ``str``. No JSON document starts with ``z``, so values
+written before compression existed still decode unchanged.
+"""
+
+from __future__ import annotations
+
+import base64
+import zlib
+from typing import Any
+
+from app.core import json_utils
+
+COMPRESSED_MARKER = "z:"
+DEFAULT_COMPRESS_MIN_BYTES = 4_096
+_COMPRESS_LEVEL = 6
+
+
+def encode_json(value: Any) -> str:
+    """Serialize ``value`` to compact JSON text."""
+    return json_utils.dumps(value)
+
+
+def encode_value(value: Any, *, compress_min_bytes: int = DEFAULT_COMPRESS_MIN_BYTES) -> str:
+    """Serialize ``value`` for Redis, compressing large payloads.
+
+    Compression is skipped when it would not make the stored value smaller.
+    A ``compress_min_bytes`` of 0 or less disables compression.
+    """
+    return compress_text(encode_json(value), compress_min_bytes=compress_min_bytes)
+
+
+def compress_text(text: str, *, compress_min_bytes: int = DEFAULT_COMPRESS_MIN_BYTES) -> str:
+    """Wrap already-encoded JSON text in the compressed envelope when worthwhile."""
+    if compress_min_bytes <= 0:
+        return text
+    raw = text.encode("utf-8")
+    if len(raw) < compress_min_bytes:
+        return text
+    packed = COMPRESSED_MARKER + base64.b64encode(zlib.compress(raw, _COMPRESS_LEVEL)).decode(
+        "ascii"
+    )
+    return packed if len(packed) < len(raw) else text
+
+
+def decode_text(raw: str | bytes) -> str | bytes:
+    """Strip the compressed envelope, returning plain JSON text or bytes."""
+    if isinstance(raw, bytes):
+        if raw.startswith(COMPRESSED_MARKER.encode("ascii")):
+            raw = raw.decode("ascii")
+        else:
+            return raw
+    if raw.startswith(COMPRESSED_MARKER):
+        return zlib.decompress(base64.b64decode(raw[len(COMPRESSED_MARKER) :])).decode("utf-8")
+    return raw
+
+
+def decode_value(raw: str | bytes) -> Any:
+    """Parse a value produced by :func:`encode_value` (or legacy plain JSON)."""
+    return json_utils.loads(decode_text(raw))
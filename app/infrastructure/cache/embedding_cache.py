@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING, Any, cast
 from app.core.logging_utils import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from app.config import AppConfig
     from app.infrastructure.cache.redis_cache import RedisCache
 
@@ -180,6 +182,88 @@ class EmbeddingCache:
             )
         return success
 
+    async def get_many(
+        self,
+        content_hashes: Sequence[str],
+        model_name: str,
+    ) -> list[list[float] | None]:
+        """Get several cached embeddings in one round trip.
+
+        Args:
+            content_hashes: SHA256 hashes of the contents.
+            model_name: Embedding model name.
+
+        Returns:
+            One entry per hash, in order; None where not cached.
+        """
+        if not self._cache.enabled or not content_hashes:
+            return [None] * len(content_hashes)
+
+        cached = await self._cache.get_many_json(
+            [("embed", "v1", model_name, content_hash) for content_hash in content_hashes]
+        )
+        results: list[list[float] | None] = []
+        for content_hash, entry in zip(content_hashes, cached, strict=True):
+            embedding_b64 = entry.get("embedding") if isinstance(entry, dict) else None
+            if not isinstance(embedding_b64, str):
+                results.append(None)
+                continue
+            try:
+                results.append(self.deserialize_embedding(embedding_b64))
+            except Exception as exc:
+                logger.warning(
+                    "embedding_cache_deserialize_failed",
+                    extra={"hash": content_hash[:8], "error": str(exc)},
+                )
+                results.append(None)
+        return results
+
+    async def set_many(
+        self,
+        items: Sequence[tuple[str, Any]],
+        model_name: str,
+    ) -> int:
+        """Cache several embeddings with one pipelined write.
+
+        Args:
+            items: ``(content_hash, embedding)`` pairs.
+            model_name: Embedding model name.
+
+        Returns:
+            Number of embeddings cached.
+        """
+        if not self._cache.enabled or not items:
+            return 0
+
+        entries: list[tuple[tuple[str, ...], dict[str, Any]]] = []
+        for content_hash, embedding in items:
+            try:
+                embedding_b64 = self.serialize_embedding(embedding)
+            except Exception as exc:
+                logger.warning(
+                    "embedding_cache_serialize_failed",
+                    extra={"hash": content_hash[:8], "error": str(exc)},
+                )
+                continue
+            entries.append(
+                (
+                    ("embed", "v1", model_name, content_hash),
+                    {
+                        "embedding": embedding_b64,
+                        "dimensions": len(embedding),
+                        "model": model_name,
+                    },
+                )
+            )
+
+        ttl = self._cfg.redis.embedding_cache_ttl_seconds
+        stored = await self._cache.set_many_json(entries, ttl_seconds=ttl)
+        logger.debug(
+            "embeddings_cached",
+            extra={"model": model_name, "count": stored, "ttl": ttl},
+        )
+        return stored
+
     async def get_or_compute(
         self,
         text: str,
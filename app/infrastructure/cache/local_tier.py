@@ -0,0 +1,90 @@
+"""Bounded in-process cache tier that sits in front of Redis."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class LocalCacheTier:
+    """LRU cache with a per-entry TTL and a hard entry cap.
+
+    Entries hold encoded JSON text rather than live objects, so every hit
+    decodes a fresh copy and callers can mutate what they get back without
+    corrupting the cached value. Expired entries are dropped lazily on access
+    and whenever the cap forces an eviction.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> str | None:
+        """Return the stored text for ``key`` or None when absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, *, ttl_seconds: float | None = None) -> None:
+        """Store ``value``; the effective TTL never exceeds the tier's own TTL."""
+        if not self.enabled:
+            return
+        ttl = self._ttl_seconds if ttl_seconds is None else min(ttl_seconds, self._ttl_seconds)
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self.prune_expired()
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Drop every entry whose key starts with ``prefix``."""
+        doomed = [key for key in self._entries if key.startswith(prefix)]
+        for key in doomed:
+            del self._entries[key]
+        return len(doomed)
+
+    def prune_expired(self) -> int:
+        """Remove expired entries and return the number deleted."""
+        now = self._clock()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        self._entries.clear()
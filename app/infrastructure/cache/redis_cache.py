@@ -1,22 +1,83 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 from typing import TYPE_CHECKING, Any
 
+from app.core import json_utils
 from app.core.logging_utils import get_logger
+from app.infrastructure.cache.codec import (
+    DEFAULT_COMPRESS_MIN_BYTES,
+    compress_text,
+    decode_text,
+    encode_json,
+)
+from app.infrastructure.cache.local_tier import LocalCacheTier
 from app.infrastructure.redis import get_redis, redis_key
+from app.observability.metrics import record_cache_lookup
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
 
     from app.config import AppConfig
 
 logger = get_logger(__name__)
 
+# Namespaces whose values may be served from the per-process tier. Their
+# entries are content-addressed or short-lived, so a few seconds of staleness
+# in one worker is harmless. Auth tokens, query results and batch progress
+# stay Redis-only: a revocation or invalidation in one worker must be visible
+# to every other worker on the next read.
+LOCAL_TIER_NAMESPACES = frozenset({"fc", "llm", "embed", "trending"})
+
+_DEFAULT_LOCAL_MAX_ENTRIES = 2_048
+_DEFAULT_LOCAL_TTL_SECONDS = 30
+
+
+class _CacheStats:
+    """Process-wide lookup counters per key namespace."""
+
+    def __init__(self) -> None:
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def record(self, namespace: str, outcome: str) -> None:
+        counts = self._counts.setdefault(namespace, {"local_hit": 0, "redis_hit": 0, "miss": 0})
+        counts[outcome] += 1
+        record_cache_lookup(namespace=namespace, outcome=outcome, hit_ratio=self._hit_ratio(counts))
+
+    @staticmethod
+    def _hit_ratio(counts: dict[str, int]) -> float:
+        total = sum(counts.values())
+        if not total:
+            return 0.0
+        return (counts["local_hit"] + counts["redis_hit"]) / total
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {
+            namespace: {**counts, "hit_ratio": round(self._hit_ratio(counts), 4)}
+            for namespace, counts in self._counts.items()
+        }
+
+    def reset(self) -> None:
+        self._counts.clear()
+
+
+_stats = _CacheStats()
+
+
+def cache_stats() -> dict[str, dict[str, float]]:
+    """Return lookup counts and hit ratio per namespace for this process."""
+    return _stats.snapshot()
+
 
 class RedisCache:
-    """Small helper for JSON-based Redis caching with fail-open behavior."""
+    """JSON cache facade with a per-process tier in front of Redis.
+
+    Reads check the bounded in-process LRU first (for namespaces listed in
+    ``LOCAL_TIER_NAMESPACES``), then Redis. Values are encoded with orjson and
+    large ones are compressed (see ``codec``). Every Redis failure is logged
+    and treated as a miss (fail-open).
+    """
 
     def __init__(self, cfg: AppConfig) -> None:
         self.cfg = cfg
@@ -24,11 +85,24 @@ class RedisCache:
         self._lock = asyncio.Lock()
         timeout = cfg.redis.cache_timeout_sec or 0.3
         self._timeout = max(0.05, float(timeout))
+        self._compress_min_bytes = int(
+            getattr(cfg.redis, "cache_compress_min_bytes", DEFAULT_COMPRESS_MIN_BYTES)
+        )
+        self._local = LocalCacheTier(
+            max_entries=getattr(cfg.redis, "local_cache_max_entries", _DEFAULT_LOCAL_MAX_ENTRIES),
+            ttl_seconds=getattr(cfg.redis, "local_cache_ttl_seconds", _DEFAULT_LOCAL_TTL_SECONDS),
+        )
+        self._loads: dict[str, asyncio.Future[Any]] = {}
 
     @property
     def enabled(self) -> bool:
         return bool(self.cfg.redis.enabled and self.cfg.redis.cache_enabled)
 
+    @property
+    def local_enabled(self) -> bool:
+        """Whether the in-process tier serves reads (independent of Redis)."""
+        return bool(self.cfg.redis.cache_enabled and self._local.enabled)
+
     async def _get_client(self) -> Any:
         if not self.enabled:
             return None
@@ -51,13 +125,41 @@ class RedisCache:
                 return None
             return self._client
 
+    def _key(self, parts: Iterable[str]) -> tuple[str, str]:
+        """Return ``(redis_key, namespace)`` for key parts."""
+        clean = [p for p in parts if p]
+        namespace = clean[0] if clean else ""
+        return redis_key(self.cfg.redis.prefix, *clean), namespace
+
+    def _uses_local(self, namespace: str) -> bool:
+        return namespace in LOCAL_TIER_NAMESPACES and self.local_enabled
+
+    def _decode(self, key: str, raw: str | bytes) -> tuple[Any, str | None]:
+        """Decode a Redis value; returns ``(value, plain_json_text)``."""
+        try:
+            text = decode_text(raw)
+            value = json_utils.loads(text)
+        except Exception:
+            logger.warning("redis_cache_decode_failed", extra={"key": key})
+            return None, None
+        return value, text if isinstance(text, str) else text.decode("utf-8")
+
     async def get_json(self, *parts: str) -> Any | None:
         """Fetch a JSON value; returns None on miss or any error."""
+        key, namespace = self._key(parts)
+        local = self._uses_local(namespace)
+        if local:
+            text = self._local.get(key)
+            if text is not None:
+                _stats.record(namespace, "local_hit")
+                return json_utils.loads(text)
+
         client = await self._get_client()
         if not client:
+            if local:
+                _stats.record(namespace, "miss")
             return None
 
-        key = redis_key(self.cfg.redis.prefix, *[p for p in parts if p])
         try:
             async with asyncio.timeout(self._timeout):
                 raw = await client.get(key)
@@ -67,33 +169,92 @@ class RedisCache:
                 exc_info=True,
                 extra={"key": key, "error": str(exc)},
             )
+            _stats.record(namespace, "miss")
             return None
 
         if raw is None:
+            _stats.record(namespace, "miss")
             return None
 
-        try:
-            return json.loads(raw)
-        except Exception:
-            logger.warning("redis_cache_decode_failed", extra={"key": key})
+        value, text = self._decode(key, raw)
+        if text is None:
+            _stats.record(namespace, "miss")
             return None
+        if local:
+            self._local.set(key, text)
+        _stats.record(namespace, "redis_hit")
+        return value
 
-    async def set_json(self, *, value: Any, ttl_seconds: int, parts: Iterable[str]) -> bool:
-        """Store a JSON value with TTL; returns False on failure."""
-        if ttl_seconds <= 0:
-            return False
+    async def get_many_json(self, keys: Sequence[Sequence[str]]) -> list[Any | None]:
+        """Fetch several values with one ``MGET``; results align with ``keys``."""
+        results: list[Any | None] = [None] * len(keys)
+        resolved = [self._key(parts) for parts in keys]
+        pending: list[int] = []
+        for index, (key, namespace) in enumerate(resolved):
+            if self._uses_local(namespace):
+                text = self._local.get(key)
+                if text is not None:
+                    _stats.record(namespace, "local_hit")
+                    results[index] = json_utils.loads(text)
+                    continue
+            pending.append(index)
+
+        if not pending:
+            return results
 
         client = await self._get_client()
-        if not client:
+        raw_values: list[Any] = [None] * len(pending)
+        if client:
+            redis_keys = [resolved[index][0] for index in pending]
+            try:
+                async with asyncio.timeout(self._timeout):
+                    raw_values = list(await client.mget(redis_keys))
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning(
+                    "redis_cache_mget_failed",
+                    exc_info=True,
+                    extra={"keys": len(redis_keys), "error": str(exc)},
+                )
+                raw_values = [None] * len(pending)
+
+        for index, raw in zip(pending, raw_values, strict=True):
+            key, namespace = resolved[index]
+            if raw is None:
+                if client or self._uses_local(namespace):
+                    _stats.record(namespace, "miss")
+                continue
+            value, text = self._decode(key, raw)
+            if text is None:
+                _stats.record(namespace, "miss")
+                continue
+            if self._uses_local(namespace):
+                self._local.set(key, text)
+            _stats.record(namespace, "redis_hit")
+            results[index] = value
+        return results
+
+    async def set_json(self, *, value: Any, ttl_seconds: int, parts: Iterable[str]) -> bool:
+        """Store a JSON value with TTL; returns False when no tier accepted it."""
+        if ttl_seconds <= 0:
             return False
 
-        key = redis_key(self.cfg.redis.prefix, *[p for p in parts if p])
+        key, namespace = self._key(parts)
         try:
-            payload = json.dumps(value, ensure_ascii=False)
+            text = encode_json(value)
         except Exception:
             logger.warning("redis_cache_encode_failed", extra={"key": key})
             return False
 
+        stored = False
+        if self._uses_local(namespace):
+            self._local.set(key, text, ttl_seconds=ttl_seconds)
+            stored = True
+
+        client = await self._get_client()
+        if not client:
+            return stored
+
+        payload = compress_text(text, compress_min_bytes=self._compress_min_bytes)
         try:
             async with asyncio.timeout(self._timeout):
                 await client.set(key, payload, ex=ttl_seconds)
@@ -104,20 +265,119 @@ class RedisCache:
                 exc_info=True,
                 extra={"key": key, "error": str(exc)},
             )
-            return False
+            return stored
+
+    async def set_many_json(
+        self, items: Sequence[tuple[Sequence[str], Any]], *, ttl_seconds: int
+    ) -> int:
+        """Store several values in one pipelined round trip.
+
+        Returns the number of values Redis accepted, or the number kept in the
+        local tier when Redis is unavailable.
+        """
+        if ttl_seconds <= 0 or not items:
+            return 0
+
+        encoded: list[tuple[str, str]] = []
+        local_count = 0
+        for parts, value in items:
+            key, namespace = self._key(parts)
+            try:
+                text = encode_json(value)
+            except Exception:
+                logger.warning("redis_cache_encode_failed", extra={"key": key})
+                continue
+            if self._uses_local(namespace):
+                self._local.set(key, text, ttl_seconds=ttl_seconds)
+                local_count += 1
+            encoded.append((key, text))
+
+        client = await self._get_client()
+        if not client or not encoded:
+            return local_count
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, text in encoded:
+                pipe.set(
+                    key,
+                    compress_text(text, compress_min_bytes=self._compress_min_bytes),
+                    ex=ttl_seconds,
+                )
+            async with asyncio.timeout(self._timeout):
+                await pipe.execute()
+            return len(encoded)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning(
+                "redis_cache_pipeline_set_failed",
+                exc_info=True,
+                extra={"keys": len(encoded), "error": str(exc)},
+            )
+            return local_count
+
+    async def get_or_load(
+        self,
+        *parts: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+    ) -> Any:
+        """Return the cached value or run ``loader`` once for concurrent misses.
+
+        Callers that miss on the same key while a load is in flight await that
+        load instead of starting their own, and share its result (treat it as
+        read-only) or its exception. The load runs in its own task, so a
+        cancelled caller does not abort it for the others. ``None`` results are
+        returned but not cached.
+        """
+        cached = await self.get_json(*parts)
+        if cached is not None:
+            return cached
+
+        key, _ = self._key(parts)
+        load = self._loads.get(key)
+        if load is None:
+            load = asyncio.ensure_future(self._load_and_store(parts, loader, ttl_seconds))
+            self._loads[key] = load
+            load.add_done_callback(functools.partial(self._finish_load, key))
+        return await asyncio.shield(load)
+
+    async def _load_and_store(
+        self,
+        parts: Sequence[str],
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+    ) -> Any:
+        value = await loader()
+        if value is not None:
+            await self.set_json(value=value, ttl_seconds=ttl_seconds, parts=parts)
+        return value
+
+    def _finish_load(self, key: str, load: asyncio.Future[Any]) -> None:
+        if self._loads.get(key) is load:
+            del self._loads[key]
+        if not load.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled.
+            load.exception()
 
     async def clear(self) -> int:
         """Clear all cached keys matching the prefix.
 
         Uses SCAN instead of KEYS to avoid blocking Redis on large datasets.
         """
+        self._local.clear()
         return await self._clear_pattern(f"{self.cfg.redis.prefix}:*")
 
     async def clear_prefix(self, *parts: str) -> int:
         """Clear cache keys under a specific sub-prefix."""
-        key_prefix = redis_key(self.cfg.redis.prefix, *[p for p in parts if p])
+        key_prefix, _ = self._key(parts)
+        self.invalidate_local(*parts)
         return await self._clear_pattern(f"{key_prefix}:*")
 
+    def invalidate_local(self, *parts: str) -> int:
+        """Drop this process's tier entries under a sub-prefix, leaving Redis untouched."""
+        key_prefix, _ = self._key(parts)
+        return self._local.delete_prefix(f"{key_prefix}:")
+
     async def _clear_pattern(self, pattern: str) -> int:
         client = await self._get_client()
         if not client:
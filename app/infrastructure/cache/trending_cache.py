@@ -1,15 +1,18 @@
 """Shared trending topics cache utilities.
 
-Supports both Redis (shared across workers) and in-memory (fallback) caching.
+Payloads go through the two-tier ``RedisCache`` facade: a per-process tier in
+front of Redis (shared across workers). When Redis or the Redis cache is
+disabled, a process-only facade whose tier keeps the full trending TTL takes
+its place.
 """
 
 from __future__ import annotations
 
 import asyncio
 from collections import Counter
-from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy import select
 
@@ -28,97 +31,53 @@ TRENDING_CACHE_TTL_SECONDS = 300
 TRENDING_MAX_SCAN = 1000
 
 
-@dataclass(slots=True)
-class TrendingCacheEntry:
-    expires_at: datetime
-    payload: dict[str, Any]
-
-
 class _TrendingCacheManager:
-    """Encapsulates in-memory and Redis cache state for trending topics."""
+    """Serve trending payloads through the shared two-tier cache.
+
+    Concurrent misses for the same user/params run one database scan; the
+    result lands in the per-process tier and, when enabled, in Redis.
+    """
 
     def __init__(self) -> None:
-        self._trending_cache: dict[tuple[int, int, int], TrendingCacheEntry] = {}
-        self._lock = asyncio.Lock()
-        self._redis_cache: RedisCache | None = None
-        self._app_config: AppConfig | None = None
-
-    def prune_expired(self, now: datetime) -> int:
-        """Remove expired fallback cache entries and return the number deleted."""
-        expired_keys = [
-            key for key, entry in self._trending_cache.items() if entry.expires_at <= now
-        ]
-        for key in expired_keys:
-            self._trending_cache.pop(key, None)
-        return len(expired_keys)
-
-    def get_redis_cache(self) -> tuple[RedisCache | None, AppConfig | None]:
-        """Get or initialize the Redis cache singleton."""
-        if self._redis_cache is not None:
-            return self._redis_cache, self._app_config
+        self._cache: RedisCache | None = None
+        self._ttl_seconds = TRENDING_CACHE_TTL_SECONDS
 
-        try:
-            from app.config import load_config
-            from app.infrastructure.cache.redis_cache import RedisCache
+    def get_cache(self) -> RedisCache:
+        """Get or initialize the cache facade.
 
-            self._app_config = load_config(allow_stub_telegram=True)
-            if not self._app_config.redis.enabled:
-                return None, self._app_config
+        Without a loadable config, or with Redis or its cache disabled, the
+        facade runs in-process only, so repeated requests are still absorbed.
+        """
+        if self._cache is not None:
+            return self._cache
 
-            self._redis_cache = RedisCache(self._app_config)
-            return self._redis_cache, self._app_config
-        except Exception as exc:
-            logger.debug("trending_redis_cache_init_skipped", extra={"error": str(exc)})
-            return None, None
-
-    async def get_from_redis(self, user_id: int, days: int, limit: int) -> dict[str, Any] | None:
-        """Try to get trending payload from Redis cache."""
-        redis_cache, cfg = self.get_redis_cache()
-        if redis_cache is None or cfg is None:
-            return None
+        from app.config.redis import RedisConfig
+        from app.infrastructure.cache.redis_cache import RedisCache
 
         try:
-            cached = await redis_cache.get_json("trending", str(user_id), str(days), str(limit))
-            if isinstance(cached, dict):
-                logger.debug(
-                    "trending_redis_cache_hit",
-                    extra={"user_id": user_id, "days": days, "limit": limit},
-                )
-                return cached
-        except Exception as exc:
-            logger.warning(
-                "trending_redis_cache_get_failed",
-                extra={"user_id": user_id, "error": str(exc)},
-            )
-        return None
-
-    async def set_to_redis(
-        self, user_id: int, days: int, limit: int, payload: dict[str, Any]
-    ) -> bool:
-        """Store trending payload in Redis cache."""
-        redis_cache, cfg = self.get_redis_cache()
-        if redis_cache is None or cfg is None:
-            return False
+            from app.config import load_config
 
-        try:
-            ttl = cfg.redis.trending_cache_ttl_seconds
-            success = await redis_cache.set_json(
-                value=payload,
-                ttl_seconds=ttl,
-                parts=("trending", str(user_id), str(days), str(limit)),
-            )
-            if success:
-                logger.debug(
-                    "trending_redis_cached",
-                    extra={"user_id": user_id, "days": days, "limit": limit, "ttl": ttl},
-                )
-            return success
+            cfg = load_config(allow_stub_telegram=True)
+            self._ttl_seconds = cfg.redis.trending_cache_ttl_seconds
         except Exception as exc:
-            logger.warning(
-                "trending_redis_cache_set_failed",
-                extra={"user_id": user_id, "error": str(exc)},
+            logger.debug("trending_cache_config_unavailable", extra={"error": str(exc)})
+            cfg = cast("AppConfig", SimpleNamespace(redis=RedisConfig(enabled=False)))
+            self._ttl_seconds = TRENDING_CACHE_TTL_SECONDS
+
+        if not (cfg.redis.enabled and cfg.redis.cache_enabled):
+            # The shared local tier caps entries at a few seconds because Redis
+            # holds the real copy; here the process tier is the only copy, so it
+            # keeps trending payloads for the trending TTL.
+            local_only = cfg.redis.model_copy(
+                update={
+                    "enabled": False,
+                    "cache_enabled": True,
+                    "local_cache_ttl_seconds": self._ttl_seconds,
+                }
             )
-            return False
+            cfg = cast("AppConfig", SimpleNamespace(redis=local_only))
+        self._cache = RedisCache(cfg)
+        return self._cache
 
     async def get_payload(
         self,
@@ -129,48 +88,42 @@ class _TrendingCacheManager:
         database: Database | None = None,
     ) -> dict[str, Any]:
         """Return trending topics with per-user/param caching."""
-        now = datetime.now(UTC)
-
-        redis_cached = await self.get_from_redis(user_id, days, limit)
-        if redis_cached is not None:
-            return redis_cached
-
-        cache_key = (user_id, limit, days)
-        async with self._lock:
-            self.prune_expired(now)
-            cached = self._trending_cache.get(cache_key)
-            if cached and cached.expires_at > now:
-                return cached.payload
-
-        previous_period_start = now - timedelta(days=days * 2)
-        max_scan = min(TRENDING_MAX_SCAN, max(limit * 40, 400))
-
-        records = await _fetch_trending_records(
-            user_id,
-            previous_period_start=previous_period_start,
-            max_scan=max_scan,
-            database=database,
-        )
-
-        payload = _build_trending_payload(records, now=now, days=days, limit=limit)
-
-        await self.set_to_redis(user_id, days, limit, payload)
 
-        async with self._lock:
-            self.prune_expired(now)
-            self._trending_cache[cache_key] = TrendingCacheEntry(
-                expires_at=now + timedelta(seconds=TRENDING_CACHE_TTL_SECONDS),
-                payload=payload,
+        async def _load() -> dict[str, Any]:
+            now = datetime.now(UTC)
+            previous_period_start = now - timedelta(days=days * 2)
+            max_scan = min(TRENDING_MAX_SCAN, max(limit * 40, 400))
+            records = await _fetch_trending_records(
+                user_id,
+                previous_period_start=previous_period_start,
+                max_scan=max_scan,
+                database=database,
             )
-
-        return payload
+            logger.debug(
+                "trending_payload_computed",
+                extra={"user_id": user_id, "days": days, "limit": limit, "records": len(records)},
+            )
+            return _build_trending_payload(records, now=now, days=days, limit=limit)
+
+        cache = self.get_cache()
+        return cast(
+            "dict[str, Any]",
+            await cache.get_or_load(
+                "trending",
+                str(user_id),
+                str(days),
+                str(limit),
+                loader=_load,
+                ttl_seconds=self._ttl_seconds,
+            ),
+        )
 
     def clear(self) -> None:
         """Clear cached trending results (e.g., after summary writes)."""
-        self._trending_cache.clear()
+        cache = self.get_cache()
+        cache.invalidate_local("trending")
 
-        redis_cache, cfg = self.get_redis_cache()
-        if redis_cache is not None and cfg is not None:
+        if cache.enabled:
             try:
                 asyncio.get_event_loop().create_task(self._clear_redis())
             except RuntimeError as exc:
@@ -178,12 +131,8 @@ class _TrendingCacheManager:
 
     async def _clear_redis(self) -> None:
         """Clear all trending entries from Redis cache."""
-        redis_cache, cfg = self.get_redis_cache()
-        if redis_cache is None or cfg is None:
-            return
-
         try:
-            deleted = await redis_cache.clear()
+            deleted = await self.get_cache().clear_prefix("trending")
             logger.debug("trending_redis_cache_cleared", extra={"deleted_count": deleted})
         except Exception as exc:
             logger.warning("trending_redis_cache_clear_failed", extra={"error": str(exc)})
@@ -308,16 +257,14 @@ async def get_trending_payload(
     days: int,
     database: Database | None = None,
 ) -> dict[str, Any]:
-    """Return trending topics with per-user/param caching.
-
-    Uses Redis cache if available, falls back to in-memory cache otherwise.
-    """
+    """Return trending topics with per-user/param caching."""
     return await _cache_manager.get_payload(user_id, limit=limit, days=days, database=database)
 
 
 def clear_trending_cache() -> None:
     """Clear cached trending results (e.g., after summary writes).
 
-    Clears both in-memory and Redis caches.
+    The local tier is cleared immediately; Redis entries are removed by a
+    background task when a loop is running.
     """
     _cache_manager.clear()
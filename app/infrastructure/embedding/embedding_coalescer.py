@@ -0,0 +1,209 @@
+"""Micro-batching for single-text embedding requests.
+
+Callers across the app (summary creation, signal scoring, search queries,
+related reads) embed one text at a time. Encoding each of them separately
+means many batch-of-one forward passes (local model) or one HTTP round trip
+per text (remote API). :class:`EmbeddingCoalescer` parks concurrent
+single-text requests, keyed by model/language/task type, and flushes them
+through one batched encode. When no encode for the key is running, the batch
+goes out on the next loop iteration; otherwise it waits for the window to close
+or the batch to fill. Each caller gets its own vector back. If the batched
+encode fails, each text is retried on its own so one bad input only fails its
+own caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from app.core.logging_utils import get_logger
+from app.observability.metrics import record_embedding_batch
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    BatchEncoder = Callable[..., Awaitable[list[Any]]]
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_SECONDS = 0.005
+
+
+@dataclass(slots=True)
+class _PendingBatch:
+    model: str
+    language: str | None
+    task_type: str | None
+    texts: list[str] = field(default_factory=list)
+    futures: list[asyncio.Future[Any]] = field(default_factory=list)
+    enqueued_at: list[float] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class EmbeddingCoalescer:
+    """Coalesce concurrent single-text embedding calls into batched encodes.
+
+    ``encode_batch`` is called as ``encode_batch(texts, language=..., task_type=...)``
+    and must return one embedding per text, in order. A batch is flushed on the
+    next loop iteration when no encode of its key is in flight, and otherwise
+    after ``max_wait_seconds`` from its first request or as soon as it holds
+    ``max_batch_size`` texts, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        encode_batch: BatchEncoder,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+    ) -> None:
+        if max_batch_size <= 0:
+            msg = "max_batch_size must be positive"
+            raise ValueError(msg)
+        if max_wait_seconds < 0:
+            msg = "max_wait_seconds must be non-negative"
+            raise ValueError(msg)
+        self._encode_batch = encode_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._pending: dict[tuple[Any, ...], _PendingBatch] = {}
+        self._inflight: set[asyncio.Task[None]] = set()
+        # Running encodes per key; an idle key does not wait out the window.
+        self._busy: dict[tuple[Any, ...], int] = {}
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    @property
+    def max_wait_seconds(self) -> float:
+        return self._max_wait_seconds
+
+    async def submit(
+        self,
+        text: str,
+        *,
+        model: str,
+        language: str | None = None,
+        task_type: str | None = None,
+    ) -> Any:
+        """Queue ``text`` for the next batch of its key and await its embedding."""
+        loop = asyncio.get_running_loop()
+        # The loop is part of the key so a service reused across event loops
+        # (CLI runs, tests) never mixes futures from different loops.
+        key = (loop, model, language, task_type)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(model=model, language=language, task_type=task_type)
+            self._pending[key] = batch
+            if self._max_batch_size > 1:
+                batch.timer = loop.call_later(self._max_wait_seconds, self._flush, key)
+                if not self._busy.get(key):
+                    # Deferred by one iteration so requests submitted in the
+                    # same tick still share the encode.
+                    loop.call_soon(self._flush_if_idle, key)
+
+        future: asyncio.Future[Any] = loop.create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        batch.enqueued_at.append(time.perf_counter())
+        if len(batch.texts) >= self._max_batch_size:
+            self._flush(key)
+        return await future
+
+    async def drain(self) -> None:
+        """Flush every pending batch of the running loop and wait for all encodes."""
+        loop = asyncio.get_running_loop()
+        for key in [key for key in self._pending if key[0] is loop]:
+            self._flush(key)
+        while self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def _flush_if_idle(self, key: tuple[Any, ...]) -> None:
+        if not self._busy.get(key):
+            self._flush(key)
+
+    def _flush(self, key: tuple[Any, ...]) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._run(batch), loop=key[0])
+        self._inflight.add(task)
+        self._busy[key] = self._busy.get(key, 0) + 1
+
+        def _done(finished: asyncio.Task[None]) -> None:
+            self._inflight.discard(finished)
+            remaining = self._busy.pop(key, 1) - 1
+            if remaining:
+                self._busy[key] = remaining
+
+        task.add_done_callback(_done)
+
+    async def _run(self, batch: _PendingBatch) -> None:
+        dispatched_at = time.perf_counter()
+        record_embedding_batch(
+            model=batch.model,
+            size=len(batch.texts),
+            wait_seconds=[dispatched_at - enqueued for enqueued in batch.enqueued_at],
+        )
+        # Skip texts whose callers were cancelled while the batch was filling.
+        live = [index for index, future in enumerate(batch.futures) if not future.done()]
+        if not live:
+            return
+        texts: Sequence[str] = [batch.texts[index] for index in live]
+        outcomes: list[Any]
+        try:
+            outcomes = await self._encode(batch, texts)
+        except asyncio.CancelledError:
+            self._cancel(batch, live)
+            raise
+        except Exception as exc:
+            logger.warning(
+                "embedding_batch_failed",
+                extra={"model": batch.model, "batch_size": len(texts), "error": str(exc)},
+            )
+            if len(texts) == 1:
+                outcomes = [exc]
+            else:
+                try:
+                    outcomes = await asyncio.gather(
+                        *(self._encode_one(batch, text) for text in texts),
+                        return_exceptions=True,
+                    )
+                except asyncio.CancelledError:
+                    self._cancel(batch, live)
+                    raise
+        for index, outcome in zip(live, outcomes, strict=True):
+            future = batch.futures[index]
+            if future.done():
+                continue
+            if isinstance(outcome, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _encode(self, batch: _PendingBatch, texts: Sequence[str]) -> list[Any]:
+        embeddings = await self._encode_batch(
+            texts, language=batch.language, task_type=batch.task_type
+        )
+        if len(embeddings) != len(texts):
+            msg = f"Batched encode returned {len(embeddings)} embeddings for {len(texts)} texts"
+            raise RuntimeError(msg)
+        return embeddings
+
+    async def _encode_one(self, batch: _PendingBatch, text: str) -> Any:
+        [embedding] = await self._encode(batch, [text])
+        return embedding
+
+    @staticmethod
+    def _cancel(batch: _PendingBatch, live: list[int]) -> None:
+        for index in live:
+            batch.futures[index].cancel()
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from app.config.integrations import EmbeddingConfig
     from app.infrastructure.embedding.embedding_protocol import EmbeddingServiceProtocol
 
 
+def _batching_options(config: EmbeddingConfig) -> dict[str, Any]:
+    return {
+        "max_batch_size": config.batch_max_size,
+        "max_batch_wait_seconds": config.batch_max_wait_ms / 1000.0,
+    }
+
+
 def create_embedding_service(
     config: EmbeddingConfig | None = None,
 ) -> EmbeddingServiceProtocol:
@@ -19,9 +26,12 @@ def create_embedding_service(
     """
     from app.infrastructure.embedding.embedding_service import EmbeddingService
 
-    if config is None or config.provider == "local":
+    if config is None:
         return EmbeddingService()
 
+    if config.provider == "local":
+        return EmbeddingService(**_batching_options(config))
+
     if config.provider == "gemini":
         from app.infrastructure.embedding.gemini_embedding_service import GeminiEmbeddingService
 
@@ -29,6 +39,7 @@ def create_embedding_service(
             api_key=config.gemini_api_key,
             model=config.gemini_model,
             dimensions=config.gemini_dimensions,
+            **_batching_options(config),
         )
 
     msg = f"Unknown embedding provider: {config.provider}"
@@ -10,16 +10,59 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
 
+_UNPACK_ERROR = (
+    "Failed to unpack embedding blob as float32 array. "
+    "If this is a legacy pickle-serialized embedding, it must be "
+    "migrated to struct-packed format first."
+)
+
+
+def _load_numpy() -> Any | None:
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+_np = _load_numpy()
+
+
 def pack_embedding(embedding: Any) -> bytes:
     """Serialize an embedding vector as packed float32 bytes for DB storage.
 
     Accepts numpy arrays or list[float]. Uses struct packing instead of pickle
-    to avoid deserialization attack vectors if the DB is compromised.
+    to avoid deserialization attack vectors if the DB is compromised. With
+    NumPy available the bytes come straight from a little-endian float32 array.
     """
+    if _np is not None:
+        if not isinstance(embedding, _np.ndarray) and hasattr(embedding, "tolist"):
+            # Tensors and other array-likes (possibly on an accelerator).
+            embedding = embedding.tolist()
+        array = _np.asarray(embedding, dtype="<f4")
+        if array.ndim != 1:
+            msg = f"Embedding must be one-dimensional, got shape {array.shape}"
+            raise ValueError(msg)
+        packed: bytes = array.tobytes()
+        return packed
     values: list[float] = embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
     return struct.pack(f"<{len(values)}f", *values)
 
 
+def unpack_embedding_array(blob: bytes | bytearray | memoryview) -> Any:
+    """Return a read-only float32 NumPy view over ``blob`` without copying.
+
+    The array shares memory with ``blob``; copy it before mutating. Requires
+    NumPy.
+    """
+    if _np is None:
+        msg = "numpy is required for unpack_embedding_array"
+        raise ImportError(msg)
+    if len(blob) % 4:
+        raise ValueError(_UNPACK_ERROR)
+    return _np.frombuffer(blob, dtype="<f4")
+
+
 def unpack_embedding(blob: bytes) -> list[float]:
     """Deserialize an embedding vector from DB storage.
 
@@ -29,15 +72,14 @@ def unpack_embedding(blob: bytes) -> list[float]:
     security concerns (unsafe deserialization). Run a migration to
     re-encode any old embeddings before upgrading.
     """
+    if _np is not None:
+        values: list[float] = unpack_embedding_array(blob).tolist()
+        return values
     try:
         count = len(blob) // 4  # 4 bytes per float32
         return list(struct.unpack(f"<{count}f", blob))
     except struct.error as exc:
-        raise ValueError(
-            "Failed to unpack embedding blob as float32 array. "
-            "If this is a legacy pickle-serialized embedding, it must be "
-            "migrated to struct-packed format first."
-        ) from exc
+        raise ValueError(_UNPACK_ERROR) from exc
 
 
 class EmbeddingSerializationMixin:
@@ -7,6 +7,11 @@ from typing import TYPE_CHECKING, Any
 
 from app.application.ports.search import EmbeddingDependencyUnavailableError
 from app.core.logging_utils import get_logger
+from app.infrastructure.embedding.embedding_coalescer import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_SECONDS,
+    EmbeddingCoalescer,
+)
 from app.infrastructure.embedding.embedding_protocol import EmbeddingSerializationMixin
 
 if TYPE_CHECKING:
@@ -33,6 +38,9 @@ class EmbeddingService(EmbeddingSerializationMixin):
         self,
         default_model: str = "paraphrase-multilingual-MiniLM-L12-v2",
         model_registry: dict[str, str] | None = None,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
     ) -> None:
         """Initialize embedding service with multi-language support.
 
@@ -40,6 +48,10 @@ class EmbeddingService(EmbeddingSerializationMixin):
             default_model: Default model to use when language is not specified
             model_registry: Custom mapping of language codes to model names
                            If None, uses DEFAULT_MODELS
+            max_batch_size: Most single-text requests coalesced into one encode;
+                           1 encodes every request on its own
+            max_batch_wait_seconds: How long a request may wait for others to
+                           join its batch
         """
         self._default_model = default_model
         self._model_registry = model_registry or DEFAULT_MODELS.copy()
@@ -49,6 +61,11 @@ class EmbeddingService(EmbeddingSerializationMixin):
         # the sentence-transformers import fails, re-attempting it per call is
         # both pointless and slow, so the failure is remembered and re-raised.
         self._dependency_error: EmbeddingDependencyUnavailableError | None = None
+        self._coalescer = EmbeddingCoalescer(
+            self.generate_embeddings_batch,
+            max_batch_size=max_batch_size,
+            max_wait_seconds=max_batch_wait_seconds,
+        )
 
     def _get_model_name_for_language(self, language: str | None) -> str:
         """Get the appropriate model name for a language."""
@@ -96,6 +113,9 @@ class EmbeddingService(EmbeddingSerializationMixin):
     ) -> Any:
         """Generate embedding vector for text.
 
+        Concurrent calls for the same model are coalesced into one batched
+        encode (see :class:`EmbeddingCoalescer`).
+
         Args:
             text: Text to embed
             language: Language code (en, ru, auto) to select optimal model
@@ -104,12 +124,9 @@ class EmbeddingService(EmbeddingSerializationMixin):
             Numpy array embedding vector
         """
         model_name = self._get_model_name_for_language(language)
-        model = self._ensure_model(model_name)
-
-        # Run in thread pool to avoid blocking
-        return await asyncio.to_thread(
-            model.encode, text, convert_to_numpy=True, show_progress_bar=False
-        )
+        self._ensure_model(model_name)
+        # Local models ignore task_type, so requests of every task type share a batch.
+        return await self._coalescer.submit(text, model=model_name, language=language)
 
     async def generate_embeddings_batch(
         self,
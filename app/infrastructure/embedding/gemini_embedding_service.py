@@ -9,10 +9,18 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
 from app.core.logging_utils import get_logger
+from app.infrastructure.embedding.embedding_coalescer import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_SECONDS,
+    EmbeddingCoalescer,
+)
 from app.infrastructure.embedding.embedding_protocol import EmbeddingSerializationMixin
 
 logger = get_logger(__name__)
 
+# Upper bound on texts per ``embed_content`` request (batchEmbedContents limit).
+_MAX_REQUEST_TEXTS = 100
+
 # Task type mapping: caller-friendly names -> Gemini API enum values
 _TASK_TYPE_MAP: dict[str | None, str] = {
     "document": "RETRIEVAL_DOCUMENT",
@@ -33,6 +41,9 @@ class GeminiEmbeddingService(EmbeddingSerializationMixin):
         api_key: str,
         model: str = "gemini-embedding-2-preview",
         dimensions: int = 768,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
     ) -> None:
         if not api_key:
             msg = "GEMINI_API_KEY is required when EMBEDDING_PROVIDER=gemini"
@@ -41,6 +52,11 @@ class GeminiEmbeddingService(EmbeddingSerializationMixin):
         self._model = model
         self._dimensions = dimensions
         self._client: Any | None = None
+        self._coalescer = EmbeddingCoalescer(
+            self.generate_embeddings_batch,
+            max_batch_size=max_batch_size,
+            max_wait_seconds=max_batch_wait_seconds,
+        )
 
     def _ensure_client(self) -> Any:
         """Lazily initialise the google-genai client."""
@@ -63,40 +79,59 @@ class GeminiEmbeddingService(EmbeddingSerializationMixin):
     ) -> list[float]:
         """Generate embedding via Gemini API.
 
+        Concurrent calls with the same task type are coalesced into one
+        batched request (see :class:`EmbeddingCoalescer`).
+
         Args:
             text: Text to embed.
             language: Ignored (Gemini is natively multilingual).
             task_type: One of ``"document"``, ``"query"``, or ``None``.
         """
+        self._ensure_client()
+        embedding: list[float] = await self._coalescer.submit(
+            text, model=self._model, task_type=task_type
+        )
+        return embedding
+
+    async def generate_embeddings_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        language: str | None = None,
+        task_type: str | None = None,
+    ) -> list[Any]:
+        """Batch embedding: one ``embed_content`` call per ``_MAX_REQUEST_TEXTS`` texts."""
+        chunks = [
+            texts[start : start + _MAX_REQUEST_TEXTS]
+            for start in range(0, len(texts), _MAX_REQUEST_TEXTS)
+        ]
+        results = await asyncio.gather(
+            *(self._embed_contents(chunk, task_type=task_type) for chunk in chunks)
+        )
+        return [values for chunk_values in results for values in chunk_values]
+
+    async def _embed_contents(
+        self, texts: Sequence[str], *, task_type: str | None
+    ) -> list[list[float]]:
         client = self._ensure_client()
         gemini_task = _TASK_TYPE_MAP.get(task_type, "SEMANTIC_SIMILARITY")
 
         result = await asyncio.to_thread(
             client.models.embed_content,
             model=self._model,
-            contents=text,
+            # A lone text is sent as-is so single requests keep their payload.
+            contents=texts[0] if len(texts) == 1 else list(texts),
             config={
                 "task_type": gemini_task,
                 "output_dimensionality": self._dimensions,
             },
         )
 
-        values: list[float] = result.embeddings[0].values
-        return values
-
-    async def generate_embeddings_batch(
-        self,
-        texts: Sequence[str],
-        *,
-        language: str | None = None,
-        task_type: str | None = None,
-    ) -> list[Any]:
-        """Batch embedding via parallel Gemini calls (no batch REST endpoint)."""
-        return list(
-            await asyncio.gather(
-                *(self.generate_embedding(t, language=language, task_type=task_type) for t in texts)
-            )
-        )
+        embeddings = result.embeddings
+        if len(embeddings) != len(texts):
+            msg = f"Gemini returned {len(embeddings)} embeddings for {len(texts)} texts"
+            raise RuntimeError(msg)
+        return [embedding.values for embedding in embeddings]
 
     # -- Metadata --------------------------------------------------------------
 
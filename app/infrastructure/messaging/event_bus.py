@@ -2,14 +2,26 @@
 
 This event bus allows decoupling between event publishers and subscribers.
 It follows the Observer pattern and enables loose coupling for side effects.
+
+Handlers run one after another by default. Groups listed in
+``concurrent_groups`` opt out of that order: each such group runs as its own
+lane, in parallel with the other handlers, while its members keep their
+subscription order. With ``dispatch_mode="concurrent"`` every ungrouped
+handler and every group runs in parallel. Each handler call is timed,
+optionally bounded by a timeout, and isolated: a failure or timeout is logged
+and never affects other handlers or the publisher.
 """
 
+import asyncio
+import time
 from collections import defaultdict
-from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar
 
 from app.core.logging_utils import get_logger
 from app.domain.events.summary_events import DomainEvent
+from app.observability.metrics import record_event_handler_latency
 
 logger = get_logger(__name__)
 
@@ -19,6 +31,21 @@ TEvent = TypeVar("TEvent", bound=DomainEvent)
 # Event handler type - async function that takes an event and returns None
 EventHandler = Callable[[TEvent], Awaitable[None]]
 
+DispatchMode = Literal["sequential", "concurrent"]
+
+
+def _handler_name(handler: Callable[..., Any]) -> str:
+    name = getattr(handler, "__qualname__", None) or getattr(handler, "__name__", None)
+    return str(name or repr(handler))
+
+
+@dataclass(frozen=True, slots=True)
+class _Subscription:
+    handler: EventHandler[Any]
+    name: str
+    group: str | None
+    timeout: float | None
+
 
 class EventBus:
     """Simple in-memory event bus for domain events.
@@ -28,13 +55,14 @@ class EventBus:
 
     Example:
         ```python
-        event_bus = EventBus()
+        event_bus = EventBus(concurrent_groups={"webhooks"})
 
         # Subscribe to events
         async def on_summary_created(event: SummaryCreated):
             print(f"Summary {event.summary_id} was created!")
 
         event_bus.subscribe(SummaryCreated, on_summary_created)
+        event_bus.subscribe(SummaryCreated, send_webhook, group="webhooks", timeout=5.0)
 
         # Publish events
         event = SummaryCreated(
@@ -45,32 +73,89 @@ class EventBus:
             has_insights=False,
         )
         await event_bus.publish(event)
+
+        # Or return immediately and let handlers finish in the background
+        await event_bus.publish(event, background=True)
         ```
 
     """
 
-    def __init__(self) -> None:
-        # Map event type to list of handlers
-        self._handlers: dict[type, list[EventHandler]] = defaultdict(list)
+    def __init__(
+        self,
+        *,
+        dispatch_mode: DispatchMode = "sequential",
+        handler_timeout: float | None = None,
+        concurrent_groups: Iterable[str] = (),
+    ) -> None:
+        """Create an event bus.
+
+        Args:
+            dispatch_mode: ``sequential`` awaits handlers one by one, except
+                for ``concurrent_groups``; ``concurrent`` runs ungrouped
+                handlers and ordering groups in parallel.
+            handler_timeout: Default per-handler timeout in seconds, used when a
+                subscription does not set its own. ``None`` means no limit.
+            concurrent_groups: Groups that run in parallel with the ordered
+                handlers in sequential mode.
+
+        """
+        if dispatch_mode not in ("sequential", "concurrent"):
+            msg = f"Unknown dispatch_mode: {dispatch_mode!r}"
+            raise ValueError(msg)
+        if handler_timeout is not None and handler_timeout <= 0:
+            msg = "handler_timeout must be positive"
+            raise ValueError(msg)
+        self._dispatch_mode = dispatch_mode
+        self._handler_timeout = handler_timeout
+        self._concurrent_groups = frozenset(concurrent_groups)
+        # Map event type to list of subscriptions
+        self._handlers: dict[type, list[_Subscription]] = defaultdict(list)
+        # Strong references to background dispatches until they finish
+        self._background: set[asyncio.Task[None]] = set()
+
+    @property
+    def dispatch_mode(self) -> DispatchMode:
+        return self._dispatch_mode
+
+    @property
+    def pending_background_dispatches(self) -> int:
+        return len(self._background)
 
     def subscribe(
         self,
         event_type: type[TEvent],
         handler: EventHandler[TEvent],
+        *,
+        group: str | None = None,
+        timeout: float | None = None,
     ) -> None:
         """Subscribe a handler to a specific event type.
 
         Args:
             event_type: The type of event to subscribe to (e.g., SummaryCreated).
             handler: Async function to call when event is published.
+            group: Ordering group. Handlers sharing a group run in subscription
+                order; the group runs in parallel with other handlers in
+                concurrent mode or when listed in ``concurrent_groups``.
+            timeout: Per-handler timeout in seconds, overriding the bus default.
 
         """
-        self._handlers[event_type].append(handler)
+        if timeout is not None and timeout <= 0:
+            msg = "timeout must be positive"
+            raise ValueError(msg)
+        subscription = _Subscription(
+            handler=handler,
+            name=_handler_name(handler),
+            group=group,
+            timeout=timeout,
+        )
+        self._handlers[event_type].append(subscription)
         logger.debug(
             "event_handler_subscribed",
             extra={
                 "event_type": event_type.__name__,
-                "handler": handler.__name__,
+                "handler": subscription.name,
+                "group": group,
                 "total_handlers": len(self._handlers[event_type]),
             },
         )
@@ -88,38 +173,42 @@ class EventBus:
 
         """
         if event_type in self._handlers:
-            try:
-                self._handlers[event_type].remove(handler)
-                logger.debug(
-                    "event_handler_unsubscribed",
-                    extra={
-                        "event_type": event_type.__name__,
-                        "handler": handler.__name__,
-                    },
-                )
-            except ValueError:
-                logger.warning(
-                    "event_handler_not_found",
-                    extra={
-                        "event_type": event_type.__name__,
-                        "handler": handler.__name__,
-                    },
-                )
+            subscriptions = self._handlers[event_type]
+            for index, subscription in enumerate(subscriptions):
+                if subscription.handler == handler:
+                    del subscriptions[index]
+                    logger.debug(
+                        "event_handler_unsubscribed",
+                        extra={
+                            "event_type": event_type.__name__,
+                            "handler": subscription.name,
+                        },
+                    )
+                    return
+            logger.warning(
+                "event_handler_not_found",
+                extra={
+                    "event_type": event_type.__name__,
+                    "handler": _handler_name(handler),
+                },
+            )
 
-    async def publish(self, event: DomainEvent) -> None:
+    async def publish(self, event: DomainEvent, *, background: bool = False) -> None:
         """Publish a domain event to all subscribed handlers.
 
-        Handlers are called asynchronously. If a handler fails, the error is
-        logged but other handlers continue to execute.
+        Handlers are called asynchronously. If a handler fails or times out,
+        the error is logged but other handlers continue to execute.
 
         Args:
             event: The domain event to publish.
+            background: Return immediately and dispatch in a background task.
+                Use :meth:`drain` to wait for pending background dispatches.
 
         """
         event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
+        subscriptions = list(self._handlers.get(event_type, []))
 
-        if not handlers:
+        if not subscriptions:
             logger.debug(
                 "event_published_no_handlers",
                 extra={
@@ -134,24 +223,97 @@ class EventBus:
             extra={
                 "event_type": event_type.__name__,
                 "event_id": getattr(event, "aggregate_id", None),
-                "handler_count": len(handlers),
+                "handler_count": len(subscriptions),
+                "dispatch_mode": self._dispatch_mode,
+                "background": background,
             },
         )
 
-        # Call all handlers asynchronously
-        for handler in handlers:
-            try:
-                await handler(event)
-            except Exception as exc:
-                # Log error but continue with other handlers
-                logger.exception(
-                    "event_handler_failed",
+        if background:
+            task = asyncio.create_task(self._dispatch(event, subscriptions))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+            return
+        await self._dispatch(event, subscriptions)
+
+    async def drain(self) -> None:
+        """Wait until all background dispatches started so far have finished."""
+        while self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    async def _dispatch(self, event: DomainEvent, subscriptions: list[_Subscription]) -> None:
+        concurrent = self._dispatch_mode == "concurrent"
+        lanes: dict[str, list[_Subscription]] = {}
+        ordered: list[_Subscription] = []
+        for subscription in subscriptions:
+            group = subscription.group
+            if group is not None and (concurrent or group in self._concurrent_groups):
+                lanes.setdefault(group, []).append(subscription)
+            else:
+                ordered.append(subscription)
+        if not lanes:
+            if concurrent:
+                await asyncio.gather(*(self._invoke(event, sub) for sub in ordered))
+            else:
+                await self._run_in_order(event, ordered)
+            return
+
+        head = (
+            [self._invoke(event, sub) for sub in ordered]
+            if concurrent
+            else [self._run_in_order(event, ordered)]
+        )
+        await asyncio.gather(*head, *(self._run_in_order(event, lane) for lane in lanes.values()))
+
+    async def _run_in_order(self, event: DomainEvent, subscriptions: list[_Subscription]) -> None:
+        for subscription in subscriptions:
+            await self._invoke(event, subscription)
+
+    async def _invoke(self, event: DomainEvent, subscription: _Subscription) -> None:
+        event_type = type(event).__name__
+        timeout = subscription.timeout or self._handler_timeout
+        outcome = "success"
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout) as scope:
+                await subscription.handler(event)
+        except TimeoutError as exc:
+            if not scope.expired():
+                outcome = "error"
+                self._log_failure(event_type, subscription, exc)
+            else:
+                outcome = "timeout"
+                logger.warning(
+                    "event_handler_timed_out",
                     extra={
-                        "event_type": event_type.__name__,
-                        "handler": handler.__name__,
-                        "error": str(exc),
+                        "event_type": event_type,
+                        "handler": subscription.name,
+                        "timeout_sec": timeout,
                     },
                 )
+        except Exception as exc:
+            # Log error but continue with other handlers
+            outcome = "error"
+            self._log_failure(event_type, subscription, exc)
+        finally:
+            latency = time.perf_counter() - started
+            record_event_handler_latency(
+                event_type=event_type,
+                handler=subscription.name,
+                outcome=outcome,
+                latency_seconds=latency,
+            )
+
+    @staticmethod
+    def _log_failure(event_type: str, subscription: _Subscription, exc: Exception) -> None:
+        logger.exception(
+            "event_handler_failed",
+            extra={
+                "event_type": event_type,
+                "handler": subscription.name,
+                "error": str(exc),
+            },
+        )
 
     def clear_handlers(self, event_type: type[TEvent] | None = None) -> None:
         """Clear handlers for a specific event type or all handlers.
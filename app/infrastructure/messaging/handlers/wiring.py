@@ -25,6 +25,20 @@ from app.infrastructure.messaging.handlers.webhook_dispatcher import WebhookDisp
 
 logger = get_logger(__name__)
 
+# Rule actions can attach tags that smart collection rules then match on, so the
+# rule engine and smart collections always run in that order.
+SUMMARY_TAGGING_GROUP = "summary_tagging"
+
+# Outbound network side effects that nothing else waits on. Only these groups
+# run alongside the ordered handlers; everything else keeps sequential dispatch.
+WEBHOOK_GROUP = "webhooks"
+EMBEDDING_GROUP = "embeddings"
+PUSH_NOTIFICATION_GROUP = "push_notifications"
+NOTIFICATION_GROUP = "notifications"
+CONCURRENT_EVENT_GROUPS = frozenset(
+    {WEBHOOK_GROUP, EMBEDDING_GROUP, PUSH_NOTIFICATION_GROUP, NOTIFICATION_GROUP}
+)
+
 
 def wire_event_handlers(
     event_bus: Any,
@@ -69,9 +83,11 @@ def wire_event_handlers(
     event_bus.subscribe(TagDetached, search_index_handler.on_tag_detached)
     event_bus.subscribe(SummaryCreated, audit_log_handler.on_summary_created)
     event_bus.subscribe(SummaryCreated, cache_handler.on_summary_created)
-    event_bus.subscribe(SummaryCreated, webhook_handler.on_summary_created)
+    event_bus.subscribe(SummaryCreated, webhook_handler.on_summary_created, group=WEBHOOK_GROUP)
     if embedding_handler:
-        event_bus.subscribe(SummaryCreated, embedding_handler.on_summary_created)
+        event_bus.subscribe(
+            SummaryCreated, embedding_handler.on_summary_created, group=EMBEDDING_GROUP
+        )
 
     push_handler: PushNotificationEventHandler | None = None
     if push_notification_service and summary_repository and request_repository:
@@ -80,21 +96,27 @@ def wire_event_handlers(
             summary_repository=summary_repository,
             request_repository=request_repository,
         )
-        event_bus.subscribe(SummaryCreated, push_handler.on_summary_created)
+        event_bus.subscribe(
+            SummaryCreated, push_handler.on_summary_created, group=PUSH_NOTIFICATION_GROUP
+        )
 
     event_bus.subscribe(SummaryMarkedAsRead, analytics_handler.on_summary_marked_as_read)
     event_bus.subscribe(SummaryMarkedAsRead, cache_handler.on_summary_marked_as_read)
 
     event_bus.subscribe(RequestCompleted, analytics_handler.on_request_completed)
     event_bus.subscribe(RequestCompleted, audit_log_handler.on_request_completed)
-    event_bus.subscribe(RequestCompleted, notification_handler.on_request_completed)
+    event_bus.subscribe(
+        RequestCompleted, notification_handler.on_request_completed, group=NOTIFICATION_GROUP
+    )
     event_bus.subscribe(RequestCompleted, cache_handler.on_request_completed)
-    event_bus.subscribe(RequestCompleted, webhook_handler.on_request_completed)
+    event_bus.subscribe(RequestCompleted, webhook_handler.on_request_completed, group=WEBHOOK_GROUP)
 
     event_bus.subscribe(RequestFailed, analytics_handler.on_request_failed)
     event_bus.subscribe(RequestFailed, audit_log_handler.on_request_failed)
-    event_bus.subscribe(RequestFailed, notification_handler.on_request_failed)
-    event_bus.subscribe(RequestFailed, webhook_handler.on_request_failed)
+    event_bus.subscribe(
+        RequestFailed, notification_handler.on_request_failed, group=NOTIFICATION_GROUP
+    )
+    event_bus.subscribe(RequestFailed, webhook_handler.on_request_failed, group=WEBHOOK_GROUP)
 
     rule_handler = RuleEngineHandler(
         RuleExecutionUseCase(
@@ -108,7 +130,9 @@ def wire_event_handlers(
         ),
         request_repository=request_repository,
     )
-    event_bus.subscribe(SummaryCreated, rule_handler.on_summary_created)
+    event_bus.subscribe(
+        SummaryCreated, rule_handler.on_summary_created, group=SUMMARY_TAGGING_GROUP
+    )
     event_bus.subscribe(RequestCompleted, rule_handler.on_request_completed)
     event_bus.subscribe(RequestFailed, rule_handler.on_request_failed)
     event_bus.subscribe(TagAttached, rule_handler.on_tag_attached)
@@ -117,7 +141,11 @@ def wire_event_handlers(
     # Smart collection auto-population on new summaries
     if database is not None:
         smart_collection_handler = SmartCollectionHandler(database)
-        event_bus.subscribe(SummaryCreated, smart_collection_handler.on_summary_created)
+        event_bus.subscribe(
+            SummaryCreated,
+            smart_collection_handler.on_summary_created,
+            group=SUMMARY_TAGGING_GROUP,
+        )
 
     # Per-user webhook dispatcher (additive alongside system-wide WebhookEventHandler)
     webhook_dispatcher: WebhookDispatcher | None = None
@@ -126,11 +154,14 @@ def wire_event_handlers(
             webhook_repository=webhook_repository,
             request_repository=request_repository,
         )
-        event_bus.subscribe(SummaryCreated, webhook_dispatcher.on_summary_created)
-        event_bus.subscribe(RequestCompleted, webhook_dispatcher.on_request_completed)
-        event_bus.subscribe(RequestFailed, webhook_dispatcher.on_request_failed)
-        event_bus.subscribe(TagAttached, webhook_dispatcher.on_tag_attached)
-        event_bus.subscribe(TagDetached, webhook_dispatcher.on_tag_detached)
+        for event_type, handler in (
+            (SummaryCreated, webhook_dispatcher.on_summary_created),
+            (RequestCompleted, webhook_dispatcher.on_request_completed),
+            (RequestFailed, webhook_dispatcher.on_request_failed),
+            (TagAttached, webhook_dispatcher.on_tag_attached),
+            (TagDetached, webhook_dispatcher.on_tag_detached),
+        ):
+            event_bus.subscribe(event_type, handler, group=WEBHOOK_GROUP)
 
     logger.info(
         "event_handlers_wired",
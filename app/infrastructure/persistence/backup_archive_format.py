@@ -0,0 +1,108 @@
+"""Entry layout and row streaming for backup archives.
+
+Version 2.0 archives store every table as ``<table>.ndjson`` (one JSON object
+per line) next to ``manifest.json`` and ``preferences.json``. Rows are written
+and read one at a time, so neither backup nor restore holds a whole table in
+memory. Version 1.0 archives (one JSON array per table) remain readable.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from typing import TYPE_CHECKING, Any
+
+from app.core.logging_utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = get_logger(__name__)
+
+ARCHIVE_VERSION = "2.0"
+LEGACY_ARCHIVE_VERSION = "1.0"
+SUPPORTED_ARCHIVE_VERSIONS = frozenset({ARCHIVE_VERSION, LEGACY_ARCHIVE_VERSION})
+
+# Restore order: every table only references tables listed before it.
+ARCHIVE_TABLES = (
+    "requests",
+    "summaries",
+    "tags",
+    "summary_tags",
+    "collections",
+    "collection_items",
+    "highlights",
+)
+
+_WRITE_BUFFER_BYTES = 64 * 1024
+
+
+def table_entry_name(table: str, version: str = ARCHIVE_VERSION) -> str:
+    """Return the ZIP entry that holds *table* in an archive of *version*."""
+    if version == LEGACY_ARCHIVE_VERSION:
+        return f"{table}.json"
+    return f"{table}.ndjson"
+
+
+def compression_method(name: str) -> int:
+    """Map a ``BACKUP_COMPRESSION`` value to a ``zipfile`` compression constant.
+
+    Zstandard entries need Python 3.14's ``zipfile.ZIP_ZSTANDARD``; on older
+    interpreters the archive falls back to deflate.
+    """
+    if name == "zstd":
+        method = getattr(zipfile, "ZIP_ZSTANDARD", None)
+        if method is not None:
+            return int(method)
+        logger.warning("backup_zstd_unavailable", extra={"fallback": "deflate"})
+    return zipfile.ZIP_DEFLATED
+
+
+def encode_row(row: dict[str, Any]) -> bytes:
+    return json.dumps(row, default=str, separators=(",", ":")).encode() + b"\n"
+
+
+class NdjsonEntryWriter:
+    """Write rows into one ZIP entry as NDJSON, buffering small writes."""
+
+    def __init__(self, archive: zipfile.ZipFile, name: str) -> None:
+        self._stream = archive.open(name, "w")
+        self._buffer = bytearray()
+        self.count = 0
+
+    def write_many(self, rows: Iterable[dict[str, Any]]) -> None:
+        for row in rows:
+            self._buffer += encode_row(row)
+            self.count += 1
+            if len(self._buffer) >= _WRITE_BUFFER_BYTES:
+                self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        self._stream.close()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer.clear()
+
+    def __enter__(self) -> NdjsonEntryWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def iter_table_rows(
+    archive: zipfile.ZipFile, table: str, version: str = ARCHIVE_VERSION
+) -> Iterator[dict[str, Any]]:
+    """Yield the rows of *table*, decoding one line at a time for NDJSON entries."""
+    name = table_entry_name(table, version)
+    if version == LEGACY_ARCHIVE_VERSION:
+        yield from json.loads(archive.read(name))
+        return
+    with archive.open(name) as raw, io.TextIOWrapper(raw, encoding="utf-8") as lines:
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
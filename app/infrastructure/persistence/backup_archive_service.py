@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import os
 import zipfile
+from dataclasses import dataclass, field
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select, update
+from sqlalchemy import and_, inspect, select, update
 
 from app.core.logging_utils import get_logger
 from app.core.time_utils import UTC
@@ -25,9 +27,17 @@ from app.db.models import (
     Tag,
     User,
     UserBackup,
-    model_to_dict,
 )
 from app.db.types import _utcnow
+from app.infrastructure.persistence.backup_archive_format import (
+    ARCHIVE_TABLES,
+    ARCHIVE_VERSION,
+    SUPPORTED_ARCHIVE_VERSIONS,
+    NdjsonEntryWriter,
+    compression_method,
+    iter_table_rows,
+    table_entry_name,
+)
 from app.infrastructure.persistence.backup_crypto import (
     InvalidBackupCiphertextError,
     decrypt_backup,
@@ -37,13 +47,18 @@ from app.infrastructure.persistence.backup_crypto import (
 from app.infrastructure.persistence.backup_safety import ZipSafetyViolation, validate_zip_safety
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from sqlalchemy import Select
 
     from app.config.backup import BackupConfig
     from app.db.session import Database
 
 logger = get_logger(__name__)
 
+# Rows per server-side cursor fetch on backup and per lookup/insert on restore.
+_STREAM_BATCH_SIZE = 500
+
 
 def _database(db: Database | None) -> Database:
     if db is not None:
@@ -58,10 +73,6 @@ def _resolve_data_dir(data_dir: str | None) -> Path:
     return Path(data_dir or os.getenv("DATA_DIR", "/data"))
 
 
-def _dump_rows(rows: Sequence[object]) -> list[dict[str, Any]]:
-    return [row for row in (model_to_dict(item) for item in rows) if row is not None]
-
-
 def _read_json(archive: zipfile.ZipFile, name: str) -> Any:
     return json.loads(archive.read(name))
 
@@ -74,6 +85,56 @@ def _old_id(row: dict[str, Any], *keys: str) -> int | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Backup
+# ---------------------------------------------------------------------------
+
+
+def _row_select(model: type[Any]) -> Select[Any]:
+    """Select *model*'s columns as plain rows, keyed like ``model_to_dict``.
+
+    Column rows are not added to the session identity map, so streaming them
+    keeps memory bounded by the cursor batch.
+    """
+    return select(*(getattr(model, attr.key) for attr in inspect(model).column_attrs))
+
+
+def _backup_queries(user_id: int) -> dict[str, Select[Any]]:
+    owned_summary = and_(Request.user_id == user_id, Summary.is_deleted.is_(False))
+    owned_tag = and_(Tag.user_id == user_id, Tag.is_deleted.is_(False))
+    owned_collection = and_(Collection.user_id == user_id, Collection.is_deleted.is_(False))
+    return {
+        "requests": _row_select(Request)
+        .where(Request.user_id == user_id)
+        .order_by(Request.created_at.asc(), Request.id.asc()),
+        "summaries": _row_select(Summary)
+        .join(Request, Summary.request_id == Request.id)
+        .where(owned_summary)
+        .order_by(Summary.id),
+        "tags": _row_select(Tag).where(owned_tag).order_by(Tag.id),
+        "summary_tags": _row_select(SummaryTag)
+        .join(Summary, SummaryTag.summary_id == Summary.id)
+        .join(Request, Summary.request_id == Request.id)
+        .join(Tag, SummaryTag.tag_id == Tag.id)
+        .where(owned_summary, owned_tag)
+        .order_by(SummaryTag.id),
+        "collections": _row_select(Collection).where(owned_collection).order_by(Collection.id),
+        "collection_items": _row_select(CollectionItem)
+        .join(Collection, CollectionItem.collection_id == Collection.id)
+        .where(owned_collection)
+        .order_by(CollectionItem.id),
+        "highlights": _row_select(SummaryHighlight)
+        .where(SummaryHighlight.user_id == user_id)
+        .order_by(SummaryHighlight.created_at, SummaryHighlight.id),
+    }
+
+
+async def _stream_rows(session: Any, stmt: Select[Any], writer: NdjsonEntryWriter) -> None:
+    result = await session.stream(stmt.execution_options(yield_per=_STREAM_BATCH_SIZE))
+    async for batch in result.mappings().partitions():
+        writer.write_many(dict(row) for row in batch)
+
+
 async def async_create_backup_archive(
     user_id: int,
     backup_id: int,
@@ -82,12 +143,18 @@ async def async_create_backup_archive(
     data_dir: str | None = None,
     cfg: BackupConfig | None = None,
 ) -> None:
-    """Create a ZIP backup of all user data."""
+    """Create a ZIP backup of all user data.
+
+    Tables are streamed from server-side cursors into NDJSON entries of a ZIP
+    written straight to disk, so memory stays bounded by one cursor batch
+    regardless of archive size.
+    """
     from app.config.backup import load_backup_config
 
     cfg = cfg or load_backup_config()
     database = _database(db)
     backup_dir = _resolve_data_dir(data_dir) / "backups" / str(user_id)
+    part_path: Path | None = None
 
     try:
         async with database.transaction() as session:
@@ -97,167 +164,60 @@ async def async_create_backup_archive(
                 .values(status="processing", updated_at=_utcnow())
             )
 
+        os.makedirs(backup_dir, exist_ok=True)
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        zip_path = backup_dir / f"ratatoskr-backup-{user_id}-{timestamp}.zip"
+        part_path = zip_path.with_name(f"{zip_path.name}.part")
+
+        async with database.transaction() as session:
+            # One snapshot for every table, so link rows (summary tags, collection
+            # items) agree with the summaries, tags and collections written.
+            await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
             user_row = await session.get(User, user_id)
             if user_row is None:
                 msg = f"User {user_id} not found"
                 raise ValueError(msg)
             preferences = user_row.preferences_json
 
-            requests_rows = list(
-                (
-                    await session.execute(
-                        select(Request)
-                        .where(Request.user_id == user_id)
-                        .order_by(Request.created_at.asc())
-                    )
-                )
-                .scalars()
-                .all()
-            )
-            requests_data = _dump_rows(requests_rows)
-
-            summaries_rows = list(
-                (
-                    await session.execute(
-                        select(Summary)
-                        .join(Request, Summary.request_id == Request.id)
-                        .where(Request.user_id == user_id, Summary.is_deleted.is_(False))
-                    )
+            counts: dict[str, int] = {}
+            queries = _backup_queries(user_id)
+            with zipfile.ZipFile(part_path, "w", compression_method(cfg.compression)) as archive:
+                for table in ARCHIVE_TABLES:
+                    with NdjsonEntryWriter(archive, table_entry_name(table)) as writer:
+                        await _stream_rows(session, queries[table], writer)
+                    counts[table] = writer.count
+                archive.writestr(
+                    "preferences.json",
+                    json.dumps(preferences, default=str) if preferences else "{}",
                 )
-                .scalars()
-                .all()
-            )
-            summary_ids = [summary.id for summary in summaries_rows]
-            summaries_data = _dump_rows(summaries_rows)
-
-            tags_rows = list(
-                (
-                    await session.execute(
-                        select(Tag).where(Tag.user_id == user_id, Tag.is_deleted.is_(False))
-                    )
-                )
-                .scalars()
-                .all()
-            )
-            tag_ids = [tag.id for tag in tags_rows]
-            tags_data = _dump_rows(tags_rows)
-
-            summary_tags_rows = (
-                list(
-                    (
-                        await session.execute(
-                            select(SummaryTag).where(
-                                SummaryTag.summary_id.in_(summary_ids),
-                                SummaryTag.tag_id.in_(tag_ids),
-                            )
-                        )
-                    )
-                    .scalars()
-                    .all()
-                )
-                if summary_ids and tag_ids
-                else []
-            )
-            summary_tags_data = _dump_rows(summary_tags_rows)
-
-            collections_rows = list(
-                (
-                    await session.execute(
-                        select(Collection).where(
-                            Collection.user_id == user_id,
-                            Collection.is_deleted.is_(False),
-                        )
-                    )
-                )
-                .scalars()
-                .all()
-            )
-            collection_ids = [collection.id for collection in collections_rows]
-            collections_data = _dump_rows(collections_rows)
-
-            collection_items_rows = (
-                list(
-                    (
-                        await session.execute(
-                            select(CollectionItem).where(
-                                CollectionItem.collection_id.in_(collection_ids)
-                            )
-                        )
-                    )
-                    .scalars()
-                    .all()
-                )
-                if collection_ids
-                else []
-            )
-            collection_items_data = _dump_rows(collection_items_rows)
-
-            highlights_rows = list(
-                (
-                    await session.execute(
-                        select(SummaryHighlight).where(SummaryHighlight.user_id == user_id)
-                    )
-                )
-                .scalars()
-                .all()
-            )
-            highlights_data = _dump_rows(highlights_rows)
-
-            items_count = (
-                len(summaries_data) + len(tags_data) + len(collections_data) + len(highlights_data)
-            )
-            manifest = {
-                "version": "1.0",
-                "user_id": user_id,
-                "created_at": datetime.now(UTC).isoformat(),
-                "counts": {
-                    "requests": len(requests_data),
-                    "summaries": len(summaries_data),
-                    "tags": len(tags_data),
-                    "summary_tags": len(summary_tags_data),
-                    "collections": len(collections_data),
-                    "collection_items": len(collection_items_data),
-                    "highlights": len(highlights_data),
-                },
-            }
-
-        os.makedirs(backup_dir, exist_ok=True)
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-
-        buf = BytesIO()
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
-            archive.writestr("manifest.json", json.dumps(manifest, default=str, indent=2))
-            archive.writestr("requests.json", json.dumps(requests_data, default=str))
-            archive.writestr("summaries.json", json.dumps(summaries_data, default=str))
-            archive.writestr("tags.json", json.dumps(tags_data, default=str))
-            archive.writestr("summary_tags.json", json.dumps(summary_tags_data, default=str))
-            archive.writestr("collections.json", json.dumps(collections_data, default=str))
-            archive.writestr(
-                "collection_items.json", json.dumps(collection_items_data, default=str)
-            )
-            archive.writestr("highlights.json", json.dumps(highlights_data, default=str))
-            archive.writestr(
-                "preferences.json",
-                json.dumps(preferences, default=str) if preferences else "{}",
-            )
+                manifest = {
+                    "version": ARCHIVE_VERSION,
+                    "format": "ndjson",
+                    "user_id": user_id,
+                    "created_at": datetime.now(UTC).isoformat(),
+                    "counts": counts,
+                }
+                archive.writestr("manifest.json", json.dumps(manifest, default=str, indent=2))
 
-        zip_bytes = buf.getvalue()
+        items_count = (
+            counts["summaries"] + counts["tags"] + counts["collections"] + counts["highlights"]
+        )
         if cfg.is_encryption_enabled:
-            payload = encrypt_backup(zip_bytes, cfg.encryption_key)
-            suffix = ".zip.enc"
+            # A Fernet token authenticates the whole message, so the finished
+            # (compressed) ZIP is encrypted in one piece.
+            final_path = zip_path.with_suffix(".zip.enc")
+            final_path.write_bytes(encrypt_backup(part_path.read_bytes(), cfg.encryption_key))
+            part_path.unlink()
         else:
-            payload = zip_bytes
-            suffix = ".zip"
+            final_path = part_path.replace(zip_path)
 
-        zip_path = backup_dir / f"ratatoskr-backup-{user_id}-{timestamp}{suffix}"
-        zip_path.write_bytes(payload)
-        file_size = len(payload)
+        file_size = final_path.stat().st_size
         async with database.transaction() as session:
             await session.execute(
                 update(UserBackup)
                 .where(UserBackup.id == backup_id)
                 .values(
-                    file_path=str(zip_path),
+                    file_path=str(final_path),
                     file_size_bytes=file_size,
                     items_count=items_count,
                     status="completed",
@@ -278,6 +238,8 @@ async def async_create_backup_archive(
             "backup_creation_failed",
             extra={"backup_id": backup_id, "user_id": user_id, "error": str(exc)},
         )
+        if part_path is not None:
+            part_path.unlink(missing_ok=True)
         async with database.transaction() as session:
             await session.execute(
                 update(UserBackup)
@@ -286,6 +248,338 @@ async def async_create_backup_archive(
             )
 
 
+# ---------------------------------------------------------------------------
+# Restore
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class _RestoreState:
+    """Counters and old-id -> new-id maps shared by the per-table restore steps."""
+
+    session: Any
+    user_id: int
+    restored: dict[str, int]
+    skipped: dict[str, int]
+    errors: list[str]
+    request_ids: dict[int, int] = field(default_factory=dict)
+    summary_ids: dict[int, int] = field(default_factory=dict)
+    tag_ids: dict[int, int] = field(default_factory=dict)
+    collection_ids: dict[int, int] = field(default_factory=dict)
+
+
+async def _id_lookup(session: Any, stmt: Select[Any]) -> dict[Any, int]:
+    return dict((await session.execute(stmt)).tuples().all())
+
+
+async def _pair_lookup(session: Any, stmt: Select[Any]) -> set[tuple[int, int]]:
+    return set((await session.execute(stmt)).tuples().all())
+
+
+async def _assign_ids(session: Any, pending: list[tuple[int, Any]], id_map: dict[int, int]) -> None:
+    if not pending:
+        return
+    await session.flush()
+    for old_id, row in pending:
+        id_map[old_id] = row.id
+
+
+async def _restore_requests(state: _RestoreState, batch: Sequence[dict[str, Any]]) -> None:
+    parsed: list[tuple[int, dict[str, Any]]] = []
+    for request in batch:
+        try:
+            parsed.append((int(request["id"]), request))
+        except Exception as exc:
+            state.errors.append(f"request {request.get('id')}: {exc}")
+
+    hashes = sorted({str(r["dedupe_hash"]) for _, r in parsed if r.get("dedupe_hash")})
+    known = (
+        await _id_lookup(
+            state.session,
+            select(Request.dedupe_hash, Request.id).where(
+                Request.user_id == state.user_id, Request.dedupe_hash.in_(hashes)
+            ),
+        )
+        if hashes
+        else {}
+    )
+    created: dict[str, Request] = {}
+    pending: list[tuple[int, Any]] = []
+    for old_request_id, request in parsed:
+        dedupe = request.get("dedupe_hash")
+        if dedupe and dedupe in known:
+            state.request_ids[old_request_id] = known[dedupe]
+            state.skipped["requests"] += 1
+            continue
+        if dedupe and dedupe in created:
+            pending.append((old_request_id, created[dedupe]))
+            state.skipped["requests"] += 1
+            continue
+        new_request = Request(
+            type=request.get("type", "url"),
+            status=request.get("status", "completed"),
+            user_id=state.user_id,
+            input_url=request.get("input_url"),
+            normalized_url=request.get("normalized_url"),
+            dedupe_hash=dedupe,
+            lang_detected=request.get("lang_detected"),
+        )
+        state.session.add(new_request)
+        pending.append((old_request_id, new_request))
+        if dedupe:
+            created[dedupe] = new_request
+        state.restored["requests"] += 1
+    await _assign_ids(state.session, pending, state.request_ids)
+
+
+async def _restore_summaries(state: _RestoreState, batch: Sequence[dict[str, Any]]) -> None:
+    parsed: list[tuple[int, int, dict[str, Any]]] = []
+    for summary in batch:
+        try:
+            old_request_id = _old_id(summary, "request_id", "request")
+            new_request_id = state.request_ids.get(old_request_id or -1)
+            if new_request_id is None:
+                state.skipped["summaries"] += 1
+                continue
+            parsed.append((int(summary["id"]), new_request_id, summary))
+        except Exception as exc:
+            state.errors.append(f"summary {summary.get('id')}: {exc}")
+
+    if not parsed:
+        return
+    known = await _id_lookup(
+        state.session,
+        select(Summary.request_id, Summary.id).where(
+            Summary.request_id.in_(sorted({request_id for _, request_id, _ in parsed}))
+        ),
+    )
+    created: dict[int, Summary] = {}
+    pending: list[tuple[int, Any]] = []
+    for old_summary_id, new_request_id, summary in parsed:
+        if new_request_id in known:
+            state.summary_ids[old_summary_id] = known[new_request_id]
+            state.skipped["summaries"] += 1
+            continue
+        if new_request_id in created:
+            pending.append((old_summary_id, created[new_request_id]))
+            state.skipped["summaries"] += 1
+            continue
+        new_summary = Summary(
+            request_id=new_request_id,
+            lang=summary.get("lang", "en"),
+            json_payload=summary.get("json_payload"),
+            is_read=bool(summary.get("is_read", False)),
+            is_deleted=bool(summary.get("is_deleted", False)),
+        )
+        state.session.add(new_summary)
+        pending.append((old_summary_id, new_summary))
+        created[new_request_id] = new_summary
+        state.restored["summaries"] += 1
+    await _assign_ids(state.session, pending, state.summary_ids)
+
+
+async def _restore_tags(state: _RestoreState, batch: Sequence[dict[str, Any]]) -> None:
+    parsed: list[tuple[int, str, dict[str, Any]]] = []
+    for tag in batch:
+        try:
+            normalized_name = tag.get("normalized_name") or tag.get("name", "").strip().lower()
+            parsed.append((int(tag["id"]), normalized_name, tag))
+        except Exception as exc:
+            state.errors.append(f"tag {tag.get('id')}: {exc}")
+
+    if not parsed:
+        return
+    known = await _id_lookup(
+        state.session,
+        select(Tag.normalized_name, Tag.id).where(
+            Tag.user_id == state.user_id,
+            Tag.normalized_name.in_(sorted({name for _, name, _ in parsed})),
+            Tag.is_deleted.is_(False),
+        ),
+    )
+    created: dict[str, Tag] = {}
+    pending: list[tuple[int, Any]] = []
+    for old_tag_id, normalized_name, tag in parsed:
+        if normalized_name in known:
+            state.tag_ids[old_tag_id] = known[normalized_name]
+            state.skipped["tags"] += 1
+            continue
+        if normalized_name in created:
+            pending.append((old_tag_id, created[normalized_name]))
+            state.skipped["tags"] += 1
+            continue
+        new_tag = Tag(
+            user_id=state.user_id,
+            name=tag.get("name", normalized_name),
+            normalized_name=normalized_name,
+            color=tag.get("color"),
+        )
+        state.session.add(new_tag)
+        pending.append((old_tag_id, new_tag))
+        created[normalized_name] = new_tag
+        state.restored["tags"] += 1
+    await _assign_ids(state.session, pending, state.tag_ids)
+
+
+async def _restore_summary_tags(state: _RestoreState, batch: Sequence[dict[str, Any]]) -> None:
+    parsed: list[tuple[int, int, dict[str, Any]]] = []
+    for summary_tag in batch:
+        try:
+            new_summary_id = state.summary_ids.get(
+                _old_id(summary_tag, "summary_id", "summary") or -1
+            )
+            new_tag_id = state.tag_ids.get(_old_id(summary_tag, "tag_id", "tag") or -1)
+            if new_summary_id is None or new_tag_id is None:
+                continue
+            parsed.append((new_summary_id, new_tag_id, summary_tag))
+        except Exception as exc:
+            state.errors.append(f"summary_tag {summary_tag.get('id')}: {exc}")
+
+    if not parsed:
+        return
+    seen = await _pair_lookup(
+        state.session,
+        select(SummaryTag.summary_id, SummaryTag.tag_id).where(
+            SummaryTag.summary_id.in_(sorted({summary_id for summary_id, _, _ in parsed})),
+            SummaryTag.tag_id.in_(sorted({tag_id for _, tag_id, _ in parsed})),
+        ),
+    )
+    for new_summary_id, new_tag_id, summary_tag in parsed:
+        if (new_summary_id, new_tag_id) in seen:
+            continue
+        seen.add((new_summary_id, new_tag_id))
+        state.session.add(
+            SummaryTag(
+                summary_id=new_summary_id,
+                tag_id=new_tag_id,
+                source=summary_tag.get("source", "manual"),
+            )
+        )
+        state.restored["summary_tags"] += 1
+
+
+async def _restore_collections(state: _RestoreState, batch: Sequence[dict[str, Any]]) -> None:
+    parsed: list[tuple[int, dict[str, Any]]] = []
+    for collection in batch:
+        try:
+            parsed.append((int(collection["id"]), collection))
+        except Exception as exc:
+            state.errors.append(f"collection {collection.get('id')}: {exc}")
+
+    names = sorted({str(c["name"]) for _, c in parsed if c.get("name") is not None})
+    known = (
+        await _id_lookup(
+            state.session,
+            select(Collection.name, Collection.id).where(
+                Collection.user_id == state.user_id,
+                Collection.name.in_(names),
+                Collection.is_deleted.is_(False),
+            ),
+        )
+        if names
+        else {}
+    )
+    created: dict[str, Collection] = {}
+    pending: list[tuple[int, Any]] = []
+    for old_collection_id, collection in parsed:
+        name = collection.get("name")
+        if name in known:
+            state.collection_ids[old_collection_id] = known[name]
+            state.skipped["collections"] += 1
+            continue
+        if name in created:
+            pending.append((old_collection_id, created[name]))
+            state.skipped["collections"] += 1
+            continue
+        new_collection = Collection(
+            user_id=state.user_id,
+            name=collection.get("name", "Imported collection"),
+            description=collection.get("description"),
+            position=collection.get("position"),
+            collection_type=collection.get("collection_type", "manual"),
+            query_conditions_json=collection.get("query_conditions_json"),
+            query_match_mode=collection.get("query_match_mode", "all"),
+        )
+        state.session.add(new_collection)
+        pending.append((old_collection_id, new_collection))
+        if name is not None:
+            created[name] = new_collection
+        state.restored["collections"] += 1
+    await _assign_ids(state.session, pending, state.collection_ids)
+
+
+async def _restore_collection_items(state: _RestoreState, batch: Sequence[dict[str, Any]]) -> None:
+    parsed: list[tuple[int, int, dict[str, Any]]] = []
+    for item in batch:
+        try:
+            new_collection_id = state.collection_ids.get(
+                _old_id(item, "collection_id", "collection") or -1
+            )
+            new_summary_id = state.summary_ids.get(_old_id(item, "summary_id", "summary") or -1)
+            if new_collection_id is None or new_summary_id is None:
+                continue
+            parsed.append((new_collection_id, new_summary_id, item))
+        except Exception as exc:
+            state.errors.append(f"collection_item {item.get('id')}: {exc}")
+
+    if not parsed:
+        return
+    seen = await _pair_lookup(
+        state.session,
+        select(CollectionItem.collection_id, CollectionItem.summary_id).where(
+            CollectionItem.collection_id.in_(sorted({c for c, _, _ in parsed})),
+            CollectionItem.summary_id.in_(sorted({s for _, s, _ in parsed})),
+        ),
+    )
+    for new_collection_id, new_summary_id, item in parsed:
+        if (new_collection_id, new_summary_id) in seen:
+            continue
+        seen.add((new_collection_id, new_summary_id))
+        state.session.add(
+            CollectionItem(
+                collection_id=new_collection_id,
+                summary_id=new_summary_id,
+                position=item.get("position"),
+            )
+        )
+        state.restored["collection_items"] += 1
+
+
+async def _restore_highlights(state: _RestoreState, batch: Sequence[dict[str, Any]]) -> None:
+    for highlight in batch:
+        try:
+            new_summary_id = state.summary_ids.get(
+                _old_id(highlight, "summary_id", "summary") or -1
+            )
+            if new_summary_id is None:
+                continue
+            state.session.add(
+                SummaryHighlight(
+                    user_id=state.user_id,
+                    summary_id=new_summary_id,
+                    text=highlight.get("text", ""),
+                    start_offset=highlight.get("start_offset"),
+                    end_offset=highlight.get("end_offset"),
+                    color=highlight.get("color"),
+                    note=highlight.get("note"),
+                )
+            )
+            state.restored["highlights"] += 1
+        except Exception as exc:
+            state.errors.append(f"highlight {highlight.get('id')}: {exc}")
+
+
+_RESTORE_STEPS: dict[str, Callable[[_RestoreState, Sequence[dict[str, Any]]], Awaitable[None]]] = {
+    "requests": _restore_requests,
+    "summaries": _restore_summaries,
+    "tags": _restore_tags,
+    "summary_tags": _restore_summary_tags,
+    "collections": _restore_collections,
+    "collection_items": _restore_collection_items,
+    "highlights": _restore_highlights,
+}
+
+
 async def async_restore_from_archive(
     user_id: int,
     zip_bytes: bytes,
@@ -293,7 +587,13 @@ async def async_restore_from_archive(
     db: Database | None = None,
     cfg: BackupConfig | None = None,
 ) -> dict[str, Any]:
-    """Restore user data from a backup ZIP and return a summary."""
+    """Restore user data from a backup ZIP and return a summary.
+
+    Table entries are decoded row by row and restored in batches: one lookup
+    query for existing rows and one multi-row insert per batch. Decryption and
+    batch decoding run in worker threads. The restore is all-or-nothing: when it
+    fails, the transaction rolls back and the returned counts are zero.
+    """
     from app.config.backup import load_backup_config
 
     restored: dict[str, int] = {
@@ -320,7 +620,7 @@ async def async_restore_from_archive(
             errors.append("Encrypted backup but BACKUP_ENCRYPTION_KEY is not configured")
             return {"restored": restored, "skipped": skipped, "errors": errors}
         try:
-            zip_bytes = decrypt_backup(zip_bytes, cfg.encryption_key)
+            zip_bytes = await asyncio.to_thread(decrypt_backup, zip_bytes, cfg.encryption_key)
         except InvalidBackupCiphertextError:
             errors.append("Could not decrypt backup (wrong key or corrupted archive)")
             return {"restored": restored, "skipped": skipped, "errors": errors}
@@ -328,7 +628,8 @@ async def async_restore_from_archive(
         logger.warning("restore_unencrypted_backup", extra={"user_id": user_id})
 
     try:
-        validate_zip_safety(
+        await asyncio.to_thread(
+            validate_zip_safety,
             zip_bytes,
             max_entries=cfg.max_zip_entries,
             max_compressed_bytes=cfg.max_compressed_bytes,
@@ -343,237 +644,45 @@ async def async_restore_from_archive(
         with zipfile.ZipFile(BytesIO(zip_bytes), "r") as archive:
             manifest = _read_json(archive, "manifest.json")
             archive_version = manifest.get("version", "unknown")
-            if archive_version not in ("1.0",):
+            if archive_version not in SUPPORTED_ARCHIVE_VERSIONS:
                 return {
                     "restored": restored,
                     "skipped": skipped,
                     "errors": [f"Unsupported backup version: {archive_version}"],
                 }
-
-            requests_data = _read_json(archive, "requests.json")
-            summaries_data = _read_json(archive, "summaries.json")
-            tags_data = _read_json(archive, "tags.json")
-            summary_tags_data = _read_json(archive, "summary_tags.json")
-            collections_data = _read_json(archive, "collections.json")
-            collection_items_data = _read_json(archive, "collection_items.json")
-            highlights_data = _read_json(archive, "highlights.json")
-
-        database = _database(db)
-        async with database.transaction() as session:
-            request_id_map: dict[int, int] = {}
-            summary_id_map: dict[int, int] = {}
-            tag_id_map: dict[int, int] = {}
-            collection_id_map: dict[int, int] = {}
-
-            for request in requests_data:
-                try:
-                    dedupe = request.get("dedupe_hash")
-                    old_request_id = int(request["id"])
-                    if dedupe:
-                        existing = await session.scalar(
-                            select(Request).where(
-                                Request.user_id == user_id,
-                                Request.dedupe_hash == dedupe,
-                            )
-                        )
-                        if existing:
-                            request_id_map[old_request_id] = existing.id
-                            skipped["requests"] += 1
-                            continue
-
-                    new_request = Request(
-                        type=request.get("type", "url"),
-                        status=request.get("status", "completed"),
-                        user_id=user_id,
-                        input_url=request.get("input_url"),
-                        normalized_url=request.get("normalized_url"),
-                        dedupe_hash=request.get("dedupe_hash"),
-                        lang_detected=request.get("lang_detected"),
-                    )
-                    session.add(new_request)
-                    await session.flush()
-                    request_id_map[old_request_id] = new_request.id
-                    restored["requests"] += 1
-                except Exception as exc:
-                    errors.append(f"request {request.get('id')}: {exc}")
-
-            for summary in summaries_data:
-                try:
-                    old_request_id = _old_id(summary, "request_id", "request")
-                    new_request_id = request_id_map.get(old_request_id or -1)
-                    if new_request_id is None:
-                        skipped["summaries"] += 1
-                        continue
-
-                    existing_summary = await session.scalar(
-                        select(Summary).where(Summary.request_id == new_request_id)
-                    )
-                    old_summary_id = int(summary["id"])
-                    if existing_summary:
-                        summary_id_map[old_summary_id] = existing_summary.id
-                        skipped["summaries"] += 1
-                        continue
-
-                    new_summary = Summary(
-                        request_id=new_request_id,
-                        lang=summary.get("lang", "en"),
-                        json_payload=summary.get("json_payload"),
-                        is_read=bool(summary.get("is_read", False)),
-                        is_deleted=bool(summary.get("is_deleted", False)),
-                    )
-                    session.add(new_summary)
-                    await session.flush()
-                    summary_id_map[old_summary_id] = new_summary.id
-                    restored["summaries"] += 1
-                except Exception as exc:
-                    errors.append(f"summary {summary.get('id')}: {exc}")
-
-            for tag in tags_data:
-                try:
-                    normalized_name = (
-                        tag.get("normalized_name") or tag.get("name", "").strip().lower()
-                    )
-                    existing_tag = await session.scalar(
-                        select(Tag).where(
-                            Tag.user_id == user_id,
-                            Tag.normalized_name == normalized_name,
-                            Tag.is_deleted.is_(False),
-                        )
-                    )
-                    old_tag_id = int(tag["id"])
-                    if existing_tag:
-                        tag_id_map[old_tag_id] = existing_tag.id
-                        skipped["tags"] += 1
-                        continue
-                    new_tag = Tag(
-                        user_id=user_id,
-                        name=tag.get("name", normalized_name),
-                        normalized_name=normalized_name,
-                        color=tag.get("color"),
-                    )
-                    session.add(new_tag)
-                    await session.flush()
-                    tag_id_map[old_tag_id] = new_tag.id
-                    restored["tags"] += 1
-                except Exception as exc:
-                    errors.append(f"tag {tag.get('id')}: {exc}")
-
-            for summary_tag in summary_tags_data:
-                try:
-                    new_summary_id = summary_id_map.get(
-                        _old_id(summary_tag, "summary_id", "summary") or -1
-                    )
-                    new_tag_id = tag_id_map.get(_old_id(summary_tag, "tag_id", "tag") or -1)
-                    if new_summary_id is None or new_tag_id is None:
-                        continue
-                    existing = await session.scalar(
-                        select(SummaryTag).where(
-                            SummaryTag.summary_id == new_summary_id,
-                            SummaryTag.tag_id == new_tag_id,
-                        )
-                    )
-                    if existing is not None:
-                        continue
-                    session.add(
-                        SummaryTag(
-                            summary_id=new_summary_id,
-                            tag_id=new_tag_id,
-                            source=summary_tag.get("source", "manual"),
-                        )
-                    )
-                    await session.flush()
-                    restored["summary_tags"] += 1
-                except Exception as exc:
-                    errors.append(f"summary_tag {summary_tag.get('id')}: {exc}")
-
-            for collection in collections_data:
-                try:
-                    existing_collection = await session.scalar(
-                        select(Collection).where(
-                            Collection.user_id == user_id,
-                            Collection.name == collection.get("name"),
-                            Collection.is_deleted.is_(False),
-                        )
-                    )
-                    old_collection_id = int(collection["id"])
-                    if existing_collection:
-                        collection_id_map[old_collection_id] = existing_collection.id
-                        skipped["collections"] += 1
-                        continue
-                    new_collection = Collection(
-                        user_id=user_id,
-                        name=collection.get("name", "Imported collection"),
-                        description=collection.get("description"),
-                        position=collection.get("position"),
-                        collection_type=collection.get("collection_type", "manual"),
-                        query_conditions_json=collection.get("query_conditions_json"),
-                        query_match_mode=collection.get("query_match_mode", "all"),
-                    )
-                    session.add(new_collection)
-                    await session.flush()
-                    collection_id_map[old_collection_id] = new_collection.id
-                    restored["collections"] += 1
-                except Exception as exc:
-                    errors.append(f"collection {collection.get('id')}: {exc}")
-
-            for item in collection_items_data:
-                try:
-                    new_collection_id = collection_id_map.get(
-                        _old_id(item, "collection_id", "collection") or -1
-                    )
-                    new_summary_id = summary_id_map.get(
-                        _old_id(item, "summary_id", "summary") or -1
-                    )
-                    if new_collection_id is None or new_summary_id is None:
-                        continue
-                    existing = await session.scalar(
-                        select(CollectionItem).where(
-                            CollectionItem.collection_id == new_collection_id,
-                            CollectionItem.summary_id == new_summary_id,
-                        )
-                    )
-                    if existing is not None:
-                        continue
-                    session.add(
-                        CollectionItem(
-                            collection_id=new_collection_id,
-                            summary_id=new_summary_id,
-                            position=item.get("position"),
-                        )
-                    )
-                    await session.flush()
-                    restored["collection_items"] += 1
-                except Exception as exc:
-                    errors.append(f"collection_item {item.get('id')}: {exc}")
-
-            for highlight in highlights_data:
-                try:
-                    new_summary_id = summary_id_map.get(
-                        _old_id(highlight, "summary_id", "summary") or -1
-                    )
-                    if new_summary_id is None:
-                        continue
-                    session.add(
-                        SummaryHighlight(
-                            user_id=user_id,
-                            summary_id=new_summary_id,
-                            text=highlight.get("text", ""),
-                            start_offset=highlight.get("start_offset"),
-                            end_offset=highlight.get("end_offset"),
-                            color=highlight.get("color"),
-                            note=highlight.get("note"),
-                        )
-                    )
-                    restored["highlights"] += 1
-                except Exception as exc:
-                    errors.append(f"highlight {highlight.get('id')}: {exc}")
+            for table in ARCHIVE_TABLES:
+                archive.getinfo(table_entry_name(table, archive_version))
+
+            database = _database(db)
+            async with database.transaction() as session:
+                state = _RestoreState(
+                    session=session,
+                    user_id=user_id,
+                    restored=restored,
+                    skipped=skipped,
+                    errors=errors,
+                )
+                for table in ARCHIVE_TABLES:
+                    restore_batch = _RESTORE_STEPS[table]
+                    rows = iter_table_rows(archive, table, archive_version)
+                    batches = itertools.batched(rows, _STREAM_BATCH_SIZE, strict=False)
+                    while batch := await asyncio.to_thread(next, batches, ()):
+                        await restore_batch(state, batch)
+                        await session.flush()
+                        # Only the id maps are needed from here on.
+                        session.expunge_all()
     except KeyError as exc:
         errors.append(f"Missing required file in backup archive: {exc}")
     except zipfile.BadZipFile:
         errors.append("Invalid or corrupt ZIP archive")
     except Exception as exc:
         errors.append(str(exc))
+    else:
+        return {"restored": restored, "skipped": skipped, "errors": errors}
 
+    # Nothing was committed, so counts gathered before the failure are void.
+    restored = dict.fromkeys(restored, 0)
+    skipped = dict.fromkeys(skipped, 0)
     return {"restored": restored, "skipped": skipped, "errors": errors}
 
 
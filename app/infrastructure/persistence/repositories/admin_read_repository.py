@@ -207,6 +207,79 @@ class AdminReadRepositoryAdapter:
 
             return {"llm_7d": llm_stats, "scraper_7d": scraper_stats}
 
+    async def async_prompt_cache_report(self, *, since: Any, limit: int = 50) -> dict[str, Any]:
+        """Cache-hit ratio and cached prompt tokens per (prompt_cache_key, model)."""
+        calls = func.count(LLMCall.id)
+        async with self._database.session() as session:
+            rows = (
+                await session.execute(
+                    select(
+                        LLMCall.prompt_cache_key,
+                        LLMCall.model,
+                        calls,
+                        func.sum(case((LLMCall.cache_read_tokens > 0, 1), else_=0)),
+                        func.sum(LLMCall.tokens_prompt),
+                        func.sum(LLMCall.cache_read_tokens),
+                        func.sum(LLMCall.cache_creation_tokens),
+                        func.min(LLMCall.id),
+                    )
+                    .where(
+                        LLMCall.created_at >= since,
+                        LLMCall.prompt_cache_key.is_not(None),
+                        LLMCall.status == "ok",
+                    )
+                    .group_by(LLMCall.prompt_cache_key, LLMCall.model)
+                    .order_by(desc(calls))
+                    .limit(limit)
+                )
+            ).all()
+
+            sample_ids = [row[7] for row in rows]
+            previews: dict[int, str] = {}
+            if sample_ids:
+                samples = await session.execute(
+                    select(LLMCall.id, LLMCall.request_messages_json).where(
+                        LLMCall.id.in_(sample_ids)
+                    )
+                )
+                previews = {call_id: _system_prompt_preview(msgs) for call_id, msgs in samples}
+
+        prompts: list[dict[str, Any]] = []
+        total_calls = total_hits = total_prompt = total_cached = 0
+        for key, model, count, hits, prompt, cached, written, sample_id in rows:
+            count_int = int(count or 0)
+            hits_int = int(hits or 0)
+            prompt_int = int(prompt or 0)
+            cached_int = int(cached or 0)
+            total_calls += count_int
+            total_hits += hits_int
+            total_prompt += prompt_int
+            total_cached += cached_int
+            prompts.append(
+                {
+                    "prompt_cache_key": key,
+                    "model": model,
+                    "preview": previews.get(sample_id, ""),
+                    "calls": count_int,
+                    "cache_hits": hits_int,
+                    "hit_ratio": round(hits_int / count_int, 4) if count_int else 0.0,
+                    "prompt_tokens": prompt_int,
+                    "cached_tokens": cached_int,
+                    "cache_write_tokens": int(written or 0),
+                    "cached_token_ratio": (
+                        round(cached_int / prompt_int, 4) if prompt_int else 0.0
+                    ),
+                }
+            )
+
+        return {
+            "prompts": prompts,
+            "total_calls": total_calls,
+            "hit_ratio": round(total_hits / total_calls, 4) if total_calls else 0.0,
+            "total_prompt_tokens": total_prompt,
+            "total_cached_tokens": total_cached,
+        }
+
     async def async_audit_log(
         self,
         *,
@@ -265,3 +338,17 @@ def _parse_since(since: str | None) -> dt.datetime | None:
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=UTC)
     return parsed
+
+
+def _system_prompt_preview(messages: Any, length: int = 120) -> str:
+    if not isinstance(messages, list):
+        return ""
+    for message in messages:
+        if isinstance(message, dict) and message.get("role") == "system":
+            content = message.get("content")
+            if isinstance(content, list):
+                content = " ".join(
+                    part.get("text", "") for part in content if isinstance(part, dict)
+                )
+            return " ".join(str(content or "").split())[:length]
+    return ""
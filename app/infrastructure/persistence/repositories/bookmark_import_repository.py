@@ -15,12 +15,18 @@ from app.db.models import Collection, CollectionItem, Request, Summary, SummaryT
 from app.domain.services.tag_service import normalize_tag_name
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from app.db.session import Database
     from app.domain.services.import_parsers.base import ImportedBookmark
 
 
 class BookmarkImportAdapter:
-    """Import one bookmark and all derived records in a single transaction."""
+    """Import bookmarks and all derived records transactionally.
+
+    ``async_import_bookmark`` handles one bookmark per transaction;
+    ``async_import_bookmarks`` handles a chunk with one statement per table.
+    """
 
     def __init__(self, database: Database) -> None:
         self._database = database
@@ -129,3 +135,214 @@ class BookmarkImportAdapter:
                 )
 
             return BookmarkImportItemResult(url=bookmark.url, outcome="created")
+
+    async def async_import_bookmarks(
+        self,
+        bookmarks: Sequence[ImportedBookmark],
+        *,
+        user_id: int,
+        options: dict[str, Any],
+    ) -> list[BookmarkImportItemResult]:
+        """Persist a chunk of bookmarks in one transaction, results in input order.
+
+        Existing dedupe hashes are found with one query and every table gets a
+        single multi-row insert. Bookmarks whose URL cannot be normalized fail
+        individually; any other error aborts the whole chunk.
+        """
+
+        now = _dt.datetime.now(UTC)
+        server_version = int(now.timestamp() * 1000)
+        results: list[BookmarkImportItemResult | None] = [None] * len(bookmarks)
+        pending: dict[str, tuple[int, ImportedBookmark, str]] = {}
+        for index, bookmark in enumerate(bookmarks):
+            try:
+                normalized_url = normalize_url(bookmark.url)
+                dedupe_hash = compute_dedupe_hash(normalized_url)
+            except Exception as exc:
+                results[index] = BookmarkImportItemResult(
+                    url=bookmark.url, outcome="failed", error=f"{bookmark.url}: {exc}"
+                )
+                continue
+            if dedupe_hash in pending:
+                results[index] = BookmarkImportItemResult(url=bookmark.url, outcome="skipped")
+                continue
+            pending[dedupe_hash] = (index, bookmark, normalized_url)
+
+        async with self._database.transaction() as session:
+            collection_id = await self._resolve_target_collection(session, user_id, options)
+
+            if pending:
+                existing = set(
+                    (
+                        await session.execute(
+                            select(Request.dedupe_hash).where(
+                                Request.dedupe_hash.in_(list(pending))
+                            )
+                        )
+                    ).scalars()
+                )
+                for dedupe_hash in existing:
+                    index, bookmark, _ = pending.pop(dedupe_hash)
+                    results[index] = BookmarkImportItemResult(url=bookmark.url, outcome="skipped")
+
+            request_rows = [
+                {
+                    "type": "import",
+                    "status": "completed",
+                    "user_id": user_id,
+                    "input_url": bookmark.url,
+                    "normalized_url": normalized_url,
+                    "dedupe_hash": dedupe_hash,
+                    "content_text": bookmark.notes,
+                    "created_at": bookmark.created_at or now,
+                    "updated_at": now,
+                    "server_version": server_version,
+                }
+                # Concurrent chunks insert in one global key order, so overlapping
+                # batches wait on each other instead of deadlocking.
+                for dedupe_hash, (_, bookmark, normalized_url) in sorted(pending.items())
+            ]
+            request_ids: dict[str, int] = {}
+            if request_rows:
+                # A concurrent chunk may insert the same URL first; the loser skips it.
+                rows = await session.execute(
+                    insert(Request)
+                    .values(request_rows)
+                    .on_conflict_do_nothing(index_elements=[Request.dedupe_hash])
+                    .returning(Request.dedupe_hash, Request.id)
+                )
+                request_ids = dict(rows.tuples())
+
+            created = [
+                (request_ids[dedupe_hash], index, bookmark)
+                for dedupe_hash, (index, bookmark, _) in pending.items()
+                if dedupe_hash in request_ids
+            ]
+            for dedupe_hash, (index, bookmark, _) in pending.items():
+                if dedupe_hash not in request_ids:
+                    results[index] = BookmarkImportItemResult(url=bookmark.url, outcome="skipped")
+            if created:
+                summary_ids = await self._insert_summaries(session, created, now, server_version)
+                await self._link_tags(session, user_id, created, summary_ids)
+                if collection_id is not None:
+                    await session.execute(
+                        insert(CollectionItem)
+                        .values(
+                            [
+                                {"collection_id": collection_id, "summary_id": summary_id}
+                                for summary_id in summary_ids.values()
+                            ]
+                        )
+                        .on_conflict_do_nothing(
+                            index_elements=[CollectionItem.collection_id, CollectionItem.summary_id]
+                        )
+                    )
+            for _, index, bookmark in created:
+                results[index] = BookmarkImportItemResult(url=bookmark.url, outcome="created")
+
+        return [result for result in results if result is not None]
+
+    @staticmethod
+    async def _resolve_target_collection(
+        session: Any, user_id: int, options: dict[str, Any]
+    ) -> int | None:
+        target_collection_id = options.get("target_collection_id")
+        if target_collection_id is None:
+            return None
+        collection_id = await session.scalar(
+            select(Collection.id).where(
+                Collection.id == target_collection_id,
+                Collection.user_id == user_id,
+            )
+        )
+        if collection_id is None:
+            msg = f"collection {target_collection_id} not found or not owned by user"
+            raise ValueError(msg)
+        return int(collection_id)
+
+    @staticmethod
+    async def _insert_summaries(
+        session: Any,
+        created: list[tuple[int, int, ImportedBookmark]],
+        now: _dt.datetime,
+        server_version: int,
+    ) -> dict[int, int]:
+        """Insert one summary per new request; return request id -> summary id."""
+        rows = await session.execute(
+            insert(Summary)
+            .values(
+                [
+                    {
+                        "request_id": request_id,
+                        "json_payload": {
+                            "title": bookmark.title or bookmark.url,
+                            "summary_250": bookmark.notes or "",
+                            "topic_tags": bookmark.tags,
+                        },
+                        "lang": None,
+                        "server_version": server_version,
+                        "created_at": bookmark.created_at or now,
+                        "updated_at": now,
+                    }
+                    for request_id, _, bookmark in created
+                ]
+            )
+            .returning(Summary.request_id, Summary.id)
+        )
+        return dict(rows.tuples())
+
+    @staticmethod
+    async def _link_tags(
+        session: Any,
+        user_id: int,
+        created: list[tuple[int, int, ImportedBookmark]],
+        summary_ids: dict[int, int],
+    ) -> None:
+        """Upsert the chunk's tags once and link them to the new summaries."""
+        tag_names: dict[str, str] = {}
+        links: set[tuple[int, str]] = set()
+        for request_id, _, bookmark in created:
+            for raw_tag in bookmark.tags:
+                normalized = normalize_tag_name(raw_tag)
+                if not normalized:
+                    continue
+                tag_names.setdefault(normalized, raw_tag.strip())
+                links.add((summary_ids[request_id], normalized))
+        if not links:
+            return
+
+        await session.execute(
+            insert(Tag)
+            .values(
+                [
+                    {"user_id": user_id, "normalized_name": normalized, "name": name}
+                    # Sorted for the same lock-order reason as the request rows
+                    for normalized, name in sorted(tag_names.items())
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[Tag.user_id, Tag.normalized_name])
+        )
+        tag_ids = dict(
+            (
+                await session.execute(
+                    select(Tag.normalized_name, Tag.id).where(
+                        Tag.user_id == user_id,
+                        Tag.normalized_name.in_(list(tag_names)),
+                    )
+                )
+            ).tuples()
+        )
+        missing = set(tag_names) - set(tag_ids)
+        if missing:
+            msg = f"failed to resolve tag {sorted(missing)[0]!r}"
+            raise RuntimeError(msg)
+        await session.execute(
+            insert(SummaryTag)
+            .values(
+                [
+                    {"summary_id": summary_id, "tag_id": tag_ids[normalized], "source": "import"}
+                    for summary_id, normalized in sorted(links)
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[SummaryTag.summary_id, SummaryTag.tag_id])
+        )
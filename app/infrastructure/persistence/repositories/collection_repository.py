@@ -20,6 +20,7 @@ from app.db.models import (
     User,
     model_to_dict,
 )
+from app.infrastructure.persistence.rule_condition_sql import summary_condition_prefilter
 
 if TYPE_CHECKING:
     from app.db.session import Database
@@ -659,6 +660,56 @@ class CollectionRepositoryAdapter:
                 for summary, request in rows
             ]
 
+    async def async_list_smart_collection_candidates(
+        self,
+        user_id: int,
+        conditions: list[dict[str, Any]],
+        match_mode: str = "all",
+        limit: int = 10000,
+    ) -> list[dict[str, Any]]:
+        """Return the user's summaries that may satisfy *conditions*.
+
+        Same shape and window as ``async_list_user_summaries_with_request``
+        (newest *limit* summaries), reduced to the fields
+        ``build_summary_context`` reads and prefiltered in SQL where the
+        conditions allow it. Callers still run the Python matcher.
+        """
+        recent = (
+            select(Summary.id)
+            .join(Request, Summary.request_id == Request.id)
+            .where(Request.user_id == user_id, Summary.is_deleted.is_(False))
+            .order_by(Summary.created_at.desc())
+            .limit(limit)
+            .subquery()
+        )
+        stmt = (
+            select(
+                Summary.id,
+                Summary.lang,
+                Summary.json_payload,
+                Request.normalized_url,
+                Request.input_url,
+            )
+            .join(recent, recent.c.id == Summary.id)
+            .join(Request, Summary.request_id == Request.id)
+            .order_by(Summary.created_at.desc())
+        )
+        prefilter = summary_condition_prefilter(conditions, match_mode)
+        if prefilter is not None:
+            stmt = stmt.where(prefilter)
+        async with self._database.session() as session:
+            rows = await session.execute(stmt)
+            return [
+                {
+                    "summary": {"id": row.id, "lang": row.lang, "json_payload": row.json_payload},
+                    "request": {
+                        "normalized_url": row.normalized_url,
+                        "input_url": row.input_url,
+                    },
+                }
+                for row in rows
+            ]
+
 
 async def _active_collection(session: Any, collection_id: int | None) -> Collection | None:
     if collection_id is None:
@@ -101,3 +101,19 @@ class CrawlResultRepositoryAdapter:
                 )
             ).scalars()
             return [model_to_dict(row) or {} for row in rows]
+
+    async def async_get_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """Get up to *limit* crawl results with ``server_version > since``, oldest version first."""
+        async with self._database.session() as session:
+            rows = (
+                await session.execute(
+                    select(CrawlResult)
+                    .join(Request, CrawlResult.request_id == Request.id)
+                    .where(Request.user_id == user_id, CrawlResult.server_version > since)
+                    .order_by(CrawlResult.server_version, CrawlResult.id)
+                    .limit(limit)
+                )
+            ).scalars()
+            return [model_to_dict(row) or {} for row in rows]
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.dialects.postgresql import insert
 
 from app.db.models import Request, Summary, SummaryEmbedding, model_to_dict
 from app.db.types import _utcnow
 
 if TYPE_CHECKING:
+    import datetime as dt
+
     from app.db.session import Database
 
 
@@ -77,6 +79,32 @@ class EmbeddingRepositoryAdapter:
             )
             return [_embedding_row(row[0], row[1], row[2]) for row in rows]
 
+    async def async_get_embeddings_updated_since(
+        self,
+        since: dt.datetime,
+        *,
+        after_id: int,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch embeddings written after ``(since, after_id)``, oldest write first.
+
+        ``SummaryEmbedding.created_at`` is re-stamped on every upsert, so this
+        returns both new and regenerated embeddings. Paging on the
+        ``(created_at, id)`` pair keeps rows that share the boundary timestamp.
+        """
+        if limit <= 0:
+            return []
+        async with self._database.session() as session:
+            rows = await session.execute(
+                select(SummaryEmbedding, Summary, Request)
+                .join(Summary, SummaryEmbedding.summary_id == Summary.id)
+                .join(Request, Summary.request_id == Request.id)
+                .where(tuple_(SummaryEmbedding.created_at, SummaryEmbedding.id) > (since, after_id))
+                .order_by(SummaryEmbedding.created_at, SummaryEmbedding.id)
+                .limit(limit)
+            )
+            return [_embedding_row(row[0], row[1], row[2]) for row in rows]
+
     async def async_create_or_update_summary_embedding(
         self,
         summary_id: int,
@@ -150,4 +178,7 @@ def _embedding_row(
         "json_payload": summary.json_payload,
         "normalized_url": request.normalized_url,
         "input_url": request.input_url,
+        "request_created_at": request.created_at,
+        "embedding_updated_at": embedding.created_at,
+        "embedding_id": embedding.id,
     }
@@ -40,6 +40,9 @@ def _build_llm_call_payload(call_data: dict[str, Any] | Any) -> dict[str, Any]:
         "structured_output_used": call_data.get("structured_output_used"),
         "structured_output_mode": call_data.get("structured_output_mode"),
         "error_context_json": error_context_payload,
+        "cache_read_tokens": call_data.get("cache_read_tokens"),
+        "cache_creation_tokens": call_data.get("cache_creation_tokens"),
+        "prompt_cache_key": call_data.get("prompt_cache_key"),
     }
 
     # Attempt-tracking: pass through if present; the repo layer fills in
@@ -73,6 +76,18 @@ async def _compute_next_attempt_index(session: Any, request_id: int | None) -> i
     return (current_max or 0) + 1
 
 
+async def _current_attempt_indexes(session: Any, request_ids: set[int]) -> dict[int | None, int]:
+    """Return max(attempt_index) per request id, omitting requests without LLM calls."""
+    if not request_ids:
+        return {}
+    rows = await session.execute(
+        select(LLMCall.request_id, func.max(LLMCall.attempt_index))
+        .where(LLMCall.request_id.in_(request_ids))
+        .group_by(LLMCall.request_id)
+    )
+    return {request_id: int(current or 0) for request_id, current in rows}
+
+
 async def _resolve_initial_trigger(session: Any, request_id: int | None) -> str | None:
     """Return the ``initial_attempt_trigger`` stored on the parent request.
 
@@ -135,18 +150,24 @@ class LLMRepositoryAdapter:
             return []
 
         async with self._database.transaction() as session:
+            payloads = [_build_llm_call_payload(call_data) for call_data in calls]
             # Track the running max per request_id so that rows within the
-            # same batch are numbered correctly without extra round-trips.
-            running_max: dict[int | None, int] = {}
+            # same batch are numbered correctly; existing maxima come from one
+            # grouped query instead of one query per request.
+            running_max: dict[int | None, int] = await _current_attempt_indexes(
+                session,
+                {
+                    payload["request_id"]
+                    for payload in payloads
+                    if payload.get("attempt_index") is None
+                    and payload.get("request_id") is not None
+                },
+            )
             rows: list[LLMCall] = []
-            for call_data in calls:
-                payload = _build_llm_call_payload(call_data)
+            for payload in payloads:
                 if "attempt_index" not in payload or payload.get("attempt_index") is None:
                     req_id: int | None = payload.get("request_id")
-                    if req_id not in running_max:
-                        running_max[req_id] = await _compute_next_attempt_index(session, req_id)
-                    else:
-                        running_max[req_id] += 1
+                    running_max[req_id] = running_max.get(req_id, 0) + 1
                     payload["attempt_index"] = running_max[req_id]
                 else:
                     # Caller provided explicit value; keep running_max in sync.
@@ -230,3 +251,19 @@ class LLMRepositoryAdapter:
                 )
             ).scalars()
             return [model_to_dict(row) or {} for row in rows]
+
+    async def async_get_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """Get up to *limit* LLM calls with ``server_version > since``, oldest version first."""
+        async with self._database.session() as session:
+            rows = (
+                await session.execute(
+                    select(LLMCall)
+                    .join(Request, LLMCall.request_id == Request.id)
+                    .where(Request.user_id == user_id, LLMCall.server_version > since)
+                    .order_by(LLMCall.server_version, LLMCall.id)
+                    .limit(limit)
+                )
+            ).scalars()
+            return [model_to_dict(row) or {} for row in rows]
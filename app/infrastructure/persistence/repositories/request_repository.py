@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 from sqlalchemy import func, or_, select, update
 from sqlalchemy.dialects.postgresql import insert
 
+from app.db.batch_operations import BatchOperations
 from app.db.json_utils import prepare_json_payload
 from app.db.models import CrawlResult, Request, Summary, TelegramMessage, model_to_dict
 from app.db.types import _utcnow
@@ -90,6 +91,39 @@ class RequestRepositoryAdapter:
             )
             return model_to_dict(request)
 
+    async def async_get_requests_by_dedupe_hashes(
+        self, dedupe_hashes: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Return ``id``/``status``/``updated_at`` of existing requests, keyed by dedupe_hash."""
+        if not dedupe_hashes:
+            return {}
+        async with self._database.session() as session:
+            rows = await session.execute(
+                select(Request.id, Request.dedupe_hash, Request.status, Request.updated_at).where(
+                    Request.dedupe_hash.in_(set(dedupe_hashes))
+                )
+            )
+            return {row.dedupe_hash: dict(row._mapping) for row in rows}
+
+    async def async_find_recent_requests_by_dedupe_hashes(
+        self, dedupe_hashes: list[str], *, max_age_sec: int = 300
+    ) -> dict[str, dict[str, Any]]:
+        """Bulk variant of :meth:`async_find_recent_request_by_dedupe`, keyed by dedupe_hash."""
+        from datetime import timedelta
+
+        if not dedupe_hashes:
+            return {}
+        cutoff = _utcnow() - timedelta(seconds=max_age_sec)
+        async with self._database.session() as session:
+            rows = await session.execute(
+                select(Request.id, Request.dedupe_hash, Request.status, Request.updated_at).where(
+                    Request.dedupe_hash.in_(set(dedupe_hashes)),
+                    Request.status.in_(["processing", "pending", "error"]),
+                    Request.updated_at >= cutoff,
+                )
+            )
+            return {row.dedupe_hash: dict(row._mapping) for row in rows}
+
     async def async_get_latest_request_by_correlation_id(
         self, correlation_id: str
     ) -> dict[str, Any] | None:
@@ -160,6 +194,20 @@ class RequestRepositoryAdapter:
             ).scalars()
             return [model_to_dict(row) or {} for row in rows]
 
+    async def async_get_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        async with self._database.session() as session:
+            rows = (
+                await session.execute(
+                    select(Request)
+                    .where(Request.user_id == user_id, Request.server_version > since)
+                    .order_by(Request.server_version, Request.id)
+                    .limit(limit)
+                )
+            ).scalars()
+            return [model_to_dict(row) or {} for row in rows]
+
     async def async_get_request_id_by_url_with_summary(self, user_id: int, url: str) -> int | None:
         async with self._database.session() as session:
             return await session.scalar(
@@ -251,6 +299,11 @@ class RequestRepositoryAdapter:
     ) -> None:
         await self._update_request(request_id, bot_reply_message_id=bot_reply_message_id)
 
+    async def async_update_bot_reply_message_ids_batch(
+        self, updates: list[tuple[int, int]]
+    ) -> None:
+        await BatchOperations(self._database).async_update_bot_reply_message_ids_batch(updates)
+
     async def async_create_request(
         self,
         *,
@@ -354,6 +407,58 @@ class RequestRepositoryAdapter:
                 raise RuntimeError(msg)
             return int(existing_id), False
 
+    async def async_create_minimal_requests(
+        self, rows: list[dict[str, Any]]
+    ) -> dict[str, tuple[int, bool]]:
+        """Create many minimal request rows with one multi-row INSERT.
+
+        Each row takes the keyword arguments of :meth:`async_create_minimal_request`
+        and must carry a ``dedupe_hash``. Rows whose hash already exists (or repeats
+        within ``rows``) resolve to the existing id. Returns ``(id, is_new)`` keyed
+        by dedupe_hash.
+        """
+        payloads: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            dedupe_hash = row.get("dedupe_hash")
+            if not dedupe_hash:
+                msg = "dedupe_hash is required for bulk request creation"
+                raise ValueError(msg)
+            payloads.setdefault(
+                dedupe_hash,
+                {
+                    "type": row.get("type_", "url"),
+                    "status": _status_value(row.get("status", RequestStatus.PENDING)),
+                    "correlation_id": row.get("correlation_id"),
+                    "chat_id": row.get("chat_id"),
+                    "user_id": row.get("user_id"),
+                    "input_url": row.get("input_url"),
+                    "normalized_url": row.get("normalized_url"),
+                    "dedupe_hash": dedupe_hash,
+                },
+            )
+        if not payloads:
+            return {}
+        async with self._database.transaction() as session:
+            stmt = (
+                insert(Request)
+                .values(list(payloads.values()))
+                .on_conflict_do_nothing(index_elements=[Request.dedupe_hash])
+                .returning(Request.id, Request.dedupe_hash)
+            )
+            result = {row.dedupe_hash: (int(row.id), True) for row in await session.execute(stmt)}
+            conflicting = [dedupe_hash for dedupe_hash in payloads if dedupe_hash not in result]
+            if conflicting:
+                existing = await session.execute(
+                    select(Request.id, Request.dedupe_hash).where(
+                        Request.dedupe_hash.in_(conflicting)
+                    )
+                )
+                result.update({row.dedupe_hash: (int(row.id), False) for row in existing})
+            if len(result) != len(payloads):
+                msg = "request conflict did not return an existing id"
+                raise RuntimeError(msg)
+            return result
+
     async def async_update_request_status(self, request_id: int, status: str) -> None:
         await self._update_request(request_id, status=status)
 
@@ -264,30 +264,41 @@ class RSSFeedRepositoryAdapter:
         items: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """Insert feed items in bulk, ignoring duplicates by feed and GUID."""
-        if not items:
-            return []
+        created = await self.async_create_feed_items_batch({feed_id: items})
+        return created.get(feed_id, [])
 
+    async def async_create_feed_items_batch(
+        self,
+        items_by_feed: dict[int, list[dict[str, Any]]],
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Insert items for many feeds in one statement, ignoring duplicates.
+
+        Returns the newly inserted items per feed, in input order; feeds with
+        nothing new map to an empty list.
+        """
         values: list[dict[str, Any]] = []
-        seen_guids: set[str] = set()
-        for item in items:
-            guid = str(item["guid"])
-            if guid in seen_guids:
-                continue
-            seen_guids.add(guid)
-            values.append(
-                {
-                    "feed_id": feed_id,
-                    "guid": guid,
-                    "title": item.get("title"),
-                    "url": item.get("url"),
-                    "content": item.get("content"),
-                    "author": item.get("author"),
-                    "published_at": item.get("published_at"),
-                }
-            )
+        for feed_id, items in items_by_feed.items():
+            seen_guids: set[str] = set()
+            for item in items:
+                guid = str(item["guid"])
+                if guid in seen_guids:
+                    continue
+                seen_guids.add(guid)
+                values.append(
+                    {
+                        "feed_id": feed_id,
+                        "guid": guid,
+                        "title": item.get("title"),
+                        "url": item.get("url"),
+                        "content": item.get("content"),
+                        "author": item.get("author"),
+                        "published_at": item.get("published_at"),
+                    }
+                )
 
+        created: dict[int, list[dict[str, Any]]] = {feed_id: [] for feed_id in items_by_feed}
         if not values:
-            return []
+            return created
 
         async with self._database.transaction() as session:
             stmt = (
@@ -303,12 +314,14 @@ class RSSFeedRepositoryAdapter:
             )
             inserted = list((await session.execute(stmt)).scalars())
 
-        inserted_by_guid = {item.guid: self._feed_item_dict(item) for item in inserted}
-        return [
-            inserted_by_guid[record["guid"]]
-            for record in values
-            if record["guid"] in inserted_by_guid
-        ]
+        inserted_by_key = {
+            (item.feed_id, item.guid): self._feed_item_dict(item) for item in inserted
+        }
+        for record in values:
+            key = (record["feed_id"], record["guid"])
+            if key in inserted_by_key:
+                created[record["feed_id"]].append(inserted_by_key[key])
+        return created
 
     async def async_list_feed_items(
         self,
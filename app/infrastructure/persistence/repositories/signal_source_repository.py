@@ -61,6 +61,53 @@ class SignalSourceRepositoryAdapter:
             )
             return model_to_dict(source) or {}
 
+    async def async_upsert_sources(self, sources: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Upsert many sources in one statement.
+
+        Each entry takes the keyword arguments of :meth:`async_upsert_source`.
+        Returns one row per entry in input order; repeated ``(kind,
+        external_id)`` pairs resolve to the same row, written with the last
+        entry's values.
+        """
+        if not sources:
+            return []
+
+        now = _utcnow()
+        values_by_key: dict[tuple[str, str | None], dict[str, Any]] = {}
+        for source in sources:
+            key = (source["kind"], source.get("external_id"))
+            values_by_key[key] = {
+                "kind": source["kind"],
+                "external_id": source.get("external_id"),
+                "url": source.get("url"),
+                "title": source.get("title"),
+                "description": source.get("description"),
+                "site_url": source.get("site_url"),
+                "metadata_json": source.get("metadata"),
+                "updated_at": now,
+            }
+
+        async with self._database.transaction() as session:
+            stmt = insert(Source).values(list(values_by_key.values()))
+            rows = (
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[Source.kind, Source.external_id],
+                        set_={
+                            "url": stmt.excluded.url,
+                            "title": stmt.excluded.title,
+                            "description": stmt.excluded.description,
+                            "site_url": stmt.excluded.site_url,
+                            "metadata_json": stmt.excluded.metadata_json,
+                            "updated_at": now,
+                        },
+                    ).returning(Source)
+                )
+            ).scalars()
+            rows_by_key = {(row.kind, row.external_id): model_to_dict(row) or {} for row in rows}
+
+        return [rows_by_key[(source["kind"], source.get("external_id"))] for source in sources]
+
     async def async_subscribe(
         self,
         *,
@@ -301,37 +348,44 @@ class SignalSourceRepositoryAdapter:
         source_id: int,
         items: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
-        if not items:
-            return []
+        upserted = await self.async_upsert_feed_items_batch({source_id: items})
+        return upserted.get(source_id, [])
 
+    async def async_upsert_feed_items_batch(
+        self,
+        items_by_source: dict[int, list[dict[str, Any]]],
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Upsert feed items for many sources in one statement, grouped by source."""
         values: list[dict[str, Any]] = []
-        seen_external_ids: set[str] = set()
-        for item in items:
-            external_id = str(item["external_id"])
-            if external_id in seen_external_ids:
-                continue
-            seen_external_ids.add(external_id)
-            engagement = item.get("engagement") or {}
-            values.append(
-                {
-                    "source_id": source_id,
-                    "external_id": external_id,
-                    "canonical_url": item.get("canonical_url"),
-                    "title": item.get("title"),
-                    "content_text": item.get("content_text"),
-                    "author": item.get("author"),
-                    "published_at": item.get("published_at"),
-                    "views": engagement.get("views"),
-                    "forwards": engagement.get("forwards"),
-                    "comments": engagement.get("comments"),
-                    "engagement_score": engagement.get("score"),
-                    "metadata_json": item.get("metadata"),
-                    "updated_at": _utcnow(),
-                }
-            )
+        for source_id, items in items_by_source.items():
+            seen_external_ids: set[str] = set()
+            for item in items:
+                external_id = str(item["external_id"])
+                if external_id in seen_external_ids:
+                    continue
+                seen_external_ids.add(external_id)
+                engagement = item.get("engagement") or {}
+                values.append(
+                    {
+                        "source_id": source_id,
+                        "external_id": external_id,
+                        "canonical_url": item.get("canonical_url"),
+                        "title": item.get("title"),
+                        "content_text": item.get("content_text"),
+                        "author": item.get("author"),
+                        "published_at": item.get("published_at"),
+                        "views": engagement.get("views"),
+                        "forwards": engagement.get("forwards"),
+                        "comments": engagement.get("comments"),
+                        "engagement_score": engagement.get("score"),
+                        "metadata_json": item.get("metadata"),
+                        "updated_at": _utcnow(),
+                    }
+                )
 
+        upserted: dict[int, list[dict[str, Any]]] = {source_id: [] for source_id in items_by_source}
         if not values:
-            return []
+            return upserted
 
         async with self._database.transaction() as session:
             now = _utcnow()
@@ -359,12 +413,12 @@ class SignalSourceRepositoryAdapter:
                 ).scalars()
             )
 
-        rows_by_external_id = {row.external_id: self._feed_item_dict(row) for row in rows}
-        return [
-            rows_by_external_id[record["external_id"]]
-            for record in values
-            if record["external_id"] in rows_by_external_id
-        ]
+        rows_by_key = {(row.source_id, row.external_id): self._feed_item_dict(row) for row in rows}
+        for record in values:
+            key = (record["source_id"], record["external_id"])
+            if key in rows_by_key:
+                upserted[record["source_id"]].append(rows_by_key[key])
+        return upserted
 
     async def async_upsert_topic(
         self,
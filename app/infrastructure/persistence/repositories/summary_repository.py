@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, or_, select, text, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import func, literal, or_, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
 
 from app.application.services.topic_search_utils import ensure_mapping, tokenize
 from app.core.logging_utils import get_logger
@@ -25,6 +27,108 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Columns whose changes move the list-view counters.
+_COUNTED_COLUMNS = frozenset({"is_read", "is_favorited", "is_deleted", "lang"})
+
+# JSON paths of ``Summary.json_payload`` that the list-view card reads.
+_CARD_PAYLOAD_KEYS = (
+    "tldr",
+    "summary_250",
+    "estimated_reading_time_min",
+    "topic_tags",
+    "confidence",
+    "hallucination_risk",
+)
+_CARD_METADATA_KEYS = ("title", "domain", "image", "og:image", "ogImage")
+
+
+class _SummaryCountCache:
+    """Short-TTL cache of per-user list counters (filtered total and unread count).
+
+    The cache is per process. Writes made through :class:`SummaryRepositoryAdapter`
+    invalidate the owner's entries (or every entry when the owner is not
+    known); writes from other processes only age out with the TTL, so callers
+    that need exact counters pass ``cached=False``.
+    """
+
+    def __init__(self, *, ttl_sec: float = 30.0, max_entries: int = 4096) -> None:
+        self._ttl_sec = ttl_sec
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, tuple[int, int]]] = OrderedDict()
+
+    def get(self, key: tuple[Any, ...], now: float) -> tuple[int, int] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if now - entry[0] >= self._ttl_sec:
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def put(self, key: tuple[Any, ...], value: tuple[int, int], now: float) -> None:
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        if user_id is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+
+
+_summary_counts = _SummaryCountCache()
+
+
+def clear_summary_count_cache() -> None:
+    """Drop every cached list counter (tests, admin tooling)."""
+    _summary_counts.invalidate()
+
+
+def _summary_list_filters(
+    *,
+    is_read: bool | None = None,
+    is_favorited: bool | None = None,
+    lang: str | None = None,
+    start_date: Any | None = None,
+    end_date: Any | None = None,
+    search: str | None = None,
+) -> list[Any]:
+    """Optional list-view filters, on top of the owner and not-deleted conditions."""
+    conditions: list[Any] = []
+    if is_read is not None:
+        conditions.append(Summary.is_read.is_(is_read))
+    if is_favorited is not None:
+        conditions.append(Summary.is_favorited.is_(is_favorited))
+    if lang:
+        conditions.append(Summary.lang == lang)
+    if start_date:
+        conditions.append(Summary.created_at >= start_date)
+    if end_date:
+        conditions.append(Summary.created_at <= end_date)
+    if search:
+        # Case-insensitive substring match on the article URL.
+        # The Summary's title lives in Summary.json_payload (JSONB)
+        # and needs a JSON-extract expression — defer that to a
+        # follow-up. URL match covers the URL-paste search path.
+        conditions.append(Request.input_url.ilike(f"%{search}%"))
+    return conditions
+
+
+def _card_payload_expression() -> Any:
+    """``json_payload`` reduced to the keys the list card reads, built in SQL."""
+    payload = Summary.json_payload
+    metadata_args: list[Any] = []
+    for key in _CARD_METADATA_KEYS:
+        metadata_args.extend((key, payload["metadata"][key]))
+    payload_args: list[Any] = ["metadata", func.jsonb_build_object(*metadata_args)]
+    for key in _CARD_PAYLOAD_KEYS:
+        payload_args.extend((key, payload[key]))
+    # Absent keys come back as JSON null; strip them so ``.get(key, default)`` applies.
+    return func.jsonb_strip_nulls(func.jsonb_build_object(*payload_args), type_=JSONB)
+
 
 class SummaryRepositoryAdapter:
     """Adapter for summary persistence using SQLAlchemy."""
@@ -41,13 +145,15 @@ class SummaryRepositoryAdapter:
         is_read: bool = False,
     ) -> int:
         """Create or update a summary and return its version."""
-        return await self._upsert_summary_record(
+        version = await self._upsert_summary_record(
             request_id=request_id,
             lang=lang,
             json_payload=json_payload,
             insights_json=insights_json,
             is_read=is_read,
         )
+        _summary_counts.invalidate()
+        return version
 
     async def async_finalize_request_summary(
         self,
@@ -73,7 +179,8 @@ class SummaryRepositoryAdapter:
                 .where(Request.id == request_id)
                 .values(status=_status_value(request_status), updated_at=_utcnow())
             )
-            return version
+        _summary_counts.invalidate()
+        return version
 
     async def async_update_summary_insights(
         self, request_id: int, insights_json: dict[str, Any]
@@ -100,55 +207,27 @@ class SummaryRepositoryAdapter:
         search: str | None = None,
     ) -> tuple[list[dict[str, Any]], int, int]:
         """Get paginated summaries for a user with filtering and stats."""
+        filters: dict[str, Any] = {
+            "is_read": is_read,
+            "is_favorited": is_favorited,
+            "lang": lang,
+            "start_date": start_date,
+            "end_date": end_date,
+            "search": search,
+        }
+        total, unread_count = await self.async_get_user_summary_counts(user_id, **filters)
         async with self._database.session() as session:
-            conditions = [Request.user_id == user_id, Summary.is_deleted.is_(False)]
-            if is_read is not None:
-                conditions.append(Summary.is_read.is_(is_read))
-            if is_favorited is not None:
-                conditions.append(Summary.is_favorited.is_(is_favorited))
-            if lang:
-                conditions.append(Summary.lang == lang)
-            if start_date:
-                conditions.append(Summary.created_at >= start_date)
-            if end_date:
-                conditions.append(Summary.created_at <= end_date)
-            if search:
-                # Case-insensitive substring match on the article URL.
-                # The Summary's title lives in Summary.json_payload (JSONB)
-                # and needs a JSON-extract expression — defer that to a
-                # follow-up. URL match covers the URL-paste search path.
-                conditions.append(Request.input_url.ilike(f"%{search}%"))
-
-            total = int(
-                await session.scalar(
-                    select(func.count())
-                    .select_from(Summary)
-                    .join(Request, Summary.request_id == Request.id)
-                    .where(*conditions)
-                )
-                or 0
-            )
-            unread_count = int(
-                await session.scalar(
-                    select(func.count())
-                    .select_from(Summary)
-                    .join(Request, Summary.request_id == Request.id)
-                    .where(
-                        Request.user_id == user_id,
-                        Summary.is_read.is_(False),
-                        Summary.is_deleted.is_(False),
-                    )
-                )
-                or 0
-            )
-
             order_by = Request.created_at.desc()
             if sort != "created_at_desc":
                 order_by = Request.created_at.asc()
             rows = await session.execute(
                 select(Summary, Request)
                 .join(Request, Summary.request_id == Request.id)
-                .where(*conditions)
+                .where(
+                    Request.user_id == user_id,
+                    Summary.is_deleted.is_(False),
+                    *_summary_list_filters(**filters),
+                )
                 .order_by(order_by)
                 .limit(limit)
                 .offset(offset)
@@ -160,6 +239,135 @@ class SummaryRepositoryAdapter:
                 summaries.append(data)
             return summaries, total, unread_count
 
+    async def async_get_user_summary_cards(
+        self,
+        user_id: int,
+        *,
+        limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        offset: int = 0,
+        is_read: bool | None = None,
+        is_favorited: bool | None = None,
+        lang: str | None = None,
+        start_date: Any | None = None,
+        end_date: Any | None = None,
+        sort: str = "created_at_desc",
+        search: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get one page of list-view cards for a user.
+
+        Only the columns and ``json_payload`` paths the card needs are selected.
+        Rows are ordered by ``(Request.created_at, Request.id)``; pass the last
+        row's ``request["created_at"]``/``request["id"]`` as *after* to get the
+        next page at index-seek cost. *offset* is honoured only without *after*.
+        """
+        descending = sort == "created_at_desc"
+        conditions = [Request.user_id == user_id, Summary.is_deleted.is_(False)]
+        conditions += _summary_list_filters(
+            is_read=is_read,
+            is_favorited=is_favorited,
+            lang=lang,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+        )
+        if after is not None:
+            position = tuple_(Request.created_at, Request.id)
+            boundary = tuple_(
+                literal(after[0], Request.created_at.type), literal(after[1], Request.id.type)
+            )
+            conditions.append(position < boundary if descending else position > boundary)
+        order_by = (
+            (Request.created_at.desc(), Request.id.desc())
+            if descending
+            else (Request.created_at.asc(), Request.id.asc())
+        )
+        stmt = (
+            select(
+                Summary.id,
+                Summary.request_id,
+                Summary.lang,
+                Summary.is_read,
+                Summary.is_favorited,
+                Summary.created_at,
+                _card_payload_expression().label("json_payload"),
+                Request.input_url,
+                Request.normalized_url,
+                Request.created_at.label("request_created_at"),
+            )
+            .join(Request, Summary.request_id == Request.id)
+            .where(*conditions)
+            .order_by(*order_by)
+            .limit(limit)
+        )
+        if after is None and offset:
+            stmt = stmt.offset(offset)
+        async with self._database.session() as session:
+            rows = await session.execute(stmt)
+            return [
+                {
+                    "id": row.id,
+                    "request_id": row.request_id,
+                    "lang": row.lang,
+                    "is_read": row.is_read,
+                    "is_favorited": row.is_favorited,
+                    "created_at": row.created_at,
+                    "json_payload": row.json_payload,
+                    "request": {
+                        "id": row.request_id,
+                        "input_url": row.input_url,
+                        "normalized_url": row.normalized_url,
+                        "created_at": row.request_created_at,
+                    },
+                }
+                for row in rows
+            ]
+
+    async def async_get_user_summary_counts(
+        self,
+        user_id: int,
+        *,
+        is_read: bool | None = None,
+        is_favorited: bool | None = None,
+        lang: str | None = None,
+        start_date: Any | None = None,
+        end_date: Any | None = None,
+        search: str | None = None,
+        cached: bool = True,
+    ) -> tuple[int, int]:
+        """Return ``(filtered_total, unread_count)`` for the list view.
+
+        Both counters come from one scan of the user's summaries and are cached
+        in this process for a short TTL; writes through this adapter invalidate
+        them. ``cached=False`` skips the cached value and refreshes it.
+        """
+        key = (user_id, is_read, is_favorited, lang, str(start_date), str(end_date), search)
+        now = time.monotonic()
+        hit = _summary_counts.get(key, now) if cached else None
+        if hit is not None:
+            return hit
+        filters = _summary_list_filters(
+            is_read=is_read,
+            is_favorited=is_favorited,
+            lang=lang,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+        )
+        total_expr = func.count().filter(*filters) if filters else func.count()
+        async with self._database.session() as session:
+            row = (
+                await session.execute(
+                    select(total_expr, func.count().filter(Summary.is_read.is_(False)))
+                    .select_from(Summary)
+                    .join(Request, Summary.request_id == Request.id)
+                    .where(Request.user_id == user_id, Summary.is_deleted.is_(False))
+                )
+            ).one()
+        counts = (int(row[0] or 0), int(row[1] or 0))
+        _summary_counts.put(key, counts, now)
+        return counts
+
     async def async_get_summary_by_request(self, request_id: int) -> dict[str, Any] | None:
         """Get a summary by request ID."""
         async with self._database.session() as session:
@@ -331,7 +539,8 @@ class SummaryRepositoryAdapter:
                 .where(Summary.id.in_(owned_ids))
                 .values(is_read=True, updated_at=_utcnow())
             )
-            return len(owned_ids)
+        _summary_counts.invalidate(user_id)
+        return len(owned_ids)
 
     async def async_bulk_set_summaries_favorite(
         self, *, user_id: int, summary_ids: list[int], value: bool
@@ -357,7 +566,8 @@ class SummaryRepositoryAdapter:
                 .where(Summary.id.in_(owned_ids))
                 .values(is_favorited=value, updated_at=_utcnow())
             )
-            return len(owned_ids)
+        _summary_counts.invalidate(user_id)
+        return len(owned_ids)
 
     async def async_bulk_soft_delete_summaries(
         self, *, user_id: int, summary_ids: list[int]
@@ -384,7 +594,8 @@ class SummaryRepositoryAdapter:
                 .where(Summary.id.in_(owned_ids))
                 .values(is_deleted=True, deleted_at=now, updated_at=now)
             )
-            return len(owned_ids)
+        _summary_counts.invalidate(user_id)
+        return len(owned_ids)
 
     async def async_mark_summary_as_read(self, summary_id: int) -> None:
         """Mark a summary as read."""
@@ -402,6 +613,7 @@ class SummaryRepositoryAdapter:
                 .where(Summary.request_id == request_id)
                 .values(is_read=True, updated_at=_utcnow())
             )
+        _summary_counts.invalidate()
 
     async def async_get_read_status(self, request_id: int) -> bool:
         """Return whether the summary for a given request is marked as read."""
@@ -437,7 +649,9 @@ class SummaryRepositoryAdapter:
             summary.is_favorited = not summary.is_favorited
             summary.updated_at = _utcnow()
             await session.flush()
-            return summary.is_favorited
+            is_favorited = summary.is_favorited
+        _summary_counts.invalidate()
+        return is_favorited
 
     async def async_set_favorite(self, summary_id: int, value: bool) -> None:
         """Persist an explicit favorite status for a summary."""
@@ -572,6 +786,22 @@ class SummaryRepositoryAdapter:
             ).scalars()
             return [model_to_dict(row) or {} for row in rows]
 
+    async def async_get_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """Get up to *limit* summaries with ``server_version > since``, oldest version first."""
+        async with self._database.session() as session:
+            rows = (
+                await session.execute(
+                    select(Summary)
+                    .join(Request, Summary.request_id == Request.id)
+                    .where(Request.user_id == user_id, Summary.server_version > since)
+                    .order_by(Summary.server_version, Summary.id)
+                    .limit(limit)
+                )
+            ).scalars()
+            return [model_to_dict(row) or {} for row in rows]
+
     async def async_get_summary_for_sync_apply(
         self, summary_id: int, user_id: int
     ) -> dict[str, Any] | None:
@@ -626,7 +856,9 @@ class SummaryRepositoryAdapter:
             value = await session.scalar(
                 select(Summary.server_version).where(Summary.id == summary_id)
             )
-            return int(value or 0)
+        if has_mutation:
+            _summary_counts.invalidate()
+        return int(value or 0)
 
     def to_domain_model(self, db_summary: dict[str, Any]) -> DomainSummary:
         """Convert a database record to the summary domain model."""
@@ -697,6 +929,8 @@ class SummaryRepositoryAdapter:
         values["updated_at"] = _utcnow()
         async with self._database.transaction() as session:
             await session.execute(update(Summary).where(Summary.id == summary_id).values(**values))
+        if _COUNTED_COLUMNS & values.keys():
+            _summary_counts.invalidate()
 
     async def _find_topic_search_request_ids(
         self, topic: str, *, candidate_limit: int
@@ -9,6 +9,8 @@ from sqlalchemy import select, update
 from app.db.models import VideoDownload, model_to_dict
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from app.db.session import Database
 
 
@@ -42,6 +44,20 @@ class VideoDownloadRepositoryAdapter:
             download = await session.get(VideoDownload, download_id)
             return model_to_dict(download)
 
+    async def async_list_video_downloads_by_archive_status(
+        self, archive_statuses: Sequence[str]
+    ) -> list[dict[str, Any]]:
+        """List video downloads whose archival download is in one of the given states."""
+        if not archive_statuses:
+            return []
+        async with self._database.session() as session:
+            downloads = await session.scalars(
+                select(VideoDownload)
+                .where(VideoDownload.archive_status.in_(list(archive_statuses)))
+                .order_by(VideoDownload.id)
+            )
+            return [model_to_dict(download) for download in downloads if download is not None]
+
     async def async_update_video_download_status(
         self,
         download_id: int,
@@ -0,0 +1,201 @@
+"""Push smart-collection conditions down into SQL.
+
+``summary_condition_prefilter`` turns a condition list into a WHERE clause
+over ``summaries`` joined to ``requests``. The clause keeps every row the
+Python matcher could accept for the context ``build_summary_context`` builds
+from those two rows (without explicit tag names, so tags are the payload's
+``topic_tags``). It may keep extra rows, so callers still run the compiled
+matcher over the candidates, and the final result is exactly what the Python
+evaluator returns.
+
+A condition that cannot be expressed with the same semantics (regexes, whose
+Python and POSIX dialects differ, or operands of an unexpected type) is left
+to Python: it is skipped in ``all`` mode and disables the prefilter in
+``any`` mode.
+"""
+
+from __future__ import annotations
+
+import string
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Numeric, Text, and_, case, false, func, literal, not_, or_, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+from app.db.models import Request, Summary
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.sql.elements import ColumnElement
+
+# Reading times are compared through ``numeric``; the comparison only mirrors
+# Python's float comparison while the operand is exactly representable.
+_MAX_EXACT_INT = 2**53
+
+_payload = Summary.json_payload
+
+
+def _text_field(key: str) -> ColumnElement[Any]:
+    return func.coalesce(_payload[key].astext, "")
+
+
+def _url() -> ColumnElement[Any]:
+    # normalized_url or input_url or "" (build_summary_context)
+    return func.coalesce(func.nullif(Request.normalized_url, ""), Request.input_url, "")
+
+
+def _content() -> ColumnElement[Any]:
+    # summary_1000 or summary_250: a non-string or empty summary_1000 is falsy
+    # or makes Python raise, either way summary_250 decides a match.
+    summary_1000 = _payload["summary_1000"]
+    return case(
+        (
+            and_(
+                func.jsonb_typeof(summary_1000) == "string",
+                summary_1000.astext != "",
+            ),
+            summary_1000.astext,
+        ),
+        else_=func.coalesce(_payload["summary_250"].astext, ""),
+    )
+
+
+def _reading_time() -> ColumnElement[Any]:
+    raw = _payload["estimated_reading_time_min"]
+    kind = func.jsonb_typeof(raw)
+    return case(
+        (raw.is_(None), literal(0, Numeric)),
+        (kind == "number", raw.astext.cast(Numeric)),
+        (kind == "boolean", case((raw.astext == "true", 1), else_=0)),
+        else_=None,
+    )
+
+
+def _topic_tags() -> ColumnElement[Any]:
+    return type_coerce(func.coalesce(_payload["topic_tags"], literal([], JSONB)), JSONB)
+
+
+def _bindable(value: Any) -> bool:
+    return isinstance(value, str) and "\x00" not in value
+
+
+def _str_options(value: Any) -> list[str] | None:
+    if isinstance(value, list):
+        options = value
+    elif isinstance(value, str):
+        options = [v.strip() for v in value.split(",")]
+    else:
+        return None
+    return options if all(_bindable(option) for option in options) else None
+
+
+def _casefold_contains(column: ColumnElement[Any], value: str) -> ColumnElement[bool]:
+    """``value.lower() in column.lower()`` without relying on the DB collation.
+
+    ASCII-only text is folded with ``translate`` exactly as ``str.lower`` folds
+    it. Text with any multi-byte character is kept for Python to decide.
+    """
+    needle = value.lower()
+    if not _bindable(needle):
+        return func.octet_length(column) != func.length(column)
+    folded = func.translate(column, string.ascii_uppercase, string.ascii_lowercase)
+    return or_(
+        func.strpos(folded, needle) > 0,
+        func.octet_length(column) != func.length(column),
+    )
+
+
+def _condition_clause(condition: Any) -> ColumnElement[bool] | None:
+    """Return a superset clause for one condition, or None if not expressible."""
+    if not isinstance(condition, dict):
+        return None
+    cond_type = condition.get("type", "")
+    if not isinstance(cond_type, str):
+        return None
+    operator = condition.get("operator", "")
+    value = condition.get("value", [] if cond_type == "has_tag" else "")
+
+    if cond_type == "domain_matches":
+        if operator not in {"equals", "contains", "regex"}:
+            return false()
+        if operator == "regex" or not _bindable(value):
+            return None
+        if operator == "equals":
+            return _url() == value
+        return func.strpos(_url(), value) > 0
+
+    if cond_type in {"title_contains", "content_contains"}:
+        if operator not in {"contains", "regex"}:
+            return false()
+        if operator == "regex" or not isinstance(value, str):
+            return None
+        column = _text_field("title") if cond_type == "title_contains" else _content()
+        return _casefold_contains(column, value)
+
+    if cond_type == "has_tag":
+        if operator not in {"any", "all", "none"}:
+            return false()
+        wanted = value if isinstance(value, list) else [value]
+        if not all(_bindable(tag) for tag in wanted):
+            return None
+        tags = _topic_tags()
+        wanted_array = literal(wanted, ARRAY(Text))
+        not_array = func.jsonb_typeof(tags) != "array"
+        if operator == "any":
+            return or_(not_array, tags.has_any(wanted_array))
+        if operator == "all":
+            return or_(not_array, tags.has_all(wanted_array))
+        return or_(not_array, not_(tags.has_any(wanted_array)))
+
+    if cond_type in {"language_is", "source_type"}:
+        if operator not in {"equals", "in"}:
+            return false()
+        column = Summary.lang if cond_type == "language_is" else _text_field("source_type")
+        if operator == "equals":
+            return column == value if _bindable(value) else None
+        options = _str_options(value)
+        if options is None:
+            return None
+        return column.in_(options) if options else false()
+
+    if cond_type == "reading_time":
+        try:
+            threshold = int(condition.get("value", 0))
+        except (TypeError, ValueError):
+            return false()
+        except Exception:
+            return None
+        if operator not in {"gt", "lt", "eq"}:
+            return false()
+        if abs(threshold) > _MAX_EXACT_INT:
+            return None
+        reading_time = _reading_time()
+        if operator == "gt":
+            return reading_time > threshold
+        if operator == "lt":
+            return reading_time < threshold
+        # Equality is widened to the open unit interval; Python decides.
+        return and_(reading_time > threshold - 1, reading_time < threshold + 1)
+
+    # Unknown condition types never match.
+    return false()
+
+
+def summary_condition_prefilter(
+    conditions: Sequence[Any], match_mode: str = "all"
+) -> ColumnElement[bool] | None:
+    """Return a candidate WHERE clause for *conditions*, or None to scan everything."""
+    clauses = [_condition_clause(condition) for condition in conditions]
+    if match_mode == "any":
+        if not clauses or any(clause is None for clause in clauses):
+            return None
+        combined = or_(*[c for c in clauses if c is not None])
+    else:
+        pushed = [clause for clause in clauses if clause is not None]
+        if not pushed:
+            return None
+        combined = and_(*pushed)
+    # A payload stored as a JSON string is parsed by build_summary_context in
+    # Python; none of the JSON paths above can see into it.
+    return or_(func.jsonb_typeof(_payload) == "string", combined)
@@ -41,3 +41,50 @@ class SyncAuxReadAdapter:
                 )
             ).scalars()
             return [model_to_dict(row) or {} for row in rows]
+
+    async def get_highlights_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        async with self._database.session() as session:
+            rows = (
+                await session.execute(
+                    select(SummaryHighlight)
+                    .where(
+                        SummaryHighlight.user_id == user_id,
+                        SummaryHighlight.server_version > since,
+                    )
+                    .order_by(SummaryHighlight.server_version, SummaryHighlight.id)
+                    .limit(limit)
+                )
+            ).scalars()
+            return [model_to_dict(row) or {} for row in rows]
+
+    async def get_tags_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        async with self._database.session() as session:
+            rows = (
+                await session.execute(
+                    select(Tag)
+                    .where(Tag.user_id == user_id, Tag.server_version > since)
+                    .order_by(Tag.server_version, Tag.id)
+                    .limit(limit)
+                )
+            ).scalars()
+            return [model_to_dict(row) or {} for row in rows]
+
+    async def get_summary_tags_for_user_since(
+        self, user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        async with self._database.session() as session:
+            rows = (
+                await session.execute(
+                    select(SummaryTag)
+                    .join(Summary, SummaryTag.summary_id == Summary.id)
+                    .join(Request, Summary.request_id == Request.id)
+                    .where(Request.user_id == user_id, SummaryTag.server_version > since)
+                    .order_by(SummaryTag.server_version, SummaryTag.id)
+                    .limit(limit)
+                )
+            ).scalars()
+            return [model_to_dict(row) or {} for row in rows]
@@ -0,0 +1,229 @@
+"""Warm in-memory embedding matrix for local vector search.
+
+``VectorSearchService`` used to deserialize every candidate blob into a Python
+list and rebuild a NumPy matrix from those lists on every query. This module
+keeps the embeddings resident instead: one contiguous float32 matrix whose rows
+are L2-normalized at insert time, a ``request_id -> row`` index, and per-row
+display metadata. A query is then a single matrix-vector product over the
+selected rows followed by an ``argpartition`` top-k; result objects are only
+built for rows that are actually returned.
+
+Rows are inserted from blobs with :func:`unpack_embedding_array` (a zero-copy
+view) and copied exactly once, into their matrix slot. Removal swaps the last
+row into the freed slot so the live rows stay dense.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from app.infrastructure.embedding.embedding_protocol import unpack_embedding_array
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+_INITIAL_CAPACITY = 256
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingMatrixRow:
+    """Display metadata stored next to one matrix row."""
+
+    request_id: int
+    summary_id: int
+    url: str | None
+    title: str | None
+    snippet: str | None
+    source: str | None
+    published_at: str | None
+
+
+class EmbeddingMatrix:
+    """Dense, incrementally maintained matrix of normalized float32 embeddings."""
+
+    def __init__(self, *, max_rows: int = 20_000) -> None:
+        import numpy as np
+
+        if max_rows <= 0:
+            msg = "max_rows must be positive"
+            raise ValueError(msg)
+        self._np = np
+        self._max_rows = max_rows
+        self._dimensions: int | None = None
+        self._vectors: Any = np.empty((0, 0), dtype=np.float32)
+        self._recency: Any = np.empty(0, dtype=np.float64)
+        self._rows: list[EmbeddingMatrixRow] = []
+        self._slots: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, request_id: object) -> bool:
+        return request_id in self._slots
+
+    @property
+    def dimensions(self) -> int | None:
+        return self._dimensions
+
+    @property
+    def max_rows(self) -> int:
+        return self._max_rows
+
+    def clear(self) -> None:
+        """Drop every row; the next insert fixes the dimensionality again."""
+        self._dimensions = None
+        self._vectors = self._np.empty((0, 0), dtype=self._np.float32)
+        self._recency = self._np.empty(0, dtype=self._np.float64)
+        self._rows.clear()
+        self._slots.clear()
+
+    def upsert(
+        self,
+        row: EmbeddingMatrixRow,
+        embedding_blob: bytes,
+        *,
+        recency: float = 0.0,
+    ) -> None:
+        """Insert or replace the row for ``row.request_id``.
+
+        Raises:
+            ValueError: If the blob is malformed or its dimensionality differs
+                from the rows already stored.
+        """
+        np = self._np
+        vector = unpack_embedding_array(embedding_blob)
+        if vector.shape[0] == 0:
+            msg = f"Embedding for request {row.request_id} is empty"
+            raise ValueError(msg)
+        if self._dimensions is None:
+            self._dimensions = int(vector.shape[0])
+            self._vectors = np.empty((_INITIAL_CAPACITY, self._dimensions), dtype=np.float32)
+            self._recency = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        if vector.shape[0] != self._dimensions:
+            msg = (
+                f"Embedding for request {row.request_id} has {vector.shape[0]} dimensions, "
+                f"expected {self._dimensions}"
+            )
+            raise ValueError(msg)
+
+        slot = self._slots.get(row.request_id)
+        if slot is None:
+            slot = len(self._rows)
+            self._ensure_capacity(slot + 1)
+            self._rows.append(row)
+            self._slots[row.request_id] = slot
+        else:
+            self._rows[slot] = row
+
+        target = self._vectors[slot]
+        target[:] = vector
+        norm = float(np.linalg.norm(target))
+        if norm > 0.0 and np.isfinite(norm):
+            target /= norm
+        else:
+            target.fill(0.0)
+        self._recency[slot] = recency
+
+        if len(self._rows) > self._max_rows:
+            self._evict_oldest(len(self._rows) - self._max_rows)
+
+    def remove(self, request_ids: Iterable[int]) -> int:
+        """Remove rows for ``request_ids``; returns how many were present."""
+        removed = 0
+        for request_id in request_ids:
+            slot = self._slots.pop(request_id, None)
+            if slot is None:
+                continue
+            last = len(self._rows) - 1
+            if slot != last:
+                moved = self._rows[last]
+                self._rows[slot] = moved
+                self._vectors[slot] = self._vectors[last]
+                self._recency[slot] = self._recency[last]
+                self._slots[moved.request_id] = slot
+            self._rows.pop()
+            removed += 1
+        return removed
+
+    def slots_for(self, request_ids: Sequence[int]) -> Any:
+        """Return matrix slots for the given request ids that are resident."""
+        slots = [self._slots[rid] for rid in dict.fromkeys(request_ids) if rid in self._slots]
+        return self._np.asarray(slots, dtype=self._np.intp)
+
+    def missing(self, request_ids: Sequence[int]) -> list[int]:
+        """Return the request ids (deduplicated, in order) that are not resident."""
+        return [rid for rid in dict.fromkeys(request_ids) if rid not in self._slots]
+
+    def recent_slots(self, limit: int) -> Any:
+        """Return slots of the ``limit`` rows with the highest recency."""
+        np = self._np
+        size = len(self._rows)
+        if limit >= size:
+            return np.arange(size, dtype=np.intp)
+        if limit <= 0:
+            return np.empty(0, dtype=np.intp)
+        recency = self._recency[:size]
+        return np.argpartition(-recency, limit - 1)[:limit].astype(np.intp)
+
+    def rank(
+        self,
+        query_embedding: Any,
+        *,
+        slots: Any | None = None,
+        min_similarity: float = 0.0,
+        limit: int | None = None,
+    ) -> list[tuple[EmbeddingMatrixRow, float]]:
+        """Rank rows by cosine similarity to ``query_embedding``, best first.
+
+        Only rows scoring at least ``min_similarity`` are returned. With
+        ``limit`` the best rows are selected with ``argpartition`` before
+        sorting, so the cost is linear in the number of scored rows.
+
+        Raises:
+            ValueError: If the query dimensionality does not match the matrix.
+        """
+        np = self._np
+        size = len(self._rows)
+        if size == 0 or (limit is not None and limit <= 0):
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.ndim != 1 or query.shape[0] != self._dimensions:
+            msg = "Embedding dimensions do not match"
+            raise ValueError(msg)
+        query_norm = float(np.linalg.norm(query))
+        if query_norm <= 0.0 or not np.isfinite(query_norm):
+            return []
+
+        if slots is None:
+            slots = np.arange(size, dtype=np.intp)
+        if slots.size == 0:
+            return []
+        scores = (self._vectors[slots] @ query) / np.float32(query_norm)
+        np.clip(scores, 0.0, 1.0, out=scores)
+
+        passing = np.flatnonzero(scores >= min_similarity)
+        if limit is not None and limit < passing.size:
+            top = np.argpartition(-scores[passing], limit - 1)[:limit]
+            passing = passing[top]
+        order = passing[np.argsort(-scores[passing], kind="stable")]
+        return [(self._rows[int(slots[i])], float(scores[i])) for i in order]
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        np = self._np
+        new_capacity = max(needed, capacity * 2)
+        vectors = np.empty((new_capacity, self._dimensions), dtype=np.float32)
+        vectors[:capacity] = self._vectors
+        recency = np.empty(new_capacity, dtype=np.float64)
+        recency[:capacity] = self._recency
+        self._vectors = vectors
+        self._recency = recency
+
+    def _evict_oldest(self, count: int) -> None:
+        np = self._np
+        recency = self._recency[: len(self._rows)]
+        oldest = np.argpartition(recency, count - 1)[:count]
+        self.remove([self._rows[int(slot)].request_id for slot in oldest])
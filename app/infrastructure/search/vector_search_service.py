@@ -5,18 +5,22 @@ from __future__ import annotations
 import asyncio
 import heapq
 import math
+import time
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.core.lang import detect_language
 from app.core.logging_utils import get_logger
+from app.infrastructure.search.embedding_matrix import EmbeddingMatrixRow
 
 if TYPE_CHECKING:
+    import datetime as dt
     from collections.abc import Iterable
 
     from app.application.ports.search import EmbeddingRepositoryPort, TopicSearchRepositoryPort
     from app.infrastructure.embedding.embedding_protocol import EmbeddingServiceProtocol
+    from app.infrastructure.search.embedding_matrix import EmbeddingMatrix
     from app.infrastructure.search.search_filters import SearchFilters
 
 logger = get_logger(__name__)
@@ -37,8 +41,49 @@ class VectorSearchResult(BaseModel):
     published_at: str | None = None
 
 
+def _display_fields(row: dict[str, Any]) -> dict[str, Any]:
+    payload = row["json_payload"] or {}
+    metadata = payload.get("metadata", {}) if isinstance(payload, dict) else {}
+
+    url = (
+        metadata.get("canonical_url")
+        or metadata.get("url")
+        or row.get("normalized_url")
+        or row.get("input_url")
+    )
+    title = metadata.get("title") or payload.get("title")
+    snippet = payload.get("summary_250") or payload.get("tldr") or payload.get("summary_1000")
+    if snippet and len(snippet) > 300:
+        snippet = snippet[:297] + "..."
+
+    source = metadata.get("domain") or metadata.get("source")
+    published_at = (
+        metadata.get("published_at") or metadata.get("published") or metadata.get("last_updated")
+    )
+    return {
+        "url": url,
+        "title": title or url,
+        "snippet": snippet,
+        "source": source,
+        "published_at": published_at,
+    }
+
+
+def _timestamp(value: Any) -> float:
+    timestamp = getattr(value, "timestamp", None)
+    return float(timestamp()) if callable(timestamp) else 0.0
+
+
 class VectorSearchService:
-    """Semantic search using vector embeddings."""
+    """Semantic search using vector embeddings.
+
+    When an :class:`EmbeddingMatrix` is supplied, candidate embeddings stay
+    resident between queries: the matrix is loaded with the same recent window
+    the fallback scan reads, FTS candidates that are not resident are fetched
+    once and added, and new or regenerated embeddings are pulled incrementally
+    every ``matrix_refresh_interval_sec``. A full reload every
+    ``matrix_reload_interval_sec`` drops rows whose summaries were deleted.
+    """
 
     def __init__(
         self,
@@ -50,6 +95,9 @@ class VectorSearchService:
         min_similarity: float = 0.3,
         candidate_multiplier: int = 40,
         fallback_scan_limit: int = 5000,
+        embedding_matrix: EmbeddingMatrix | None = None,
+        matrix_refresh_interval_sec: float = 30.0,
+        matrix_reload_interval_sec: float = 3600.0,
     ) -> None:
         if max_results <= 0:
             msg = "max_results must be positive"
@@ -63,6 +111,9 @@ class VectorSearchService:
         if fallback_scan_limit <= 0:
             msg = "fallback_scan_limit must be positive"
             raise ValueError(msg)
+        if embedding_matrix is not None and embedding_matrix.max_rows < fallback_scan_limit:
+            msg = "embedding_matrix.max_rows must be at least fallback_scan_limit"
+            raise ValueError(msg)
 
         self._repo = embedding_repository
         self._topic_repo = topic_search_repository
@@ -71,6 +122,17 @@ class VectorSearchService:
         self._min_similarity = min_similarity
         self._candidate_multiplier = candidate_multiplier
         self._fallback_scan_limit = fallback_scan_limit
+        self._matrix = embedding_matrix
+        self._matrix_refresh_interval = matrix_refresh_interval_sec
+        self._matrix_reload_interval = matrix_reload_interval_sec
+        # _matrix_lock guards reading and writing the resident rows; the database
+        # fetches that feed them run outside it, one at a time under _matrix_sync_lock.
+        self._matrix_lock = asyncio.Lock()
+        self._matrix_sync_lock = asyncio.Lock()
+        self._matrix_loaded_at: float | None = None
+        self._matrix_refreshed_at = 0.0
+        # (embedding_updated_at, embedding_id) of the newest row seen by a scan.
+        self._matrix_cursor: tuple[dt.datetime, int] | None = None
 
     async def search(
         self,
@@ -101,6 +163,34 @@ class VectorSearchService:
             candidate_limit=candidate_limit,
         )
 
+        if self._matrix is not None:
+            try:
+                matrix_results = await self._search_matrix(
+                    query_embedding, candidate_request_ids, filters
+                )
+            except ValueError:
+                # Query dimensions differ from the resident rows, typically after
+                # an embedding model change: reload on the next query.
+                logger.warning("vector_search_matrix_reset", exc_info=True)
+                self._reset_matrix()
+            else:
+                if matrix_results is None:
+                    logger.warning("no_embeddings_available", extra={"cid": correlation_id})
+                    return []
+                results, scanned = matrix_results
+                logger.info(
+                    "vector_search_completed",
+                    extra={
+                        "cid": correlation_id,
+                        "query_length": len(query),
+                        "total_candidates": scanned,
+                        "returned_results": len(results),
+                        "filters": str(filters) if filters else "none",
+                        "matrix_rows": len(self._matrix),
+                    },
+                )
+                return results
+
         if candidate_request_ids:
             candidates = await self._fetch_embeddings_by_request_ids(candidate_request_ids)
         else:
@@ -135,6 +225,141 @@ class VectorSearchService:
         )
         return top_results
 
+    async def _search_matrix(
+        self,
+        query_embedding: Any,
+        candidate_request_ids: list[int] | None,
+        filters: SearchFilters | None,
+    ) -> tuple[list[VectorSearchResult], int] | None:
+        matrix = self._matrix
+        if matrix is None:
+            return None
+        await self._sync_matrix()
+        missing_rows: list[dict[str, Any]] = []
+        if candidate_request_ids:
+            missing = matrix.missing(candidate_request_ids)
+            if missing:
+                missing_rows = await self._repo.async_get_embeddings_by_request_ids(missing)
+        async with self._matrix_lock:
+            if candidate_request_ids:
+                self._load_matrix_rows(missing_rows)
+                slots = matrix.slots_for(candidate_request_ids)
+            else:
+                slots = matrix.recent_slots(self._fallback_scan_limit)
+            if len(slots) == 0:
+                return None
+
+            has_filters = bool(filters and filters.has_filters())
+            # Scoring a few thousand normalized rows is a single BLAS call, so it
+            # runs inline; the lock keeps concurrent refreshes from resizing the
+            # matrix underneath it.
+            ranked = matrix.rank(
+                query_embedding,
+                slots=slots,
+                min_similarity=self._min_similarity,
+                limit=None if has_filters else self._max_results,
+            )
+
+        results: list[VectorSearchResult] = []
+        for row, score in ranked:
+            if has_filters and filters is not None and not filters.matches(row):
+                continue
+            results.append(
+                VectorSearchResult(
+                    request_id=row.request_id,
+                    summary_id=row.summary_id,
+                    similarity_score=score,
+                    url=row.url,
+                    title=row.title,
+                    snippet=row.snippet,
+                    source=row.source,
+                    published_at=row.published_at,
+                )
+            )
+            if len(results) >= self._max_results:
+                break
+        return results, len(slots)
+
+    async def _sync_matrix(self) -> None:
+        # Once the matrix holds rows, searches rank on them instead of queueing
+        # behind a refresh that another search already started.
+        if self._matrix_sync_lock.locked() and self._matrix_loaded_at is not None:
+            return
+        async with self._matrix_sync_lock:
+            await self._sync_matrix_locked()
+
+    async def _sync_matrix_locked(self) -> None:
+        now = time.monotonic()
+        if (
+            self._matrix_loaded_at is None
+            or now - self._matrix_loaded_at >= self._matrix_reload_interval
+        ):
+            rows = await self._repo.async_get_recent_embeddings(limit=self._fallback_scan_limit)
+            async with self._matrix_lock:
+                self._reset_matrix()
+                self._load_matrix_rows(rows)
+                self._advance_cursor(rows)
+            self._matrix_loaded_at = now
+            self._matrix_refreshed_at = now
+            return
+
+        get_updated = getattr(self._repo, "async_get_embeddings_updated_since", None)
+        if (
+            get_updated is None
+            or self._matrix_cursor is None
+            or now - self._matrix_refreshed_at < self._matrix_refresh_interval
+        ):
+            return
+        self._matrix_refreshed_at = now
+        while True:
+            since, after_id = self._matrix_cursor
+            rows = await get_updated(since, after_id=after_id, limit=self._fallback_scan_limit)
+            async with self._matrix_lock:
+                self._load_matrix_rows(rows)
+                self._advance_cursor(rows)
+            if len(rows) < self._fallback_scan_limit:
+                return
+
+    def _reset_matrix(self) -> None:
+        if self._matrix is not None:
+            self._matrix.clear()
+        self._matrix_loaded_at = None
+        self._matrix_cursor = None
+
+    def _advance_cursor(self, rows: list[dict[str, Any]]) -> None:
+        # Only the recent-window and catch-up scans move the cursor. Candidates
+        # fetched by id can be newer than rows the catch-up has not reached yet,
+        # and moving past them would skip those rows.
+        for row in rows:
+            updated_at = row.get("embedding_updated_at")
+            embedding_id = row.get("embedding_id")
+            if updated_at is None or embedding_id is None:
+                continue
+            position = (updated_at, embedding_id)
+            if self._matrix_cursor is None or position > self._matrix_cursor:
+                self._matrix_cursor = position
+
+    def _load_matrix_rows(self, rows: list[dict[str, Any]]) -> None:
+        matrix = self._matrix
+        if matrix is None:
+            return
+        for row in rows:
+            try:
+                matrix.upsert(
+                    EmbeddingMatrixRow(
+                        request_id=row["request_id"],
+                        summary_id=row["summary_id"],
+                        **_display_fields(row),
+                    ),
+                    row["embedding_blob"],
+                    recency=_timestamp(row.get("request_created_at")),
+                )
+            except (ValueError, KeyError, AttributeError, TypeError):
+                logger.exception(
+                    "failed_to_process_embedding_row",
+                    extra={"summary_id": row.get("summary_id")},
+                )
+
     async def _fetch_embeddings_by_request_ids(
         self, request_ids: list[int]
     ) -> list[dict[str, Any]]:
@@ -150,39 +375,12 @@ class VectorSearchService:
         for row in rows:
             try:
                 embedding = self._embedding_service.deserialize_embedding(row["embedding_blob"])
-                payload = row["json_payload"] or {}
-                metadata = payload.get("metadata", {}) if isinstance(payload, dict) else {}
-
-                url = (
-                    metadata.get("canonical_url")
-                    or metadata.get("url")
-                    or row.get("normalized_url")
-                    or row.get("input_url")
-                )
-                title = metadata.get("title") or payload.get("title")
-                snippet = (
-                    payload.get("summary_250") or payload.get("tldr") or payload.get("summary_1000")
-                )
-                if snippet and len(snippet) > 300:
-                    snippet = snippet[:297] + "..."
-
-                source = metadata.get("domain") or metadata.get("source")
-                published_at = (
-                    metadata.get("published_at")
-                    or metadata.get("published")
-                    or metadata.get("last_updated")
-                )
-
                 results.append(
                     {
                         "request_id": row["request_id"],
                         "summary_id": row["summary_id"],
                         "embedding": embedding,
-                        "url": url,
-                        "title": title or url,
-                        "snippet": snippet,
-                        "source": source,
-                        "published_at": published_at,
+                        **_display_fields(row),
                     }
                 )
             except (ValueError, KeyError, AttributeError, TypeError):
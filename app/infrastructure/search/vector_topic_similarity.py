@@ -39,14 +39,19 @@ class VectorTopicSimilarityAdapter:
         embedding_service: EmbeddingServiceProtocol,
         user_id: int | None = None,
         top_k: int = 8,
+        batch_size: int = 256,
     ) -> None:
         if top_k <= 0:
             msg = "top_k must be positive"
             raise ValueError(msg)
+        if batch_size <= 0:
+            msg = "batch_size must be positive"
+            raise ValueError(msg)
         self._vector_store = vector_store
         self._embedding_service = embedding_service
         self._user_id = user_id
         self._top_k = top_k
+        self._batch_size = batch_size
 
     def is_ready(self) -> bool:
         health_check = getattr(self._vector_store, "health_check", None)
@@ -64,13 +69,10 @@ class VectorTopicSimilarityAdapter:
                 query_text,
                 task_type="query",
             )
-            filters: dict[str, Any] = {}
-            if self._user_id is not None:
-                filters["user_id"] = self._user_id
             result = await asyncio.to_thread(
                 self._vector_store.query,
                 query_embedding,
-                filters,
+                self._filters(),
                 self._top_k,
             )
         except Exception:
@@ -81,7 +83,67 @@ class VectorTopicSimilarityAdapter:
             )
             return 0.0
 
-        scores = [self._distance_to_similarity(hit.distance) for hit in result.hits]
+        return self._result_similarity(result)
+
+    async def score_items(self, candidates: Sequence[SignalCandidate]) -> list[float]:
+        """Score candidates with one batched embedding call and one search-batch per chunk.
+
+        Produces the same scores as calling ``score_item`` for each candidate;
+        if a batch fails, that chunk falls back to the per-item path so a
+        single bad candidate cannot zero out its neighbours.
+        """
+        scores = [0.0] * len(candidates)
+        pending = [
+            (index, text)
+            for index, text in enumerate(self._candidate_text(c) for c in candidates)
+            if text
+        ]
+        for start in range(0, len(pending), self._batch_size):
+            chunk = pending[start : start + self._batch_size]
+            try:
+                chunk_scores = await self._score_texts_batch([text for _, text in chunk])
+            except Exception:
+                logger.warning(
+                    "signal_vector_similarity_batch_failed",
+                    extra={"count": len(chunk)},
+                    exc_info=True,
+                )
+                chunk_scores = [await self.score_item(candidates[index]) for index, _ in chunk]
+            for (index, _), score in zip(chunk, chunk_scores, strict=True):
+                scores[index] = score
+        return scores
+
+    async def _score_texts_batch(self, texts: list[str]) -> list[float]:
+        embeddings = await self._embedding_service.generate_embeddings_batch(
+            texts,
+            task_type="query",
+        )
+        if len(embeddings) != len(texts):
+            msg = f"embedding batch returned {len(embeddings)} vectors for {len(texts)} texts"
+            raise ValueError(msg)
+
+        filters = self._filters()
+        query_batch = getattr(self._vector_store, "query_batch", None)
+        if callable(query_batch):
+            results = await asyncio.to_thread(query_batch, embeddings, filters, self._top_k)
+        else:
+            results = await asyncio.to_thread(
+                lambda: [self._vector_store.query(e, filters, self._top_k) for e in embeddings]
+            )
+        if len(results) != len(texts):
+            msg = f"vector search batch returned {len(results)} results for {len(texts)} queries"
+            raise ValueError(msg)
+        return [self._result_similarity(result) for result in results]
+
+    def _filters(self) -> dict[str, Any]:
+        filters: dict[str, Any] = {}
+        if self._user_id is not None:
+            filters["user_id"] = self._user_id
+        return filters
+
+    @classmethod
+    def _result_similarity(cls, result: VectorQueryResult) -> float:
+        scores = [cls._distance_to_similarity(hit.distance) for hit in result.hits]
         return max(scores, default=0.0)
 
     @staticmethod
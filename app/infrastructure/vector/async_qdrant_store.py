@@ -0,0 +1,385 @@
+"""Async Qdrant vector store for bulk write paths (backfill, reconciliation)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, FilterSelector, PointIdsList, VectorParams
+
+from app.core.logging_utils import get_logger
+from app.infrastructure.vector.protocol import VectorStoreError
+from app.infrastructure.vector.qdrant_store import (
+    CONTENT_HASH_KEY,
+    PAYLOAD_INDEXES,
+    QdrantStoreBase,
+)
+from app.infrastructure.vector.result_types import VectorQueryResult
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from qdrant_client.models import PointStruct
+
+logger = get_logger(__name__)
+
+_SCROLL_PAGE_SIZE = 1024
+# Request ids are positive, so a filter on this one matches no points.
+_NO_REQUEST_ID = -1
+
+
+class AsyncQdrantVectorStore(QdrantStoreBase):
+    """Vector store built on ``AsyncQdrantClient``; no worker threads involved.
+
+    Connects over gRPC when ``prefer_grpc`` is set and the server answers on its
+    gRPC port, otherwise over REST. Call :meth:`connect` before use.
+
+    Writes are delta-aware: points whose stored ``content_hash`` matches the new
+    one are not re-upserted. :meth:`apply_writes` is the low-level entry point
+    used by :class:`~app.infrastructure.vector.write_batcher.QdrantWriteBatcher`.
+
+    Graceful degradation mirrors ``QdrantVectorStore``: with ``required=False``
+    failures are logged and the store marks itself unavailable.
+    """
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        api_key: str | None,
+        environment: str,
+        user_scope: str,
+        collection_version: str = "v1",
+        embedding_space: str | None = None,
+        embedding_dim: int = 768,
+        required: bool = False,
+        connection_timeout: float = 10.0,
+        prefer_grpc: bool = True,
+    ) -> None:
+        super().__init__(
+            url=url,
+            api_key=api_key,
+            environment=environment,
+            user_scope=user_scope,
+            collection_version=collection_version,
+            embedding_space=embedding_space,
+            embedding_dim=embedding_dim,
+            required=required,
+            connection_timeout=connection_timeout,
+        )
+        self._prefer_grpc = prefer_grpc
+        self._client: AsyncQdrantClient | None = None
+
+    # ------------------------------------------------------------------
+    # Connection helpers
+    # ------------------------------------------------------------------
+
+    async def connect(self, max_attempts: int = 3, base_delay: float = 2.0) -> bool:
+        for attempt in range(1, max_attempts + 1):
+            if await self._try_connect():
+                return True
+            if attempt < max_attempts:
+                delay = base_delay * attempt
+                logger.info(
+                    "vector_connect_retry",
+                    extra={"attempt": attempt, "next_delay_sec": delay, "url": self._url},
+                )
+                await asyncio.sleep(delay)
+        return False
+
+    async def _open_client(self) -> AsyncQdrantClient:
+        """Open a client, preferring gRPC and falling back to REST."""
+        transports = [True, False] if self._prefer_grpc else [False]
+        last_exc: Exception | None = None
+        for grpc in transports:
+            client = AsyncQdrantClient(
+                url=self._url,
+                api_key=self._api_key,
+                timeout=int(self._connection_timeout),
+                prefer_grpc=grpc,
+            )
+            try:
+                await client.get_collections()  # probe / auth check
+            except Exception as exc:
+                last_exc = exc
+                await client.close()
+                if grpc:
+                    logger.info(
+                        "vector_grpc_unavailable_falling_back_to_rest",
+                        extra={"url": self._url, "error": str(exc)},
+                    )
+                continue
+            return client
+        raise VectorStoreError(str(last_exc)) from last_exc
+
+    async def _try_connect(self) -> bool:
+        try:
+            client = await self._open_client()
+            if not await client.collection_exists(self._collection_name):
+                await client.create_collection(
+                    collection_name=self._collection_name,
+                    vectors_config=VectorParams(
+                        size=self._embedding_dim,
+                        distance=Distance.COSINE,
+                    ),
+                )
+                for field, schema in PAYLOAD_INDEXES:
+                    await client.create_payload_index(
+                        collection_name=self._collection_name,
+                        field_name=field,
+                        field_schema=schema,
+                    )
+
+            self._client = client
+            self._available = True
+            logger.info(
+                "vector_collection_initialized",
+                extra={
+                    "collection": self._collection_name,
+                    "url": self._url,
+                    "environment": self._environment,
+                    "version": self._collection_version,
+                    "async": True,
+                },
+            )
+            return True
+        except Exception as exc:
+            logger.error(
+                "vector_initialization_failed",
+                extra={"url": self._url, "error": str(exc), "required": self._required},
+            )
+            self._available = False
+            if self._required:
+                raise VectorStoreError(str(exc)) from exc
+            return False
+
+    async def ensure_available(self) -> bool:
+        if self._available:
+            return True
+        logger.info("vector_reconnect_attempt", extra={"url": self._url})
+        return await self._try_connect()
+
+    async def health_check(self) -> bool:
+        if not self._available or self._client is None:
+            return False
+        try:
+            await self._client.get_collections()
+            return True
+        except Exception:
+            self._available = False
+            return False
+
+    def _handle_failure(self, event: str, exc: Exception, **extra: Any) -> None:
+        logger.error(event, extra={**extra, "error": str(exc)})
+        if self._required:
+            raise VectorStoreError(str(exc)) from exc
+        self._available = False
+
+    # ------------------------------------------------------------------
+    # Delta lookups
+    # ------------------------------------------------------------------
+
+    async def fetch_request_point_hashes(
+        self, request_ids: Sequence[int | str]
+    ) -> dict[str, str | None]:
+        """Return point UUID string -> stored content hash for all points of the requests."""
+        if not request_ids or self._client is None:
+            return {}
+        hashes: dict[str, str | None] = {}
+        offset: Any = None
+        while True:
+            records, offset = await self._client.scroll(
+                collection_name=self._collection_name,
+                scroll_filter=self._request_filter(request_ids),
+                limit=_SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=[CONTENT_HASH_KEY],
+                with_vectors=False,
+            )
+            for record in records:
+                hashes[str(record.id)] = (record.payload or {}).get(CONTENT_HASH_KEY)
+            if offset is None:
+                return hashes
+
+    async def fetch_point_hashes(self, point_ids: Sequence[str]) -> dict[str, str | None]:
+        """Return stored content hashes for the given point ids (missing ids are omitted)."""
+        if not point_ids or self._client is None:
+            return {}
+        records = await self._client.retrieve(
+            collection_name=self._collection_name,
+            ids=list(point_ids),
+            with_payload=[CONTENT_HASH_KEY],
+            with_vectors=False,
+        )
+        return {str(r.id): (r.payload or {}).get(CONTENT_HASH_KEY) for r in records}
+
+    # ------------------------------------------------------------------
+    # Write operations
+    # ------------------------------------------------------------------
+
+    async def apply_writes(
+        self,
+        *,
+        upserts: Sequence[PointStruct] = (),
+        delete_point_ids: Sequence[str] = (),
+        delete_request_ids: Sequence[int | str] = (),
+        wait: bool,
+    ) -> bool:
+        """Send upserts, then point deletes, then request deletes; True on success.
+
+        Qdrant applies updates to a collection in order, so with ``wait=True``
+        the call returns only once every earlier unacknowledged write is visible.
+        """
+        if not await self.ensure_available():
+            logger.warning(
+                "vector_write_skipped",
+                extra={"reason": "not_available", "upserts": len(upserts)},
+            )
+            return False
+        client = self._client
+        try:
+            if upserts:
+                await client.upsert(
+                    collection_name=self._collection_name, points=list(upserts), wait=wait
+                )
+            if delete_point_ids:
+                await client.delete(
+                    collection_name=self._collection_name,
+                    points_selector=PointIdsList(points=list(delete_point_ids)),
+                    wait=wait,
+                )
+            if delete_request_ids:
+                await client.delete(
+                    collection_name=self._collection_name,
+                    points_selector=FilterSelector(filter=self._request_filter(delete_request_ids)),
+                    wait=wait,
+                )
+            return True
+        except Exception as exc:
+            self._handle_failure(
+                "vector_write_failed",
+                exc,
+                upserts=len(upserts),
+                deletes=len(delete_point_ids) + len(delete_request_ids),
+            )
+            return False
+
+    async def write_barrier(self) -> bool:
+        """Block until every earlier write is applied; True on success.
+
+        Sends a ``wait=True`` delete whose filter matches nothing. Qdrant applies
+        a collection's updates in order, so it completes only after the writes
+        queued before it, and it changes no points itself.
+        """
+        if not await self.ensure_available():
+            return False
+        try:
+            await self._client.delete(
+                collection_name=self._collection_name,
+                points_selector=FilterSelector(filter=self._request_filter([_NO_REQUEST_ID])),
+                wait=True,
+            )
+            return True
+        except Exception as exc:
+            self._handle_failure("vector_write_barrier_failed", exc)
+            return False
+
+    async def upsert_notes(
+        self,
+        vectors: Sequence[Sequence[float]],
+        metadatas: Sequence[dict[str, Any]],
+        ids: Sequence[str] | None = None,
+    ) -> None:
+        points = self.build_points(vectors, metadatas, ids)
+        if not await self.ensure_available():
+            logger.warning(
+                "vector_upsert_skipped", extra={"reason": "not_available", "count": len(points)}
+            )
+            return
+        try:
+            existing = await self.fetch_point_hashes([str(p.id) for p in points])
+        except Exception as exc:
+            self._handle_failure("vector_upsert_failed", exc, count=len(points))
+            return
+        await self.apply_writes(upserts=self.changed_points(points, existing), wait=True)
+
+    async def replace_request_notes(
+        self,
+        request_id: int | str,
+        vectors: Sequence[Sequence[float]],
+        metadatas: Sequence[dict[str, Any]],
+        ids: Sequence[str] | None = None,
+    ) -> None:
+        points = self.build_points(vectors, metadatas, ids)
+        if not await self.ensure_available():
+            logger.warning(
+                "vector_replace_skipped",
+                extra={"reason": "not_available", "request_id": request_id, "count": len(points)},
+            )
+            return
+        try:
+            existing = await self.fetch_request_point_hashes([request_id])
+        except Exception as exc:
+            self._handle_failure("vector_replace_failed", exc, request_id=request_id)
+            return
+        await self.apply_writes(
+            upserts=self.changed_points(points, existing),
+            delete_point_ids=list(existing.keys() - {str(p.id) for p in points}),
+            wait=True,
+        )
+
+    async def delete_by_request_id(self, request_id: int | str) -> None:
+        await self.apply_writes(delete_request_ids=[request_id], wait=True)
+
+    # ------------------------------------------------------------------
+    # Read operations
+    # ------------------------------------------------------------------
+
+    async def query(
+        self,
+        query_vector: Sequence[float],
+        filters: dict[str, Any] | None,
+        top_k: int,
+    ) -> VectorQueryResult:
+        if top_k <= 0:
+            msg = "top_k must be positive"
+            raise ValueError(msg)
+        if not await self.ensure_available():
+            logger.warning(
+                "vector_query_skipped", extra={"reason": "not_available", "top_k": top_k}
+            )
+            return VectorQueryResult.empty()
+        try:
+            response = await self._client.query_points(
+                collection_name=self._collection_name,
+                query=list(query_vector),
+                query_filter=self._build_query_filter(filters),
+                limit=top_k,
+                with_payload=True,
+            )
+            return self._to_query_result(response.points)
+        except Exception as exc:
+            self._handle_failure("vector_query_failed", exc)
+            return VectorQueryResult.empty()
+
+    async def count(self) -> int:
+        if not await self.ensure_available():
+            return 0
+        try:
+            result = await self._client.count(collection_name=self._collection_name, exact=True)
+            return result.count
+        except Exception:
+            return 0
+
+    async def aclose(self) -> None:
+        client = self._client
+        if client is None:
+            return
+        try:
+            await client.close()
+        except Exception as exc:
+            logger.warning("vector_client_close_failed", extra={"error": str(exc)})
+        finally:
+            self._client = None
+            self._available = False
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import time
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
@@ -13,10 +15,12 @@ from qdrant_client.models import (
     FieldCondition,
     Filter,
     FilterSelector,
+    MatchAny,
     MatchValue,
     PayloadSchemaType,
     PointIdsList,
     PointStruct,
+    QueryRequest,
     VectorParams,
 )
 
@@ -32,17 +36,31 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-class QdrantVectorStore:
-    """Synchronous vector store wrapper around Qdrant.
+# Payload fields indexed on collection creation (shared by sync and async stores).
+PAYLOAD_INDEXES: tuple[tuple[str, PayloadSchemaType], ...] = (
+    ("request_id", PayloadSchemaType.INTEGER),
+    ("summary_id", PayloadSchemaType.INTEGER),
+    ("user_id", PayloadSchemaType.INTEGER),
+    ("environment", PayloadSchemaType.KEYWORD),
+    ("user_scope", PayloadSchemaType.KEYWORD),
+    ("language", PayloadSchemaType.KEYWORD),
+    ("tags", PayloadSchemaType.KEYWORD),
+)
 
-    Uses the synchronous ``QdrantClient`` so callers can wrap it in
-    ``asyncio.to_thread``.
-    All connection retries use ``time.sleep`` (not ``asyncio.sleep``) so
-    ``__init__`` is safe to call from inside a running event loop.
+# Payload key holding a digest of the point's vector and payload; lets writers skip
+# re-upserting points whose content has not changed.
+CONTENT_HASH_KEY = "content_hash"
 
-    Graceful degradation: when ``required=False`` (default), every public
-    method logs a warning on failure rather than raising an exception.
-    """
+
+def point_content_hash(vector: Sequence[float], payload: dict[str, Any]) -> str:
+    """Digest of a point's vector and payload (excluding the hash itself)."""
+    body = {k: v for k, v in payload.items() if k != CONTENT_HASH_KEY}
+    raw = json.dumps([list(vector), body], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class QdrantStoreBase:
+    """Configuration, naming and point/filter helpers shared by the Qdrant stores."""
 
     def __init__(
         self,
@@ -71,13 +89,10 @@ class QdrantVectorStore:
         self._required = required
         self._connection_timeout = connection_timeout
         self._available = False
-        self._client: QdrantClient | None = None
         self._collection_name = self._build_collection_name(
             environment, user_scope, collection_version, embedding_space
         )
 
-        self._connect_with_retry()
-
     # ------------------------------------------------------------------
     # Properties
     # ------------------------------------------------------------------
@@ -106,8 +121,12 @@ class QdrantVectorStore:
     def collection_name(self) -> str:
         return self._collection_name
 
+    @property
+    def required(self) -> bool:
+        return self._required
+
     # ------------------------------------------------------------------
-    # Connection helpers
+    # Internal helpers
     # ------------------------------------------------------------------
 
     @staticmethod
@@ -130,6 +149,155 @@ class QdrantVectorStore:
         ).strip("_")
         return f"{base_name}_{safe_es}" if safe_es else base_name
 
+    @staticmethod
+    def _extract_id(metadata: dict[str, Any]) -> str:
+        """Derive a stable string key from metadata."""
+        request_id = metadata.get("request_id")
+        summary_id = metadata.get("summary_id")
+        chunk_id = metadata.get("chunk_id")
+        window_id = metadata.get("window_id")
+
+        if request_id is not None:
+            base = str(request_id)
+            if chunk_id:
+                return f"{base}:{chunk_id}"
+            if window_id:
+                return f"{base}:{window_id}"
+            if summary_id is not None:
+                return f"{base}:{summary_id}"
+            return base
+
+        return uuid4().hex
+
+    def _build_points(
+        self,
+        vectors: Sequence[Sequence[float]],
+        metadatas: Sequence[dict[str, Any]],
+        ids: Sequence[str],
+    ) -> list[PointStruct]:
+        points = []
+        for vec, meta, raw_id in zip(vectors, metadatas, ids, strict=True):
+            # Drop empty lists — Qdrant rejects them for KEYWORD-indexed array fields
+            clean = {k: v for k, v in meta.items() if not (isinstance(v, list) and not v)}
+            # Inject scope fields so query filters always match stored points
+            clean["environment"] = self._environment
+            clean["user_scope"] = self._user_scope
+            vector = list(vec)
+            clean[CONTENT_HASH_KEY] = point_content_hash(vector, clean)
+            points.append(
+                PointStruct(
+                    id=_str_to_uuid(raw_id),
+                    vector=vector,
+                    payload=clean,
+                )
+            )
+        return points
+
+    def build_points(
+        self,
+        vectors: Sequence[Sequence[float]],
+        metadatas: Sequence[dict[str, Any]],
+        ids: Sequence[str] | None = None,
+    ) -> list[PointStruct]:
+        """Validate a write and build its points, deriving ids from metadata when omitted."""
+        if len(vectors) != len(metadatas):
+            msg = "vectors and metadatas must have the same length"
+            raise ValueError(msg)
+        if ids and len(ids) != len(vectors):
+            msg = "ids must have the same length as vectors"
+            raise ValueError(msg)
+
+        final_ids = list(ids) if ids else [self._extract_id(m) for m in metadatas]
+        return self._build_points(vectors, metadatas, final_ids)
+
+    @staticmethod
+    def _request_filter(request_ids: Sequence[int | str]) -> Filter:
+        ids = [int(request_id) for request_id in request_ids]
+        match = MatchValue(value=ids[0]) if len(ids) == 1 else MatchAny(any=ids)
+        return Filter(must=[FieldCondition(key="request_id", match=match)])
+
+    @staticmethod
+    def changed_points(
+        points: Sequence[PointStruct], existing_hashes: dict[str, str | None]
+    ) -> list[PointStruct]:
+        """Drop points whose stored content hash matches the new one."""
+        return [
+            point
+            for point in points
+            if existing_hashes.get(str(point.id)) != (point.payload or {}).get(CONTENT_HASH_KEY)
+        ]
+
+    def _build_query_filter(self, filters: dict[str, Any] | None) -> Filter:
+        filter_payload = {
+            key: value
+            for key, value in (filters or {}).items()
+            if key not in {"environment", "user_scope"}
+        }
+        return QdrantQueryFilters(
+            environment=self._environment,
+            user_scope=self._user_scope,
+            **filter_payload,
+        ).to_filter()
+
+    @staticmethod
+    def _to_query_result(points: Sequence[Any]) -> VectorQueryResult:
+        # Qdrant COSINE returns similarity (1=identical).
+        # Convert to distance convention: distance = 1 - similarity.
+        hits = [
+            VectorQueryHit(
+                id=str(p.id),
+                distance=max(0.0, 1.0 - float(p.score)),
+                metadata=dict(p.payload or {}),
+            )
+            for p in points
+        ]
+        return VectorQueryResult(hits=hits)
+
+
+class QdrantVectorStore(QdrantStoreBase):
+    """Synchronous vector store wrapper around Qdrant.
+
+    Uses the synchronous ``QdrantClient`` so callers can wrap it in
+    ``asyncio.to_thread``.
+    All connection retries use ``time.sleep`` (not ``asyncio.sleep``) so
+    ``__init__`` is safe to call from inside a running event loop.
+
+    Graceful degradation: when ``required=False`` (default), every public
+    method logs a warning on failure rather than raising an exception.
+    """
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        api_key: str | None,
+        environment: str,
+        user_scope: str,
+        collection_version: str = "v1",
+        embedding_space: str | None = None,
+        embedding_dim: int = 768,
+        required: bool = False,
+        connection_timeout: float = 10.0,
+    ) -> None:
+        super().__init__(
+            url=url,
+            api_key=api_key,
+            environment=environment,
+            user_scope=user_scope,
+            collection_version=collection_version,
+            embedding_space=embedding_space,
+            embedding_dim=embedding_dim,
+            required=required,
+            connection_timeout=connection_timeout,
+        )
+        self._client: QdrantClient | None = None
+
+        self._connect_with_retry()
+
+    # ------------------------------------------------------------------
+    # Connection helpers
+    # ------------------------------------------------------------------
+
     def _connect_with_retry(self, max_attempts: int = 3, base_delay: float = 2.0) -> None:
         for attempt in range(1, max_attempts + 1):
             if self._try_connect():
@@ -159,15 +327,7 @@ class QdrantVectorStore:
                         distance=Distance.COSINE,
                     ),
                 )
-                for field, schema in [
-                    ("request_id", PayloadSchemaType.INTEGER),
-                    ("summary_id", PayloadSchemaType.INTEGER),
-                    ("user_id", PayloadSchemaType.INTEGER),
-                    ("environment", PayloadSchemaType.KEYWORD),
-                    ("user_scope", PayloadSchemaType.KEYWORD),
-                    ("language", PayloadSchemaType.KEYWORD),
-                    ("tags", PayloadSchemaType.KEYWORD),
-                ]:
+                for field, schema in PAYLOAD_INDEXES:
                     client.create_payload_index(
                         collection_name=self._collection_name,
                         field_name=field,
@@ -200,70 +360,21 @@ class QdrantVectorStore:
         logger.info("vector_reconnect_attempt", extra={"url": self._url})
         return self._try_connect()
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _extract_id(metadata: dict[str, Any]) -> str:
-        """Derive a stable string key from metadata."""
-        request_id = metadata.get("request_id")
-        summary_id = metadata.get("summary_id")
-        chunk_id = metadata.get("chunk_id")
-        window_id = metadata.get("window_id")
-
-        if request_id is not None:
-            base = str(request_id)
-            if chunk_id:
-                return f"{base}:{chunk_id}"
-            if window_id:
-                return f"{base}:{window_id}"
-            if summary_id is not None:
-                return f"{base}:{summary_id}"
-            return base
-
-        return uuid4().hex
-
-    def _build_points(
-        self,
-        vectors: Sequence[Sequence[float]],
-        metadatas: Sequence[dict[str, Any]],
-        ids: Sequence[str],
-    ) -> list[PointStruct]:
-        points = []
-        for vec, meta, raw_id in zip(vectors, metadatas, ids, strict=True):
-            # Drop empty lists — Qdrant rejects them for KEYWORD-indexed array fields
-            clean = {k: v for k, v in meta.items() if not (isinstance(v, list) and not v)}
-            # Inject scope fields so query filters always match stored points
-            clean["environment"] = self._environment
-            clean["user_scope"] = self._user_scope
-            points.append(
-                PointStruct(
-                    id=_str_to_uuid(raw_id),
-                    vector=list(vec),
-                    payload=clean,
-                )
-            )
-        return points
-
-    def _fetch_request_point_ids(self, request_id: int | str) -> set[str]:
-        """Return all Qdrant point UUID strings stored for a request."""
+    def _fetch_request_point_hashes(self, request_id: int | str) -> dict[str, str | None]:
+        """Return point UUID string -> stored content hash for every point of a request."""
         client = self._client
         try:
-            req_filter = Filter(
-                must=[FieldCondition(key="request_id", match=MatchValue(value=int(request_id)))]
-            )
             records, _ = client.scroll(
                 collection_name=self._collection_name,
-                scroll_filter=req_filter,
+                scroll_filter=self._request_filter([request_id]),
                 limit=10_000,
-                with_payload=False,
+                with_payload=[CONTENT_HASH_KEY],
                 with_vectors=False,
             )
-            return {str(r.id) for r in records}
+            return {str(r.id): (r.payload or {}).get(CONTENT_HASH_KEY) for r in records}
         except Exception:
             logger.warning("vector_fetch_request_ids_failed", extra={"request_id": request_id})
-            return set()
+            return {}
 
     # ------------------------------------------------------------------
     # Write operations
@@ -283,15 +394,7 @@ class QdrantVectorStore:
             )
             return
 
-        if len(vectors) != len(metadatas):
-            msg = "vectors and metadatas must have the same length"
-            raise ValueError(msg)
-        if ids and len(ids) != len(vectors):
-            msg = "ids must have the same length as vectors"
-            raise ValueError(msg)
-
-        final_ids = list(ids) if ids else [self._extract_id(m) for m in metadatas]
-        points = self._build_points(vectors, metadatas, final_ids)
+        points = self.build_points(vectors, metadatas, ids)
 
         try:
             self._client.upsert(
@@ -321,22 +424,15 @@ class QdrantVectorStore:
             )
             return
 
-        if len(vectors) != len(metadatas):
-            msg = "vectors and metadatas must have the same length"
-            raise ValueError(msg)
-        if ids and len(ids) != len(vectors):
-            msg = "ids must have the same length as vectors"
-            raise ValueError(msg)
-
-        final_ids = list(ids) if ids else [self._extract_id(m) for m in metadatas]
-        new_uuid_strs = {_str_to_uuid(raw_id) for raw_id in final_ids}
-        points = self._build_points(vectors, metadatas, final_ids)
+        points = self.build_points(vectors, metadatas, ids)
 
         client = self._client
         try:
-            existing_uuid_strs = self._fetch_request_point_ids(request_id)
-            client.upsert(collection_name=self._collection_name, points=points, wait=True)
-            stale = existing_uuid_strs - new_uuid_strs
+            existing = self._fetch_request_point_hashes(request_id)
+            changed = self.changed_points(points, existing)
+            if changed:
+                client.upsert(collection_name=self._collection_name, points=changed, wait=True)
+            stale = existing.keys() - {str(point.id) for point in points}
             if stale:
                 client.delete(
                     collection_name=self._collection_name,
@@ -374,16 +470,7 @@ class QdrantVectorStore:
             msg = "top_k must be positive"
             raise ValueError(msg)
 
-        filter_payload = {
-            key: value
-            for key, value in (filters or {}).items()
-            if key not in {"environment", "user_scope"}
-        }
-        qdrant_filter = QdrantQueryFilters(
-            environment=self._environment,
-            user_scope=self._user_scope,
-            **filter_payload,
-        ).to_filter()
+        qdrant_filter = self._build_query_filter(filters)
 
         try:
             client = self._client
@@ -394,17 +481,7 @@ class QdrantVectorStore:
                 limit=top_k,
                 with_payload=True,
             )
-            # Qdrant COSINE returns similarity (1=identical).
-            # Convert to distance convention: distance = 1 - similarity.
-            hits = [
-                VectorQueryHit(
-                    id=str(p.id),
-                    distance=max(0.0, 1.0 - float(p.score)),
-                    metadata=dict(p.payload or {}),
-                )
-                for p in response.points
-            ]
-            return VectorQueryResult(hits=hits)
+            return self._to_query_result(response.points)
         except Exception as exc:
             logger.error("vector_query_failed", extra={"error": str(exc)})
             if self._required:
@@ -412,6 +489,59 @@ class QdrantVectorStore:
             self._available = False
             return VectorQueryResult.empty()
 
+    def query_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        filters: dict[str, Any] | None,
+        top_k: int,
+    ) -> list[VectorQueryResult]:
+        """Run several similarity queries in one Qdrant search-batch round trip.
+
+        Results are returned in input order and match what ``query`` would
+        return for each vector individually.
+        """
+        if not query_vectors:
+            return []
+        if not self._available:
+            self.ensure_available()
+        if not self._available:
+            logger.warning(
+                "vector_query_batch_skipped",
+                extra={"reason": "not_available", "top_k": top_k, "count": len(query_vectors)},
+            )
+            return [VectorQueryResult.empty() for _ in query_vectors]
+
+        if top_k <= 0:
+            msg = "top_k must be positive"
+            raise ValueError(msg)
+
+        qdrant_filter = self._build_query_filter(filters)
+        requests = [
+            QueryRequest(
+                query=list(vector),
+                filter=qdrant_filter,
+                limit=top_k,
+                with_payload=True,
+            )
+            for vector in query_vectors
+        ]
+
+        try:
+            responses = self._client.query_batch_points(
+                collection_name=self._collection_name,
+                requests=requests,
+            )
+            return [self._to_query_result(response.points) for response in responses]
+        except Exception as exc:
+            logger.error(
+                "vector_query_batch_failed",
+                extra={"count": len(query_vectors), "error": str(exc)},
+            )
+            if self._required:
+                raise VectorStoreError(str(exc)) from exc
+            self._available = False
+            return [VectorQueryResult.empty() for _ in query_vectors]
+
     def delete_by_request_id(self, request_id: int | str) -> None:
         if not self._available:
             self.ensure_available()
@@ -423,16 +553,7 @@ class QdrantVectorStore:
         try:
             self._client.delete(
                 collection_name=self._collection_name,
-                points_selector=FilterSelector(
-                    filter=Filter(
-                        must=[
-                            FieldCondition(
-                                key="request_id",
-                                match=MatchValue(value=int(request_id)),
-                            )
-                        ]
-                    )
-                ),
+                points_selector=FilterSelector(filter=self._request_filter([request_id])),
                 wait=True,
             )
         except Exception as exc:
@@ -0,0 +1,290 @@
+"""Cross-request write batching for the async Qdrant vector store."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from app.core.logging_utils import get_logger
+from app.infrastructure.vector.protocol import VectorStoreError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from qdrant_client.models import PointStruct
+
+    from app.infrastructure.vector.async_qdrant_store import AsyncQdrantVectorStore
+
+logger = get_logger(__name__)
+
+_DEFAULT_MAX_POINTS = 512
+_DEFAULT_BARRIER_EVERY = 8
+
+
+@dataclass(slots=True)
+class WriteBatcherStats:
+    """Running counters for a batcher; throughput covers written and unchanged points."""
+
+    points_written: int = 0
+    points_unchanged: int = 0
+    points_deleted: int = 0
+    requests_deleted: int = 0
+    flushes: int = 0
+    barriers: int = 0
+    failed_flushes: int = 0
+    # Points and request deletes still buffered after close() gave up on them.
+    points_unsent: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def points_per_sec(self) -> float:
+        elapsed = time.perf_counter() - self.started_at
+        processed = self.points_written + self.points_unchanged
+        return processed / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "points_written": self.points_written,
+            "points_unchanged": self.points_unchanged,
+            "points_deleted": self.points_deleted,
+            "requests_deleted": self.requests_deleted,
+            "flushes": self.flushes,
+            "barriers": self.barriers,
+            "failed_flushes": self.failed_flushes,
+            "points_unsent": self.points_unsent,
+            "points_per_sec": round(self.points_per_sec, 1),
+        }
+
+
+class QdrantWriteBatcher:
+    """Buffer point upserts and deletes across requests and send them in large batches.
+
+    Each flush costs one hash lookup plus at most three writes, whatever the number
+    of requests it covers. Points whose stored ``content_hash`` is unchanged are
+    skipped, and points a replaced request no longer has are deleted.
+
+    Flushes are sent with ``wait=False``; every ``barrier_every``-th flush (and
+    :meth:`barrier`/:meth:`close`) waits instead, which acts as a consistency
+    barrier because Qdrant applies a collection's updates in order. With nothing
+    buffered, :meth:`barrier` sends the store's no-op ``write_barrier``.
+
+    A failed flush puts its batch back in the buffer, behind anything buffered
+    since, and the next flush retries it. Whatever :meth:`close` still cannot
+    send is counted in ``stats.points_unsent``.
+
+    Later operations on a request supersede buffered ones: a delete drops a
+    buffered replace and vice versa. Plain upserts and replaces that touch the same
+    request flush the buffer first to keep ordering.
+    """
+
+    def __init__(
+        self,
+        store: AsyncQdrantVectorStore,
+        *,
+        max_points: int = _DEFAULT_MAX_POINTS,
+        barrier_every: int = _DEFAULT_BARRIER_EVERY,
+    ) -> None:
+        self._store = store
+        self._max_points = max(1, max_points)
+        self._barrier_every = max(1, barrier_every)
+        self._replaces: dict[int, list[PointStruct]] = {}
+        self._deletes: set[int] = set()
+        self._upserts: dict[str, PointStruct] = {}
+        self._upsert_request_ids: set[Any] = set()
+        self._buffered_points = 0
+        self._failed_streak = 0
+        self._unacknowledged = False
+        self.stats = WriteBatcherStats()
+
+    async def __aenter__(self) -> QdrantWriteBatcher:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Buffering
+    # ------------------------------------------------------------------
+
+    async def replace_request_notes(
+        self,
+        request_id: int | str,
+        vectors: Sequence[Sequence[float]],
+        metadatas: Sequence[dict[str, Any]],
+        ids: Sequence[str] | None = None,
+    ) -> None:
+        points = self._store.build_points(vectors, metadatas, ids)
+        key = int(request_id)
+        if key in self._upsert_request_ids:
+            await self.flush()
+        self._deletes.discard(key)
+        previous = self._replaces.pop(key, None)
+        self._buffered_points += len(points) - len(previous or ())
+        self._replaces[key] = points
+        await self._flush_if_full()
+
+    async def upsert_notes(
+        self,
+        vectors: Sequence[Sequence[float]],
+        metadatas: Sequence[dict[str, Any]],
+        ids: Sequence[str] | None = None,
+    ) -> None:
+        points = self._store.build_points(vectors, metadatas, ids)
+        touched = {(p.payload or {}).get("request_id") for p in points}
+        if touched & (self._deletes | self._replaces.keys()):
+            await self.flush()
+        for point in points:
+            if self._upserts.get(str(point.id)) is None:
+                self._buffered_points += 1
+            self._upserts[str(point.id)] = point
+        self._upsert_request_ids |= touched
+        await self._flush_if_full()
+
+    async def delete_by_request_id(self, request_id: int | str) -> None:
+        key = int(request_id)
+        self._buffered_points -= len(self._replaces.pop(key, ()))
+        self._deletes.add(key)
+        await self._flush_if_full()
+
+    async def _flush_if_full(self) -> None:
+        # After failures, wait for another full batch before retrying so an
+        # unavailable store is not hit on every buffered request.
+        threshold = self._max_points * (self._failed_streak + 1)
+        if self._buffered_points + len(self._deletes) >= threshold:
+            await self.flush()
+
+    # ------------------------------------------------------------------
+    # Sending
+    # ------------------------------------------------------------------
+
+    async def flush(self, *, wait: bool | None = None) -> None:
+        """Send everything buffered; ``wait=None`` waits only on barrier flushes."""
+        if not (self._replaces or self._deletes or self._upserts):
+            return
+        replaces, deletes, upserts = self._replaces, self._deletes, self._upserts
+        self._replaces, self._deletes, self._upserts = {}, set(), {}
+        self._upsert_request_ids = set()
+        self._buffered_points = 0
+
+        self.stats.flushes += 1
+        if wait is None:
+            wait = self.stats.flushes % self._barrier_every == 0
+
+        new_points = [point for points in replaces.values() for point in points]
+        replaced_ids = {str(point.id) for point in new_points}
+        new_points.extend(upserts.values())
+        try:
+            existing = await self._store.fetch_request_point_hashes(list(replaces))
+            stale = [point_id for point_id in existing if point_id not in replaced_ids]
+            existing.update(await self._store.fetch_point_hashes(list(upserts)))
+        except Exception as exc:
+            self._requeue(replaces, deletes, upserts)
+            self._record_failure(exc, len(new_points))
+            return
+
+        changed = self._store.changed_points(new_points, existing)
+        if not await self._store.apply_writes(
+            upserts=changed,
+            delete_point_ids=stale,
+            delete_request_ids=sorted(deletes),
+            wait=wait,
+        ):
+            # Part of the batch may have been applied; the retry recomputes
+            # hashes and stale points, so re-sending all of it is safe.
+            self._requeue(replaces, deletes, upserts)
+            self.stats.failed_flushes += 1
+            self._failed_streak += 1
+            return
+
+        self._failed_streak = 0
+        self._unacknowledged = not wait
+        self.stats.barriers += int(wait)
+        self.stats.points_written += len(changed)
+        self.stats.points_unchanged += len(new_points) - len(changed)
+        self.stats.points_deleted += len(stale)
+        self.stats.requests_deleted += len(deletes)
+        logger.debug(
+            "vector_batch_flushed",
+            extra={
+                "upserted": len(changed),
+                "unchanged": len(new_points) - len(changed),
+                "stale_deleted": len(stale),
+                "requests_deleted": len(deletes),
+                "wait": wait,
+            },
+        )
+
+    async def barrier(self) -> None:
+        """Flush and block until every write sent so far is applied."""
+        if self._replaces or self._deletes or self._upserts:
+            await self.flush(wait=True)
+        elif self._unacknowledged and await self._store.write_barrier():
+            self.stats.barriers += 1
+            self._unacknowledged = False
+
+    async def close(self) -> WriteBatcherStats:
+        """Drain the buffer behind a barrier and return the final stats.
+
+        Buffered writes that still fail are dropped and counted in
+        ``stats.points_unsent``.
+        """
+        await self.barrier()
+        unsent = self._buffered_points + len(self._deletes)
+        if unsent:
+            self.stats.points_unsent += unsent
+            logger.error("vector_batch_unsent", extra={"count": unsent})
+            self._replaces, self._deletes, self._upserts = {}, set(), {}
+            self._upsert_request_ids = set()
+            self._buffered_points = 0
+        return self.stats
+
+    def _requeue(
+        self,
+        replaces: dict[int, list[PointStruct]],
+        deletes: set[int],
+        upserts: dict[str, PointStruct],
+    ) -> None:
+        # Restore the failed batch and replay what was buffered while it was in
+        # flight on top of it, so the newer operations still win.
+        newer_replaces, newer_deletes, newer_upserts = self._replaces, self._deletes, self._upserts
+        self._replaces, self._deletes, self._upserts = replaces, deletes, upserts
+        for key, points in newer_replaces.items():
+            self._drop_upserts_of(key)
+            self._deletes.discard(key)
+            self._replaces[key] = points
+        for key in newer_deletes:
+            self._drop_upserts_of(key)
+            self._replaces.pop(key, None)
+            self._deletes.add(key)
+        for point_id, point in newer_upserts.items():
+            key = _request_key(point)
+            if key is not None and key in self._deletes:
+                # Delete then upsert leaves exactly the upserted points.
+                self._deletes.discard(key)
+                self._replaces[key] = [point]
+            elif key is not None and key in self._replaces:
+                kept = [p for p in self._replaces[key] if str(p.id) != point_id]
+                self._replaces[key] = [*kept, point]
+            else:
+                self._upserts[point_id] = point
+        self._upsert_request_ids = {
+            (p.payload or {}).get("request_id") for p in self._upserts.values()
+        }
+        self._buffered_points = len(self._upserts) + sum(map(len, self._replaces.values()))
+
+    def _drop_upserts_of(self, key: int) -> None:
+        for point_id in [pid for pid, p in self._upserts.items() if _request_key(p) == key]:
+            del self._upserts[point_id]
+
+    def _record_failure(self, exc: Exception, count: int) -> None:
+        self.stats.failed_flushes += 1
+        self._failed_streak += 1
+        logger.error("vector_batch_flush_failed", extra={"count": count, "error": str(exc)})
+        if self._store.required:
+            raise VectorStoreError(str(exc)) from exc
+
+
+def _request_key(point: PointStruct) -> int | None:
+    request_id = (point.payload or {}).get("request_id")
+    return None if request_id is None else int(request_id)
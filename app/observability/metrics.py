@@ -19,8 +19,13 @@ Usage:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from app.core.logging_utils import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # Try to import prometheus_client, but make it optional
 try:
     from prometheus_client import (
@@ -141,6 +146,87 @@ if PROMETHEUS_AVAILABLE:
         registry=REGISTRY,
     )
 
+    # ---- RSS poller telemetry ------------------------------------------
+    # Wall time of one feed through fetch, parse and persist, by outcome
+    # (updated | not_modified | error). Per-feed detail goes to the
+    # ``rss_feed_polled`` log event; a feed label would be unbounded.
+    RSS_FEED_POLL_LATENCY_SECONDS = Histogram(
+        "ratatoskr_rss_feed_poll_latency_seconds",
+        "Latency of polling a single RSS feed in seconds",
+        ["outcome"],
+        buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+        registry=REGISTRY,
+    )
+
+    # Event bus handler metrics
+    EVENT_HANDLER_LATENCY_SECONDS = Histogram(
+        "ratatoskr_event_handler_latency_seconds",
+        "Latency of a single event bus handler invocation in seconds",
+        ["event_type", "handler", "outcome"],
+        buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+        registry=REGISTRY,
+    )
+
+    EMBEDDING_BATCH_SIZE = Histogram(
+        "ratatoskr_embedding_batch_size",
+        "Number of texts per coalesced embedding encode",
+        ["model"],
+        buckets=[1, 2, 4, 8, 16, 32, 64, 128],
+        registry=REGISTRY,
+    )
+
+    EMBEDDING_BATCH_WAIT_SECONDS = Histogram(
+        "ratatoskr_embedding_batch_wait_seconds",
+        "Time an embedding request waited for its batch to be dispatched",
+        ["model"],
+        buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25],
+        registry=REGISTRY,
+    )
+
+    # Cache metrics
+    CACHE_LOOKUPS_TOTAL = Counter(
+        "ratatoskr_cache_lookups_total",
+        "Cache lookups by key namespace and outcome (local_hit, redis_hit, miss)",
+        ["namespace", "outcome"],
+        registry=REGISTRY,
+    )
+
+    CACHE_HIT_RATIO = Gauge(
+        "ratatoskr_cache_hit_ratio",
+        "Per-process cache hit ratio by key namespace since startup",
+        ["namespace"],
+        registry=REGISTRY,
+    )
+
+    DB_WRITE_QUEUE_DEPTH = Gauge(
+        "ratatoskr_db_write_queue_depth",
+        "Operations waiting in the background DB write queue",
+        registry=REGISTRY,
+    )
+
+    DB_WRITE_FLUSH_SIZE = Histogram(
+        "ratatoskr_db_write_flush_size",
+        "Payloads per grouped DB write queue flush, after coalescing",
+        ["operation"],
+        buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256],
+        registry=REGISTRY,
+    )
+
+    DB_WRITE_FLUSH_LATENCY_SECONDS = Histogram(
+        "ratatoskr_db_write_flush_latency_seconds",
+        "Time to execute one grouped DB write queue flush",
+        ["operation"],
+        buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+        registry=REGISTRY,
+    )
+
+    DB_WRITE_COALESCED_TOTAL = Counter(
+        "ratatoskr_db_write_coalesced_total",
+        "Queued DB writes dropped because a later write superseded them",
+        ["operation"],
+        registry=REGISTRY,
+    )
+
     # Circuit breaker metrics
     CIRCUIT_BREAKER_STATE = Gauge(
         "ratatoskr_circuit_breaker_state",
@@ -341,6 +427,16 @@ else:
     LLM_CALL_LATENCY_SECONDS = None
     SCRAPER_ATTEMPTS_TOTAL = None
     SCRAPER_ATTEMPT_LATENCY_SECONDS = None
+    RSS_FEED_POLL_LATENCY_SECONDS = None
+    EVENT_HANDLER_LATENCY_SECONDS = None
+    EMBEDDING_BATCH_SIZE = None
+    EMBEDDING_BATCH_WAIT_SECONDS = None
+    CACHE_LOOKUPS_TOTAL = None
+    CACHE_HIT_RATIO = None
+    DB_WRITE_QUEUE_DEPTH = None
+    DB_WRITE_FLUSH_SIZE = None
+    DB_WRITE_FLUSH_LATENCY_SECONDS = None
+    DB_WRITE_COALESCED_TOTAL = None
 
 
 def get_metrics() -> bytes:
@@ -785,3 +881,95 @@ def record_scraper_attempt_latency(*, provider: str, latency_seconds: float) ->
     if latency_seconds < 0:
         return
     SCRAPER_ATTEMPT_LATENCY_SECONDS.labels(provider=provider).observe(latency_seconds)
+
+
+def record_rss_feed_poll_latency(*, outcome: str, latency_seconds: float) -> None:
+    """Record how long one feed took to poll.
+
+    Args:
+        outcome: ``updated`` | ``not_modified`` | ``error``.
+        latency_seconds: Wall time from fetch start to persisted result.
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+    if latency_seconds < 0:
+        return
+    RSS_FEED_POLL_LATENCY_SECONDS.labels(outcome=outcome).observe(latency_seconds)
+
+
+def record_event_handler_latency(
+    *, event_type: str, handler: str, outcome: str, latency_seconds: float
+) -> None:
+    """Record how long one event bus handler took for one event.
+
+    Args:
+        event_type: Domain event class name (e.g. ``SummaryCreated``).
+        handler: Handler qualified name (e.g. ``SearchIndexEventHandler.on_summary_created``).
+        outcome: ``success`` | ``error`` | ``timeout``.
+        latency_seconds: Wall time of the handler call.
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+    if latency_seconds < 0:
+        return
+    EVENT_HANDLER_LATENCY_SECONDS.labels(
+        event_type=event_type, handler=handler, outcome=outcome
+    ).observe(latency_seconds)
+
+
+def record_embedding_batch(*, model: str, size: int, wait_seconds: Sequence[float]) -> None:
+    """Record one coalesced embedding batch.
+
+    Args:
+        model: Embedding model name.
+        size: Number of texts in the batch.
+        wait_seconds: Per-request time between enqueue and batch dispatch.
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+    EMBEDDING_BATCH_SIZE.labels(model=model).observe(size)
+    wait = EMBEDDING_BATCH_WAIT_SECONDS.labels(model=model)
+    for seconds in wait_seconds:
+        if seconds >= 0:
+            wait.observe(seconds)
+
+
+def record_cache_lookup(*, namespace: str, outcome: str, hit_ratio: float) -> None:
+    """Record one cache lookup and the namespace's running hit ratio.
+
+    Args:
+        namespace: First key segment (e.g. ``llm``, ``embed``, ``trending``, ``auth``).
+        outcome: ``local_hit`` | ``redis_hit`` | ``miss``.
+        hit_ratio: Hits over lookups for the namespace in this process.
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+    CACHE_LOOKUPS_TOTAL.labels(namespace=namespace, outcome=outcome).inc()
+    CACHE_HIT_RATIO.labels(namespace=namespace).set(hit_ratio)
+
+
+def record_db_write_queue_depth(depth: int) -> None:
+    """Record the number of operations waiting in the DB write queue."""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    DB_WRITE_QUEUE_DEPTH.set(depth)
+
+
+def record_db_write_flush(
+    *, operation: str, size: int, coalesced: int, latency_seconds: float
+) -> None:
+    """Record one grouped DB write queue flush.
+
+    Args:
+        operation: Operation name of the flushed group (e.g. ``persist_llm_call``).
+        size: Payloads handed to the batch callback.
+        coalesced: Payloads dropped because a later write for the same key superseded them.
+        latency_seconds: Time spent executing the batch callback.
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+    DB_WRITE_FLUSH_SIZE.labels(operation=operation).observe(size)
+    if latency_seconds >= 0:
+        DB_WRITE_FLUSH_LATENCY_SECONDS.labels(operation=operation).observe(latency_seconds)
+    if coalesced:
+        DB_WRITE_COALESCED_TOTAL.labels(operation=operation).inc(coalesced)
@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import hashlib
 import json
-import random
 import re
 from functools import lru_cache
 from pathlib import Path
@@ -280,10 +279,7 @@ class PromptManager:
         if example_types:
             examples = [e for e in examples if e.get("content_type") in example_types]
 
-        # Select random subset if more than needed
-        if len(examples) > num_examples:
-            examples = random.sample(examples, num_examples)
-
+        # Take a fixed subset: a stable system prompt is a cacheable prompt prefix.
         return examples[:num_examples]
 
     def _load_examples(self, lang: str) -> list[dict[str, Any]]:
@@ -295,7 +291,7 @@ class PromptManager:
         examples: list[dict[str, Any]] = []
         pattern = f"*_{lang}.json" if lang != "en" else "*.json"
 
-        for path in self.examples_dir.glob(pattern):
+        for path in sorted(self.examples_dir.glob(pattern)):
             # Skip non-target language files for English
             if lang == "en" and "_ru.json" in path.name:
                 continue
@@ -210,11 +210,20 @@ class SafeSyncTransport(httpx.HTTPTransport):
         return super().handle_request(_pin_request(request, hostname, results))
 
 
+def _transport_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    # httpx ignores connection-pool limits given to a client that has a custom
+    # transport, so they are moved onto the transport.
+    limits = kwargs.pop("limits", None)
+    return {} if limits is None else {"limits": limits}
+
+
 def make_safe_async_client(**kwargs: Any) -> httpx.AsyncClient:
     """Return an AsyncClient backed by SafeAsyncTransport."""
-    return httpx.AsyncClient(transport=SafeAsyncTransport(), **kwargs)
+    transport = SafeAsyncTransport(**_transport_kwargs(kwargs))
+    return httpx.AsyncClient(transport=transport, **kwargs)
 
 
 def make_safe_sync_client(**kwargs: Any) -> httpx.Client:
     """Return a sync Client backed by SafeSyncTransport."""
-    return httpx.Client(transport=SafeSyncTransport(), **kwargs)
+    transport = SafeSyncTransport(**_transport_kwargs(kwargs))
+    return httpx.Client(transport=transport, **kwargs)
@@ -40,7 +40,16 @@ async def _rss_poll_body(cfg: AppConfig, db: Database) -> None:
     logger.info("rss_poll_starting", extra={"cid": correlation_id})
 
     try:
-        stats = await poll_all_feeds(db) if cfg.rss.enabled else {"new_item_ids": []}
+        stats = (
+            await poll_all_feeds(
+                db,
+                concurrency=cfg.rss.poll_concurrency,
+                per_host_concurrency=cfg.rss.poll_per_host_concurrency,
+                parse_workers=cfg.rss.poll_parse_workers,
+            )
+            if cfg.rss.enabled
+            else {"new_item_ids": []}
+        )
         await _run_optional_source_ingestors(cfg, db, correlation_id)
         new_item_ids: list[int] = stats.get("new_item_ids", [])
         logger.info(
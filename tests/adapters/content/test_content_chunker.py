@@ -0,0 +1,138 @@
+"""Tests for ContentChunker map-reduce summarization of long articles."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import re
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.adapters.content import content_chunker as chunker_module
+from app.adapters.content.content_chunker import ContentChunker, chunk_sentences_by_tokens
+from app.core.call_status import CallStatus
+
+
+def _cfg(*, budget_sec: float = 0.0) -> Any:
+    return SimpleNamespace(
+        runtime=SimpleNamespace(chunk_latency_budget_sec=budget_sec),
+        openrouter=SimpleNamespace(
+            model="main/model",
+            temperature=0.2,
+            top_p=None,
+            max_tokens=2048,
+            structured_output_mode="json_object",
+            flash_model="flash/model",
+            flash_fallback_models=("flash/backup",),
+        ),
+    )
+
+
+def _response(payload: dict[str, Any]) -> Any:
+    return SimpleNamespace(
+        status=CallStatus.OK,
+        response_json=None,
+        response_text=json.dumps(payload),
+        error_text=None,
+    )
+
+
+class _FakeLLM:
+    """Answers chunk prompts with ``part N`` and synthesis prompts with ``synth K``."""
+
+    def __init__(self, *, delays: dict[int, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.events: list[str] = []
+        self.overrides: list[str | None] = []
+        self._synth = 0
+
+    async def chat(self, messages: list[dict[str, Any]], **kwargs: Any) -> Any:
+        content = messages[-1]["content"]
+        self.overrides.append(kwargs.get("model_override"))
+        if "DRAFT CONTENT START" in content:
+            self._synth += 1
+            self.events.append(f"synth-{self._synth}")
+            return _response({"summary_250": f"synth {self._synth}", "tldr": "t"})
+        part = int(re.search(r"part (\d+)/", content).group(1))  # type: ignore[union-attr]
+        if kwargs.get("model_override") is None:
+            await asyncio.sleep(self.delays.get(part, 0))
+        self.events.append(f"chunk-{part}")
+        return _response({"summary_250": f"part {part}", "tldr": f"t{part}"})
+
+
+def _chunker(llm: _FakeLLM, **cfg_kwargs: Any) -> ContentChunker:
+    return ContentChunker(
+        cfg=_cfg(**cfg_kwargs),
+        openrouter=llm,  # type: ignore[arg-type]
+        response_formatter=None,  # type: ignore[arg-type]
+        audit_func=lambda *_args: None,
+        sem=contextlib.nullcontext,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _identity_shaping(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(chunker_module, "validate_and_shape_summary", dict)
+    monkeypatch.setattr(
+        chunker_module,
+        "aggregate_chunk_summaries",
+        lambda items: {"summary_250": " ".join(item["summary_250"] for item in items)},
+    )
+
+
+async def test_chunk_sentences_by_tokens_packs_to_the_token_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _count(texts: list[str], model: str | None = None) -> list[int]:
+        return [len(text.split()) for text in texts]
+
+    monkeypatch.setattr(chunker_module, "acount_tokens_batch", _count)
+    sentences = ["one two three.", "four five.", "six seven eight nine ten eleven.", "x."]
+
+    assert await chunk_sentences_by_tokens(sentences, 5) == [
+        "one two three. four five.",
+        "six seven eight nine ten eleven.",
+        "x.",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drafts_are_published_as_chunks_complete() -> None:
+    llm = _FakeLLM(delays={1: 0.03, 2: 0.0, 3: 0.01})
+    drafts: list[str] = []
+
+    async def on_draft(draft: dict[str, Any]) -> None:
+        drafts.append(draft["summary_250"])
+
+    result = await _chunker(llm).process_chunks(
+        ["a", "b", "c"], "system", "en", req_id=1, on_draft=on_draft
+    )
+
+    assert drafts == ["part 2", "part 2 part 3", "part 1 part 2 part 3"]
+    assert result == {"summary_250": "synth 1", "tldr": "t"}
+
+
+@pytest.mark.asyncio
+async def test_long_articles_reduce_groups_while_later_chunks_run() -> None:
+    llm = _FakeLLM(delays={8: 0.05})
+
+    result = await _chunker(llm).process_chunks([f"c{i}" for i in range(8)], "system", "en", 1)
+
+    # The first group of six is synthesized before the slow last chunk finishes;
+    # the second group and the final merge follow.
+    assert llm.events.index("synth-1") < llm.events.index("chunk-8")
+    assert llm.events[-2:] == ["synth-2", "synth-3"]
+    assert result == {"summary_250": "synth 3", "tldr": "t"}
+
+
+@pytest.mark.asyncio
+async def test_straggler_chunk_is_retried_on_flash_model() -> None:
+    llm = _FakeLLM(delays={2: 5.0})
+
+    result = await _chunker(llm, budget_sec=0.05).process_chunks(["a", "b"], "system", "en", 1)
+
+    assert "flash/model" in llm.overrides
+    assert result == {"summary_250": "synth 1", "tldr": "t"}
@@ -0,0 +1,243 @@
+"""Concurrency, batching and latency metrics of the RSS poller."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+import pytest
+
+from app.adapters.rss import feed_poller
+from app.adapters.rss.feed_fetcher import FeedEntry, FeedResult
+
+_FEED_URLS = [
+    "https://slow.example/a.xml",
+    "https://slow.example/b.xml",
+    "https://slow.example/c.xml",
+    "https://slow.example/d.xml",
+    "https://fast.example/a.xml",
+    "https://other.example/a.xml",
+]
+
+
+class _BatchRSSRepo:
+    instance = None
+    fail_batch = False
+
+    def __init__(self, _db) -> None:
+        self.batch_calls: list[list[int]] = []
+        self.single_calls: list[int] = []
+        self.feed_errors: list[dict] = []
+        self.successes: list[int] = []
+        self._next_id = 1000
+        _BatchRSSRepo.instance = self
+
+    async def async_list_active_feeds(self):
+        return [
+            {"id": index + 1, "url": url, "etag": None, "last_modified": None}
+            for index, url in enumerate(_FEED_URLS)
+        ]
+
+    def _created(self, feed_id: int, items: list[dict]) -> list[dict]:
+        created = []
+        for item in items:
+            self._next_id += 1
+            created.append({"id": self._next_id, "feed_id": feed_id, **item})
+        return created
+
+    async def async_create_feed_items_batch(self, items_by_feed):
+        if self.fail_batch:
+            raise RuntimeError("batch insert failed")
+        self.batch_calls.append(sorted(items_by_feed))
+        return {feed_id: self._created(feed_id, items) for feed_id, items in items_by_feed.items()}
+
+    async def async_create_feed_items(self, *, feed_id, items):
+        self.single_calls.append(feed_id)
+        return self._created(feed_id, items)
+
+    async def async_list_delivery_targets(self, _item_ids):
+        return []
+
+    async def async_update_feed_fetch_success(self, **kwargs):
+        self.successes.append(kwargs["feed_id"])
+
+    async def async_record_feed_fetch_error(self, **kwargs):
+        self.feed_errors.append(kwargs)
+
+
+class _BatchSignalRepo:
+    instance = None
+
+    def __init__(self, _db) -> None:
+        self.source_batches: list[int] = []
+        self.item_batches: list[list[int]] = []
+        self.errors: list[dict] = []
+        self._ids: dict[str, int] = {}
+        _BatchSignalRepo.instance = self
+
+    def _source(self, payload: dict) -> dict:
+        source_id = self._ids.setdefault(payload["external_id"], 500 + len(self._ids))
+        return {"id": source_id, **payload}
+
+    async def async_upsert_sources(self, payloads):
+        self.source_batches.append(len(payloads))
+        return [self._source(payload) for payload in payloads]
+
+    async def async_upsert_source(self, **kwargs):
+        return self._source(kwargs)
+
+    async def async_upsert_feed_items_batch(self, items_by_source):
+        self.item_batches.append(sorted(items_by_source))
+        return dict(items_by_source)
+
+    async def async_subscribe_many(self, **_kwargs):
+        return None
+
+    async def async_record_source_fetch_success(self, _source_id: int):
+        return None
+
+    async def async_record_source_fetch_error(self, **kwargs):
+        self.errors.append(kwargs)
+        return False
+
+
+@pytest.fixture
+def repos(monkeypatch):
+    monkeypatch.setattr(feed_poller, "RSSFeedRepositoryAdapter", _BatchRSSRepo)
+    monkeypatch.setattr(feed_poller, "SignalSourceRepositoryAdapter", _BatchSignalRepo)
+    _BatchRSSRepo.fail_batch = False
+    latencies: list[str] = []
+    monkeypatch.setattr(
+        feed_poller,
+        "record_rss_feed_poll_latency",
+        lambda *, outcome, latency_seconds: latencies.append(outcome),
+    )
+    return SimpleNamespace(latencies=latencies)
+
+
+def _result(url: str) -> FeedResult:
+    return FeedResult(title=url, entries=[FeedEntry(guid=f"{url}#1", url=f"{url}/post")])
+
+
+@pytest.mark.asyncio
+async def test_poll_caps_parallel_fetches_globally_and_per_host(monkeypatch, repos) -> None:
+    in_flight: dict[str, int] = defaultdict(int)
+    peak_per_host: dict[str, int] = defaultdict(int)
+    peak_total = 0
+
+    async def fetch(url, **_kwargs):
+        nonlocal peak_total
+        host = urlparse(url).hostname or ""
+        in_flight[host] += 1
+        peak_per_host[host] = max(peak_per_host[host], in_flight[host])
+        peak_total = max(peak_total, sum(in_flight.values()))
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return _result(url)
+
+    monkeypatch.setattr(feed_poller, "fetch_feed_async", fetch)
+
+    stats = await feed_poller.poll_all_feeds(
+        SimpleNamespace(), concurrency=3, per_host_concurrency=2
+    )
+
+    assert stats["polled"] == len(_FEED_URLS)
+    assert peak_per_host["slow.example"] == 2
+    assert peak_total == 3
+
+
+@pytest.mark.asyncio
+async def test_poll_persists_fetched_feeds_in_batches(monkeypatch, repos) -> None:
+    async def fetch(url, **_kwargs):
+        return _result(url)
+
+    monkeypatch.setattr(feed_poller, "fetch_feed_async", fetch)
+
+    stats = await feed_poller.poll_all_feeds(SimpleNamespace())
+
+    rss_repo = _BatchRSSRepo.instance
+    signal_repo = _BatchSignalRepo.instance
+    assert stats["new_items"] == len(_FEED_URLS)
+    assert len(stats["new_item_ids"]) == len(_FEED_URLS)
+    # One upsert before fetching and one with fetched metadata, each for every feed.
+    assert signal_repo.source_batches == [len(_FEED_URLS), len(_FEED_URLS)]
+    assert rss_repo.batch_calls == [[1, 2, 3, 4, 5, 6]]
+    assert len(signal_repo.item_batches) == 1
+    assert len(signal_repo.item_batches[0]) == len(_FEED_URLS)
+    assert rss_repo.single_calls == []
+    assert repos.latencies == ["updated"] * len(_FEED_URLS)
+
+
+@pytest.mark.asyncio
+async def test_poll_falls_back_to_per_feed_inserts_when_batch_fails(monkeypatch, repos) -> None:
+    async def fetch(url, **_kwargs):
+        return _result(url)
+
+    monkeypatch.setattr(feed_poller, "fetch_feed_async", fetch)
+    _BatchRSSRepo.fail_batch = True
+
+    stats = await feed_poller.poll_all_feeds(SimpleNamespace())
+
+    assert stats["new_items"] == len(_FEED_URLS)
+    assert sorted(_BatchRSSRepo.instance.single_calls) == [1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_poll_isolates_failing_and_unchanged_feeds(monkeypatch, repos) -> None:
+    async def fetch(url, **_kwargs):
+        if url.startswith("https://fast.example"):
+            raise RuntimeError("connection reset")
+        if url.startswith("https://other.example"):
+            return FeedResult(not_modified=True)
+        return _result(url)
+
+    monkeypatch.setattr(feed_poller, "fetch_feed_async", fetch)
+
+    stats = await feed_poller.poll_all_feeds(SimpleNamespace())
+
+    assert stats == {
+        "polled": 4,
+        "new_items": 4,
+        "errors": 1,
+        "skipped": 1,
+        "new_item_ids": stats["new_item_ids"],
+    }
+    assert _BatchRSSRepo.instance.feed_errors[0]["feed_id"] == 5
+    assert _BatchSignalRepo.instance.errors[0]["error"] == "connection reset"
+    assert sorted(repos.latencies) == ["error", "not_modified"] + ["updated"] * 4
+
+
+@pytest.mark.asyncio
+async def test_poll_stops_fetches_before_closing_client_when_persist_fails(
+    monkeypatch, repos
+) -> None:
+    running = 0
+    closed_while_running: list[int] = []
+
+    class _Client:
+        async def aclose(self) -> None:
+            closed_while_running.append(running)
+
+    async def fetch(url, **_kwargs):
+        nonlocal running
+        running += 1
+        try:
+            if url.startswith("https://slow.example"):
+                await asyncio.sleep(10)
+            return _result(url)
+        finally:
+            running -= 1
+
+    async def fail_persist(*_args, **_kwargs):
+        raise RuntimeError("database down")
+
+    monkeypatch.setattr(feed_poller, "fetch_feed_async", fetch)
+    monkeypatch.setattr(feed_poller, "make_safe_async_client", lambda **_kwargs: _Client())
+    monkeypatch.setattr(feed_poller, "_persist_batch", fail_persist)
+
+    with pytest.raises(RuntimeError, match="database down"):
+        await feed_poller.poll_all_feeds(SimpleNamespace())
+
+    assert closed_while_running == [0]
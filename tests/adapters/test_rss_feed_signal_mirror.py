@@ -104,10 +104,9 @@ async def test_rss_poll_mirrors_new_items_into_signal_sources(monkeypatch):
 
     monkeypatch.setattr(feed_poller, "RSSFeedRepositoryAdapter", _FakeRSSRepo)
     monkeypatch.setattr(feed_poller, "SignalSourceRepositoryAdapter", _FakeSignalRepo)
-    monkeypatch.setattr(
-        feed_poller,
-        "fetch_feed",
-        lambda *_args, **_kwargs: FeedResult(
+
+    async def _fetch(*_args, **_kwargs):
+        return FeedResult(
             title="Example",
             description="Feed",
             site_url="https://example.com",
@@ -121,8 +120,9 @@ async def test_rss_poll_mirrors_new_items_into_signal_sources(monkeypatch):
                     published_at=dt.datetime(2026, 4, 30, tzinfo=UTC),
                 )
             ],
-        ),
-    )
+        )
+
+    monkeypatch.setattr(feed_poller, "fetch_feed_async", _fetch)
 
     stats = await feed_poller.poll_all_feeds(SimpleNamespace())
 
@@ -144,10 +144,10 @@ async def test_rss_poll_records_signal_source_error_for_broken_feed(monkeypatch)
     monkeypatch.setattr(feed_poller, "RSSFeedRepositoryAdapter", _FakeRSSRepo)
     monkeypatch.setattr(feed_poller, "SignalSourceRepositoryAdapter", _FakeSignalRepo)
 
-    def _broken_fetch(*_args, **_kwargs):
+    async def _broken_fetch(*_args, **_kwargs):
         raise RuntimeError("feed is broken")
 
-    monkeypatch.setattr(feed_poller, "fetch_feed", _broken_fetch)
+    monkeypatch.setattr(feed_poller, "fetch_feed_async", _broken_fetch)
 
     stats = await feed_poller.poll_all_feeds(SimpleNamespace())
 
@@ -0,0 +1,165 @@
+"""Tests for the cursor-based SyncRecordCollector.collect_page merge."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from app.api.services.sync import SyncEnvelopeSerializer, SyncRecordCollector
+
+_UPDATED_AT = "2026-01-01T00:00:00+00:00"
+
+
+def _row(row_id: Any, server_version: int, **extra: Any) -> dict[str, Any]:
+    return {"id": row_id, "server_version": server_version, "updated_at": _UPDATED_AT, **extra}
+
+
+def _since(rows: list[dict[str, Any]], since: int, limit: int) -> list[dict[str, Any]]:
+    matching = [row for row in rows if row["server_version"] > since]
+    matching.sort(key=lambda row: (row["server_version"], row["id"]))
+    return matching[:limit]
+
+
+class _FakeRepository:
+    def __init__(self, rows: list[dict[str, Any]], *, cursor: bool = True) -> None:
+        self.rows = rows
+        self.full_reads = 0
+        self.since_calls: list[tuple[int, int]] = []
+        if cursor:
+            self.async_get_for_user_since = self._get_since
+
+    async def async_get_all_for_user(self, _user_id: int) -> list[dict[str, Any]]:
+        self.full_reads += 1
+        return list(self.rows)
+
+    async def _get_since(self, _user_id: int, *, since: int, limit: int) -> list[dict[str, Any]]:
+        self.since_calls.append((since, limit))
+        return _since(self.rows, since, limit)
+
+
+class _FakeUserRepository:
+    def __init__(self, user: dict[str, Any] | None) -> None:
+        self.user = user
+
+    async def async_get_user_by_telegram_id(self, _user_id: int) -> dict[str, Any] | None:
+        return self.user
+
+
+class _FakeAuxReadPort:
+    def __init__(
+        self,
+        highlights: list[dict[str, Any]],
+        tags: list[dict[str, Any]],
+        summary_tags: list[dict[str, Any]],
+    ) -> None:
+        self.highlights = highlights
+        self.tags = tags
+        self.summary_tags = summary_tags
+
+    async def get_highlights_for_user(self, _user_id: int) -> list[dict[str, Any]]:
+        return list(self.highlights)
+
+    async def get_tags_for_user(self, _user_id: int) -> list[dict[str, Any]]:
+        return list(self.tags)
+
+    async def get_summary_tags_for_user(self, _user_id: int) -> list[dict[str, Any]]:
+        return list(self.summary_tags)
+
+    async def get_highlights_for_user_since(
+        self, _user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return _since(self.highlights, since, limit)
+
+    async def get_tags_for_user_since(
+        self, _user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return _since(self.tags, since, limit)
+
+    async def get_summary_tags_for_user_since(
+        self, _user_id: int, *, since: int, limit: int
+    ) -> list[dict[str, Any]]:
+        return _since(self.summary_tags, since, limit)
+
+
+def _collector(seed: int, *, cursor: bool = True, per_entity: int = 40) -> SyncRecordCollector:
+    rng = random.Random(seed)
+    versions = iter(rng.sample(range(1, 10_000), per_entity * 7 + 1))
+
+    def rows(**extra: Any) -> list[dict[str, Any]]:
+        return [_row(i, next(versions), **extra) for i in range(1, per_entity + 1)]
+
+    return SyncRecordCollector(
+        user_repository=_FakeUserRepository(
+            {"telegram_user_id": 7, "server_version": next(versions), "updated_at": _UPDATED_AT}
+        ),
+        request_repository=_FakeRepository(rows(type="url", status="ok"), cursor=cursor),
+        summary_repository=_FakeRepository(rows(request=1), cursor=cursor),
+        crawl_result_repository=_FakeRepository(rows(request=1), cursor=cursor),
+        llm_repository=_FakeRepository(rows(request=1), cursor=cursor),
+        aux_read_port=_FakeAuxReadPort(
+            [_row(f"hl-{i}", next(versions), summary_id=1) for i in range(per_entity)],
+            rows(name="tag"),
+            rows(summary_id=1, tag_id=1),
+        ),
+        serializer=SyncEnvelopeSerializer(),
+    )
+
+
+def _keys(records: list[Any]) -> list[tuple[str, str, int]]:
+    return [(rec.entity_type, str(rec.id), rec.server_version) for rec in records]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("limit", [1, 7, 50, 400])
+async def test_collect_page_walk_matches_materialized_pagination(seed: int, limit: int) -> None:
+    collector = _collector(seed)
+    records = await collector.collect_records(7)
+
+    since = 0
+    while True:
+        expected = SyncRecordCollector.paginate_records(records, since, limit)
+        page, has_more, next_since = await collector.collect_page(7, since=since, limit=limit)
+
+        assert _keys(page) == _keys(expected[0])
+        assert (has_more, next_since) == expected[1:]
+        if not has_more:
+            break
+        since = next_since
+
+
+@pytest.mark.asyncio
+async def test_collect_page_pushes_cursor_and_bound_into_queries() -> None:
+    collector = _collector(4)
+
+    await collector.collect_page(7, since=1234, limit=25)
+
+    repo = collector._request_repo
+    assert repo.since_calls == [(1234, 26)]
+    assert repo.full_reads == 0
+
+
+@pytest.mark.asyncio
+async def test_collect_page_falls_back_to_full_reads_without_cursor_queries() -> None:
+    cursor = _collector(5)
+    legacy = _collector(5, cursor=False)
+
+    page, has_more, next_since = await legacy.collect_page(7, since=500, limit=30)
+
+    assert legacy._summary_repo.full_reads == 1
+    assert _keys(page) == _keys((await cursor.collect_page(7, since=500, limit=30))[0])
+    assert has_more is True
+    assert next_since == page[-1].server_version
+
+
+@pytest.mark.asyncio
+async def test_collect_page_returns_since_when_nothing_changed() -> None:
+    collector = _collector(6)
+
+    page, has_more, next_since = await collector.collect_page(7, since=10_000, limit=10)
+
+    assert page == []
+    assert has_more is False
+    assert next_since == 10_000
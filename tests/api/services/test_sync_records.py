@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.api.models.responses import SyncEntityEnvelope
+from app.api.services.sync import SyncRecordCollector
 from app.api.services.sync_service import SyncService
 from app.core.time_utils import UTC
 
@@ -26,6 +27,15 @@ def make_sync_envelope(
     )
 
 
+def _paginated(records: list[SyncEntityEnvelope]):
+    """Build a ``_collect_page`` side effect that pages over *records*."""
+
+    def collect_page(_user_id: int, *, since: int, limit: int):
+        return SyncRecordCollector.paginate_records(records, since, limit)
+
+    return collect_page
+
+
 @pytest.fixture
 def mock_config():
     """Create mock AppConfig."""
@@ -220,11 +230,11 @@ class TestGetFull:
             sync_service, "_load_session", new_callable=AsyncMock, return_value=session_payload
         ):
             with patch.object(
-                sync_service, "_collect_records", new_callable=AsyncMock
+                sync_service, "_collect_page", new_callable=AsyncMock
             ) as mock_collect:
-                mock_collect.return_value = [
-                    make_sync_envelope(entity_id=i, server_version=i) for i in range(1, 6)
-                ]
+                mock_collect.side_effect = _paginated(
+                    [make_sync_envelope(entity_id=i, server_version=i) for i in range(1, 6)]
+                )
 
                 result = await sync_service.get_full(
                     session_id="test-session", user_id=123, client_id="test-client", limit=10
@@ -251,12 +261,12 @@ class TestGetFull:
             sync_service, "_load_session", new_callable=AsyncMock, return_value=session_payload
         ):
             with patch.object(
-                sync_service, "_collect_records", new_callable=AsyncMock
+                sync_service, "_collect_page", new_callable=AsyncMock
             ) as mock_collect:
                 # 200+ records to ensure pagination with limit=100
-                mock_collect.return_value = [
-                    make_sync_envelope(entity_id=i, server_version=i) for i in range(1, 151)
-                ]
+                mock_collect.side_effect = _paginated(
+                    [make_sync_envelope(entity_id=i, server_version=i) for i in range(1, 151)]
+                )
 
                 # Use limit=50 to override session chunk_limit
                 result = await sync_service.get_full(
@@ -287,12 +297,14 @@ class TestGetDelta:
             sync_service, "_load_session", new_callable=AsyncMock, return_value=session_payload
         ):
             with patch.object(
-                sync_service, "_collect_records", new_callable=AsyncMock
+                sync_service, "_collect_page", new_callable=AsyncMock
             ) as mock_collect:
-                mock_collect.return_value = [
-                    make_sync_envelope(entity_id=i, server_version=i, deleted_at=None)
-                    for i in range(5, 8)
-                ]
+                mock_collect.side_effect = _paginated(
+                    [
+                        make_sync_envelope(entity_id=i, server_version=i, deleted_at=None)
+                        for i in range(5, 8)
+                    ]
+                )
 
                 result = await sync_service.get_delta(
                     session_id="test-session",
@@ -324,13 +336,15 @@ class TestGetDelta:
             sync_service, "_load_session", new_callable=AsyncMock, return_value=session_payload
         ):
             with patch.object(
-                sync_service, "_collect_records", new_callable=AsyncMock
+                sync_service, "_collect_page", new_callable=AsyncMock
             ) as mock_collect:
                 deleted_time = now.isoformat() + "Z"
-                mock_collect.return_value = [
-                    make_sync_envelope(entity_id=5, server_version=5, deleted_at=None),
-                    make_sync_envelope(entity_id=6, server_version=6, deleted_at=deleted_time),
-                ]
+                mock_collect.side_effect = _paginated(
+                    [
+                        make_sync_envelope(entity_id=5, server_version=5, deleted_at=None),
+                        make_sync_envelope(entity_id=6, server_version=6, deleted_at=deleted_time),
+                    ]
+                )
 
                 result = await sync_service.get_delta(
                     session_id="test-session",
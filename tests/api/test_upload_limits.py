@@ -85,7 +85,7 @@ def test_import_too_many_bookmarks(client: TestClient, db):
 
     fake_bookmarks = [{"url": f"https://example.com/{i}"} for i in range(3)]
     mock_parser_cls = MagicMock()
-    mock_parser_cls.return_value.parse.return_value = fake_bookmarks
+    mock_parser_cls.return_value.iter_parse.return_value = iter(fake_bookmarks)
 
     with (
         patch("app.api.routers.import_export.load_config", return_value=mock_cfg),
@@ -124,7 +124,7 @@ def test_import_success(client: TestClient, db):
 
     fake_bookmarks = [MagicMock(url="https://example.com/1", created_at=None)]
     mock_parser_cls = MagicMock()
-    mock_parser_cls.return_value.parse.return_value = fake_bookmarks
+    mock_parser_cls.return_value.iter_parse.return_value = iter(fake_bookmarks)
 
     mock_job = {"id": 99, "status": "pending", "total_items": 1}
 
@@ -0,0 +1,122 @@
+"""Tests for the MinHash engine and LSH band index used by signal dedupe."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.application.services.signal_minhash import (
+    MINHASH_SIGNATURE_SIZE,
+    MinHasher,
+    MinHashLSHIndex,
+    minhash_band_key,
+    signature_similarity,
+)
+
+pytest.importorskip("numpy")
+
+_VOCAB = [f"word{i}" for i in range(400)]
+
+
+def _shingles(tokens: list[str], width: int = 4) -> set[str]:
+    return {" ".join(tokens[idx : idx + width]) for idx in range(len(tokens) - width + 1)}
+
+
+def _corpus(seed: int, count: int) -> list[set[str]]:
+    rng = random.Random(seed)
+    bases = [[rng.choice(_VOCAB) for _ in range(30)] for _ in range(count // 3)]
+    documents: list[set[str]] = []
+    for _ in range(count):
+        tokens = list(rng.choice(bases))
+        for _ in range(rng.randint(0, 8)):
+            tokens[rng.randrange(len(tokens))] = rng.choice(_VOCAB)
+        documents.append(_shingles(tokens))
+    return documents
+
+
+def test_numpy_and_python_signatures_are_identical() -> None:
+    documents = [*_corpus(1, 40), set(), {"single shingle"}]
+
+    vectorized = MinHasher(use_numpy=True).signatures(documents)
+    scalar = MinHasher(use_numpy=False).signatures(documents)
+
+    assert vectorized == scalar
+    assert vectorized[-2] is None
+    assert all(len(sig) == MINHASH_SIGNATURE_SIZE for sig in vectorized if sig is not None)
+    assert all(0 <= value <= 0xFFFFFFFF for sig in vectorized if sig for value in sig)
+
+
+def test_signature_is_order_independent_and_deterministic() -> None:
+    shingles = ["a b c d", "b c d e", "c d e f"]
+
+    assert MinHasher().signature(shingles) == MinHasher().signature(list(reversed(shingles)))
+
+
+def test_signature_similarity_tracks_jaccard() -> None:
+    hasher = MinHasher()
+    tokens = [f"t{i}" for i in range(60)]
+    left = _shingles(tokens)
+    right = _shingles(tokens[:45] + [f"x{i}" for i in range(15)])
+    jaccard = len(left & right) / len(left | right)
+
+    estimate = signature_similarity(hasher.signature(left), hasher.signature(right))
+
+    assert estimate == pytest.approx(jaccard, abs=0.2)
+
+
+@pytest.mark.parametrize("seed", [3, 11, 29])
+def test_lsh_index_matches_all_pairs_scan(seed: int) -> None:
+    threshold = 0.55
+    signatures = [sig for sig in MinHasher().signatures(_corpus(seed, 150)) if sig]
+
+    def brute_force() -> list[int]:
+        kept: list[tuple[int, ...]] = []
+        kept_ids: list[int] = []
+        for idx, sig in enumerate(signatures):
+            if any(signature_similarity(sig, other) >= threshold for other in kept):
+                continue
+            kept.append(sig)
+            kept_ids.append(idx)
+        return kept_ids
+
+    def with_index() -> list[int]:
+        index = MinHashLSHIndex(threshold=threshold)
+        kept_ids: list[int] = []
+        for idx, sig in enumerate(signatures):
+            if index.find_near_duplicate(sig) is not None:
+                continue
+            index.add(idx, sig)
+            kept_ids.append(idx)
+        return kept_ids
+
+    assert with_index() == brute_force()
+
+
+def test_lsh_index_skips_unrelated_signatures() -> None:
+    hasher = MinHasher()
+    index = MinHashLSHIndex()
+    for idx in range(50):
+        index.add(idx, hasher.signature(_shingles([f"doc{idx}-{i}" for i in range(20)])))
+
+    probe = hasher.signature(_shingles([f"probe-{i}" for i in range(20)]))
+
+    assert len(index) == 50
+    assert index.candidates(probe) == set()
+    assert index.find_near_duplicate(probe) is None
+
+
+def test_lsh_index_rejects_short_signatures() -> None:
+    with pytest.raises(ValueError, match="shorter"):
+        MinHashLSHIndex(bands=32, rows=2).add(1, (1, 2, 3))
+
+
+def test_minhash_band_key_format() -> None:
+    signature = MinHasher().signature(["a b c d", "b c d e", "c d e f"])
+
+    key = minhash_band_key(signature)
+
+    assert key is not None
+    assert key.startswith("minhash:")
+    assert len(key) == len("minhash:") + 8
+    assert minhash_band_key((1, 2, 3)) is None
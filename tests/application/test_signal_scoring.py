@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Sequence
 
 import pytest
 
@@ -26,6 +27,19 @@ class _FakeTopicSimilarity:
         return self._scores.get(candidate.feed_item_id, 0.0)
 
 
+class _FakeBatchTopicSimilarity(_FakeTopicSimilarity):
+    def __init__(self, scores: dict[int, float]) -> None:
+        super().__init__(scores)
+        self.batch_sizes: list[int] = []
+
+    async def score_item(self, candidate: SignalCandidate) -> float:
+        raise AssertionError("batch-capable ports must not be scored per item")
+
+    async def score_items(self, candidates: Sequence[SignalCandidate]) -> list[float]:
+        self.batch_sizes.append(len(candidates))
+        return [self._scores.get(candidate.feed_item_id, 0.0) for candidate in candidates]
+
+
 @pytest.mark.asyncio
 async def test_signal_scoring_rejects_90_percent_before_llm_judge():
     now = dt.datetime(2026, 4, 30, tzinfo=UTC)
@@ -115,11 +129,13 @@ async def test_signal_scoring_dedupes_near_duplicate_text_with_minhash():
             feed_item_id=2,
             source_id=2,
             source_kind="rss",
-            title="Python packaging migration guide for teams",
+            title="Python packaging migration guide",
             canonical_url="https://example.net/b",
             published_at=now,
             metadata={
-                "content_text": "A Python packaging migration guide for teams moving from setup.py"
+                "content_text": (
+                    "Python packaging migration guide for teams moving from setup.py today"
+                )
             },
         ),
     ]
@@ -129,3 +145,61 @@ async def test_signal_scoring_dedupes_near_duplicate_text_with_minhash():
 
     assert [item.feed_item_id for item in scored] == [1]
     assert str(scored[0].evidence["minhash_key"]).startswith("minhash:")
+    assert scored[0].evidence["minhash_version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_signal_scoring_keeps_distinct_text_with_shared_prefix():
+    now = dt.datetime(2026, 4, 30, tzinfo=UTC)
+    candidates = [
+        SignalCandidate(
+            feed_item_id=1,
+            source_id=1,
+            source_kind="rss",
+            title="Python packaging migration guide",
+            canonical_url="https://example.com/a",
+            published_at=now,
+            metadata={"content_text": "How to move a monorepo from setup.py to pyproject.toml"},
+        ),
+        SignalCandidate(
+            feed_item_id=2,
+            source_id=2,
+            source_kind="rss",
+            title="Python packaging migration guide",
+            canonical_url="https://example.net/b",
+            published_at=now,
+            metadata={"content_text": "Why our data team rewrote every notebook in Rust instead"},
+        ),
+    ]
+    service = SignalScoringService(topic_similarity=_FakeTopicSimilarity({1: 1.0, 2: 1.0}))
+
+    scored = await service.score(candidates, now=now)
+
+    assert [item.feed_item_id for item in scored] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_signal_scoring_batch_port_matches_per_item_port():
+    now = dt.datetime(2026, 4, 30, tzinfo=UTC)
+    candidates = [
+        SignalCandidate(
+            feed_item_id=i,
+            source_id=i % 3,
+            source_kind="rss",
+            title=f"Item {i}",
+            canonical_url=f"https://example.com/{i}",
+            published_at=now - dt.timedelta(hours=i),
+            views=i * 5,
+        )
+        for i in range(30)
+    ]
+    scores = {i: (i % 7) / 7 for i in range(30)}
+    batch_port = _FakeBatchTopicSimilarity(scores)
+
+    batched = await SignalScoringService(topic_similarity=batch_port).score(candidates, now=now)
+    single = await SignalScoringService(topic_similarity=_FakeTopicSimilarity(scores)).score(
+        candidates, now=now
+    )
+
+    assert batch_port.batch_sizes == [30]
+    assert batched == single
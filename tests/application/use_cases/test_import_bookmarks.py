@@ -0,0 +1,163 @@
+"""Tests for the chunked ImportBookmarksUseCase."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.application.dto.import_bookmarks import BookmarkImportItemResult, ImportBookmarksCommand
+from app.application.use_cases.import_pipeline import ImportBookmarksUseCase
+from app.domain.services.import_parsers.base import ImportedBookmark
+
+# ---------------------------------------------------------------------------
+# Helpers / stubs
+# ---------------------------------------------------------------------------
+
+
+class _FakeJobRepo:
+    def __init__(self) -> None:
+        self.statuses: list[str] = []
+        self.progress: list[dict[str, Any]] = []
+
+    async def async_set_status(self, job_id: int, status: str) -> None:
+        self.statuses.append(status)
+
+    async def async_update_progress(self, job_id: int, **counters: Any) -> None:
+        self.progress.append(counters)
+
+
+class _FakeImportRepo:
+    """Records chunk sizes and peak concurrency; ``fail_bulk_on`` URLs break a chunk."""
+
+    def __init__(self, *, fail_bulk_on: set[str] | None = None) -> None:
+        self.fail_bulk_on = fail_bulk_on or set()
+        self.chunks: list[int] = []
+        self.single_calls = 0
+        self.active = 0
+        self.peak = 0
+        self.seen: set[str] = set()
+
+    def _outcome(self, bookmark: ImportedBookmark) -> BookmarkImportItemResult:
+        if bookmark.url.startswith("bad:"):
+            return BookmarkImportItemResult(
+                url=bookmark.url, outcome="failed", error=f"{bookmark.url}: invalid"
+            )
+        if bookmark.url in self.seen:
+            return BookmarkImportItemResult(url=bookmark.url, outcome="skipped")
+        self.seen.add(bookmark.url)
+        return BookmarkImportItemResult(url=bookmark.url, outcome="created")
+
+    async def async_import_bookmarks(
+        self, bookmarks: Any, *, user_id: int, options: dict[str, Any]
+    ) -> list[BookmarkImportItemResult]:
+        self.chunks.append(len(bookmarks))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0)
+            if any(b.url in self.fail_bulk_on for b in bookmarks):
+                raise RuntimeError("bulk insert failed")
+            return [self._outcome(b) for b in bookmarks]
+        finally:
+            self.active -= 1
+
+    async def async_import_bookmark(
+        self, bookmark: ImportedBookmark, *, user_id: int, options: dict[str, Any]
+    ) -> BookmarkImportItemResult:
+        self.single_calls += 1
+        if bookmark.url in self.fail_bulk_on:
+            raise RuntimeError("row rejected")
+        return self._outcome(bookmark)
+
+
+def _bookmarks(urls: list[str]):
+    # A generator: the use case must not need len() or indexing.
+    return (ImportedBookmark(url=url) for url in urls)
+
+
+def _command(urls: list[str]) -> ImportBookmarksCommand:
+    return ImportBookmarksCommand(job_id=1, bookmarks=_bookmarks(urls), user_id=7)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_imports_in_bounded_concurrent_chunks() -> None:
+    jobs, imports = _FakeJobRepo(), _FakeImportRepo()
+    use_case = ImportBookmarksUseCase(
+        import_job_repository=jobs,
+        bookmark_import_repository=imports,
+        chunk_size=10,
+        max_concurrent_chunks=3,
+    )
+    urls = [f"https://example.com/{i}" for i in range(95)]
+
+    snapshot = await use_case.execute(_command([*urls, urls[0]]))
+
+    assert imports.chunks == [10] * 9 + [6]
+    assert imports.peak == 3
+    assert imports.single_calls == 0
+    assert (snapshot.processed, snapshot.created, snapshot.skipped, snapshot.failed) == (
+        96,
+        95,
+        1,
+        0,
+    )
+    assert snapshot.status == "completed"
+    assert jobs.statuses == ["processing", "completed"]
+
+
+@pytest.mark.asyncio
+async def test_progress_is_flushed_when_a_chunk_crosses_the_interval() -> None:
+    jobs = _FakeJobRepo()
+    use_case = ImportBookmarksUseCase(
+        import_job_repository=jobs,
+        bookmark_import_repository=_FakeImportRepo(),
+        progress_flush_interval=10,
+        chunk_size=4,
+        max_concurrent_chunks=1,
+    )
+
+    await use_case.execute(_command([f"https://example.com/{i}" for i in range(22)]))
+
+    # Chunks end at 4, 8, 12, 16, 20, 22; flushes at 12 and 20, then the final snapshot.
+    assert [p["processed"] for p in jobs.progress] == [12, 20, 22]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_falls_back_to_single_imports() -> None:
+    imports = _FakeImportRepo(fail_bulk_on={"https://example.com/3"})
+    use_case = ImportBookmarksUseCase(
+        import_job_repository=_FakeJobRepo(),
+        bookmark_import_repository=imports,
+        chunk_size=5,
+    )
+
+    snapshot = await use_case.execute(
+        _command([*(f"https://example.com/{i}" for i in range(10)), "bad:url"])
+    )
+
+    assert imports.single_calls == 5
+    assert (snapshot.processed, snapshot.created, snapshot.failed) == (11, 9, 2)
+    assert snapshot.errors == ["https://example.com/3: row rejected", "bad:url: invalid"]
+    assert snapshot.status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_all_failed_marks_job_failed() -> None:
+    jobs = _FakeJobRepo()
+    use_case = ImportBookmarksUseCase(
+        import_job_repository=jobs,
+        bookmark_import_repository=_FakeImportRepo(),
+    )
+
+    snapshot = await use_case.execute(_command(["bad:1", "bad:2"]))
+
+    assert snapshot.status == "failed"
+    assert snapshot.failed == 2
+    assert jobs.statuses == ["processing", "failed"]
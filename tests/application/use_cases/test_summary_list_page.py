@@ -0,0 +1,69 @@
+"""Tests for the keyset list-view page of the summary read model."""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any, cast
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api.exceptions import ValidationError
+from app.api.routers.content.summaries import _decode_list_cursor, _encode_list_cursor
+from app.application.use_cases.summary_read_model import SummaryReadModelUseCase
+
+
+def _use_case(repo: Any) -> SummaryReadModelUseCase:
+    return SummaryReadModelUseCase(
+        summary_repository=cast("Any", repo),
+        request_repository=AsyncMock(),
+        crawl_result_repository=AsyncMock(),
+        llm_repository=AsyncMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_page_fetches_one_extra_card_to_detect_more() -> None:
+    repo = AsyncMock()
+    repo.async_get_user_summary_cards.return_value = [{"id": i} for i in range(3)]
+    repo.async_get_user_summary_counts.return_value = (10, 4)
+    after = (dt.datetime(2026, 1, 1, tzinfo=dt.UTC), 7)
+
+    cards, has_more, total, unread = await _use_case(repo).get_user_summary_page(
+        42, limit=2, after=after, is_read=False, search="  "
+    )
+
+    assert [card["id"] for card in cards] == [0, 1]
+    assert (has_more, total, unread) == (True, 10, 4)
+    call = repo.async_get_user_summary_cards.await_args
+    assert call.kwargs["limit"] == 3
+    assert call.kwargs["after"] == after
+    assert call.kwargs["search"] is None
+    assert repo.async_get_user_summary_counts.await_args.kwargs["is_read"] is False
+
+
+@pytest.mark.asyncio
+async def test_last_page_reports_no_more() -> None:
+    repo = AsyncMock()
+    repo.async_get_user_summary_cards.return_value = [{"id": 1}]
+    repo.async_get_user_summary_counts.return_value = (1, 0)
+
+    cards, has_more, _, _ = await _use_case(repo).get_user_summary_page(42, limit=2)
+
+    assert cards == [{"id": 1}]
+    assert has_more is False
+
+
+def test_list_cursor_round_trips() -> None:
+    created_at = dt.datetime(2026, 3, 4, 5, 6, 7, 891011, tzinfo=dt.UTC)
+
+    cursor = _encode_list_cursor({"request": {"created_at": created_at, "id": 99}})
+
+    assert "=" not in cursor
+    assert _decode_list_cursor(cursor) == (created_at, 99)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!!", "bnVsbA", "WyJ4IiwxXQ"])
+def test_invalid_list_cursor_is_a_validation_error(cursor: str) -> None:
+    with pytest.raises(ValidationError):
+        _decode_list_cursor(cursor)
@@ -0,0 +1,191 @@
+"""Benchmarks for backup archive creation on a 20k-summary account (Postgres).
+
+Compares the streaming writer (``async_create_backup_archive``: server-side
+cursors into NDJSON ZIP entries on disk) with the previous approach of loading
+every table as ORM objects and serialising each one with ``json.dumps`` into an
+in-memory ZIP. Wall time comes from pytest-benchmark; peak Python heap from
+``tracemalloc`` is recorded in ``extra_info``. The streaming peak should stay
+near one cursor batch while the legacy peak grows with the account.
+
+Needs ``TEST_DATABASE_URL``; the account is seeded once per module and removed
+afterwards.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tracemalloc
+import zipfile
+from io import BytesIO
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+pytest_benchmark = pytest.importorskip("pytest_benchmark")
+
+from sqlalchemy import delete, insert, select
+
+from app.config.backup import BackupConfig
+from app.config.database import DatabaseConfig
+from app.db.models import Request, Summary, User, UserBackup, model_to_dict
+from app.db.session import Database
+from app.infrastructure.persistence.backup_archive_service import async_create_backup_archive
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+_USER_ID = 919_191
+_SUMMARIES = 20_000
+_CHUNK = 5_000
+_PAYLOAD = {
+    "tldr": "Short overview of the article.",
+    "summary_250": "A compact summary. " * 10,
+    "summary_1000": "A longer summary body. " * 60,
+    "key_ideas": ["idea"] * 10,
+    "topic_tags": ["#bench"],
+}
+
+
+async def _seed(database: Database) -> None:
+    async with database.transaction() as session:
+        session.add(User(telegram_user_id=_USER_ID, username="backup-bench"))
+        await session.flush()
+        for offset in range(0, _SUMMARIES, _CHUNK):
+            request_ids = (
+                await session.execute(
+                    insert(Request)
+                    .values(
+                        [
+                            {
+                                "type": "url",
+                                "status": "ok",
+                                "user_id": _USER_ID,
+                                "input_url": f"https://example.com/backup/{i}",
+                                "dedupe_hash": f"bench-backup-{i}",
+                            }
+                            for i in range(offset, offset + _CHUNK)
+                        ]
+                    )
+                    .returning(Request.id)
+                )
+            ).scalars()
+            await session.execute(
+                insert(Summary).values(
+                    [
+                        {"request_id": rid, "lang": "en", "json_payload": _PAYLOAD}
+                        for rid in request_ids
+                    ]
+                )
+            )
+
+
+async def _cleanup(database: Database) -> None:
+    async with database.transaction() as session:
+        owned = select(Request.id).where(Request.user_id == _USER_ID)
+        await session.execute(delete(Summary).where(Summary.request_id.in_(owned)))
+        await session.execute(delete(Request).where(Request.user_id == _USER_ID))
+        await session.execute(delete(UserBackup).where(UserBackup.user_id == _USER_ID))
+        await session.execute(delete(User).where(User.telegram_user_id == _USER_ID))
+
+
+async def _legacy_archive(database: Database) -> bytes:
+    """The pre-streaming shape: whole tables as ORM objects, then one json.dumps each."""
+    async with database.transaction() as session:
+        requests = (
+            (await session.execute(select(Request).where(Request.user_id == _USER_ID)))
+            .scalars()
+            .all()
+        )
+        summaries = (
+            (
+                await session.execute(
+                    select(Summary)
+                    .join(Request, Summary.request_id == Request.id)
+                    .where(Request.user_id == _USER_ID)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        requests_data = [model_to_dict(row) for row in requests]
+        summaries_data = [model_to_dict(row) for row in summaries]
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("requests.json", json.dumps(requests_data, default=str))
+        archive.writestr("summaries.json", json.dumps(summaries_data, default=str))
+    return buf.getvalue()
+
+
+async def _streaming_archive(database: Database, data_dir: Path) -> None:
+    async with database.transaction() as session:
+        backup = UserBackup(user_id=_USER_ID, type="manual", status="pending")
+        session.add(backup)
+        await session.flush()
+        backup_id = backup.id
+    await async_create_backup_archive(
+        _USER_ID, backup_id, db=database, data_dir=str(data_dir), cfg=BackupConfig()
+    )
+
+
+def _peak_heap(loop: asyncio.AbstractEventLoop, run: Callable[[], Awaitable[Any]]) -> int:
+    tracemalloc.start()
+    try:
+        loop.run_until_complete(run())
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture(scope="module")
+def account() -> Any:
+    dsn = os.getenv("TEST_DATABASE_URL", "")
+    if not dsn:
+        pytest.skip("TEST_DATABASE_URL is required for the backup archive benchmark")
+    loop = asyncio.new_event_loop()
+    database = Database(DatabaseConfig(dsn=dsn, pool_size=2, max_overflow=0))
+    loop.run_until_complete(database.migrate())
+    loop.run_until_complete(_cleanup(database))
+    loop.run_until_complete(_seed(database))
+    try:
+        yield loop, database
+    finally:
+        loop.run_until_complete(_cleanup(database))
+        loop.run_until_complete(database.dispose())
+        loop.close()
+
+
+class TestBackupArchiveBenchmarks:
+    """Legacy in-memory archive vs streaming NDJSON archive."""
+
+    def test_legacy_in_memory_archive(self, benchmark, account) -> None:
+        loop, database = account
+
+        archive = benchmark.pedantic(
+            lambda: loop.run_until_complete(_legacy_archive(database)),
+            rounds=3,
+            iterations=1,
+        )
+
+        assert archive
+        benchmark.extra_info["summaries"] = _SUMMARIES
+        benchmark.extra_info["peak_heap_bytes"] = _peak_heap(
+            loop, lambda: _legacy_archive(database)
+        )
+
+    def test_streaming_archive(self, benchmark, account, tmp_path) -> None:
+        loop, database = account
+
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(_streaming_archive(database, tmp_path)),
+            rounds=3,
+            iterations=1,
+        )
+
+        streaming_peak = _peak_heap(loop, lambda: _streaming_archive(database, tmp_path))
+        legacy_peak = _peak_heap(loop, lambda: _legacy_archive(database))
+        benchmark.extra_info["summaries"] = _SUMMARIES
+        benchmark.extra_info["peak_heap_bytes"] = streaming_peak
+        assert streaming_peak < legacy_peak / 4
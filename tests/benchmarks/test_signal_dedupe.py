@@ -0,0 +1,80 @@
+"""Benchmarks for MinHash signatures and LSH near-duplicate dedupe of signals."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pytest_benchmark = pytest.importorskip("pytest_benchmark")
+pytest.importorskip("numpy")
+
+from app.application.services.signal_minhash import MinHasher
+from app.application.services.signal_scoring import (
+    SignalCandidate,
+    SignalScoringService,
+    _candidate_text,
+    _word_shingles,
+)
+
+_VOCAB = [f"term{i}" for i in range(2000)]
+
+
+def _candidates(count: int) -> list[SignalCandidate]:
+    rng = random.Random(count)
+    stories = [" ".join(rng.choice(_VOCAB) for _ in range(60)) for _ in range(max(1, count // 4))]
+    candidates: list[SignalCandidate] = []
+    for i in range(count):
+        words = rng.choice(stories).split()
+        for _ in range(rng.randint(0, 20)):
+            words[rng.randrange(len(words))] = rng.choice(_VOCAB)
+        candidates.append(
+            SignalCandidate(
+                feed_item_id=i,
+                source_id=i % 50,
+                source_kind="rss",
+                title=" ".join(words[:8]),
+                canonical_url=f"https://example.com/{i}",
+                metadata={"content_text": " ".join(words[8:])},
+            )
+        )
+    return candidates
+
+
+class _ReadyTopicSimilarity:
+    def is_ready(self) -> bool:
+        return True
+
+    async def score_item(self, candidate: SignalCandidate) -> float:
+        return 0.0
+
+
+class TestSignalDedupeBenchmarks:
+    """Signature throughput and dedupe cost for large ingestion batches."""
+
+    @pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "python"])
+    def test_signature_throughput(self, benchmark, use_numpy: bool) -> None:
+        shingle_sets = [_word_shingles(_candidate_text(c)) for c in _candidates(500)]
+        hasher = MinHasher(use_numpy=use_numpy)
+
+        signatures = benchmark.pedantic(
+            hasher.signatures, args=(shingle_sets,), rounds=3, iterations=1
+        )
+
+        assert len(signatures) == 500
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["signatures_per_sec"] = round(500 / mean) if mean > 0 else 0
+
+    @pytest.mark.parametrize("count", [1_000, 10_000])
+    def test_dedupe_throughput(self, benchmark, count: int) -> None:
+        candidates = _candidates(count)
+        service = SignalScoringService(topic_similarity=_ReadyTopicSimilarity())
+
+        def dedupe() -> int:
+            return len(service._dedupe(candidates, service._minhash_keys(candidates)))
+
+        kept = benchmark.pedantic(dedupe, rounds=3, iterations=1)
+
+        assert 0 < kept < count
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["candidates_per_sec"] = round(count / mean) if mean > 0 else 0
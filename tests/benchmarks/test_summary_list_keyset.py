@@ -0,0 +1,155 @@
+"""Benchmarks for summary list pages on a 50k-summary archive (Postgres).
+
+Compares three reads of one 20-card page: the first page, a deep page reached
+by ``OFFSET`` (the legacy ``async_get_user_summaries`` query) and the same
+deep page reached by keyset cursor (``async_get_user_summary_cards``). With the
+``(user_id, created_at, id)`` index the keyset page is an index seek, so its
+cost should match the first page while the ``OFFSET`` page scans everything
+before it. Counters are excluded here; they are cached per user.
+
+Needs ``TEST_DATABASE_URL``; the archive is seeded once per module and removed
+afterwards.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import os
+from typing import Any
+
+import pytest
+
+pytest_benchmark = pytest.importorskip("pytest_benchmark")
+
+from sqlalchemy import delete, insert, select
+
+from app.config.database import DatabaseConfig
+from app.core.time_utils import UTC
+from app.db.models import Request, Summary
+from app.db.session import Database
+from app.infrastructure.persistence.repositories.summary_repository import (
+    SummaryRepositoryAdapter,
+)
+
+_USER_ID = 909_090
+_ARCHIVE = 50_000
+_PAGE = 20
+_CHUNK = 5_000
+_PAYLOAD = {
+    "tldr": "Short overview of the article.",
+    "summary_250": "A compact summary. " * 10,
+    "summary_1000": "A longer summary body. " * 60,
+    "key_ideas": ["idea"] * 10,
+    "topic_tags": ["#bench"],
+    "metadata": {"title": "Benchmark article", "domain": "example.com"},
+}
+
+
+async def _seed(database: Database) -> None:
+    start = dt.datetime(2024, 1, 1, tzinfo=UTC)
+    async with database.transaction() as session:
+        for offset in range(0, _ARCHIVE, _CHUNK):
+            request_ids = (
+                await session.execute(
+                    insert(Request)
+                    .values(
+                        [
+                            {
+                                "type": "url",
+                                "status": "ok",
+                                "user_id": _USER_ID,
+                                "input_url": f"https://example.com/bench/{i}",
+                                "dedupe_hash": f"bench-list-{i}",
+                                "created_at": start + dt.timedelta(minutes=i),
+                            }
+                            for i in range(offset, offset + _CHUNK)
+                        ]
+                    )
+                    .returning(Request.id)
+                )
+            ).scalars()
+            await session.execute(
+                insert(Summary).values(
+                    [
+                        {"request_id": rid, "lang": "en", "json_payload": _PAYLOAD}
+                        for rid in request_ids
+                    ]
+                )
+            )
+
+
+async def _cleanup(database: Database) -> None:
+    async with database.transaction() as session:
+        owned = select(Request.id).where(Request.user_id == _USER_ID)
+        await session.execute(delete(Summary).where(Summary.request_id.in_(owned)))
+        await session.execute(delete(Request).where(Request.user_id == _USER_ID))
+
+
+@pytest.fixture(scope="module")
+def archive() -> Any:
+    dsn = os.getenv("TEST_DATABASE_URL", "")
+    if not dsn:
+        pytest.skip("TEST_DATABASE_URL is required for the summary list benchmark")
+    loop = asyncio.new_event_loop()
+    database = Database(DatabaseConfig(dsn=dsn, pool_size=2, max_overflow=0))
+    loop.run_until_complete(database.migrate())
+    loop.run_until_complete(_cleanup(database))
+    loop.run_until_complete(_seed(database))
+    repo = SummaryRepositoryAdapter(database)
+    # Cursor of the card just before the last page.
+    boundary = loop.run_until_complete(
+        repo.async_get_user_summary_cards(
+            _USER_ID, limit=1, offset=_ARCHIVE - _PAGE - 1, sort="created_at_desc"
+        )
+    )[0]["request"]
+    try:
+        yield loop, repo, (boundary["created_at"], boundary["id"])
+    finally:
+        loop.run_until_complete(_cleanup(database))
+        loop.run_until_complete(database.dispose())
+        loop.close()
+
+
+class TestSummaryListKeysetBenchmarks:
+    """First page vs deep page by OFFSET vs deep page by keyset cursor."""
+
+    def test_first_page(self, benchmark, archive) -> None:
+        loop, repo, _ = archive
+
+        cards = benchmark.pedantic(
+            lambda: loop.run_until_complete(repo.async_get_user_summary_cards(_USER_ID)),
+            rounds=10,
+            iterations=1,
+        )
+
+        assert len(cards) == _PAGE
+        benchmark.extra_info["archive"] = _ARCHIVE
+
+    def test_deep_page_by_offset(self, benchmark, archive) -> None:
+        loop, repo, _ = archive
+
+        rows, _, _ = benchmark.pedantic(
+            lambda: loop.run_until_complete(
+                repo.async_get_user_summaries(_USER_ID, limit=_PAGE, offset=_ARCHIVE - _PAGE)
+            ),
+            rounds=5,
+            iterations=1,
+        )
+
+        assert len(rows) == _PAGE
+        benchmark.extra_info["archive"] = _ARCHIVE
+
+    def test_deep_page_by_cursor(self, benchmark, archive) -> None:
+        loop, repo, after = archive
+
+        cards = benchmark.pedantic(
+            lambda: loop.run_until_complete(
+                repo.async_get_user_summary_cards(_USER_ID, limit=_PAGE, after=after)
+            ),
+            rounds=10,
+            iterations=1,
+        )
+
+        assert len(cards) == _PAGE
+        benchmark.extra_info["archive"] = _ARCHIVE
@@ -0,0 +1,98 @@
+"""Replay of recorded summary token streams through the section assembler.
+
+Each record is one LLM response as the list of deltas it arrived in. The
+assembler sees every delta in order, exactly as the Telegram draft streamer
+feeds it, and the cost of each ``add_delta`` call is measured.
+
+By default the streams are synthetic: summaries of growing length serialised
+the way the model emits them and cut into 1-6 character tokens. Point
+``SUMMARY_STREAM_REPLAY_DELTAS`` at a JSONL file of ``{"deltas": [...]}``
+records to replay captured responses instead.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+pytest_benchmark = pytest.importorskip("pytest_benchmark")
+
+from app.adapters.content.streaming.section_assembler import SummarySectionStreamAssembler
+
+
+def _synthetic_streams(count: int = 8) -> list[list[str]]:
+    rng = random.Random(11)
+    streams: list[list[str]] = []
+    for index in range(count):
+        words = 200 * (index + 1)
+        document = {
+            "summary_250": " ".join(f"word{rng.randrange(500)}" for _ in range(60)),
+            "summary_1000": " ".join(f"word{rng.randrange(500)}" for _ in range(words)),
+            "tldr": "Résumé — " + " ".join(f"w{rng.randrange(99)}" for _ in range(words // 4)),
+            "key_ideas": [f'Idea {i}: "quoted" detail' for i in range(8)],
+            "topic_tags": [f"#topic{i}" for i in range(6)],
+            "entities": {"people": ["Ada"], "organizations": [], "locations": []},
+        }
+        text = json.dumps(document, ensure_ascii=index % 2 == 0, indent=2)
+        deltas: list[str] = []
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 6)
+            deltas.append(text[pos : pos + step])
+            pos += step
+        streams.append(deltas)
+    return streams
+
+
+def _load_streams() -> list[list[str]]:
+    path = os.getenv("SUMMARY_STREAM_REPLAY_DELTAS")
+    if not path:
+        return _synthetic_streams()
+    with Path(path).open(encoding="utf-8") as handle:
+        return [json.loads(line)["deltas"] for line in handle if line.strip()]
+
+
+def _replay(streams: list[list[str]]) -> int:
+    emitted = 0
+    for deltas in streams:
+        assembler = SummarySectionStreamAssembler()
+        for delta in deltas:
+            emitted += len(assembler.add_delta(delta))
+    return emitted
+
+
+class TestSummaryStreamReplay:
+    """Per-delta parse cost must not grow with the amount already streamed."""
+
+    def test_replay_throughput(self, benchmark) -> None:
+        streams = _load_streams()
+        deltas = sum(len(stream) for stream in streams)
+
+        emitted = benchmark.pedantic(_replay, args=(streams,), rounds=3, iterations=1)
+
+        assert emitted > 0
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["deltas_per_sec"] = round(deltas / mean) if mean > 0 else 0
+
+    def test_per_delta_cost_stays_flat(self) -> None:
+        stream = max(_load_streams(), key=len)
+        assembler = SummarySectionStreamAssembler()
+        timings: list[float] = []
+        for delta in stream:
+            started = time.perf_counter()
+            assembler.add_delta(delta)
+            timings.append(time.perf_counter() - started)
+
+        quarter = len(timings) // 4
+        early = statistics.median(timings[:quarter])
+        late = statistics.median(timings[-quarter:])
+
+        # Re-scanning the whole buffer made late deltas orders of magnitude
+        # slower than early ones; incremental parsing keeps them comparable.
+        assert late < early * 5 + 20e-6
@@ -0,0 +1,161 @@
+"""Benchmarks for delta-sync latency: cursor merge vs materialize-then-filter.
+
+Each run syncs a user whose archive holds 10k, 100k or 1M rows spread evenly
+over the seven synced entity kinds, asking for the 50 most recent changes.
+Tables are synthetic: rows are generated on demand from their position, and
+the cursor query jumps straight to the first row past ``since`` the way an
+index on ``server_version`` would, so the numbers isolate collector cost
+(materialize + serialize + sort vs bounded fetch + k-way merge) from database
+I/O. The legacy path is skipped at 1M rows; it needs minutes and gigabytes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+pytest_benchmark = pytest.importorskip("pytest_benchmark")
+
+from app.api.services.sync import SyncEnvelopeSerializer, SyncRecordCollector
+
+_KINDS = 7
+_DELTA = 50
+_LIMIT = 200
+_UPDATED_AT = "2026-01-01T00:00:00+00:00"
+
+
+class _SyntheticTable:
+    """Rows with ``server_version`` ``offset, offset + 7, ...`` up to ``total``."""
+
+    def __init__(self, offset: int, total: int) -> None:
+        self._offset = offset
+        self._total = total
+
+    def _row(self, version: int) -> dict[str, Any]:
+        return {
+            "id": version,
+            "server_version": version,
+            "updated_at": _UPDATED_AT,
+            "created_at": _UPDATED_AT,
+            "request": 1,
+            "summary_id": 1,
+            "tag_id": 1,
+        }
+
+    def _versions_after(self, since: int) -> range:
+        start = self._offset
+        if since >= start:
+            start += ((since - start) // _KINDS + 1) * _KINDS
+        return range(start, self._total + 1, _KINDS)
+
+    def all(self) -> list[dict[str, Any]]:
+        return [self._row(version) for version in self._versions_after(0)]
+
+    def since(self, since: int, limit: int) -> list[dict[str, Any]]:
+        return [self._row(version) for version in self._versions_after(since)[:limit]]
+
+
+class _Repository:
+    def __init__(self, table: _SyntheticTable, *, cursor: bool) -> None:
+        self._table = table
+        if cursor:
+            self.async_get_for_user_since = self._get_since
+
+    async def async_get_all_for_user(self, _user_id: int) -> list[dict[str, Any]]:
+        return self._table.all()
+
+    async def _get_since(self, _user_id: int, *, since: int, limit: int) -> list[dict[str, Any]]:
+        return self._table.since(since, limit)
+
+
+class _UserRepository:
+    async def async_get_user_by_telegram_id(self, user_id: int) -> dict[str, Any]:
+        return {"telegram_user_id": user_id, "server_version": 0, "updated_at": _UPDATED_AT}
+
+
+class _AuxReadPort:
+    def __init__(self, tables: list[_SyntheticTable], *, cursor: bool) -> None:
+        self._highlights, self._tags, self._summary_tags = tables
+        if cursor:
+            self.get_highlights_for_user_since = self._since(self._highlights)
+            self.get_tags_for_user_since = self._since(self._tags)
+            self.get_summary_tags_for_user_since = self._since(self._summary_tags)
+
+    @staticmethod
+    def _since(table: _SyntheticTable) -> Any:
+        async def read(_user_id: int, *, since: int, limit: int) -> list[dict[str, Any]]:
+            return table.since(since, limit)
+
+        return read
+
+    async def get_highlights_for_user(self, _user_id: int) -> list[dict[str, Any]]:
+        return self._highlights.all()
+
+    async def get_tags_for_user(self, _user_id: int) -> list[dict[str, Any]]:
+        return self._tags.all()
+
+    async def get_summary_tags_for_user(self, _user_id: int) -> list[dict[str, Any]]:
+        return self._summary_tags.all()
+
+
+def _collector(total: int, *, cursor: bool) -> SyncRecordCollector:
+    tables = [_SyntheticTable(offset, total) for offset in range(1, _KINDS + 1)]
+    return SyncRecordCollector(
+        user_repository=_UserRepository(),
+        request_repository=_Repository(tables[0], cursor=cursor),
+        summary_repository=_Repository(tables[1], cursor=cursor),
+        crawl_result_repository=_Repository(tables[2], cursor=cursor),
+        llm_repository=_Repository(tables[3], cursor=cursor),
+        aux_read_port=_AuxReadPort(tables[4:], cursor=cursor),
+        serializer=SyncEnvelopeSerializer(),
+    )
+
+
+def _delta_cursor(collector: SyncRecordCollector, since: int) -> tuple[Any, bool, int | None]:
+    return asyncio.run(collector.collect_page(1, since=since, limit=_LIMIT))
+
+
+def _delta_materialized(collector: SyncRecordCollector, since: int) -> tuple[Any, bool, int | None]:
+    records = asyncio.run(collector.collect_records(1))
+    return collector.paginate_records(records, since, _LIMIT)
+
+
+class TestSyncDeltaBenchmarks:
+    """Latency of a 50-row delta sync against archives of growing size."""
+
+    @pytest.mark.parametrize("total", [10_000, 100_000, 1_000_000])
+    def test_cursor_delta_latency(self, benchmark, total: int) -> None:
+        collector = _collector(total, cursor=True)
+
+        page, has_more, _ = benchmark.pedantic(
+            _delta_cursor, args=(collector, total - _DELTA), rounds=5, iterations=1
+        )
+
+        assert len(page) == _DELTA
+        assert has_more is False
+        benchmark.extra_info["rows"] = total
+
+    @pytest.mark.parametrize("total", [10_000, 100_000])
+    def test_materialized_delta_latency(self, benchmark, total: int) -> None:
+        collector = _collector(total, cursor=False)
+
+        page, has_more, _ = benchmark.pedantic(
+            _delta_materialized, args=(collector, total - _DELTA), rounds=1, iterations=1
+        )
+
+        assert len(page) == _DELTA
+        assert has_more is False
+        benchmark.extra_info["rows"] = total
+
+    def test_cursor_and_materialized_pages_match(self) -> None:
+        since = 10_000 - 3 * _LIMIT
+
+        cursor = _delta_cursor(_collector(10_000, cursor=True), since)
+        materialized = _delta_materialized(_collector(10_000, cursor=False), since)
+
+        assert [(rec.entity_type, rec.id) for rec in cursor[0]] == [
+            (rec.entity_type, rec.id) for rec in materialized[0]
+        ]
+        assert cursor[1:] == materialized[1:]
@@ -0,0 +1,172 @@
+"""Benchmarks for time-to-first-progress-message of URL batches.
+
+Measures ``URLBatchProcessor`` from the start of pre-registration until the
+initial progress message is sent, for 10, 50 and 200-URL batches, on the bulk
+path (a few ``IN (...)`` queries and one multi-row insert) and on the per-URL
+path (up to three round trips per URL). The repositories are in-memory fakes
+that charge a fixed simulated round-trip latency per call, so the numbers show
+how the query count scales rather than real database cost. URLs use an IP
+literal host so URL validation does no DNS lookups. The fixed 0.5s settle
+delay in ``execute_batch`` is not included.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest_benchmark = pytest.importorskip("pytest_benchmark")
+
+from app.adapter_models.batch_processing import URLBatchStatus
+from app.adapters.telegram.url_batch_processor import (
+    BatchProcessRequest,
+    URLBatchProcessor,
+    _BatchRunState,
+)
+from app.core.url_utils import compute_dedupe_hash
+
+_ROUND_TRIP_SEC = 0.002
+
+
+class _InMemoryRepos:
+    """Request/summary store; a tenth of the URLs already have summaries."""
+
+    def __init__(self, urls: list[str]) -> None:
+        self.requests: dict[str, dict[str, Any]] = {}
+        self.summaries: dict[int, dict[str, Any]] = {}
+        self.round_trips = 0
+        for index, url in enumerate(urls[::10], start=1):
+            self.requests[compute_dedupe_hash(url)] = {"id": index, "status": "ok"}
+            self.summaries[index] = {"json_payload": {"title": f"Cached {index}"}}
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(_ROUND_TRIP_SEC)
+
+    # Per-URL API.
+    async def async_get_request_by_dedupe_hash(self, dedupe_hash: str) -> dict[str, Any] | None:
+        await self._round_trip()
+        return self.requests.get(dedupe_hash)
+
+    async def async_get_summary_by_request(self, request_id: int) -> dict[str, Any] | None:
+        await self._round_trip()
+        return self.summaries.get(request_id)
+
+    async def async_find_recent_request_by_dedupe(
+        self, dedupe_hash: str, *, max_age_sec: int
+    ) -> dict[str, Any] | None:
+        await self._round_trip()
+        row = self.requests.get(dedupe_hash)
+        return row if row and row["status"] in ("processing", "pending", "error") else None
+
+    async def async_create_minimal_request(self, **row: Any) -> tuple[int, bool]:
+        await self._round_trip()
+        return self._insert(row)
+
+    # Bulk API.
+    async def async_get_requests_by_dedupe_hashes(
+        self, hashes: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        await self._round_trip()
+        return {h: self.requests[h] for h in hashes if h in self.requests}
+
+    async def async_get_summaries_by_request_ids(
+        self, request_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        await self._round_trip()
+        return {i: self.summaries[i] for i in request_ids if i in self.summaries}
+
+    async def async_find_recent_requests_by_dedupe_hashes(
+        self, hashes: list[str], *, max_age_sec: int
+    ) -> dict[str, dict[str, Any]]:
+        await self._round_trip()
+        return {
+            h: row
+            for h in hashes
+            if (row := self.requests.get(h)) and row["status"] in ("processing", "pending", "error")
+        }
+
+    async def async_create_minimal_requests(
+        self, rows: list[dict[str, Any]]
+    ) -> dict[str, tuple[int, bool]]:
+        await self._round_trip()
+        return {row["dedupe_hash"]: self._insert(row) for row in rows}
+
+    def _insert(self, row: dict[str, Any]) -> tuple[int, bool]:
+        existing = self.requests.get(row["dedupe_hash"])
+        if existing is not None:
+            return existing["id"], False
+        request_id = 10_000 + len(self.requests)
+        self.requests[row["dedupe_hash"]] = {"id": request_id, "status": "pending"}
+        return request_id, True
+
+
+def _per_url_view(repos: _InMemoryRepos) -> SimpleNamespace:
+    """Expose only the per-URL API so the processor takes the legacy path."""
+    return SimpleNamespace(
+        async_get_request_by_dedupe_hash=repos.async_get_request_by_dedupe_hash,
+        async_get_summary_by_request=repos.async_get_summary_by_request,
+        async_find_recent_request_by_dedupe=repos.async_find_recent_request_by_dedupe,
+        async_create_minimal_request=repos.async_create_minimal_request,
+    )
+
+
+async def _noop_reply(*args: Any, **kwargs: Any) -> int:
+    return 1
+
+
+def _time_to_first_progress(count: int, *, bulk: bool) -> dict[str, float]:
+    urls = [f"https://93.184.216.34/articles/{i}" for i in range(count)]
+    repos = _InMemoryRepos(urls)
+    repo: Any = repos if bulk else _per_url_view(repos)
+    processor = URLBatchProcessor(
+        response_formatter=SimpleNamespace(safe_reply_with_id=_noop_reply),  # type: ignore[arg-type]
+        request_repo=repo,
+        user_repo=SimpleNamespace(),
+        summary_repo=repo,
+    )
+    request = BatchProcessRequest(
+        message=SimpleNamespace(chat=SimpleNamespace(id=1)), urls=urls, uid=1, correlation_id="c"
+    )
+    state = _BatchRunState(
+        request=request,
+        batch_status=URLBatchStatus.from_urls(urls),
+        url_to_request_id={},
+        cached_summaries=[],
+        semaphore=asyncio.Semaphore(4),
+        sender=None,
+        draft_enabled=False,
+    )
+
+    async def run() -> None:
+        await processor._pre_register_urls(state)
+        await processor._ensure_initial_progress_message(state)
+
+    started = time.perf_counter()
+    asyncio.run(run())
+    assert state.initial_message_id == 1
+    assert len(state.url_to_request_id) == count
+    return {"seconds": time.perf_counter() - started, "round_trips": repos.round_trips}
+
+
+class TestURLBatchPreRegistrationBenchmarks:
+    """Time to the first progress message for bulk vs per-URL pre-registration."""
+
+    @pytest.mark.parametrize("count", [10, 50, 200])
+    @pytest.mark.parametrize("bulk", [True, False], ids=["bulk", "per_url"])
+    def test_time_to_first_progress_message(self, benchmark, count: int, bulk: bool) -> None:
+        outcome = benchmark.pedantic(
+            _time_to_first_progress, args=(count,), kwargs={"bulk": bulk}, rounds=3, iterations=1
+        )
+
+        benchmark.extra_info["round_trips"] = outcome["round_trips"]
+        benchmark.extra_info["simulated_round_trip_ms"] = _ROUND_TRIP_SEC * 1000
+
+    def test_bulk_round_trips_do_not_grow_with_batch_size(self) -> None:
+        assert _time_to_first_progress(10, bulk=True)["round_trips"] == 4
+        assert _time_to_first_progress(200, bulk=True)["round_trips"] == 4
+        assert _time_to_first_progress(200, bulk=False)["round_trips"] > 200 * 2
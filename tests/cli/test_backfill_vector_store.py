@@ -7,6 +7,7 @@ import pytest
 
 from app.cli import backfill_vector_store
 from app.config import QdrantConfig
+from app.infrastructure.vector.write_batcher import WriteBatcherStats
 
 
 def _qdrant_config() -> QdrantConfig:
@@ -60,8 +61,13 @@ def _patch_backfill_dependencies(
     )
     monkeypatch.setattr(
         backfill_vector_store,
-        "QdrantVectorStore",
-        lambda **_kwargs: vector_store,
+        "AsyncQdrantVectorStore",
+        lambda **_kwargs: SimpleNamespace(connect=AsyncMock(return_value=True), aclose=AsyncMock()),
+    )
+    monkeypatch.setattr(
+        backfill_vector_store,
+        "QdrantWriteBatcher",
+        lambda _store, **_kwargs: vector_store,
     )
     monkeypatch.setattr(
         backfill_vector_store,
@@ -122,17 +128,20 @@ async def test_backfill_vector_store_batches_chunk_window_embeddings(
         def deserialize_embedding(self, _blob):
             raise AssertionError("chunk-window backfill must not use summary embedding blob")
 
-    class FakeVectorStore:
+    class FakeWriteBatcher:
         def __init__(self) -> None:
             self.replaced: list[tuple[int, list[list[float]], list[dict]]] = []
             self.deleted: list[int] = []
 
-        def replace_request_notes(self, request_id, vectors, metadata) -> None:
+        async def replace_request_notes(self, request_id, vectors, metadata) -> None:
             self.replaced.append((request_id, vectors, metadata))
 
-        def delete_by_request_id(self, request_id) -> None:
+        async def delete_by_request_id(self, request_id) -> None:
             self.deleted.append(request_id)
 
+        async def close(self) -> WriteBatcherStats:
+            return WriteBatcherStats()
+
     summaries = [
         {
             "id": 101,
@@ -158,7 +167,7 @@ async def test_backfill_vector_store_batches_chunk_window_embeddings(
         ),
     )
     embedding_service = FakeEmbeddingService()
-    vector_store = FakeVectorStore()
+    vector_store = FakeWriteBatcher()
     generator = SimpleNamespace(generate_embedding_for_summary=AsyncMock(return_value=True))
 
     fake_db = _patch_backfill_dependencies(
@@ -203,16 +212,19 @@ async def test_backfill_vector_store_refetches_generated_embeddings_in_bulk(
             assert blob == b"new"
             return [9.0]
 
-    class FakeVectorStore:
+    class FakeWriteBatcher:
         def __init__(self) -> None:
             self.replaced: list[tuple[int, list[list[float]], list[dict]]] = []
 
-        def replace_request_notes(self, request_id, vectors, metadata) -> None:
+        async def replace_request_notes(self, request_id, vectors, metadata) -> None:
             self.replaced.append((request_id, vectors, metadata))
 
-        def delete_by_request_id(self, _request_id) -> None:
+        async def delete_by_request_id(self, _request_id) -> None:
             raise AssertionError("summary with text should not be deleted")
 
+        async def close(self) -> WriteBatcherStats:
+            return WriteBatcherStats()
+
     summaries = [
         {
             "id": 101,
@@ -234,7 +246,7 @@ async def test_backfill_vector_store_refetches_generated_embeddings_in_bulk(
         ),
     )
     generator = SimpleNamespace(generate_embedding_for_summary=AsyncMock(return_value=True))
-    vector_store = FakeVectorStore()
+    vector_store = FakeWriteBatcher()
 
     _patch_backfill_dependencies(
         monkeypatch,
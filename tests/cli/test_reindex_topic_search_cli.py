@@ -0,0 +1,114 @@
+"""Tests for app.cli.reindex_topic_search progress reporting and resume."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.cli import reindex_topic_search
+from app.db.topic_search_manager import TopicSearchReindexProgress
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _FakeDatabase:
+    def __init__(self) -> None:
+        self.disposed = False
+
+    async def dispose(self) -> None:
+        self.disposed = True
+
+
+class _FakeManager:
+    calls: list[dict] = []
+    fail_after_chunks: int | None = None
+
+    def __init__(self, _db, _logger) -> None:
+        return None
+
+    async def reindex(self, *, after_request_id, chunk_size, force, on_chunk):
+        _FakeManager.calls.append(
+            {"after_request_id": after_request_id, "chunk_size": chunk_size, "force": force}
+        )
+        progress = TopicSearchReindexProgress(last_request_id=after_request_id)
+        for chunk in range(3):
+            if self.fail_after_chunks is not None and chunk == self.fail_after_chunks:
+                raise RuntimeError("connection lost")
+            progress.scanned += chunk_size
+            progress.written += 1
+            progress.unchanged += chunk_size - 1
+            progress.last_request_id += chunk_size
+            on_chunk(progress)
+        return progress
+
+
+@pytest.fixture
+def cli(monkeypatch, tmp_path: Path) -> SimpleNamespace:
+    db = _FakeDatabase()
+    _FakeManager.calls = []
+    _FakeManager.fail_after_chunks = None
+    monkeypatch.setattr(
+        reindex_topic_search,
+        "_prepare_config",
+        lambda _args: SimpleNamespace(runtime=SimpleNamespace(log_level="INFO")),
+    )
+    monkeypatch.setattr(reindex_topic_search, "setup_json_logging", lambda _level: None)
+    monkeypatch.setattr(reindex_topic_search, "build_runtime_database", lambda *_a, **_k: db)
+    monkeypatch.setattr(reindex_topic_search, "TopicSearchIndexManager", _FakeManager)
+
+    async def count(_db, after_request_id):
+        return 30 - after_request_id
+
+    monkeypatch.setattr(reindex_topic_search, "_count_summaries", count)
+    return SimpleNamespace(db=db, checkpoint=tmp_path / "reindex.json")
+
+
+def test_reindex_reports_progress_and_clears_checkpoint(cli, capsys) -> None:
+    code = reindex_topic_search.main(["--chunk-size=10", f"--checkpoint={cli.checkpoint}"])
+
+    out = capsys.readouterr().out.splitlines()
+    assert code == 0
+    assert out[0].startswith("scanned=10/30 (33.3%) written=1 unchanged=9 removed=0")
+    assert "last_request_id=30" in out[2]
+    assert out[-1] == "reindex_complete=true"
+    assert not cli.checkpoint.exists()
+    assert cli.db.disposed is True
+
+
+def test_reindex_resumes_from_checkpoint_after_interruption(cli, capsys) -> None:
+    _FakeManager.fail_after_chunks = 2
+    assert reindex_topic_search.main(["--chunk-size=10", f"--checkpoint={cli.checkpoint}"]) == 1
+    assert json.loads(cli.checkpoint.read_text()) == {"last_request_id": 20}
+
+    _FakeManager.fail_after_chunks = None
+    assert reindex_topic_search.main(["--chunk-size=10", f"--checkpoint={cli.checkpoint}"]) == 0
+
+    assert [call["after_request_id"] for call in _FakeManager.calls] == [0, 20]
+    assert "resuming_after_request_id=20" in capsys.readouterr().out
+    assert not cli.checkpoint.exists()
+
+
+def test_reindex_restart_ignores_checkpoint(cli) -> None:
+    reindex_topic_search.write_checkpoint(cli.checkpoint, 20)
+
+    code = reindex_topic_search.main(["--restart", "--force", f"--checkpoint={cli.checkpoint}"])
+
+    assert code == 0
+    assert _FakeManager.calls == [
+        {
+            "after_request_id": 0,
+            "chunk_size": reindex_topic_search.REINDEX_CHUNK_SIZE,
+            "force": True,
+        }
+    ]
+
+
+def test_read_checkpoint_tolerates_missing_and_corrupt_files(tmp_path: Path) -> None:
+    path = tmp_path / "checkpoint.json"
+    assert reindex_topic_search.read_checkpoint(path) == 0
+    path.write_text("not json")
+    assert reindex_topic_search.read_checkpoint(path) == 0
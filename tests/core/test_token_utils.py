@@ -0,0 +1,101 @@
+"""Tests for the memoized, model-aware token counter."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core import token_utils
+from app.core.token_utils import (
+    acount_tokens_batch,
+    count_tokens,
+    count_tokens_batch,
+    encoding_for_model,
+    estimate_tokens,
+)
+
+
+class _FakeEncoder:
+    """Whitespace 'tokenizer' that records how often it is asked to encode."""
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+        self.batches = 0
+
+    def encode(self, text: str, **_: object) -> list[str]:
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts: list[str], **_: object) -> list[list[str]]:
+        self.batches += 1
+        return [self.encode(text) for text in texts]
+
+
+@pytest.fixture
+def encoder(monkeypatch: pytest.MonkeyPatch) -> _FakeEncoder:
+    fake = _FakeEncoder()
+    monkeypatch.setattr(token_utils, "_encoders", {"cl100k_base": fake, "o200k_base": fake})
+    token_utils.clear_token_count_cache()
+    yield fake
+    token_utils.clear_token_count_cache()
+
+
+def _text(words: int, word: str = "token") -> str:
+    return " ".join([word] * words)
+
+
+@pytest.mark.parametrize(
+    ("model", "expected"),
+    [
+        (None, "cl100k_base"),
+        ("openai/gpt-4o-mini", "o200k_base"),
+        ("openai/gpt-5", "o200k_base"),
+        ("o3-mini", "o200k_base"),
+        ("openai/gpt-4-turbo", "cl100k_base"),
+        ("google/gemini-3.1-pro-preview", "cl100k_base"),
+    ],
+)
+def test_encoding_for_model(model: str | None, expected: str) -> None:
+    assert encoding_for_model(model) == expected
+
+
+def test_repeated_text_is_encoded_once(encoder: _FakeEncoder) -> None:
+    prompt = _text(40)
+
+    assert count_tokens(prompt) == 40
+    assert count_tokens(prompt) == 40
+    assert encoder.encoded == [prompt]
+
+
+def test_batch_encodes_only_misses_and_keeps_order(encoder: _FakeEncoder) -> None:
+    cached = _text(30, "alpha")
+    count_tokens(cached)
+    encoder.encoded.clear()
+
+    counts = count_tokens_batch([_text(20, "bravo"), cached, "two words"])
+
+    assert counts == [20, 30, 2]
+    assert encoder.batches == 1
+    assert encoder.encoded == [_text(20, "bravo"), "two words"]
+
+
+def test_falls_back_to_heuristic_without_encoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(token_utils, "_encoders", {"cl100k_base": None})
+
+    assert count_tokens("x" * 400) == 100
+    assert count_tokens_batch(["", "abcdefgh"]) == [1, 2]
+
+
+def test_estimate_exceeds_heuristic_and_grows_with_non_ascii() -> None:
+    ascii_text = "summary " * 100
+    cyrillic_text = "резюме " * 100
+
+    assert estimate_tokens("") == 0
+    assert estimate_tokens(ascii_text) > len(ascii_text) // 4
+    assert estimate_tokens(cyrillic_text) > estimate_tokens(ascii_text)
+
+
+async def test_async_batch_matches_sync(encoder: _FakeEncoder) -> None:
+    texts = [_text(5), _text(70)]
+
+    assert await acount_tokens_batch(texts) == count_tokens_batch(texts)
+    assert await acount_tokens_batch([]) == []
@@ -106,3 +106,30 @@ async def test_batch_operations_use_postgres(database: Database) -> None:
 
     assert llm_count == 1
     assert summary_count == 1
+
+
+@pytest.mark.asyncio
+async def test_batched_request_updates_keep_last_value_per_id(database: Database) -> None:
+    user_id = 77802
+    async with database.transaction() as session:
+        session.add(User(telegram_user_id=user_id, username="batch-updates"))
+        requests = [
+            Request(type="url", status="pending", user_id=user_id, dedupe_hash=f"upd-{idx}")
+            for idx in range(2)
+        ]
+        session.add_all(requests)
+        await session.flush()
+    first, second = (request.id for request in requests)
+    batch = BatchOperations(database)
+
+    updated = await batch.async_update_request_statuses_batch(
+        [(first, "processing"), (second, "error"), (first, "completed")]
+    )
+    replies = await batch.async_update_bot_reply_message_ids_batch([(first, 501), (second, 502)])
+
+    assert (updated, replies) == (2, 2)
+    fetched = await batch.async_get_requests_by_ids_batch([first, second])
+    assert [(r.status, r.bot_reply_message_id) for r in fetched] == [
+        ("completed", 501),
+        ("error", 502),
+    ]
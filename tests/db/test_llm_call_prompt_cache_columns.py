@@ -0,0 +1,25 @@
+"""Tests that the LLMCall model exposes the prompt-cache accounting columns.
+
+Migration 0021 adds three nullable columns recording what the provider reported
+for prompt caching: ``cache_read_tokens``, ``cache_creation_tokens`` and the
+``prompt_cache_key`` hash of the system prefix the call was sent with.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from app.db.models import LLMCall
+
+
+def test_llm_call_has_cache_token_columns() -> None:
+    for name in ("cache_read_tokens", "cache_creation_tokens"):
+        col = LLMCall.__table__.columns[name]
+        assert col.nullable is True
+        assert isinstance(col.type, sa.Integer)
+
+
+def test_llm_call_has_prompt_cache_key_column() -> None:
+    col = LLMCall.__table__.columns["prompt_cache_key"]
+    assert col.nullable is True
+    assert isinstance(col.type, sa.Text)
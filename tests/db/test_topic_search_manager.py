@@ -82,3 +82,79 @@ async def test_topic_search_manager_indexes_and_finds_requests() -> None:
         async with database.engine.begin() as connection:
             await connection.run_sync(Base.metadata.drop_all, tables=list(reversed(_all_tables())))
         await database.dispose()
+
+
+@pytest.mark.asyncio
+async def test_topic_search_manager_reindex_is_incremental_and_resumable() -> None:
+    dsn = _test_dsn()
+    if not dsn:
+        pytest.skip("TEST_DATABASE_URL is required for Postgres topic search reindex test")
+
+    database = Database(DatabaseConfig(dsn=dsn, pool_size=1, max_overflow=1))
+    manager = TopicSearchIndexManager(database, cast("logging.Logger", _Logger()))
+    try:
+        async with database.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all, tables=list(reversed(_all_tables())))
+            await connection.run_sync(Base.metadata.create_all, tables=_all_tables())
+
+        summary_ids: list[int] = []
+        request_ids: list[int] = []
+        async with database.transaction() as session:
+            for index in range(5):
+                request = Request(
+                    type="url",
+                    status="done",
+                    input_url=f"https://example.com/{index}",
+                    normalized_url=f"https://example.com/{index}",
+                )
+                session.add(request)
+                await session.flush()
+                summary = Summary(
+                    request_id=request.id,
+                    lang="en",
+                    json_payload={"title": f"Article {index}", "summary_250": "Postgres"},
+                )
+                session.add(summary)
+                await session.flush()
+                request_ids.append(request.id)
+                summary_ids.append(summary.id)
+
+        first = await manager.reindex(chunk_size=2)
+        assert (first.scanned, first.written, first.unchanged) == (5, 5, 0)
+
+        chunks: list[int] = []
+        second = await manager.reindex(
+            chunk_size=2, on_chunk=lambda progress: chunks.append(progress.last_request_id)
+        )
+        assert (second.written, second.unchanged, second.removed) == (0, 5, 0)
+        assert chunks == [request_ids[1], request_ids[3], request_ids[4]]
+
+        async with database.transaction() as session:
+            changed = await session.get(Summary, summary_ids[1])
+            assert changed is not None
+            changed.json_payload = {"title": "Rewritten", "summary_250": "Postgres"}
+            removed = await session.get(Summary, summary_ids[3])
+            assert removed is not None
+            removed.json_payload = {}
+
+        resumed = await manager.reindex(after_request_id=request_ids[0], chunk_size=2)
+        assert (resumed.scanned, resumed.written, resumed.removed) == (4, 1, 1)
+        assert resumed.unchanged == 2
+
+        async with database.session() as session:
+            rows = dict(
+                (
+                    await session.execute(
+                        select(TopicSearchIndex.request_id, TopicSearchIndex.title)
+                    )
+                ).tuples()
+            )
+        assert request_ids[3] not in rows
+        assert rows[request_ids[1]] == "Rewritten"
+
+        forced = await manager.reindex(force=True)
+        assert (forced.written, forced.unchanged) == (4, 0)
+    finally:
+        async with database.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all, tables=list(reversed(_all_tables())))
+        await database.dispose()
@@ -0,0 +1,118 @@
+"""Tests for the zero-copy embedding codec and the warm EmbeddingMatrix."""
+
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.infrastructure.embedding.embedding_protocol import (
+    pack_embedding,
+    unpack_embedding,
+    unpack_embedding_array,
+)
+from app.infrastructure.search.embedding_matrix import EmbeddingMatrix, EmbeddingMatrixRow
+
+
+def _row(request_id: int) -> EmbeddingMatrixRow:
+    return EmbeddingMatrixRow(
+        request_id=request_id,
+        summary_id=request_id * 10,
+        url=f"https://example.com/{request_id}",
+        title=None,
+        snippet=None,
+        source=None,
+        published_at=None,
+    )
+
+
+def test_codec_matches_struct_layout_and_is_zero_copy() -> None:
+    blob = pack_embedding([1.5, -2.0, 0.25])
+
+    assert blob == struct.pack("<3f", 1.5, -2.0, 0.25)
+    assert unpack_embedding(blob) == [1.5, -2.0, 0.25]
+    view = unpack_embedding_array(blob)
+    assert view.dtype == np.dtype("<f4")
+    assert not view.flags.writeable
+    assert np.shares_memory(view, np.frombuffer(blob, dtype="<f4"))
+    assert pack_embedding(np.asarray([1.5, -2.0, 0.25], dtype=np.float64)) == blob
+
+
+def test_codec_rejects_malformed_blobs() -> None:
+    with pytest.raises(ValueError, match="float32"):
+        unpack_embedding(b"abc")
+    with pytest.raises(ValueError, match="one-dimensional"):
+        pack_embedding([[1.0, 2.0]])
+
+
+def test_rank_matches_brute_force_cosine() -> None:
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(300, 16)).astype(np.float32)
+    query = rng.normal(size=16).astype(np.float32)
+    matrix = EmbeddingMatrix()
+    for request_id, vector in enumerate(vectors, start=1):
+        matrix.upsert(_row(request_id), pack_embedding(vector))
+
+    ranked = matrix.rank(query, min_similarity=0.2, limit=10)
+
+    cosine = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    expected = [int(i) + 1 for i in np.argsort(-cosine)[:10] if cosine[i] >= 0.2]
+    assert [row.request_id for row, _ in ranked] == expected
+    assert [score for _, score in ranked] == pytest.approx(
+        [float(cosine[rid - 1]) for rid in expected], abs=1e-5
+    )
+
+
+def test_rank_is_scoped_to_requested_slots_and_threshold() -> None:
+    matrix = EmbeddingMatrix()
+    matrix.upsert(_row(1), pack_embedding([1.0, 0.0]))
+    matrix.upsert(_row(2), pack_embedding([0.9, 0.1]))
+    matrix.upsert(_row(3), pack_embedding([0.0, 1.0]))
+
+    ranked = matrix.rank([1.0, 0.0], slots=matrix.slots_for([3, 2, 99]), min_similarity=0.5)
+
+    assert [row.request_id for row, _ in ranked] == [2]
+    assert matrix.missing([3, 99, 99, 4]) == [99, 4]
+
+
+def test_upsert_replaces_and_remove_keeps_rows_dense() -> None:
+    matrix = EmbeddingMatrix()
+    for request_id in range(1, 5):
+        matrix.upsert(_row(request_id), pack_embedding([float(request_id), 1.0]))
+    matrix.upsert(_row(2), pack_embedding([0.0, 5.0]))
+
+    assert matrix.remove([1, 42]) == 1
+
+    assert len(matrix) == 3
+    assert 1 not in matrix
+    [(row, score)] = matrix.rank([0.0, 1.0], slots=matrix.slots_for([2]))
+    assert row.request_id == 2
+    assert score == pytest.approx(1.0)
+    assert {row.request_id for row, _ in matrix.rank([1.0, 1.0])} == {2, 3, 4}
+
+
+def test_recent_slots_and_eviction_follow_recency() -> None:
+    matrix = EmbeddingMatrix(max_rows=3)
+    for request_id in range(1, 6):
+        matrix.upsert(_row(request_id), pack_embedding([1.0, 0.0]), recency=float(request_id))
+
+    assert len(matrix) == 3
+    assert matrix.missing([1, 2, 3, 4, 5]) == [1, 2]
+    recent = matrix.recent_slots(2)
+    assert {row.request_id for row, _ in matrix.rank([1.0, 0.0], slots=recent)} == {4, 5}
+
+
+def test_dimension_mismatch_raises_until_cleared() -> None:
+    matrix = EmbeddingMatrix()
+    matrix.upsert(_row(1), pack_embedding([1.0, 0.0]))
+
+    with pytest.raises(ValueError, match="dimensions"):
+        matrix.upsert(_row(2), pack_embedding([1.0, 0.0, 0.0]))
+    with pytest.raises(ValueError, match="dimensions"):
+        matrix.rank([1.0, 0.0, 0.0])
+
+    matrix.clear()
+    matrix.upsert(_row(2), pack_embedding([1.0, 0.0, 0.0]))
+    assert matrix.dimensions == 3
@@ -0,0 +1,188 @@
+"""Unit tests for VectorTopicSimilarityAdapter single and batch scoring."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from app.application.services.signal_scoring import SignalCandidate
+from app.infrastructure.search.vector_topic_similarity import VectorTopicSimilarityAdapter
+from app.infrastructure.vector.result_types import VectorQueryHit, VectorQueryResult
+
+
+class _FakeEmbeddingService:
+    def __init__(self, *, fail_batch: bool = False) -> None:
+        self.single_calls = 0
+        self.batch_calls: list[int] = []
+        self._fail_batch = fail_batch
+
+    @staticmethod
+    def _embed(text: str) -> list[float]:
+        return [float(len(text) % 7), float(sum(map(ord, text)) % 11)]
+
+    async def generate_embedding(
+        self, text: str, *, language: str | None = None, task_type: str | None = None
+    ) -> list[float]:
+        self.single_calls += 1
+        return self._embed(text)
+
+    async def generate_embeddings_batch(
+        self, texts: Any, *, language: str | None = None, task_type: str | None = None
+    ) -> list[list[float]]:
+        self.batch_calls.append(len(texts))
+        if self._fail_batch:
+            raise RuntimeError("batch encode failed")
+        return [self._embed(text) for text in texts]
+
+
+class _FakeVectorStore:
+    def __init__(self, *, with_batch: bool = True) -> None:
+        self.available = True
+        self.query_calls = 0
+        self.batch_calls = 0
+        self.filters: list[dict[str, Any] | None] = []
+        if not with_batch:
+            self.query_batch = None  # type: ignore[assignment]
+
+    @staticmethod
+    def _result(vector: list[float]) -> VectorQueryResult:
+        distance = (vector[0] + vector[1]) / 20.0
+        return VectorQueryResult(
+            hits=[
+                VectorQueryHit(id="a", distance=distance, metadata={}),
+                VectorQueryHit(id="b", distance=distance + 0.2, metadata={}),
+            ]
+        )
+
+    def query(
+        self, query_vector: list[float], filters: dict[str, Any] | None, top_k: int
+    ) -> VectorQueryResult:
+        self.query_calls += 1
+        self.filters.append(filters)
+        return self._result(query_vector)
+
+    def query_batch(
+        self, query_vectors: list[list[float]], filters: dict[str, Any] | None, top_k: int
+    ) -> list[VectorQueryResult]:
+        self.batch_calls += 1
+        self.filters.append(filters)
+        return [self._result(vector) for vector in query_vectors]
+
+
+def _candidates(count: int) -> list[SignalCandidate]:
+    return [
+        SignalCandidate(
+            feed_item_id=i,
+            source_id=i % 3,
+            source_kind="rss",
+            title=f"Signal title {i}" if i % 5 else None,
+            canonical_url=f"https://example.com/{i}" if i % 5 else None,
+            metadata={"content_text": f"body {i}"} if i % 2 else {},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_score_items_matches_per_item_scores() -> None:
+    candidates = _candidates(12)
+    batch_adapter = VectorTopicSimilarityAdapter(
+        vector_store=_FakeVectorStore(),
+        embedding_service=_FakeEmbeddingService(),  # type: ignore[arg-type]
+        user_id=42,
+    )
+    single_adapter = VectorTopicSimilarityAdapter(
+        vector_store=_FakeVectorStore(),
+        embedding_service=_FakeEmbeddingService(),  # type: ignore[arg-type]
+        user_id=42,
+    )
+
+    batched = await batch_adapter.score_items(candidates)
+    single = [await single_adapter.score_item(candidate) for candidate in candidates]
+
+    assert batched == single
+    # Candidates 0 and 10 have no title, URL or body text and score zero without a lookup.
+    assert batched[0] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_score_items_uses_one_embedding_call_and_one_search_batch() -> None:
+    store = _FakeVectorStore()
+    embeddings = _FakeEmbeddingService()
+    adapter = VectorTopicSimilarityAdapter(
+        vector_store=store,
+        embedding_service=embeddings,  # type: ignore[arg-type]
+        user_id=7,
+    )
+
+    await adapter.score_items(_candidates(20))
+
+    assert embeddings.single_calls == 0
+    assert embeddings.batch_calls == [18]
+    assert store.batch_calls == 1
+    assert store.query_calls == 0
+    assert store.filters == [{"user_id": 7}]
+
+
+@pytest.mark.asyncio
+async def test_score_items_chunks_by_batch_size() -> None:
+    store = _FakeVectorStore()
+    embeddings = _FakeEmbeddingService()
+    adapter = VectorTopicSimilarityAdapter(
+        vector_store=store,
+        embedding_service=embeddings,  # type: ignore[arg-type]
+        batch_size=8,
+    )
+
+    scores = await adapter.score_items(_candidates(20))
+
+    assert len(scores) == 20
+    assert embeddings.batch_calls == [8, 8, 2]
+    assert store.batch_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_score_items_falls_back_to_single_queries_without_query_batch() -> None:
+    store = _FakeVectorStore(with_batch=False)
+    embeddings = _FakeEmbeddingService()
+    adapter = VectorTopicSimilarityAdapter(
+        vector_store=store,
+        embedding_service=embeddings,  # type: ignore[arg-type]
+    )
+
+    scores = await adapter.score_items(_candidates(6))
+
+    assert embeddings.batch_calls == [5]
+    assert store.query_calls == 5
+    assert scores[0] == 0.0
+    assert all(score > 0.0 for score in scores[1:])
+
+
+@pytest.mark.asyncio
+async def test_score_items_falls_back_to_per_item_path_when_batch_fails() -> None:
+    candidates = _candidates(6)
+    store = _FakeVectorStore()
+    embeddings = _FakeEmbeddingService(fail_batch=True)
+    adapter = VectorTopicSimilarityAdapter(
+        vector_store=store,
+        embedding_service=embeddings,  # type: ignore[arg-type]
+    )
+    reference = VectorTopicSimilarityAdapter(
+        vector_store=_FakeVectorStore(),
+        embedding_service=_FakeEmbeddingService(),  # type: ignore[arg-type]
+    )
+
+    scores = await adapter.score_items(candidates)
+
+    assert embeddings.single_calls == 5
+    assert scores == [await reference.score_item(candidate) for candidate in candidates]
+
+
+def test_batch_size_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        VectorTopicSimilarityAdapter(
+            vector_store=_FakeVectorStore(),
+            embedding_service=_FakeEmbeddingService(),  # type: ignore[arg-type]
+            batch_size=0,
+        )
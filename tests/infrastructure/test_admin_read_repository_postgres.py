@@ -242,3 +242,61 @@ async def test_admin_read_repository_reports_metrics_and_audit_log(database: Dat
     assert audit["total"] == 1
     assert audit["logs"][0]["event"] == "admin.test"
     assert audit["logs"][0]["details"] == {"user_id": 9001, "ok": True}
+
+
+@pytest.mark.asyncio
+async def test_admin_read_repository_reports_prompt_cache_hits(database: Database) -> None:
+    now = dt.datetime.now(UTC)
+    messages = [
+        {"role": "system", "content": "You are a careful summarizer."},
+        {"role": "user", "content": "article"},
+    ]
+    async with database.transaction() as session:
+        session.add(User(telegram_user_id=9001, username="owner", is_owner=True))
+        request = Request(
+            type="url",
+            status="completed",
+            correlation_id="admin-cache",
+            user_id=9001,
+            input_url="https://example.com/cache",
+            normalized_url="https://example.com/cache",
+            dedupe_hash="admin-cache",
+        )
+        session.add(request)
+        await session.flush()
+        session.add_all(
+            [
+                LLMCall(
+                    request_id=request.id,
+                    attempt_index=index,
+                    provider="openrouter",
+                    model="anthropic/claude-sonnet-4",
+                    status="ok",
+                    tokens_prompt=3000,
+                    cache_read_tokens=cached,
+                    cache_creation_tokens=written,
+                    prompt_cache_key="summary-prefix",
+                    request_messages_json=messages,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for index, (cached, written) in enumerate(
+                    [(None, 2500), (2500, None), (2500, None)], start=1
+                )
+            ]
+        )
+
+    report = await AdminReadRepositoryAdapter(database).async_prompt_cache_report(
+        since=now - dt.timedelta(hours=1)
+    )
+
+    assert report["total_calls"] == 3
+    assert report["total_cached_tokens"] == 5000
+    [prompt] = report["prompts"]
+    assert prompt["prompt_cache_key"] == "summary-prefix"
+    assert prompt["model"] == "anthropic/claude-sonnet-4"
+    assert prompt["preview"] == "You are a careful summarizer."
+    assert prompt["cache_hits"] == 2
+    assert prompt["hit_ratio"] == 0.6667
+    assert prompt["cache_write_tokens"] == 2500
+    assert prompt["cached_token_ratio"] == round(5000 / 9000, 4)
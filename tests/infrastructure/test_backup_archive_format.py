@@ -0,0 +1,68 @@
+"""Unit tests for the streaming backup archive layout."""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+import json
+import uuid
+import zipfile
+
+from app.infrastructure.persistence.backup_archive_format import (
+    ARCHIVE_TABLES,
+    LEGACY_ARCHIVE_VERSION,
+    NdjsonEntryWriter,
+    compression_method,
+    iter_table_rows,
+    table_entry_name,
+)
+
+
+def test_ndjson_entries_round_trip_one_row_per_line() -> None:
+    rows = [{"id": i, "text": "línea\nnueva" if i == 3 else f"row {i}"} for i in range(2_000)]
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+        with NdjsonEntryWriter(archive, table_entry_name("summaries")) as writer:
+            writer.write_many(iter(rows[:1_000]))
+            writer.write_many(iter(rows[1_000:]))
+
+    assert writer.count == 2_000
+    with zipfile.ZipFile(buf) as archive:
+        raw = archive.read("summaries.ndjson").decode()
+        assert raw.count("\n") == 2_000
+        assert list(iter_table_rows(archive, "summaries")) == rows
+
+
+def test_non_json_values_are_written_as_strings() -> None:
+    value = uuid.uuid4()
+    created = dt.datetime(2024, 1, 1, 12, 0)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        with NdjsonEntryWriter(archive, "highlights.ndjson") as writer:
+            writer.write_many([{"id": value, "created_at": created}])
+
+    with zipfile.ZipFile(buf) as archive:
+        assert list(iter_table_rows(archive, "highlights")) == [
+            {"id": str(value), "created_at": str(created)}
+        ]
+
+
+def test_legacy_json_array_entries_are_readable() -> None:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        archive.writestr("tags.json", json.dumps([{"id": 1, "name": "ai"}]))
+
+    with zipfile.ZipFile(buf) as archive:
+        rows = list(iter_table_rows(archive, "tags", LEGACY_ARCHIVE_VERSION))
+    assert rows == [{"id": 1, "name": "ai"}]
+
+
+def test_entry_names_per_version() -> None:
+    assert table_entry_name(next(iter(ARCHIVE_TABLES))) == "requests.ndjson"
+    assert table_entry_name("requests", LEGACY_ARCHIVE_VERSION) == "requests.json"
+
+
+def test_compression_method_falls_back_to_deflate_without_zstd() -> None:
+    assert compression_method("deflate") == zipfile.ZIP_DEFLATED
+    expected = getattr(zipfile, "ZIP_ZSTANDARD", zipfile.ZIP_DEFLATED)
+    assert compression_method("zstd") == expected
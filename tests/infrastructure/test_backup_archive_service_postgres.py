@@ -1,22 +1,25 @@
 from __future__ import annotations
 
+import json
 import os
 import zipfile
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 from sqlalchemy import delete, select
 
+from app.config.backup import BackupConfig
 from app.config.database import DatabaseConfig
 from app.db.models import Request, Summary, User, UserBackup
 from app.db.session import Database
 from app.infrastructure.persistence.backup_archive_service import (
     async_create_backup_archive,
+    async_restore_from_archive,
 )
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
-    from pathlib import Path
 
 
 def _test_dsn() -> str:
@@ -93,6 +96,81 @@ async def test_create_backup_archive_uses_postgres_session(
 
     with zipfile.ZipFile(backup.file_path) as archive:
         names = set(archive.namelist())
+        manifest = json.loads(archive.read("manifest.json"))
+        summary_lines = archive.read("summaries.ndjson").decode().splitlines()
     assert "manifest.json" in names
-    assert "requests.json" in names
-    assert "summaries.json" in names
+    assert "requests.ndjson" in names
+    assert "summaries.ndjson" in names
+    assert manifest["version"] == "2.0"
+    assert manifest["counts"]["summaries"] == 1
+    assert [json.loads(line)["json_payload"] for line in summary_lines] == [{"tldr": "Archived"}]
+
+
+@pytest.mark.asyncio
+async def test_streamed_backup_restores_into_another_user(
+    database: Database,
+    tmp_path: Path,
+) -> None:
+    source_user, target_user = 12002, 12003
+    async with database.transaction() as session:
+        session.add(User(telegram_user_id=source_user, username="archive-source"))
+        session.add(User(telegram_user_id=target_user, username="archive-target"))
+        await session.flush()
+        for index in range(1_200):
+            request = Request(
+                type="url",
+                status="completed",
+                user_id=source_user,
+                input_url=f"https://example.com/{index}",
+                normalized_url=f"https://example.com/{index}",
+                dedupe_hash=f"archive-stream-{index}",
+            )
+            session.add(request)
+            await session.flush()
+            session.add(
+                Summary(request_id=request.id, lang="en", json_payload={"tldr": str(index)})
+            )
+        backup = UserBackup(user_id=source_user, type="manual", status="pending")
+        session.add(backup)
+        await session.flush()
+        backup_id = backup.id
+
+    await async_create_backup_archive(
+        user_id=source_user,
+        backup_id=backup_id,
+        db=database,
+        data_dir=str(tmp_path),
+    )
+    async with database.session() as session:
+        backup = await session.scalar(select(UserBackup).where(UserBackup.id == backup_id))
+    assert backup is not None
+    assert backup.status == "completed"
+
+    # Restoring into the same user finds every request by dedupe hash.
+    archive_bytes = Path(backup.file_path).read_bytes()
+    same_user = await async_restore_from_archive(
+        source_user, archive_bytes, db=database, cfg=BackupConfig()
+    )
+    assert same_user["errors"] == []
+    assert same_user["skipped"]["requests"] == 1_200
+    assert same_user["skipped"]["summaries"] == 1_200
+
+    async with database.transaction() as session:
+        await session.execute(delete(Summary))
+        await session.execute(delete(Request))
+    restored = await async_restore_from_archive(
+        target_user, archive_bytes, db=database, cfg=BackupConfig()
+    )
+
+    assert restored["errors"] == []
+    assert restored["restored"]["requests"] == 1_200
+    assert restored["restored"]["summaries"] == 1_200
+    async with database.session() as session:
+        payloads = (
+            await session.execute(
+                select(Summary.json_payload)
+                .join(Request, Summary.request_id == Request.id)
+                .where(Request.user_id == target_user)
+            )
+        ).scalars()
+        assert sorted(int(p["tldr"]) for p in payloads) == list(range(1_200))
@@ -114,3 +114,52 @@ async def test_bookmark_import_repository_rejects_unowned_target_collection(
             user_id=9999,
             options={"target_collection_id": collection_id},
         )
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_dedupes_and_links_in_one_transaction(database: Database) -> None:
+    collection_id = await _create_user_and_collection(database)
+    repo = BookmarkImportAdapter(database)
+    await repo.async_import_bookmark(
+        ImportedBookmark(url="https://example.com/existing"), user_id=9101, options={}
+    )
+    bookmarks = [
+        ImportedBookmark(url="https://example.com/a", title="A", tags=["AI", "ml"]),
+        ImportedBookmark(url="https://example.com/existing"),
+        ImportedBookmark(url="https://example.com/a?utm_source=dup", tags=["ai"]),
+        ImportedBookmark(url="https://example.com/b", tags=["ml", " "]),
+    ]
+
+    results = await repo.async_import_bookmarks(
+        bookmarks,
+        user_id=9101,
+        options={"target_collection_id": collection_id},
+    )
+
+    assert [(r.url, r.outcome) for r in results] == [
+        ("https://example.com/a", "created"),
+        ("https://example.com/existing", "skipped"),
+        ("https://example.com/a?utm_source=dup", "skipped"),
+        ("https://example.com/b", "created"),
+    ]
+    async with database.session() as session:
+        assert await session.scalar(select(func.count(Request.id))) == 3
+        assert await session.scalar(select(func.count(Summary.id))) == 3
+        assert await session.scalar(select(func.count(Tag.id))) == 2
+        assert await session.scalar(select(func.count(SummaryTag.id))) == 3
+        assert await session.scalar(select(func.count(CollectionItem.id))) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_rejects_unowned_target_collection(database: Database) -> None:
+    collection_id = await _create_user_and_collection(database)
+    repo = BookmarkImportAdapter(database)
+
+    with pytest.raises(ValueError, match="not found or not owned"):
+        await repo.async_import_bookmarks(
+            [ImportedBookmark(url="https://example.com/other")],
+            user_id=9999,
+            options={"target_collection_id": collection_id},
+        )
+    async with database.session() as session:
+        assert await session.scalar(select(func.count(Request.id))) == 0
@@ -0,0 +1,214 @@
+"""Tests for coalescing single-text embedding requests into batches."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infrastructure.embedding import embedding_coalescer
+from app.infrastructure.embedding.embedding_coalescer import EmbeddingCoalescer
+from app.infrastructure.embedding.gemini_embedding_service import GeminiEmbeddingService
+
+
+class _RecordingEncoder:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls: list[tuple[list[str], str | None, str | None]] = []
+        self.fail = fail
+
+    async def __call__(self, texts, *, language=None, task_type=None):
+        self.calls.append((list(texts), language, task_type))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("model exploded")
+        return [f"vec:{text}" for text in texts]
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    recorded: list[tuple[str, int, int]] = []
+    monkeypatch.setattr(
+        embedding_coalescer,
+        "record_embedding_batch",
+        lambda *, model, size, wait_seconds: recorded.append((model, size, len(wait_seconds))),
+    )
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_encode(batches) -> None:
+    encoder = _RecordingEncoder()
+    coalescer = EmbeddingCoalescer(encoder, max_batch_size=32, max_wait_seconds=0.01)
+
+    results = await asyncio.gather(
+        *(coalescer.submit(f"t{i}", model="m", language="en") for i in range(5))
+    )
+
+    assert results == [f"vec:t{i}" for i in range(5)]
+    assert encoder.calls == [([f"t{i}" for i in range(5)], "en", None)]
+    assert batches == [("m", 5, 5)]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting(batches) -> None:
+    encoder = _RecordingEncoder()
+    coalescer = EmbeddingCoalescer(encoder, max_batch_size=2, max_wait_seconds=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(coalescer.submit(f"t{i}", model="m") for i in range(4))),
+        timeout=1,
+    )
+
+    assert results == [f"vec:t{i}" for i in range(4)]
+    assert [texts for texts, _, _ in encoder.calls] == [["t0", "t1"], ["t2", "t3"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_keyed_by_model_language_and_task_type(batches) -> None:
+    encoder = _RecordingEncoder()
+    coalescer = EmbeddingCoalescer(encoder, max_wait_seconds=0.005)
+
+    await asyncio.gather(
+        coalescer.submit("a", model="m", task_type="query"),
+        coalescer.submit("b", model="m", task_type="document"),
+        coalescer.submit("c", model="m", task_type="query"),
+        coalescer.submit("d", model="other", task_type="query"),
+        coalescer.submit("e", model="m", language="ru", task_type="query"),
+    )
+
+    assert sorted(encoder.calls) == [
+        (["a", "c"], None, "query"),
+        (["b"], None, "document"),
+        (["d"], None, "query"),
+        (["e"], "ru", "query"),
+    ]
+    assert sorted(size for _, size, _ in batches) == [1, 1, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_encode_error_reaches_every_caller(batches) -> None:
+    coalescer = EmbeddingCoalescer(_RecordingEncoder(fail=True), max_wait_seconds=0.005)
+
+    results = await asyncio.gather(
+        coalescer.submit("a", model="m"),
+        coalescer.submit("b", model="m"),
+        return_exceptions=True,
+    )
+
+    assert [str(result) for result in results] == ["model exploded", "model exploded"]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_retries_each_text_alone(batches) -> None:
+    encoder = _RecordingEncoder()
+
+    async def encode(texts, *, language=None, task_type=None):
+        if "bad" in texts:
+            encoder.calls.append((list(texts), language, task_type))
+            raise ValueError("input rejected")
+        return await encoder(texts, language=language, task_type=task_type)
+
+    coalescer = EmbeddingCoalescer(encode, max_wait_seconds=0.005)
+
+    results = await asyncio.gather(
+        coalescer.submit("a", model="m"),
+        coalescer.submit("bad", model="m"),
+        coalescer.submit("c", model="m"),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "vec:a"
+    assert str(results[1]) == "input rejected"
+    assert results[2] == "vec:c"
+    assert [texts for texts, _, _ in encoder.calls] == [["a", "bad", "c"], ["a"], ["bad"], ["c"]]
+
+
+@pytest.mark.asyncio
+async def test_lone_request_does_not_wait_for_the_window(batches) -> None:
+    encoder = _RecordingEncoder()
+    coalescer = EmbeddingCoalescer(encoder, max_wait_seconds=60)
+
+    result = await asyncio.wait_for(coalescer.submit("a", model="m"), timeout=1)
+
+    assert result == "vec:a"
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_for_the_window_while_an_encode_runs(batches) -> None:
+    release = asyncio.Event()
+    calls: list[list[str]] = []
+
+    async def encode(texts, *, language=None, task_type=None):
+        calls.append(list(texts))
+        await release.wait()
+        return [f"vec:{text}" for text in texts]
+
+    coalescer = EmbeddingCoalescer(encode, max_wait_seconds=0.05)
+    first = asyncio.create_task(coalescer.submit("a", model="m"))
+    await asyncio.sleep(0.001)
+    assert calls == [["a"]]
+
+    later = asyncio.gather(coalescer.submit("b", model="m"), coalescer.submit("c", model="m"))
+    await asyncio.sleep(0.001)
+    assert calls == [["a"]]
+
+    release.set()
+    assert await asyncio.wait_for(later, timeout=1) == ["vec:b", "vec:c"]
+    assert await first == "vec:a"
+    assert calls == [["a"], ["b", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_is_dropped_from_its_batch(batches) -> None:
+    encoder = _RecordingEncoder()
+    coalescer = EmbeddingCoalescer(encoder, max_wait_seconds=0.01)
+
+    cancelled = asyncio.create_task(coalescer.submit("gone", model="m"))
+    kept = asyncio.create_task(coalescer.submit("kept", model="m"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == "vec:kept"
+    assert encoder.calls == [(["kept"], None, None)]
+
+
+@pytest.mark.asyncio
+async def test_drain_flushes_pending_batches(batches) -> None:
+    encoder = _RecordingEncoder()
+    coalescer = EmbeddingCoalescer(encoder, max_wait_seconds=60)
+
+    pending = asyncio.create_task(coalescer.submit("a", model="m"))
+    await asyncio.sleep(0)
+    await coalescer.drain()
+
+    assert pending.done()
+    assert pending.result() == "vec:a"
+
+
+def test_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="max_batch_size"):
+        EmbeddingCoalescer(_RecordingEncoder(), max_batch_size=0)
+    with pytest.raises(ValueError, match="max_wait_seconds"):
+        EmbeddingCoalescer(_RecordingEncoder(), max_wait_seconds=-1)
+
+
+@pytest.mark.asyncio
+async def test_gemini_coalesces_concurrent_calls_into_one_request(batches) -> None:
+    svc = GeminiEmbeddingService(api_key="k", dimensions=2, max_batch_wait_seconds=0.01)
+    client = MagicMock()
+    client.models.embed_content.side_effect = lambda **kwargs: SimpleNamespace(
+        embeddings=[SimpleNamespace(values=[float(i), 0.0]) for i in range(len(kwargs["contents"]))]
+    )
+    svc._client = client
+
+    results = await asyncio.gather(
+        *(svc.generate_embedding(f"text {i}", task_type="document") for i in range(3))
+    )
+
+    assert results == [[0.0, 0.0], [1.0, 0.0], [2.0, 0.0]]
+    client.models.embed_content.assert_called_once()
+    call = client.models.embed_content.call_args.kwargs
+    assert call["contents"] == ["text 0", "text 1", "text 2"]
+    assert call["config"]["task_type"] == "RETRIEVAL_DOCUMENT"
@@ -99,16 +99,19 @@ async def test_embedding_repository_upserts_and_reads(database: Database) -> Non
     assert embedding["language"] == "ru"
 
     rows = await repo.async_get_embeddings_by_request_ids([request.id])
-    assert rows == [
-        {
-            "request_id": request.id,
-            "summary_id": summary.id,
-            "embedding_blob": b"second",
-            "json_payload": {"summary_250": "first"},
-            "normalized_url": request.normalized_url,
-            "input_url": request.input_url,
-        }
-    ]
+    assert len(rows) == 1
+    row = dict(rows[0])
+    assert row.pop("request_created_at") is not None
+    assert row.pop("embedding_updated_at") is not None
+    assert row.pop("embedding_id") is not None
+    assert row == {
+        "request_id": request.id,
+        "summary_id": summary.id,
+        "embedding_blob": b"second",
+        "json_payload": {"summary_250": "first"},
+        "normalized_url": request.normalized_url,
+        "input_url": request.input_url,
+    }
 
 
 @pytest.mark.asyncio
@@ -128,3 +131,33 @@ async def test_embedding_repository_lists_all_and_recent(database: Database) ->
     ]
     assert await repo.async_get_recent_embeddings(limit=0) == []
     assert await repo.async_get_embeddings_by_request_ids([]) == []
+
+
+@pytest.mark.asyncio
+async def test_embedding_repository_lists_embeddings_updated_since(database: Database) -> None:
+    repo = EmbeddingRepositoryAdapter(database)
+    first_request, first_summary = await _summary(database, suffix="since-one")
+    second_request, second_summary = await _summary(database, suffix="since-two")
+    await repo.async_create_or_update_summary_embedding(first_summary.id, b"one", "m", "v", 1)
+    await repo.async_create_or_update_summary_embedding(second_summary.id, b"two", "m", "v", 1)
+    [first] = await repo.async_get_embeddings_by_request_ids([first_request.id])
+
+    after_first = await repo.async_get_embeddings_updated_since(
+        first["embedding_updated_at"], after_id=first["embedding_id"], limit=10
+    )
+    assert [row["request_id"] for row in after_first] == [second_request.id]
+
+    # Regenerating an embedding re-stamps it, so it shows up again.
+    await repo.async_create_or_update_summary_embedding(first_summary.id, b"uno", "m", "v", 1)
+    regenerated = await repo.async_get_embeddings_updated_since(
+        after_first[0]["embedding_updated_at"], after_id=after_first[0]["embedding_id"], limit=10
+    )
+    assert [(row["request_id"], row["embedding_blob"]) for row in regenerated] == [
+        (first_request.id, b"uno")
+    ]
+    assert (
+        await repo.async_get_embeddings_updated_since(
+            first["embedding_updated_at"], after_id=first["embedding_id"], limit=0
+        )
+        == []
+    )
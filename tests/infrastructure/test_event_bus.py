@@ -1,10 +1,13 @@
 """Unit tests for EventBus."""
 
+import asyncio
 from datetime import datetime
+from unittest.mock import AsyncMock
 
 import pytest
 
 from app.domain.events.summary_events import SummaryCreated, SummaryMarkedAsRead
+from app.infrastructure.messaging import event_bus as event_bus_module
 from app.infrastructure.messaging.event_bus import EventBus
 
 
@@ -197,3 +200,172 @@ class TestEventBus:
         assert len(event_types) == 2
         assert SummaryCreated in event_types
         assert SummaryMarkedAsRead in event_types
+
+
+def _summary_created() -> SummaryCreated:
+    return SummaryCreated(
+        occurred_at=datetime.utcnow(),
+        aggregate_id=1,
+        summary_id=1,
+        request_id=2,
+        language="en",
+        has_insights=False,
+    )
+
+
+class TestConcurrentDispatch:
+    """Concurrent dispatch, ordering groups, timeouts and background mode."""
+
+    @pytest.fixture
+    def latencies(self, monkeypatch):
+        recorded: list[tuple[str, str]] = []
+        monkeypatch.setattr(
+            event_bus_module,
+            "record_event_handler_latency",
+            lambda *, event_type, handler, outcome, latency_seconds: recorded.append(
+                (handler.rsplit(".", 1)[-1], outcome)
+            ),
+        )
+        return recorded
+
+    @pytest.mark.asyncio
+    async def test_independent_handlers_overlap(self, latencies):
+        bus = EventBus(dispatch_mode="concurrent")
+        running = 0
+        peak = 0
+
+        async def slow(_event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        async def other(_event):
+            await slow(_event)
+
+        bus.subscribe(SummaryCreated, slow)
+        bus.subscribe(SummaryCreated, other)
+
+        await bus.publish(_summary_created())
+
+        assert peak == 2
+        assert sorted(latencies) == [("other", "success"), ("slow", "success")]
+
+    @pytest.mark.asyncio
+    async def test_grouped_handlers_keep_subscription_order(self, latencies):
+        bus = EventBus(dispatch_mode="concurrent")
+        calls: list[str] = []
+
+        async def first(_event):
+            await asyncio.sleep(0.02)
+            calls.append("first")
+
+        async def second(_event):
+            calls.append("second")
+
+        async def ungrouped(_event):
+            calls.append("ungrouped")
+
+        bus.subscribe(SummaryCreated, first, group="tags")
+        bus.subscribe(SummaryCreated, second, group="tags")
+        bus.subscribe(SummaryCreated, ungrouped)
+
+        await bus.publish(_summary_created())
+
+        assert calls == ["ungrouped", "first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_default_runs_only_opted_in_groups_in_parallel(self, latencies):
+        calls: list[str] = []
+
+        async def slow(_event):
+            await asyncio.sleep(0.02)
+            calls.append("slow")
+
+        async def after(_event):
+            calls.append("after")
+
+        async def grouped(_event):
+            calls.append("grouped")
+
+        def build(bus: EventBus) -> EventBus:
+            bus.subscribe(SummaryCreated, slow)
+            bus.subscribe(SummaryCreated, after)
+            bus.subscribe(SummaryCreated, grouped, group="webhooks")
+            return bus
+
+        await build(EventBus()).publish(_summary_created())
+        assert calls == ["slow", "after", "grouped"]
+
+        calls.clear()
+        await build(EventBus(concurrent_groups={"webhooks"})).publish(_summary_created())
+        assert calls == ["grouped", "slow", "after"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_failure_are_isolated(self, latencies):
+        bus = EventBus(dispatch_mode="concurrent", handler_timeout=1.0)
+        completed: list[str] = []
+
+        async def hangs(_event):
+            await asyncio.sleep(10)
+
+        async def fails(_event):
+            raise TimeoutError("upstream timed out")
+
+        async def works(_event):
+            completed.append("works")
+
+        bus.subscribe(SummaryCreated, hangs, timeout=0.01)
+        bus.subscribe(SummaryCreated, fails)
+        bus.subscribe(SummaryCreated, works)
+
+        await bus.publish(_summary_created())
+
+        assert completed == ["works"]
+        assert sorted(latencies) == [
+            ("fails", "error"),
+            ("hangs", "timeout"),
+            ("works", "success"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_background_publish_returns_before_handlers_finish(self, latencies):
+        bus = EventBus()
+        release = asyncio.Event()
+        handled: list[int] = []
+
+        async def handler(event):
+            await release.wait()
+            handled.append(event.summary_id)
+
+        bus.subscribe(SummaryCreated, handler)
+
+        await bus.publish(_summary_created(), background=True)
+        assert handled == []
+        assert bus.pending_background_dispatches == 1
+
+        release.set()
+        await bus.drain()
+
+        assert handled == [1]
+        assert bus.pending_background_dispatches == 0
+
+    def test_rejects_invalid_configuration(self):
+        with pytest.raises(ValueError, match="dispatch_mode"):
+            EventBus(dispatch_mode="parallel")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="timeout"):
+            EventBus().subscribe(SummaryCreated, AsyncMock(), timeout=0)
+
+    def test_unsubscribe_bound_method(self):
+        class Handler:
+            async def on_created(self, _event):
+                return None
+
+        bus = EventBus()
+        handler = Handler()
+        bus.subscribe(SummaryCreated, handler.on_created)
+
+        bus.unsubscribe(SummaryCreated, handler.on_created)
+
+        assert bus.get_handler_count(SummaryCreated) == 0
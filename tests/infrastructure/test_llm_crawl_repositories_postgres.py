@@ -97,6 +97,9 @@ async def test_llm_repository_persists_and_reads_batch(database: Database) -> No
     assert latest_error["error_context_json"] == {"reason": "test"}
     rows = await repo.async_get_all_for_user(request.user_id or 0)
     assert [row["id"] for row in rows] == inserted_ids
+    since_rows = await repo.async_get_for_user_since(request.user_id or 0, since=0, limit=1)
+    assert len(since_rows) == 1
+    assert since_rows[0]["id"] in inserted_ids
 
 
 @pytest.mark.asyncio
@@ -123,3 +126,7 @@ async def test_crawl_result_repository_is_idempotent(database: Database) -> None
     assert await repo.async_get_max_server_version(request.user_id or 0) is not None
     rows = await repo.async_get_all_for_user(request.user_id or 0)
     assert [item["id"] for item in rows] == [first_id]
+    since_rows = await repo.async_get_for_user_since(
+        request.user_id or 0, since=row["server_version"], limit=10
+    )
+    assert since_rows == []
@@ -0,0 +1,265 @@
+"""Unit tests for the two-tier RedisCache facade, its local tier and codec."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.cache import codec
+from app.infrastructure.cache.local_tier import LocalCacheTier
+from app.infrastructure.cache.redis_cache import RedisCache, cache_stats
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, str]] = []
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self._ops.append((key, value))
+
+    async def execute(self) -> list[bool]:
+        self._redis.pipelines += 1
+        for key, value in self._ops:
+            self._redis.store[key] = value
+        return [True] * len(self._ops)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.gets = 0
+        self.mgets = 0
+        self.pipelines = 0
+
+    async def get(self, key: str) -> str | None:
+        self.gets += 1
+        return self.store.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        self.mgets += 1
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.store[key] = value
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+def _make_cache(*, enabled: bool = True, local_ttl: int = 30) -> tuple[RedisCache, _FakeRedis]:
+    cfg = SimpleNamespace(
+        redis=SimpleNamespace(
+            enabled=enabled,
+            cache_enabled=True,
+            required=False,
+            prefix="test",
+            cache_timeout_sec=0.1,
+            local_cache_max_entries=16,
+            local_cache_ttl_seconds=local_ttl,
+            cache_compress_min_bytes=256,
+        )
+    )
+    cache = RedisCache(cfg)  # type: ignore[arg-type]
+    fake = _FakeRedis()
+    cache._client = fake
+    return cache, fake
+
+
+# ---------------------------------------------------------------------------
+# LocalCacheTier
+# ---------------------------------------------------------------------------
+
+
+class TestLocalCacheTier:
+    def test_entries_expire_after_ttl(self) -> None:
+        now = [100.0]
+        tier = LocalCacheTier(max_entries=4, ttl_seconds=10, clock=lambda: now[0])
+        tier.set("a", "1")
+        assert tier.get("a") == "1"
+        now[0] += 10
+        assert tier.get("a") is None
+        assert "a" not in tier
+
+    def test_entry_ttl_is_capped_by_tier_ttl(self) -> None:
+        now = [0.0]
+        tier = LocalCacheTier(max_entries=4, ttl_seconds=5, clock=lambda: now[0])
+        tier.set("a", "1", ttl_seconds=3_600)
+        now[0] += 5
+        assert tier.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        tier = LocalCacheTier(max_entries=2, ttl_seconds=60)
+        tier.set("a", "1")
+        tier.set("b", "2")
+        assert tier.get("a") == "1"
+        tier.set("c", "3")
+        assert tier.get("b") is None
+        assert tier.get("a") == "1"
+        assert tier.get("c") == "3"
+
+    def test_delete_prefix(self) -> None:
+        tier = LocalCacheTier(max_entries=8, ttl_seconds=60)
+        tier.set("p:trending:1", "x")
+        tier.set("p:trending:2", "y")
+        tier.set("p:llm:1", "z")
+        assert tier.delete_prefix("p:trending:") == 2
+        assert len(tier) == 1
+
+
+# ---------------------------------------------------------------------------
+# codec
+# ---------------------------------------------------------------------------
+
+
+class TestCodec:
+    def test_small_values_stay_plain_json(self) -> None:
+        encoded = codec.encode_value({"a": 1}, compress_min_bytes=256)
+        assert not encoded.startswith(codec.COMPRESSED_MARKER)
+        assert codec.decode_value(encoded) == {"a": 1}
+
+    def test_large_values_are_compressed_and_round_trip(self) -> None:
+        value = {"summary_1000": "lorem ipsum " * 500}
+        encoded = codec.encode_value(value, compress_min_bytes=256)
+        assert encoded.startswith(codec.COMPRESSED_MARKER)
+        assert len(encoded) < len(codec.encode_json(value))
+        assert codec.decode_value(encoded) == value
+
+    def test_legacy_plain_json_decodes(self) -> None:
+        assert codec.decode_value('{"hello": "world"}') == {"hello": "world"}
+
+
+# ---------------------------------------------------------------------------
+# RedisCache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_local_tier_serves_repeat_reads_without_redis() -> None:
+    cache, fake = _make_cache()
+    await cache.set_json(value={"tldr": "x"}, ttl_seconds=60, parts=("llm", "v1", "m", "h"))
+
+    first = await cache.get_json("llm", "v1", "m", "h")
+    first["tldr"] = "mutated"
+    second = await cache.get_json("llm", "v1", "m", "h")
+
+    assert second == {"tldr": "x"}
+    assert fake.gets == 0
+    assert cache_stats()["llm"]["local_hit"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_auth_namespace_always_reads_redis() -> None:
+    cache, fake = _make_cache()
+    await cache.set_json(value={"user_id": 1}, ttl_seconds=60, parts=("auth", "token", "abc"))
+
+    fake.store[next(iter(fake.store))] = '{"user_id": 1, "is_revoked": true}'
+    cached = await cache.get_json("auth", "token", "abc")
+
+    assert cached == {"user_id": 1, "is_revoked": True}
+    assert fake.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_large_values_are_compressed_in_redis() -> None:
+    cache, fake = _make_cache(local_ttl=0)
+    value = {"summary_1000": "word " * 1_000}
+    await cache.set_json(value=value, ttl_seconds=60, parts=("llm", "v1", "m", "big"))
+
+    stored = next(iter(fake.store.values()))
+    assert stored.startswith(codec.COMPRESSED_MARKER)
+    assert await cache.get_json("llm", "v1", "m", "big") == value
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_coalesces_concurrent_misses() -> None:
+    cache, _ = _make_cache()
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"value": 42}
+
+    tasks = [
+        asyncio.create_task(cache.get_or_load("trending", "1", loader=loader, ttl_seconds=60))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert results == [{"value": 42} for _ in range(5)]
+    assert await cache.get_or_load("trending", "1", loader=loader, ttl_seconds=60) == {"value": 42}
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_survives_cancelled_leader() -> None:
+    cache, _ = _make_cache()
+    release = asyncio.Event()
+
+    async def loader() -> str:
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(cache.get_or_load("trending", "2", loader=loader, ttl_seconds=60))
+    follower = asyncio.create_task(
+        cache.get_or_load("trending", "2", loader=loader, ttl_seconds=60)
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == "done"
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_propagates_loader_errors_and_retries() -> None:
+    cache, _ = _make_cache()
+
+    async def failing() -> None:
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError, match="db down"):
+        await cache.get_or_load("trending", "3", loader=failing, ttl_seconds=60)
+
+    async def working() -> str:
+        return "ok"
+
+    assert await cache.get_or_load("trending", "3", loader=working, ttl_seconds=60) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_many_ops_use_one_round_trip() -> None:
+    cache, fake = _make_cache(local_ttl=0)
+    stored = await cache.set_many_json(
+        [(("embed", "v1", "m", str(i)), {"i": i}) for i in range(3)], ttl_seconds=60
+    )
+
+    results = await cache.get_many_json(
+        [("embed", "v1", "m", "0"), ("embed", "v1", "m", "missing"), ("embed", "v1", "m", "2")]
+    )
+
+    assert stored == 3
+    assert fake.pipelines == 1
+    assert fake.mgets == 1
+    assert results == [{"i": 0}, None, {"i": 2}]
+
+
+@pytest.mark.asyncio
+async def test_local_tier_works_when_redis_disabled() -> None:
+    cache, _ = _make_cache(enabled=False)
+
+    assert await cache.set_json(value=[1, 2], ttl_seconds=60, parts=("trending", "9"))
+    assert await cache.get_json("trending", "9") == [1, 2]
+    assert not await cache.set_json(value=[1], ttl_seconds=60, parts=("auth", "token", "x"))
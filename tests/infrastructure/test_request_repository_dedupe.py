@@ -138,3 +138,38 @@ async def test_find_recent_returns_none_for_unknown_hash(database: Database) ->
     result = await repo.async_find_recent_request_by_dedupe("hash-nonexistent-xyz", max_age_sec=300)
 
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_dedupe_lookups_and_create(database: Database) -> None:
+    """Bulk lookups key rows by hash; bulk create reuses ids for existing hashes."""
+    repo = RequestRepositoryAdapter(database)
+    existing_id = await repo.async_create_request(
+        type_="url",
+        status=cast("RequestStatus", "processing"),
+        correlation_id="cid-bulk-0",
+        user_id=1,
+        chat_id=1,
+        dedupe_hash="hash-bulk-0",
+        input_url="https://example.com/bulk/0",
+    )
+
+    found = await repo.async_get_requests_by_dedupe_hashes(["hash-bulk-0", "hash-bulk-1"])
+    recent = await repo.async_find_recent_requests_by_dedupe_hashes(
+        ["hash-bulk-0", "hash-bulk-1"], max_age_sec=300
+    )
+    created = await repo.async_create_minimal_requests(
+        [
+            {"dedupe_hash": f"hash-bulk-{i}", "input_url": f"https://example.com/bulk/{i}"}
+            for i in (0, 1, 2, 1)
+        ]
+    )
+
+    assert set(found) == {"hash-bulk-0"}
+    assert found["hash-bulk-0"]["id"] == existing_id
+    assert recent["hash-bulk-0"]["status"] == "processing"
+    assert created["hash-bulk-0"] == (existing_id, False)
+    assert created["hash-bulk-1"][1] is True
+    assert created["hash-bulk-2"][1] is True
+    rows = await repo.async_get_requests_by_dedupe_hashes(["hash-bulk-1", "hash-bulk-2"])
+    assert {row["status"] for row in rows.values()} == {"pending"}
@@ -176,3 +176,7 @@ async def test_request_repository_context_and_telegram_message(database: Databas
         request_id
     ]
     assert [row["id"] for row in await repo.async_get_all_for_user(43)] == [request_id]
+    assert [row["id"] for row in await repo.async_get_for_user_since(43, since=0, limit=10)] == [
+        request_id
+    ]
+    assert await repo.async_get_for_user_since(43, since=0, limit=0) == []
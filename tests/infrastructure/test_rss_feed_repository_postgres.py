@@ -221,8 +221,18 @@ async def test_rss_feed_repository_items_and_delivery_targets(database: Database
     )
     assert [item["guid"] for item in bulk_items] == ["guid-3", "guid-4"]
 
+    second_feed = await repo.async_get_or_create_feed("https://example.com/second.xml")
+    batch = await repo.async_create_feed_items_batch(
+        {
+            int(feed["id"]): [{"guid": "guid-4"}, {"guid": "guid-5", "title": "Batch Post"}],
+            int(second_feed["id"]): [{"guid": "guid-1"}, {"guid": "guid-1"}],
+        }
+    )
+    assert [item["guid"] for item in batch[int(feed["id"])]] == ["guid-5"]
+    assert [item["feed"] for item in batch[int(second_feed["id"])]] == [second_feed["id"]]
+
     items = await repo.async_list_feed_items(int(feed["id"]))
-    assert [row["guid"] for row in items] == ["guid-2", "guid-1", "guid-3", "guid-4"]
+    assert [row["guid"] for row in items] == ["guid-2", "guid-1", "guid-3", "guid-4", "guid-5"]
 
     targets = await repo.async_list_delivery_targets([int(older_item["id"]), int(newer_item["id"])])
     assert [target["guid"] for target in targets] == ["guid-2", "guid-1"]
@@ -0,0 +1,166 @@
+"""The SQL condition prefilter never drops a summary the Python matcher accepts."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import delete
+
+from app.config.database import DatabaseConfig
+from app.db.models import Request, Summary, User
+from app.db.session import Database
+from app.domain.services.rule_compiler import compile_conditions
+from app.domain.services.summary_context import build_summary_context
+from app.infrastructure.persistence.repositories.collection_repository import (
+    CollectionRepositoryAdapter,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+_USER_ID = 8802
+
+_PAYLOADS: list[tuple[str, str | None, Any]] = [
+    (
+        "https://arxiv.org/abs/1",
+        "en",
+        {
+            "title": "Learn PYTHON fast",
+            "topic_tags": ["python", "ml"],
+            "estimated_reading_time_min": 7,
+            "source_type": "article",
+            "summary_1000": "Neural networks",
+        },
+    ),
+    (
+        "https://example.com/straße",
+        "ru",
+        {
+            "title": "STRASSE Straße",
+            "topic_tags": ["rust"],
+            "estimated_reading_time_min": 12.5,
+            "source_type": "video",
+            "summary_1000": "",
+            "summary_250": "ÉCOLE neural",
+        },
+    ),
+    ("https://example.org", None, {"title": "Kelvin K", "topic_tags": None}),
+    ("", "en", {"estimated_reading_time_min": True, "topic_tags": "python"}),
+    ("https://news.site", "de", {"summary_1000": 5, "summary_250": "NEURAL nets"}),
+    ("https://empty.site", "en", {}),
+]
+
+_CONDITION_SETS: list[tuple[list[dict[str, Any]], str]] = [
+    ([{"type": "domain_matches", "operator": "contains", "value": "example"}], "all"),
+    ([{"type": "domain_matches", "operator": "equals", "value": "https://arxiv.org/abs/1"}], "all"),
+    ([{"type": "title_contains", "operator": "contains", "value": "python"}], "all"),
+    ([{"type": "title_contains", "operator": "contains", "value": "straße"}], "all"),
+    ([{"type": "title_contains", "operator": "contains", "value": "k"}], "all"),
+    ([{"type": "content_contains", "operator": "contains", "value": "neural"}], "all"),
+    ([{"type": "has_tag", "operator": "any", "value": ["python", "go"]}], "all"),
+    ([{"type": "has_tag", "operator": "all", "value": ["python", "ml"]}], "all"),
+    ([{"type": "has_tag", "operator": "none", "value": ["rust"]}], "all"),
+    ([{"type": "language_is", "operator": "in", "value": "en, de"}], "all"),
+    ([{"type": "source_type", "operator": "equals", "value": "video"}], "all"),
+    ([{"type": "reading_time", "operator": "gt", "value": 5}], "all"),
+    ([{"type": "reading_time", "operator": "lt", "value": 8}], "all"),
+    ([{"type": "reading_time", "operator": "eq", "value": 12}], "all"),
+    (
+        [
+            {"type": "title_contains", "operator": "regex", "value": "^learn"},
+            {"type": "language_is", "operator": "equals", "value": "en"},
+        ],
+        "all",
+    ),
+    (
+        [
+            {"type": "domain_matches", "operator": "contains", "value": "arxiv"},
+            {"type": "source_type", "operator": "in", "value": ["video"]},
+        ],
+        "any",
+    ),
+    (
+        [
+            {"type": "domain_matches", "operator": "contains", "value": "arxiv"},
+            {"type": "content_contains", "operator": "regex", "value": "neur"},
+        ],
+        "any",
+    ),
+]
+
+
+def _test_dsn() -> str:
+    return os.getenv("TEST_DATABASE_URL", "")
+
+
+@pytest.fixture
+async def database() -> AsyncGenerator[Database]:
+    dsn = _test_dsn()
+    if not dsn:
+        pytest.skip("TEST_DATABASE_URL is required for Postgres repository tests")
+
+    db = Database(DatabaseConfig(dsn=dsn, pool_size=1, max_overflow=1))
+    await db.migrate()
+    await _clear(db)
+    try:
+        yield db
+    finally:
+        await _clear(db)
+        await db.dispose()
+
+
+async def _clear(database: Database) -> None:
+    async with database.transaction() as session:
+        await session.execute(delete(Summary))
+        await session.execute(delete(Request))
+        await session.execute(delete(User))
+
+
+async def _seed(database: Database) -> None:
+    async with database.transaction() as session:
+        session.add(User(telegram_user_id=_USER_ID, username="prefilter-owner"))
+        await session.flush()
+        for index, (url, lang, payload) in enumerate(_PAYLOADS):
+            request = Request(
+                user_id=_USER_ID,
+                type="url",
+                status="completed",
+                input_url=url,
+                normalized_url=url or None,
+                dedupe_hash=f"prefilter-{index}",
+            )
+            session.add(request)
+            await session.flush()
+            session.add(Summary(request_id=request.id, lang=lang, json_payload=payload))
+
+
+def _matching_ids(entries: list[dict[str, Any]], conditions: list[Any], match_mode: str) -> set:
+    compiled = compile_conditions(conditions, match_mode)
+    matched: set[int] = set()
+    for entry in entries:
+        context = build_summary_context(entry["summary"], entry["request"])
+        try:
+            if compiled.matches(context):
+                matched.add(entry["summary"]["id"])
+        except (AttributeError, TypeError):
+            continue
+    return matched
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("conditions", "match_mode"), _CONDITION_SETS)
+async def test_prefilter_keeps_every_match(
+    database: Database, conditions: list[dict[str, Any]], match_mode: str
+) -> None:
+    await _seed(database)
+    repo = CollectionRepositoryAdapter(database)
+
+    everything = await repo.async_list_smart_collection_candidates(_USER_ID, [], "all")
+    candidates = await repo.async_list_smart_collection_candidates(_USER_ID, conditions, match_mode)
+
+    assert len(everything) == len(_PAYLOADS)
+    assert _matching_ids(candidates, conditions, match_mode) == _matching_ids(
+        everything, conditions, match_mode
+    )
@@ -352,6 +352,33 @@ async def test_signal_repository_bulk_feed_items_and_subscriptions(
     assert subscription_count == 2
 
 
+@pytest.mark.asyncio
+async def test_signal_repository_batch_upserts_sources_and_items(
+    repo: SignalSourceRepositoryAdapter,
+) -> None:
+    sources = await repo.async_upsert_sources(
+        [
+            {"kind": "rss", "external_id": "https://a.example/feed.xml", "title": "A"},
+            {"kind": "substack", "external_id": "https://b.substack.com/feed", "title": "B"},
+            {"kind": "rss", "external_id": "https://a.example/feed.xml", "title": "A2"},
+        ]
+    )
+    assert sources[0]["id"] == sources[2]["id"]
+    assert sources[0]["title"] == "A2"
+    assert sources[1]["kind"] == "substack"
+    single = await repo.async_upsert_source(kind="rss", external_id="https://a.example/feed.xml")
+    assert single["id"] == sources[0]["id"]
+
+    items = await repo.async_upsert_feed_items_batch(
+        {
+            int(sources[0]["id"]): [{"external_id": "a-1"}, {"external_id": "a-2"}],
+            int(sources[1]["id"]): [{"external_id": "a-1", "title": "Same guid, other source"}],
+        }
+    )
+    assert [item["external_id"] for item in items[int(sources[0]["id"])]] == ["a-1", "a-2"]
+    assert [item["title"] for item in items[int(sources[1]["id"])]] == ["Same guid, other source"]
+
+
 @pytest.mark.asyncio
 async def test_signal_repository_detail_boost_and_source_health(
     database: Database,
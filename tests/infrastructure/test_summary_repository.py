@@ -17,6 +17,7 @@ from app.db.session import Database
 from app.domain.models.request import RequestStatus
 from app.infrastructure.persistence.repositories.summary_repository import (
     SummaryRepositoryAdapter,
+    clear_summary_count_cache,
 )
 
 if TYPE_CHECKING:
@@ -36,6 +37,7 @@ async def database() -> AsyncGenerator[Database]:
     db = Database(DatabaseConfig(dsn=dsn, pool_size=1, max_overflow=1))
     await db.migrate()
     await _clear(db)
+    clear_summary_count_cache()
     try:
         yield db
     finally:
@@ -221,6 +223,13 @@ async def test_summary_repository_user_lists_and_topic_filter(database: Database
         (await repo.async_get_summary_by_request(second_request_id))["id"],
     ]
     assert await repo.async_get_max_server_version(505) is not None
+    since_rows = await repo.async_get_for_user_since(505, since=0, limit=10)
+    assert sorted(row["id"] for row in since_rows) == sorted(
+        row["id"] for row in await repo.async_get_all_for_user(505)
+    )
+    assert [row["server_version"] for row in since_rows] == sorted(
+        row["server_version"] for row in since_rows
+    )
     insight_rows = await repo.async_get_user_summaries_for_insights(
         505, dt.datetime.now(UTC) - dt.timedelta(days=1), 5
     )
@@ -237,3 +246,62 @@ async def test_summary_repository_user_lists_and_topic_filter(database: Database
         )
         == 2
     )
+
+
+@pytest.mark.asyncio
+async def test_summary_cards_keyset_pages_and_cached_counts(database: Database) -> None:
+    repo = SummaryRepositoryAdapter(database)
+    request_ids = [
+        await _create_request(database, user_id=606, url=f"https://example.com/card/{i}")
+        for i in range(5)
+    ]
+    for index, request_id in enumerate(request_ids):
+        await repo.async_upsert_summary(
+            request_id,
+            "en",
+            {
+                "tldr": f"tldr {index}",
+                "metadata": {"title": f"Card {index}", "domain": "example.com"},
+                "key_ideas": ["large field the card never reads"],
+            },
+            is_read=index == 0,
+        )
+    # Identical created_at for two rows exercises the id tie-break.
+    async with database.transaction() as session:
+        same_time = dt.datetime(2026, 1, 1, tzinfo=UTC)
+        for request_id in request_ids[1:3]:
+            request = await session.get(Request, request_id)
+            assert request is not None
+            request.created_at = same_time
+
+    pages: list[list[int]] = []
+    after = None
+    while True:
+        cards = await repo.async_get_user_summary_cards(606, limit=2, after=after)
+        if not cards:
+            break
+        pages.append([card["request_id"] for card in cards])
+        after = (cards[-1]["request"]["created_at"], cards[-1]["request"]["id"])
+
+    legacy, total, unread = await repo.async_get_user_summaries(606, limit=10)
+    assert [rid for page in pages for rid in page] == [row["request"]["id"] for row in legacy]
+    assert sorted(rid for page in pages for rid in page) == sorted(request_ids)
+    card = (await repo.async_get_user_summary_cards(606, limit=1, sort="created_at_asc"))[0]
+    assert set(card["json_payload"]) == {"tldr", "metadata"}
+    assert card["json_payload"]["metadata"] == {"title": "Card 0", "domain": "example.com"}
+    assert (total, unread) == (5, 4)
+
+    first_summary = await repo.async_get_summary_by_request(request_ids[1])
+    assert first_summary is not None
+    await repo.async_mark_summary_as_read(first_summary["id"])
+    assert await repo.async_get_user_summary_counts(606) == (5, 3)
+    assert await repo.async_get_user_summary_counts(606, is_read=True) == (2, 3)
+
+    # A write that bypasses the adapter (another process) stays invisible to the
+    # cached counters until the caller asks for fresh ones.
+    async with database.transaction() as session:
+        summary = await session.get(Summary, first_summary["id"])
+        assert summary is not None
+        summary.is_read = False
+    assert await repo.async_get_user_summary_counts(606) == (5, 3)
+    assert await repo.async_get_user_summary_counts(606, cached=False) == (5, 4)
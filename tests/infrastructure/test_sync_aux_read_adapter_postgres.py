@@ -111,3 +111,22 @@ async def test_sync_aux_read_adapter_reads_user_scoped_records(database: Databas
     assert [row["name"] for row in tags] == ["Sync"]
     assert len(summary_tags) == 1
     assert summary_tags[0]["tag_id"] == tag.id
+
+    since_highlights = await adapter.get_highlights_for_user_since(
+        user.telegram_user_id, since=0, limit=10
+    )
+    assert [row["text"] for row in since_highlights] == ["important"]
+    assert (
+        await adapter.get_highlights_for_user_since(
+            user.telegram_user_id, since=highlight.server_version, limit=10
+        )
+        == []
+    )
+    assert [
+        row["name"]
+        for row in await adapter.get_tags_for_user_since(user.telegram_user_id, since=0, limit=1)
+    ] == ["Sync"]
+    since_summary_tags = await adapter.get_summary_tags_for_user_since(
+        user.telegram_user_id, since=0, limit=10
+    )
+    assert [row["tag_id"] for row in since_summary_tags] == [tag.id]
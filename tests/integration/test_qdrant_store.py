@@ -127,6 +127,30 @@ def test_query_distance_is_non_negative(store: QdrantVectorStore) -> None:
     assert all(h.distance >= 0.0 for h in result.hits)
 
 
+@pytest.mark.integration
+def test_query_batch_matches_single_queries(store: QdrantVectorStore) -> None:
+    store.upsert_notes(
+        [_vec(0.1), _vec(0.4), _vec(0.8)],
+        [_meta(1, 11, user_id=7), _meta(2, 22, user_id=7), _meta(3, 33, user_id=8)],
+    )
+    queries = [_vec(0.1), _vec(0.5), _vec(0.9)]
+
+    batched = store.query_batch(queries, filters={"user_id": 7}, top_k=2)
+    single = [store.query(q, filters={"user_id": 7}, top_k=2) for q in queries]
+
+    assert len(batched) == len(queries)
+    for batch_result, single_result in zip(batched, single, strict=True):
+        assert [h.id for h in batch_result.hits] == [h.id for h in single_result.hits]
+        assert [h.distance for h in batch_result.hits] == pytest.approx(
+            [h.distance for h in single_result.hits]
+        )
+
+
+@pytest.mark.integration
+def test_query_batch_empty_input_returns_empty(store: QdrantVectorStore) -> None:
+    assert store.query_batch([], filters=None, top_k=3) == []
+
+
 @pytest.mark.integration
 def test_upsert_is_idempotent(store: QdrantVectorStore) -> None:
     vectors = [_vec(0.5)]
@@ -0,0 +1,167 @@
+"""Integration tests for AsyncQdrantVectorStore and QdrantWriteBatcher (in-memory Qdrant)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+
+from app.infrastructure.vector.async_qdrant_store import AsyncQdrantVectorStore
+from app.infrastructure.vector.write_batcher import QdrantWriteBatcher
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+EMBEDDING_DIM = 3
+
+
+class _RecordingStore(AsyncQdrantVectorStore):
+    """Counts round trips and the ``wait`` flag of every write."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.lookups = 0
+        self.writes: list[dict[str, Any]] = []
+        self.barriers = 0
+        self.failing_writes = 0
+
+    async def fetch_request_point_hashes(self, request_ids):  # type: ignore[override]
+        self.lookups += 1
+        return await super().fetch_request_point_hashes(request_ids)
+
+    async def apply_writes(self, **kwargs: Any) -> bool:  # type: ignore[override]
+        self.writes.append(kwargs)
+        if self.failing_writes:
+            self.failing_writes -= 1
+            return False
+        return await super().apply_writes(**kwargs)
+
+    async def write_barrier(self) -> bool:
+        self.barriers += 1
+        return await super().write_barrier()
+
+
+@pytest.fixture
+async def store() -> AsyncGenerator[_RecordingStore]:
+    with patch(
+        "app.infrastructure.vector.async_qdrant_store.AsyncQdrantClient",
+        side_effect=lambda **_kwargs: AsyncQdrantClient(":memory:"),
+    ):
+        s = _RecordingStore(
+            url="http://localhost:6333",
+            api_key=None,
+            environment="test",
+            user_scope="unit",
+            embedding_dim=EMBEDDING_DIM,
+        )
+        assert await s.connect()
+    yield s
+    await s.aclose()
+
+
+def _vec(seed: float) -> list[float]:
+    return [seed, 1.0 - seed, seed * 0.5]
+
+
+def _meta(request_id: int, window: int) -> dict[str, Any]:
+    return {"request_id": request_id, "summary_id": request_id * 10, "window_id": f"w{window}"}
+
+
+async def _request_ids(store: AsyncQdrantVectorStore) -> list[int]:
+    hits = await store.query(_vec(0.5), None, top_k=50)
+    return sorted(hit.metadata["request_id"] for hit in hits.hits)
+
+
+async def test_batches_many_requests_into_one_round_trip(store: _RecordingStore) -> None:
+    batcher = QdrantWriteBatcher(store, max_points=100)
+    for request_id in range(1, 6):
+        await batcher.replace_request_notes(
+            request_id, [_vec(0.1 * request_id)], [_meta(request_id, 0)]
+        )
+
+    stats = await batcher.close()
+
+    assert store.lookups == 1
+    assert len(store.writes) == 1
+    assert store.writes[0]["wait"] is True
+    assert stats.points_written == 5
+    assert await _request_ids(store) == [1, 2, 3, 4, 5]
+
+
+async def test_unchanged_points_are_skipped_and_stale_points_deleted(
+    store: _RecordingStore,
+) -> None:
+    await store.replace_request_notes(1, [_vec(0.1), _vec(0.2)], [_meta(1, 0), _meta(1, 1)])
+    batcher = QdrantWriteBatcher(store)
+
+    await batcher.replace_request_notes(1, [_vec(0.1)], [_meta(1, 0)])
+    await batcher.replace_request_notes(2, [_vec(0.3)], [_meta(2, 0)])
+    stats = await batcher.close()
+
+    assert (stats.points_written, stats.points_unchanged, stats.points_deleted) == (1, 1, 1)
+    assert await store.count() == 2
+
+
+async def test_flushes_without_waiting_until_the_barrier(store: _RecordingStore) -> None:
+    batcher = QdrantWriteBatcher(store, max_points=1, barrier_every=3)
+    for request_id in range(1, 5):
+        await batcher.replace_request_notes(request_id, [_vec(0.2)], [_meta(request_id, 0)])
+
+    assert [write["wait"] for write in store.writes] == [False, False, True, False]
+
+    stats = await batcher.close()
+
+    # The buffer was empty, so a no-op barrier is sent instead of a write.
+    assert len(store.writes) == 4
+    assert store.barriers == 1
+    assert stats.barriers == 2
+    assert await store.count() == 4
+
+
+async def test_failed_flush_is_retried_with_newer_operations_on_top(
+    store: _RecordingStore,
+) -> None:
+    batcher = QdrantWriteBatcher(store, max_points=2)
+    store.failing_writes = 1
+    await batcher.replace_request_notes(1, [_vec(0.1)], [_meta(1, 0)])
+    await batcher.replace_request_notes(2, [_vec(0.2)], [_meta(2, 0)])
+    assert batcher.stats.failed_flushes == 1
+
+    await batcher.delete_by_request_id(2)
+    await batcher.replace_request_notes(3, [_vec(0.3)], [_meta(3, 0)])
+    stats = await batcher.close()
+
+    assert stats.points_unsent == 0
+    assert await _request_ids(store) == [1, 3]
+
+
+async def test_close_reports_writes_it_could_not_send(store: _RecordingStore) -> None:
+    batcher = QdrantWriteBatcher(store)
+    store.failing_writes = 2
+    await batcher.replace_request_notes(1, [_vec(0.1)], [_meta(1, 0)])
+    await batcher.delete_by_request_id(2)
+
+    await batcher.flush()
+    stats = await batcher.close()
+
+    assert stats.failed_flushes == 2
+    assert stats.points_unsent == 2
+    assert await store.count() == 0
+
+
+async def test_later_operation_on_a_request_supersedes_buffered_one(
+    store: _RecordingStore,
+) -> None:
+    await store.replace_request_notes(1, [_vec(0.1)], [_meta(1, 0)])
+    batcher = QdrantWriteBatcher(store)
+
+    await batcher.replace_request_notes(1, [_vec(0.9)], [_meta(1, 5)])
+    await batcher.delete_by_request_id(1)
+    await batcher.delete_by_request_id(2)
+    await batcher.replace_request_notes(2, [_vec(0.4)], [_meta(2, 0)])
+    stats = await batcher.close()
+
+    assert stats.requests_deleted == 1
+    assert await _request_ids(store) == [2]
@@ -0,0 +1,85 @@
+"""Property-based parity tests for compiled rule conditions using Hypothesis."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, settings, strategies as st
+
+from app.domain.services.rule_compiler import compile_conditions
+from app.domain.services.rule_engine import RuleConditionEvaluator
+
+_words = st.sampled_from(["python", "Python", "rust", "ai", "", "straße", "K", "K", "en"])
+_text = st.one_of(_words, st.text(max_size=20))
+_scalar = st.one_of(
+    _text, st.integers(-5, 20), st.floats(allow_nan=False), st.none(), st.booleans()
+)
+
+condition_strategy = st.fixed_dictionaries(
+    {
+        "type": st.sampled_from(
+            [
+                "domain_matches",
+                "title_contains",
+                "has_tag",
+                "language_is",
+                "reading_time",
+                "source_type",
+                "content_contains",
+                "unknown",
+            ]
+        ),
+        "operator": st.sampled_from(
+            ["equals", "contains", "regex", "any", "all", "none", "in", "gt", "lt", "eq", "?"]
+        ),
+        "value": st.one_of(_scalar, st.lists(_text, max_size=3), st.sampled_from(["a(", "en, ru"])),
+    }
+)
+
+context_strategy = st.fixed_dictionaries(
+    {},
+    optional={
+        "url": st.one_of(_text, st.none()),
+        "title": st.one_of(_text, st.none()),
+        "tags": st.one_of(st.lists(_text, max_size=4), _text, st.none()),
+        "language": st.one_of(_text, st.none()),
+        "reading_time": st.one_of(st.integers(-5, 30), st.floats(allow_nan=False), st.booleans()),
+        "source_type": _text,
+        "content": _text,
+    },
+)
+
+
+def _outcome(fn: Any) -> tuple[str, Any]:
+    try:
+        return "ok", fn()
+    except Exception as exc:
+        return "raised", type(exc)
+
+
+class TestCompiledConditionParity:
+    """The compiled matcher returns (or raises) exactly what the evaluator does."""
+
+    @given(
+        conditions=st.lists(condition_strategy, max_size=5),
+        contexts=st.lists(context_strategy, min_size=1, max_size=5),
+        match_mode=st.sampled_from(["all", "any"]),
+    )
+    @settings(max_examples=300, deadline=None)
+    def test_evaluate_matches_reference(
+        self,
+        conditions: list[dict[str, Any]],
+        contexts: list[dict[str, Any]],
+        match_mode: str,
+    ) -> None:
+        compiled = compile_conditions(conditions, match_mode)
+        for context in contexts:
+            expected = _outcome(
+                lambda ctx=context: RuleConditionEvaluator.evaluate_conditions(
+                    conditions, ctx, match_mode
+                )
+            )
+            assert _outcome(lambda ctx=context: compiled.evaluate(ctx)) == expected
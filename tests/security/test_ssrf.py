@@ -338,3 +338,18 @@ def test_safe_sync_transport_raises_on_dns_failure() -> None:
     ):
         with pytest.raises(httpx.ConnectError, match="DNS resolution failed"):
             transport.handle_request(request)
+
+
+# Client factories
+
+
+@pytest.mark.asyncio
+async def test_make_safe_async_client_applies_limits_to_transport() -> None:
+    from app.security.ssrf import SafeAsyncTransport, make_safe_async_client
+
+    limits = httpx.Limits(max_connections=3, max_keepalive_connections=2)
+    async with make_safe_async_client(limits=limits) as client:
+        transport = client._transport
+        assert isinstance(transport, SafeAsyncTransport)
+        assert transport._pool._max_connections == 3
+        assert transport._pool._max_keepalive_connections == 2
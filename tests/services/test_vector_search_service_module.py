@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -208,3 +209,217 @@ async def test_search_prefers_scoped_candidates_and_applies_filters(
     filtered = await service.search("semantic query", filters=cast("Any", _Filters()))
     assert len(filtered) == 1
     assert filtered[0].source == "keep.example"
+
+
+def _blob_row(
+    request_id: int,
+    vector: list[float],
+    *,
+    created: float,
+    updated: float | None = None,
+    source: str = "example.com",
+) -> dict[str, Any]:
+    from datetime import UTC, datetime
+
+    from app.infrastructure.embedding.embedding_protocol import pack_embedding
+
+    stamp = datetime.fromtimestamp(created, tz=UTC)
+    updated_stamp = datetime.fromtimestamp(created if updated is None else updated, tz=UTC)
+    return {
+        "request_id": request_id,
+        "summary_id": request_id + 1000,
+        "embedding_blob": pack_embedding(vector),
+        "json_payload": {"title": f"T{request_id}", "metadata": {"domain": source}},
+        "normalized_url": f"https://{source}/{request_id}",
+        "input_url": None,
+        "request_created_at": stamp,
+        "embedding_updated_at": updated_stamp,
+        "embedding_id": request_id,
+    }
+
+
+class _MatrixEmbeddingRepo:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = {row["request_id"]: row for row in rows}
+        self.calls: list[tuple[str, Any]] = []
+
+    async def async_get_recent_embeddings(self, *, limit: int) -> list[dict[str, Any]]:
+        self.calls.append(("recent", limit))
+        ordered = sorted(self.rows.values(), key=lambda row: row["request_created_at"])
+        return ordered[::-1][:limit]
+
+    async def async_get_embeddings_by_request_ids(
+        self, request_ids: list[int]
+    ) -> list[dict[str, Any]]:
+        self.calls.append(("by_ids", sorted(request_ids)))
+        return [self.rows[rid] for rid in request_ids if rid in self.rows]
+
+    async def async_get_embeddings_updated_since(
+        self, since: Any, *, after_id: int, limit: int
+    ) -> list[dict[str, Any]]:
+        self.calls.append(("since", (since, after_id)))
+        newer = [
+            row
+            for row in self.rows.values()
+            if (row["embedding_updated_at"], row["embedding_id"]) > (since, after_id)
+        ]
+        return sorted(newer, key=lambda row: (row["embedding_updated_at"], row["embedding_id"]))[
+            :limit
+        ]
+
+
+class _VectorEmbeddingService(_DummyEmbeddingService):
+    async def generate_embedding(
+        self, _text: str, *, language: str | None = None, task_type: str | None = None
+    ) -> list[float]:
+        return [1.0, 0.0]
+
+    def deserialize_embedding(self, blob: bytes | str) -> list[float]:
+        from app.infrastructure.embedding.embedding_protocol import unpack_embedding
+
+        return unpack_embedding(cast("bytes", blob))
+
+
+def _matrix_service(
+    repo: _MatrixEmbeddingRepo, topic_ids: list[int], *, matrix: bool = True
+) -> VectorSearchService:
+    from app.infrastructure.search.embedding_matrix import EmbeddingMatrix
+
+    return VectorSearchService(
+        embedding_repository=cast("Any", repo),
+        topic_search_repository=cast("Any", _DummyTopicRepo(topic_ids)),
+        embedding_service=cast("Any", _VectorEmbeddingService()),
+        max_results=3,
+        min_similarity=0.3,
+        fallback_scan_limit=4,
+        embedding_matrix=EmbeddingMatrix(max_rows=8) if matrix else None,
+        matrix_refresh_interval_sec=0.0,
+    )
+
+
+_MATRIX_ROWS = [
+    _blob_row(1, [1.0, 0.0], created=1.0),
+    _blob_row(2, [0.8, 0.6], created=2.0, source="other.example"),
+    _blob_row(3, [0.0, 1.0], created=3.0),
+    _blob_row(4, [0.6, 0.8], created=4.0),
+    _blob_row(5, [0.9, 0.1], created=5.0),
+    _blob_row(6, [0.95, 0.05], created=6.0),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("topic_ids", [[], [1, 2, 3, 4]])
+async def test_matrix_search_matches_legacy_results(topic_ids: list[int]) -> None:
+    pytest.importorskip("numpy")
+    warm = _matrix_service(_MatrixEmbeddingRepo(_MATRIX_ROWS), topic_ids)
+    legacy = _matrix_service(_MatrixEmbeddingRepo(_MATRIX_ROWS), topic_ids, matrix=False)
+
+    warm_results = await warm.search("query")
+    legacy_results = await legacy.search("query")
+
+    assert [r.request_id for r in warm_results] == [r.request_id for r in legacy_results]
+    assert [r.similarity_score for r in warm_results] == pytest.approx(
+        [r.similarity_score for r in legacy_results], abs=1e-6
+    )
+    assert warm_results[0].title == legacy_results[0].title
+
+
+@pytest.mark.asyncio
+async def test_matrix_search_fetches_only_missing_candidates_and_refreshes() -> None:
+    pytest.importorskip("numpy")
+    repo = _MatrixEmbeddingRepo(_MATRIX_ROWS)
+    service = _matrix_service(repo, [1, 2, 6])
+
+    await service.search("query")
+    await service.search("query")
+
+    # Recent window (3..6) is loaded once; only 1 and 2 are fetched by id, once.
+    assert [call for call in repo.calls if call[0] != "since"] == [
+        ("recent", 4),
+        ("by_ids", [1, 2]),
+    ]
+
+    repo.rows[7] = _blob_row(7, [1.0, 0.0], created=7.0)
+    service._topic_repo = cast("Any", _DummyTopicRepo([]))
+    results = await service.search("query")
+
+    assert results[0].request_id == 7
+
+
+@pytest.mark.asyncio
+async def test_matrix_refresh_keeps_tied_rows_and_ignores_candidate_loads() -> None:
+    pytest.importorskip("numpy")
+    repo = _MatrixEmbeddingRepo(_MATRIX_ROWS[4:])
+    service = _matrix_service(repo, [])
+    await service.search("query")
+
+    # Five writes share one timestamp, so a page boundary (limit 4) falls
+    # between them, and a newer row arrives as an FTS candidate before the
+    # next refresh runs.
+    for request_id in range(7, 12):
+        repo.rows[request_id] = _blob_row(request_id, [1.0, 0.0], created=7.0, updated=10.0)
+    repo.rows[12] = _blob_row(12, [1.0, 0.0], created=8.0, updated=11.0)
+    service._matrix_refresh_interval = 3600.0
+    service._topic_repo = cast("Any", _DummyTopicRepo([12]))
+    await service.search("query")
+
+    service._matrix_refresh_interval = 0.0
+    service._topic_repo = cast("Any", _DummyTopicRepo([]))
+    await service.search("query")
+
+    assert service._matrix is not None
+    assert service._matrix.missing(list(range(7, 13))) == []
+
+
+@pytest.mark.asyncio
+async def test_matrix_search_does_not_wait_for_a_running_refresh() -> None:
+    pytest.importorskip("numpy")
+    repo = _MatrixEmbeddingRepo(_MATRIX_ROWS)
+    service = _matrix_service(repo, [])
+    await service.search("query")
+
+    started = asyncio.Event()
+    release = asyncio.Event()
+    get_updated = repo.async_get_embeddings_updated_since
+
+    async def _slow_updated(since: Any, *, after_id: int, limit: int) -> list[dict[str, Any]]:
+        started.set()
+        await release.wait()
+        return await get_updated(since, after_id=after_id, limit=limit)
+
+    repo.async_get_embeddings_updated_since = _slow_updated  # type: ignore[method-assign]
+    refreshing = asyncio.create_task(service.search("query"))
+    await started.wait()
+
+    results = await asyncio.wait_for(service.search("query"), timeout=1.0)
+
+    assert results[0].request_id == 6
+    release.set()
+    await refreshing
+
+
+@pytest.mark.asyncio
+async def test_matrix_search_applies_filters_to_rows_before_building_results() -> None:
+    pytest.importorskip("numpy")
+    service = _matrix_service(_MatrixEmbeddingRepo(_MATRIX_ROWS), [1, 2, 3, 4, 5, 6])
+
+    class _Filters:
+        def has_filters(self) -> bool:
+            return True
+
+        def matches(self, result: Any) -> bool:
+            return result.source == "other.example"
+
+    results = await service.search("query", filters=cast("Any", _Filters()))
+
+    assert [r.request_id for r in results] == [2]
+
+
+def test_matrix_must_cover_fallback_window() -> None:
+    pytest.importorskip("numpy")
+    from app.infrastructure.search.embedding_matrix import EmbeddingMatrix
+
+    with pytest.raises(ValueError, match="max_rows"):
+        VectorSearchService(
+            **_DUMMY_REPOS, fallback_scan_limit=10, embedding_matrix=EmbeddingMatrix(max_rows=5)
+        )
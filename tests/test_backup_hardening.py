@@ -263,6 +263,26 @@ def _minimal_backup_zip() -> bytes:
     return buf.getvalue()
 
 
+def _streaming_backup_zip(*, skip: str | None = None) -> bytes:
+    """Minimal version 2.0 (NDJSON) backup ZIP with empty tables."""
+    manifest = {"version": "2.0", "format": "ndjson", "user_id": 1, "counts": {}}
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("manifest.json", json.dumps(manifest))
+        for name in (
+            "requests",
+            "summaries",
+            "tags",
+            "summary_tags",
+            "collections",
+            "collection_items",
+            "highlights",
+        ):
+            if name != skip:
+                zf.writestr(f"{name}.ndjson", "")
+    return buf.getvalue()
+
+
 def _make_mock_db() -> MagicMock:
     """Minimal DB mock that satisfies async_restore_from_archive."""
 
@@ -303,6 +323,51 @@ class TestRestoreHardening:
         )
         assert result["errors"] == []
 
+    async def test_restore_accepts_streaming_archive(self) -> None:
+        from app.infrastructure.persistence.backup_archive_service import (
+            async_restore_from_archive,
+        )
+
+        result = await async_restore_from_archive(
+            1, _streaming_backup_zip(), db=_make_mock_db(), cfg=BackupConfig()
+        )
+        assert result["errors"] == []
+
+    async def test_restore_reports_missing_streaming_entry(self) -> None:
+        from app.infrastructure.persistence.backup_archive_service import (
+            async_restore_from_archive,
+        )
+
+        result = await async_restore_from_archive(
+            1, _streaming_backup_zip(skip="tags"), db=_make_mock_db(), cfg=BackupConfig()
+        )
+        assert len(result["errors"]) == 1
+        assert "tags.ndjson" in result["errors"][0]
+
+    async def test_restore_failure_reports_zero_counts(self, monkeypatch) -> None:
+        from app.infrastructure.persistence import backup_archive_service
+
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("manifest.json", json.dumps({"version": "2.0", "user_id": 1}))
+            for name in backup_archive_service.ARCHIVE_TABLES:
+                zf.writestr(f"{name}.ndjson", '{"id": 1}\n')
+
+        async def restore_rows(state, batch) -> None:
+            state.restored["requests"] += len(batch)
+
+        async def fail(state, batch) -> None:
+            raise RuntimeError("insert failed")
+
+        monkeypatch.setitem(backup_archive_service._RESTORE_STEPS, "requests", restore_rows)
+        monkeypatch.setitem(backup_archive_service._RESTORE_STEPS, "summaries", fail)
+
+        result = await backup_archive_service.async_restore_from_archive(
+            1, buf.getvalue(), db=_make_mock_db(), cfg=BackupConfig()
+        )
+        assert result["errors"] == ["insert failed"]
+        assert result["restored"]["requests"] == 0
+
     async def test_restore_rejects_encrypted_without_key(self) -> None:
         from app.infrastructure.persistence.backup_archive_service import (
             async_restore_from_archive,
@@ -166,6 +166,77 @@ class TestDbWriteQueue(unittest.IsolatedAsyncioTestCase):
         await q.stop(timeout=5.0)
         self.assertIn(3, results)
 
+    async def test_interleaved_batch_keys_keep_enqueue_order(self) -> None:
+        """Batch writes are only grouped with consecutive writes of the same key."""
+        q = await self._make_queue()
+        events: list[object] = []
+
+        async def _persist(payloads: list[str]) -> None:
+            events.append(tuple(payloads))
+
+        for payload, key in [("a1", "a"), ("a2", "a"), ("b1", "b"), ("a3", "a"), ("a4", "a")]:
+            await q.enqueue_batch(payload, batch_key=key, execute_batch=_persist)
+
+        await q.stop(timeout=5.0)
+        self.assertEqual(events, [("a1", "a2"), ("b1",), ("a3", "a4")])
+
+    async def test_coalesces_superseded_writes(self) -> None:
+        """Only the latest payload per coalesce_key survives within a group."""
+        q = await self._make_queue()
+        batches: list[list[tuple[int, str]]] = []
+
+        async def _persist(payloads: list[tuple[int, str]]) -> None:
+            batches.append(payloads)
+
+        for update in [(1, "pending"), (2, "pending"), (1, "processing"), (1, "ok"), (3, "ok")]:
+            await q.enqueue_batch(
+                update,
+                batch_key="status",
+                execute_batch=_persist,
+                coalesce_key=update[0],
+            )
+
+        await q.stop(timeout=5.0)
+        self.assertEqual(batches, [[(2, "pending"), (1, "ok"), (3, "ok")]])
+
+    async def test_flush_window_collects_late_batch_writes(self) -> None:
+        """Writes arriving within the flush window join the batch already picked up."""
+        from app.db.write_queue import DbWriteQueue
+
+        q = DbWriteQueue(flush_window_seconds=0.2)
+        q.start()
+        batches: list[list[int]] = []
+        flushed = asyncio.Event()
+
+        async def _persist(payloads: list[int]) -> None:
+            batches.append(payloads)
+            flushed.set()
+
+        await q.enqueue_batch(1, batch_key="llm", execute_batch=_persist)
+        await asyncio.sleep(0.01)
+        await q.enqueue_batch(2, batch_key="llm", execute_batch=_persist)
+        await asyncio.wait_for(flushed.wait(), timeout=5.0)
+
+        await q.stop(timeout=5.0)
+        self.assertEqual(batches, [[1, 2]])
+
+    async def test_max_batch_size_splits_groups(self) -> None:
+        """A group larger than max_batch_size is flushed in several callbacks."""
+        from app.db.write_queue import DbWriteQueue
+
+        q = DbWriteQueue(max_batch_size=2)
+        q.start()
+        batches: list[list[int]] = []
+
+        async def _persist(payloads: list[int]) -> None:
+            batches.append(payloads)
+
+        for i in range(5):
+            await q.enqueue_batch(i, batch_key="llm", execute_batch=_persist)
+
+        await q.stop(timeout=5.0)
+        self.assertEqual(batches, [[0, 1], [2, 3], [4]])
+
     # ------------------------------------------------------------------
     # Edge cases
     # ------------------------------------------------------------------
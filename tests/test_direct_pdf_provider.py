@@ -114,9 +114,13 @@ def test_factory_registers_direct_pdf_when_fitz_available() -> None:
     cfg.direct_pdf_max_size_mb = 20
     cfg.min_content_length = 400
 
-    provider = _build_direct_pdf(cfg)
+    attachment_cfg = MagicMock(pdf_parallel_min_pages=8, pdf_worker_processes=3)
+
+    provider = _build_direct_pdf(cfg, attachment_cfg)
     assert provider is not None
     assert provider.provider_name == "direct_pdf"
+    assert provider._parallel_min_pages == 8
+    assert provider._worker_processes == 3
 
 
 def test_factory_skips_direct_pdf_when_disabled() -> None:
@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.adapters.rss.feed_fetcher import FeedEntry, FeedResult, fetch_feed
+from app.adapters.rss.feed_fetcher import FeedEntry, FeedResult, fetch_feed, fetch_feed_async
 
 # Ensure feedparser is available even if not installed.
 # fetch_feed does a lazy `import feedparser` inside the function body,
@@ -379,3 +379,51 @@ class TestFetchFeed:
             call_kwargs = mock_get.call_args
             assert mock_client_factory.call_args.kwargs.get("follow_redirects") is False
             assert call_kwargs.kwargs.get("timeout") == 15.0
+
+
+class TestFetchFeedAsync:
+    @pytest.mark.asyncio
+    async def test_304_not_modified_sends_conditional_headers(self) -> None:
+        import httpx
+
+        seen: dict[str, str] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.update(request.headers)
+            return httpx.Response(304)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with _patch_ssrf():
+                result = await fetch_feed_async(
+                    "https://example.com/feed.xml", client=client, etag='"abc"'
+                )
+
+        assert result.not_modified is True
+        assert seen["if-none-match"] == '"abc"'
+
+    @pytest.mark.asyncio
+    async def test_parses_off_loop_and_keeps_validators(self) -> None:
+        import httpx
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"<rss/>", headers={"ETag": '"v2"'})
+
+        parsed = _feedparser_result(
+            title="Async Feed",
+            entries=[_feedparser_entry(title="Post", link="https://example.com/p")],
+        )
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with _patch_ssrf(), patch("feedparser.parse", return_value=parsed) as parse:
+                result = await fetch_feed_async("https://example.com/feed.xml", client=client)
+
+        parse.assert_called_once_with(b"<rss/>")
+        assert result.title == "Async Feed"
+        assert result.etag == '"v2"'
+        assert [entry.url for entry in result.entries] == ["https://example.com/p"]
+
+    @pytest.mark.asyncio
+    async def test_blocks_unsafe_url_before_request(self) -> None:
+        client = MagicMock()
+        with pytest.raises(ValueError, match="Blocked URL scheme"):
+            await fetch_feed_async("file:///etc/passwd", client=client)
+        client.get.assert_not_called()
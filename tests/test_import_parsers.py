@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import unittest
 from pathlib import Path
 
+import pytest
+
+from app.domain.services.import_parsers.base import ImportParseError
 from app.domain.services.import_parsers.csv_parser import CsvBookmarkParser
-from app.domain.services.import_parsers.netscape import NetscapeHTMLParser
+from app.domain.services.import_parsers.linkwarden import LinkwardenParser
+from app.domain.services.import_parsers.netscape import _FEED_CHUNK_CHARS, NetscapeHTMLParser
 from app.domain.services.import_parsers.omnivore import OmnivoreParser
 from app.domain.services.import_parsers.pocket import PocketParser
 
@@ -195,3 +200,52 @@ class TestCsvBookmarkParser(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestStreamingParsers(unittest.TestCase):
+    def test_iter_parse_is_lazy_for_json_arrays(self) -> None:
+        items = [{"url": f"https://example.com/{i}", "title": str(i)} for i in range(3)]
+        content = json.dumps(items)
+
+        stream = OmnivoreParser().iter_parse(content)
+
+        assert next(stream).url == "https://example.com/0"
+        assert [b.url for b in stream] == ["https://example.com/1", "https://example.com/2"]
+
+    def test_truncated_json_array_raises_after_complete_elements(self) -> None:
+        content = '[{"url": "https://example.com/a"}, {"url": "https://example.com/b"}, {"url": '
+        stream = OmnivoreParser().iter_parse(content)
+
+        assert next(stream).url == "https://example.com/a"
+        assert next(stream).url == "https://example.com/b"
+        with pytest.raises(ImportParseError):
+            next(stream)
+
+    def test_truncated_json_file_fails_parse(self) -> None:
+        content = json.dumps([{"url": f"https://example.com/{i}"} for i in range(10)])
+
+        for truncated in (content[:-1], content[: len(content) // 2], content + "garbage"):
+            with pytest.raises(ImportParseError):
+                LinkwardenParser().parse(truncated)
+        assert len(LinkwardenParser().parse(content + "\n")) == 10
+
+    def test_netscape_bookmarks_split_across_feed_chunks(self) -> None:
+        entries = "".join(
+            f'<DT><A HREF="https://example.com/{i}" TAGS="t{i}">Title {i}</A>\n'
+            for i in range(5_000)
+        )
+        content = f"<DL><p>\n<DT><H3>Folder</H3>\n<DL><p>\n{entries}</DL><p>\n</DL><p>"
+
+        bookmarks = list(NetscapeHTMLParser().iter_parse(content))
+
+        assert len(content) > 2 * _FEED_CHUNK_CHARS
+        assert [b.url for b in bookmarks] == [f"https://example.com/{i}" for i in range(5_000)]
+        assert all(b.collection_name == "Folder" for b in bookmarks)
+        assert bookmarks[4_321].title == "Title 4321"
+        assert bookmarks[4_321].tags == ["t4321"]
+
+    def test_csv_iter_parse_matches_parse(self) -> None:
+        content = "url,title\nhttps://example.com/1,One\nhttps://example.com/2,Two\n"
+        parser = CsvBookmarkParser()
+
+        assert list(parser.iter_parse(content)) == parser.parse(content)
@@ -237,3 +237,34 @@ async def test_chat_response_handler_estimates_cost_and_propagates_cache_metrics
     assert outcome.llm_result.cost_usd == pytest.approx(0.002)
     assert outcome.llm_result.cache_read_tokens == 100
     assert outcome.llm_result.cache_creation_tokens == 25
+
+
+@pytest.mark.asyncio
+async def test_chat_response_handler_reads_normalized_cache_details_and_prompt_key() -> None:
+    handler = ChatResponseHandler(_make_client())
+    payload = _make_payload()
+    payload.prompt_cache_key = "0123456789abcdef"
+
+    outcome = handler.handle_successful_response(
+        data={
+            "model": "anthropic/claude-sonnet-4",
+            "choices": [{"message": {"content": "plain text"}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": 3000,
+                "completion_tokens": 200,
+                "prompt_tokens_details": {"cached_tokens": 2048, "cache_write_tokens": 0},
+            },
+        },
+        payload=payload,
+        model="anthropic/claude-sonnet-4",
+        model_reported="anthropic/claude-sonnet-4",
+        latency=15,
+        attempt=0,
+        request_id=9,
+        sanitized_messages=[{"role": "user", "content": "hello"}],
+    )
+
+    assert outcome.llm_result is not None
+    assert outcome.llm_result.cache_read_tokens == 2048
+    assert outcome.llm_result.cache_creation_tokens is None
+    assert outcome.llm_result.prompt_cache_key == "0123456789abcdef"
@@ -11,8 +11,15 @@ pytest.importorskip("fitz", reason="PyMuPDF (fitz) required for PDF extractor te
 
 import fitz
 
+from app.adapters.attachment import pdf_engine
 from app.adapters.attachment.pdf_extractor import PDFContent, PDFExtractor
 
+
+@pytest.fixture(autouse=True)
+def _clear_pdf_cache() -> None:
+    pdf_engine.clear_pdf_cache()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -229,3 +236,95 @@ def test_table_detected_and_inlined_as_markdown(tmp_path: Path) -> None:
         assert "Col A" in result.text or "10" in result.text
     else:
         pytest.skip("Table not detected by this PyMuPDF build — grid may need stricter borders")
+
+
+# ---------------------------------------------------------------------------
+# Engine: process pool, bounded renders, result cache
+# ---------------------------------------------------------------------------
+
+
+def _make_mixed_pdf(tmp_path: Path, pages: int) -> Path:
+    path, doc = _make_pdf(tmp_path)
+    for i in range(pages):
+        page = doc.new_page()
+        if i % 3 == 0:
+            page.insert_text((50, 100), f"p{i}")  # sparse -> rendered for vision
+        else:
+            page.insert_text((50, 100), f"Page {i} body text. " * 10)
+    _save(doc, path)
+    return path
+
+
+def test_parallel_extraction_matches_sequential(tmp_path: Path) -> None:
+    path = _make_mixed_pdf(tmp_path, 12)
+
+    sequential = PDFExtractor.extract(str(path), max_vision_pages=10, parallel_min_pages=0)
+    pdf_engine.clear_pdf_cache()
+    progress: list[str] = []
+    parallel = PDFExtractor.extract(
+        str(path),
+        max_vision_pages=10,
+        parallel_min_pages=1,
+        max_workers=2,
+        max_inflight_renders=1,
+        on_progress=progress.append,
+    )
+
+    assert parallel.text == sequential.text
+    assert parallel.page_count == sequential.page_count
+    assert [img.data_uri for img in parallel.image_pages] == [
+        img.data_uri for img in sequential.image_pages
+    ]
+    assert any("pages done" in message for message in progress)
+
+
+def test_resent_pdf_is_served_from_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = _make_mixed_pdf(tmp_path, 2)
+    first = PDFExtractor.extract(str(path))
+
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(path.read_bytes())
+
+    def _fail(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("document should not be reopened")
+
+    monkeypatch.setattr(pdf_engine, "scan_pages", _fail)
+
+    assert PDFExtractor.extract(str(copy)) is first
+
+
+def test_extract_text_is_cached_by_content(tmp_path: Path) -> None:
+    path = _make_mixed_pdf(tmp_path, 4)
+    data = path.read_bytes()
+
+    text = pdf_engine.extract_text(data, parallel_min_pages=0)
+    assert "Page 1 body text." in text
+    assert pdf_engine.extract_text(data, parallel_min_pages=0) is text
+
+    pdf_engine.clear_pdf_cache()
+    assert pdf_engine.extract_text(data, parallel_min_pages=1, max_workers=2) == text
+
+
+def test_result_cache_is_bounded_by_bytes() -> None:
+    cache = pdf_engine._ResultCache(max_entries=10, max_bytes=100)
+
+    cache.put("a", "first", size=60)
+    cache.put("b", "second", size=30)
+    cache.put("c", "third", size=30)
+    cache.put("huge", "too big", size=101)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "second"
+    assert cache.get("c") == "third"
+    assert cache.get("huge") is None
+
+
+def test_shutdown_pool_lets_the_next_caller_start_a_new_pool(tmp_path: Path) -> None:
+    data = _make_mixed_pdf(tmp_path, 4).read_bytes()
+    pdf_engine.extract_text(data, parallel_min_pages=1, max_workers=1)
+    pdf_engine.shutdown_pool()
+    assert pdf_engine._pool is None
+
+    pdf_engine.clear_pdf_cache()
+    assert "Page 1 body text." in pdf_engine.extract_text(data, parallel_min_pages=1, max_workers=1)
+    pdf_engine.shutdown_pool()
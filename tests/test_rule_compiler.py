@@ -0,0 +1,137 @@
+"""Parity tests: compiled condition matchers vs RuleConditionEvaluator."""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any
+
+import pytest
+
+from app.domain.services import rule_compiler
+from app.domain.services.rule_compiler import compile_conditions
+from app.domain.services.rule_engine import RuleConditionEvaluator
+
+_CONDITIONS: list[dict[str, Any]] = [
+    {"type": "domain_matches", "operator": "equals", "value": "https://example.com"},
+    {"type": "domain_matches", "operator": "contains", "value": "example"},
+    {"type": "domain_matches", "operator": "contains", "value": ""},
+    {"type": "domain_matches", "operator": "regex", "value": r"example\.(com|org)"},
+    {"type": "domain_matches", "operator": "regex", "value": "[invalid("},
+    {"type": "domain_matches", "operator": "contains", "value": 5},
+    {"type": "domain_matches", "operator": "startswith", "value": "https"},
+    {"type": "title_contains", "operator": "contains", "value": "PYTHON"},
+    {"type": "title_contains", "operator": "contains", "value": "straße"},
+    {"type": "title_contains", "operator": "regex", "value": r"^learn\s"},
+    {"type": "title_contains", "operator": "contains", "value": None},
+    {"type": "has_tag", "operator": "any", "value": ["python", "rust"]},
+    {"type": "has_tag", "operator": "all", "value": ["python", "web"]},
+    {"type": "has_tag", "operator": "none", "value": "python"},
+    {"type": "has_tag", "operator": "all", "value": []},
+    {"type": "has_tag", "operator": "any", "value": [["unhashable"]]},
+    {"type": "has_tag", "operator": "some", "value": ["python"]},
+    {"type": "language_is", "operator": "equals", "value": "en"},
+    {"type": "language_is", "operator": "in", "value": "en, ru"},
+    {"type": "language_is", "operator": "in", "value": ["de", "en"]},
+    {"type": "language_is", "operator": "in", "value": 7},
+    {"type": "reading_time", "operator": "gt", "value": 5},
+    {"type": "reading_time", "operator": "lt", "value": "10"},
+    {"type": "reading_time", "operator": "eq", "value": 7.9},
+    {"type": "reading_time", "operator": "gt", "value": "soon"},
+    {"type": "reading_time", "operator": "gt", "value": float("inf")},
+    {"type": "source_type", "operator": "equals", "value": "article"},
+    {"type": "source_type", "operator": "in", "value": "video,podcast"},
+    {"type": "content_contains", "operator": "contains", "value": "neural"},
+    {"type": "content_contains", "operator": "regex", "value": "neur(al|on)"},
+    {"type": "nonexistent_type", "operator": "equals", "value": "x"},
+    {"operator": "equals", "value": "x"},
+    {"type": ["not", "hashable"], "operator": "equals", "value": "x"},
+]
+
+_CONTEXTS: list[dict[str, Any]] = [
+    {
+        "url": "https://example.com",
+        "title": "Learn Python Today",
+        "tags": ["python", "web"],
+        "language": "en",
+        "reading_time": 7,
+        "source_type": "article",
+        "content": "Neural networks explained",
+    },
+    {
+        "url": "https://blog.example.org/post",
+        "title": "STRASSE und Straße",
+        "tags": [],
+        "language": "ru",
+        "reading_time": 12.5,
+        "source_type": "video",
+        "content": "",
+    },
+    {
+        "url": "https://other.net",
+        "title": "",
+        "tags": ["rust"],
+        "language": None,
+        "reading_time": True,
+        "source_type": "",
+        "content": "NEURON",
+    },
+    {},
+    {"url": None, "title": None, "tags": None, "reading_time": None, "content": 5},
+    {"title": "Kelvin K", "tags": "python", "reading_time": "7"},
+]
+
+
+def _outcome(fn: Any) -> tuple[str, Any]:
+    try:
+        return "ok", fn()
+    except Exception as exc:
+        return "raised", type(exc)
+
+
+@pytest.mark.parametrize(
+    "condition", _CONDITIONS, ids=lambda c: f"{c.get('type')}-{c.get('operator')}"
+)
+@pytest.mark.parametrize("context_index", range(len(_CONTEXTS)))
+def test_single_condition_parity(condition: dict[str, Any], context_index: int) -> None:
+    context = _CONTEXTS[context_index]
+    expected = _outcome(lambda: RuleConditionEvaluator.evaluate_conditions([condition], context))
+    actual = _outcome(lambda: compile_conditions([condition]).evaluate(context))
+    assert actual == expected
+
+
+@pytest.mark.parametrize("match_mode", ["all", "any", "bogus"])
+def test_condition_pairs_parity(match_mode: str) -> None:
+    for pair in itertools.combinations(_CONDITIONS[:30], 2):
+        conditions = list(pair)
+        compiled = compile_conditions(conditions, match_mode)
+        for context in _CONTEXTS:
+            expected = _outcome(
+                lambda c=conditions, ctx=context: RuleConditionEvaluator.evaluate_conditions(
+                    c, ctx, match_mode
+                )
+            )
+            assert _outcome(lambda fn=compiled, ctx=context: fn.evaluate(ctx)) == expected
+            if expected[0] == "ok":
+                assert compiled.matches(context) is expected[1][0]
+
+
+def test_compiled_conditions_are_cached_by_content() -> None:
+    rule_compiler._compile_cached.cache_clear()
+    first = compile_conditions([{"type": "has_tag", "operator": "any", "value": ["a"]}])
+    second = compile_conditions([{"value": ["a"], "operator": "any", "type": "has_tag"}])
+
+    assert first is second
+    assert compile_conditions(first.conditions, "any") is not first
+
+
+def test_regex_is_compiled_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    rule_compiler._compile_cached.cache_clear()
+    compiled = compile_conditions([{"type": "title_contains", "operator": "regex", "value": "x+"}])
+
+    def _fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("regex recompiled during evaluation")
+
+    monkeypatch.setattr(rule_compiler.re, "compile", _fail)
+    monkeypatch.setattr(rule_compiler.re, "search", _fail)
+    assert compiled.matches({"title": "XXX"})
+    assert not compiled.matches({"title": "yyy"})
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from app.adapters.content.scraper.chain import ContentScraperChain
@@ -414,3 +416,118 @@ class TestJsHeavyReordering:
         assert result.status == CallStatus.OK
         assert len(scrapling.calls) == 1
         assert len(playwright.calls) == 0  # not reached, scrapling succeeded
+
+
+# ---------------------------------------------------------------------------
+# Hedged race mode
+# ---------------------------------------------------------------------------
+
+
+class _DelayedProvider(_MockProvider):
+    """Provider that sleeps before answering; delays are consumed per call."""
+
+    def __init__(self, *, delays: list[float], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.delays = list(delays)
+        self.cancelled = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def scrape_markdown(self, url, *, mobile=True, request_id=None):
+        delay = self.delays.pop(0) if len(self.delays) > 1 else self.delays[0]
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        return await super().scrape_markdown(url, mobile=mobile, request_id=request_id)
+
+
+class TestChainRaceMode:
+    """Hedged provider racing: early start, first acceptable result wins."""
+
+    @pytest.mark.asyncio
+    async def test_hung_provider_is_hedged_and_cancelled(self) -> None:
+        hung = _DelayedProvider(name="scrapling", delays=[30], result=_ok_result())
+        fast = _DelayedProvider(name="firecrawl", delays=[0], result=_ok_result(markdown="# Fast"))
+        unused = _MockProvider(name="playwright", result=_ok_result())
+
+        chain = ContentScraperChain([hung, fast, unused], race=True, hedge_delay_sec=0.01)
+        result = await asyncio.wait_for(chain.scrape_markdown("https://example.com"), 2)
+
+        assert result.content_markdown == "# Fast"
+        assert hung.cancelled == 1
+        assert unused.calls == []
+
+    @pytest.mark.asyncio
+    async def test_failure_starts_next_provider_without_waiting(self) -> None:
+        failing = _MockProvider(name="scrapling", result=_error_result(error="blocked"))
+        fallback = _MockProvider(name="firecrawl", result=_ok_result(markdown="# Next"))
+
+        chain = ContentScraperChain([failing, fallback], race=True, hedge_delay_sec=30)
+        result = await asyncio.wait_for(chain.scrape_markdown("https://example.com"), 2)
+
+        assert result.content_markdown == "# Next"
+
+    @pytest.mark.asyncio
+    async def test_rejected_content_does_not_win_the_race(self) -> None:
+        good_content = (
+            "This article contains useful context, complete sentences, and enough "
+            "distinct words to pass the content quality guard. " * 5
+        )
+        thin = _DelayedProvider(name="scrapling", delays=[0], result=_ok_result(markdown="stub"))
+        error_page = _DelayedProvider(
+            name="firecrawl", delays=[0], result=_ok_result(markdown="404 Not Found")
+        )
+        good = _DelayedProvider(
+            name="playwright", delays=[0.01], result=_ok_result(markdown=good_content)
+        )
+
+        chain = ContentScraperChain(
+            [thin, error_page, good], min_content_length=400, race=True, hedge_delay_sec=0
+        )
+        result = await chain.scrape_markdown("https://example.com")
+
+        assert result.content_markdown == good_content
+
+    @pytest.mark.asyncio
+    async def test_all_failures_are_aggregated(self) -> None:
+        p1 = _MockProvider(name="first", result=_error_result(error="p1 fail"))
+        p2 = _MockProvider(name="second", exception=RuntimeError("p2 boom"))
+
+        chain = ContentScraperChain([p1, p2], race=True)
+        result = await chain.scrape_markdown("https://example.com")
+
+        assert result.status == CallStatus.ERROR
+        assert result.error_text == "All providers failed: first: p1 fail; second: p2 boom"
+
+    @pytest.mark.asyncio
+    async def test_provider_running_past_its_p50_triggers_hedge(self) -> None:
+        usual = _DelayedProvider(
+            name="scrapling", delays=[0.001] * 5 + [30], result=_ok_result(markdown="# Usual")
+        )
+        backup = _MockProvider(name="firecrawl", result=_ok_result(markdown="# Backup"))
+
+        chain = ContentScraperChain([usual, backup], race=True, hedge_delay_sec=30)
+        for _ in range(5):
+            assert (await chain.scrape_markdown("https://example.com")).content_markdown == (
+                "# Usual"
+            )
+        result = await asyncio.wait_for(chain.scrape_markdown("https://example.com"), 2)
+
+        assert result.content_markdown == "# Backup"
+        assert usual.cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_provider_concurrency_cap_is_shared_across_calls(self) -> None:
+        browser = _DelayedProvider(name="playwright", delays=[0.01], result=_ok_result())
+
+        chain = ContentScraperChain([browser], provider_concurrency={"playwright": 1})
+        await asyncio.gather(*(chain.scrape_markdown("https://example.com") for _ in range(3)))
+
+        assert len(browser.calls) == 3
+        assert browser.peak_in_flight == 1
@@ -1,5 +1,8 @@
+import asyncio
 import os
+import time
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import pytest
@@ -72,23 +75,45 @@ async def test_trending_payload_is_cached(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_trending_payload_prunes_expired_in_memory_entries(monkeypatch):
+async def test_concurrent_trending_misses_share_one_scan(monkeypatch):
     trending_cache.clear_trending_cache()
 
-    expired_key = (999, 1, 1)
-    trending_cache._cache_manager._trending_cache[expired_key] = trending_cache.TrendingCacheEntry(
-        expires_at=datetime.now(UTC) - timedelta(seconds=1),
-        payload={"tags": []},
-    )
+    call_count = {"value": 0}
+    release = asyncio.Event()
 
-    async def fake_get_from_redis(user_id: int, days: int, limit: int):
-        del user_id, days, limit
+    async def fake_fetch(
+        user_id: int,
+        *,
+        previous_period_start: datetime,
+        max_scan: int,
+        database=None,
+    ):
+        del user_id, previous_period_start, max_scan, database
+        call_count["value"] += 1
+        await release.wait()
+        return []
 
-    async def fake_set_to_redis(
-        user_id: int, days: int, limit: int, payload: dict[str, object]
-    ) -> bool:
-        del user_id, days, limit, payload
-        return False
+    monkeypatch.setattr(trending_cache, "_fetch_trending_records", fake_fetch)
+
+    tasks = [
+        asyncio.create_task(trending_cache.get_trending_payload(2, limit=5, days=7))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert call_count["value"] == 1
+    assert all(result == results[0] for result in results)
+
+    trending_cache.clear_trending_cache()
+
+
+@pytest.mark.asyncio
+async def test_clear_trending_cache_drops_local_entries(monkeypatch):
+    trending_cache.clear_trending_cache()
+
+    call_count = {"value": 0}
 
     async def fake_fetch(
         user_id: int,
@@ -98,19 +123,50 @@ async def test_trending_payload_prunes_expired_in_memory_entries(monkeypatch):
         database=None,
     ):
         del user_id, previous_period_start, max_scan, database
+        call_count["value"] += 1
         return []
 
-    monkeypatch.setattr(trending_cache._cache_manager, "get_from_redis", fake_get_from_redis)
-    monkeypatch.setattr(trending_cache._cache_manager, "set_to_redis", fake_set_to_redis)
     monkeypatch.setattr(trending_cache, "_fetch_trending_records", fake_fetch)
 
-    await trending_cache.get_trending_payload(1, limit=5, days=30)
+    await trending_cache.get_trending_payload(3, limit=5, days=30)
+    trending_cache.clear_trending_cache()
+    await trending_cache.get_trending_payload(3, limit=5, days=30)
 
-    assert expired_key not in trending_cache._cache_manager._trending_cache
+    assert call_count["value"] == 2
 
     trending_cache.clear_trending_cache()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("overrides", [{"enabled": False}, {"cache_enabled": False}])
+async def test_trending_keeps_its_ttl_without_redis(monkeypatch, overrides):
+    import app.config
+    from app.config.redis import RedisConfig
+
+    cfg = SimpleNamespace(redis=RedisConfig(trending_cache_ttl_seconds=300, **overrides))
+    monkeypatch.setattr(app.config, "load_config", lambda **_: cfg)
+
+    async def fake_fetch(
+        user_id: int,
+        *,
+        previous_period_start: datetime,
+        max_scan: int,
+        database=None,
+    ):
+        del user_id, previous_period_start, max_scan, database
+        return []
+
+    monkeypatch.setattr(trending_cache, "_fetch_trending_records", fake_fetch)
+
+    manager = trending_cache._TrendingCacheManager()
+    await manager.get_payload(4, limit=5, days=30)
+
+    cache = manager.get_cache()
+    assert not cache.enabled
+    ((expires_at, _),) = cache._local._entries.values()
+    assert expires_at - time.monotonic() > 250
+
+
 def test_build_trending_payload_uses_previous_period():
     now = datetime(2025, 1, 10, tzinfo=UTC)
     records = [
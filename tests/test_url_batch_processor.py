@@ -132,3 +132,83 @@ async def test_batch_completion_updates_interaction_once_processing_finishes() -
     _, kwargs = user_repo.async_update_user_interaction.await_args
     assert kwargs["interaction_id"] == 77
     assert kwargs["response_type"] == "batch_complete"
+
+
+class _BulkRequestRepo:
+    """Request repo exposing the bulk dedupe API; per-URL methods must not be used."""
+
+    def __init__(self, existing: dict[str, dict[str, Any]], in_flight: dict[str, dict[str, Any]]):
+        self.existing = existing
+        self.in_flight = in_flight
+        self.created_rows: list[dict[str, Any]] = []
+        self.async_get_request_by_dedupe_hash = AsyncMock(side_effect=AssertionError)
+        self.async_create_minimal_request = AsyncMock(side_effect=AssertionError)
+        self.async_update_request_error = AsyncMock()
+
+    async def async_get_requests_by_dedupe_hashes(self, hashes):
+        return {h: row for h, row in self.existing.items() if h in hashes}
+
+    async def async_find_recent_requests_by_dedupe_hashes(self, hashes, *, max_age_sec):
+        return {h: row for h, row in self.in_flight.items() if h in hashes}
+
+    async def async_create_minimal_requests(self, rows):
+        self.created_rows.extend(rows)
+        return {row["dedupe_hash"]: (100 + index, True) for index, row in enumerate(rows)}
+
+
+def _batch_state(processor: URLBatchProcessor, urls: list[str]) -> _BatchRunState:
+    request = BatchProcessRequest(
+        message=SimpleNamespace(chat=SimpleNamespace(id=1)), urls=urls, uid=1, correlation_id="cid"
+    )
+    return _BatchRunState(
+        request=request,
+        batch_status=URLBatchStatus.from_urls(urls),
+        url_to_request_id={},
+        cached_summaries=[],
+        semaphore=AsyncMock(),
+        sender=processor._response_formatter,
+        draft_enabled=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_pre_registration_resolves_batch_in_bulk_queries() -> None:
+    from app.core.url_utils import compute_dedupe_hash
+
+    cached_url, busy_url, new_url = (
+        "https://example.com/cached",
+        "https://example.com/busy",
+        "https://example.com/new",
+    )
+    request_repo = _BulkRequestRepo(
+        existing={compute_dedupe_hash(cached_url): {"id": 5, "status": "ok"}},
+        in_flight={compute_dedupe_hash(busy_url): {"id": 6, "status": "processing"}},
+    )
+    processor = _make_processor(request_repo=request_repo)
+    processor._summary_repo.async_get_summaries_by_request_ids = AsyncMock(
+        return_value={5: {"json_payload": '{"title": "Cached article"}'}}
+    )
+    state = _batch_state(processor, [cached_url, busy_url, new_url, new_url + "/"])
+
+    await processor._pre_register_urls(state)
+
+    assert state.url_to_request_id == {cached_url: 5, new_url: 100}
+    assert [row["input_url"] for row in request_repo.created_rows] == [new_url]
+    assert [cached.request_id for cached in state.cached_summaries] == [5]
+    processor._summary_repo.async_get_summaries_by_request_ids.assert_awaited_once_with([5])
+
+
+@pytest.mark.asyncio
+async def test_bulk_pre_registration_failure_falls_back_to_per_url_path() -> None:
+    request_repo = _BulkRequestRepo(existing={}, in_flight={})
+    request_repo.async_create_minimal_requests = AsyncMock(side_effect=RuntimeError("db down"))  # type: ignore[method-assign]
+    request_repo.async_get_request_by_dedupe_hash = AsyncMock(return_value=None)
+    request_repo.async_create_minimal_request = AsyncMock(return_value=(42, True))
+    processor = _make_processor(request_repo=request_repo)
+    processor._summary_repo.async_get_summaries_by_request_ids = AsyncMock(return_value={})
+    state = _batch_state(processor, ["https://example.com/a"])
+
+    await processor._pre_register_urls(state)
+
+    assert state.url_to_request_id == {"https://example.com/a": 42}
+    request_repo.async_create_minimal_request.assert_awaited_once()
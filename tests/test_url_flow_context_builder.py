@@ -34,7 +34,7 @@ def _make_builder(*, long_context_model: str | None = None) -> tuple[URLFlowCont
         )
     )
     content_chunker = MagicMock()
-    content_chunker.should_chunk_content = MagicMock(return_value=(True, 1000, ["chunk-1"]))
+    content_chunker.should_chunk_content = AsyncMock(return_value=(True, 1000, ["chunk-1"]))
     response_formatter = SimpleNamespace(
         send_language_detection_notification=AsyncMock(),
         send_content_analysis_notification=AsyncMock(),
@@ -61,6 +61,8 @@ def _make_processor(
     proc.content_chunker.process_chunks = AsyncMock(
         return_value=chunk_summary or {"summary_250": "chunked", "tldr": "chunked"}
     )
+    proc.summary_request_factory = MagicMock()
+    proc.summary_request_factory.build_stream_coordinator = MagicMock(return_value=None)
     proc.semantic_helper = MagicMock()
     proc.semantic_helper.enrich_with_rag_fields = AsyncMock(
         side_effect=lambda payload, **_kwargs: payload
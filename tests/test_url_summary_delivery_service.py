@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from app.adapters.content.url_summary_delivery_service import URLSummaryDeliveryService
+from app.db.write_queue import DbWriteQueue
+
+
+def _service(request_repo: MagicMock, queue: DbWriteQueue | None) -> URLSummaryDeliveryService:
+    return URLSummaryDeliveryService(
+        cfg=MagicMock(),
+        db=MagicMock(),
+        response_formatter=MagicMock(),
+        summary_repo=MagicMock(),
+        audit_func=MagicMock(),
+        request_repo=request_repo,
+        db_write_queue=queue,
+    )
+
+
+async def test_reply_message_ids_are_batched_through_write_queue() -> None:
+    request_repo = MagicMock()
+    request_repo.async_update_bot_reply_message_ids_batch = AsyncMock()
+    request_repo.async_update_bot_reply_message_id = AsyncMock()
+    queue = DbWriteQueue()
+    queue.start()
+    service = _service(request_repo, queue)
+
+    for req_id, msg_id in [(1, 10), (2, 20), (1, 11)]:
+        await service._persist_bot_reply_message_id(
+            req_id=req_id, bot_reply_msg_id=msg_id, correlation_id="cid"
+        )
+    await queue.stop(timeout=5.0)
+
+    request_repo.async_update_bot_reply_message_ids_batch.assert_awaited_once_with(
+        [(2, 20), (1, 11)]
+    )
+    request_repo.async_update_bot_reply_message_id.assert_not_awaited()
+
+
+async def test_reply_message_id_is_written_directly_without_queue() -> None:
+    request_repo = MagicMock()
+    request_repo.async_update_bot_reply_message_id = AsyncMock()
+    service = _service(request_repo, None)
+
+    await service._persist_bot_reply_message_id(req_id=1, bot_reply_msg_id=10, correlation_id=None)
+
+    request_repo.async_update_bot_reply_message_id.assert_awaited_once_with(1, 10)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import sys
+import time
 import types
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, cast
@@ -15,6 +17,9 @@ except ModuleNotFoundError:
     class _DownloadError(Exception):
         pass
 
+    class _DownloadCancelled(Exception):
+        pass
+
     class _FallbackYoutubeDL:
         def __init__(self, *args, **kwargs):
             self._opts = kwargs
@@ -36,7 +41,9 @@ except ModuleNotFoundError:
 
     yt_dlp = types.ModuleType("yt_dlp")
     yt_dlp.YoutubeDL = _FallbackYoutubeDL  # type: ignore[attr-defined]
-    yt_dlp.utils = types.SimpleNamespace(DownloadError=_DownloadError)  # type: ignore[attr-defined]
+    yt_dlp.utils = types.SimpleNamespace(  # type: ignore[attr-defined]
+        DownloadError=_DownloadError, DownloadCancelled=_DownloadCancelled
+    )
     sys.modules["yt_dlp"] = yt_dlp
 
 try:
@@ -86,6 +93,10 @@ def _make_cfg(tmp_path: Path) -> Any:
             subtitle_languages=["en"],
             auto_cleanup_enabled=True,
             cleanup_after_days=30,
+            archive_max_concurrent=1,
+            archive_rate_limit_kbps=512,
+            archive_timeout_sec=30.0,
+            storage_reconcile_interval_hours=24,
         )
     )
 
@@ -302,7 +313,7 @@ async def test_pipeline_cleans_partial_files_after_error(tmp_path: Path) -> None
         feedback_service=feedback_service,
         session_service=session_service,
     )
-    pipeline._extract_transcript_api = AsyncMock(return_value=("body", "en", False, "api"))
+    pipeline._extract_transcript_api = AsyncMock(return_value=("", "", False, "api"))
     pipeline._download_video_sync = MagicMock(side_effect=ValueError("boom"))
 
     with pytest.raises(ValueError, match="boom"):
@@ -317,6 +328,253 @@ async def test_pipeline_cleans_partial_files_after_error(tmp_path: Path) -> None
     session_service.cleanup_partial_download_files.assert_called_once()
 
 
+def _make_pipeline(tmp_path: Path) -> tuple[Any, Any]:
+    session_service = MagicMock(spec=YouTubeDownloadSessionService)
+    session_service.storage_path = tmp_path / "videos"
+    session_service.storage_path.mkdir(parents=True, exist_ok=True)
+    session_service.mark_download_started = AsyncMock()
+    session_service.persist_success = AsyncMock()
+    session_service.handle_failure = AsyncMock()
+    session_service.check_storage_limits = AsyncMock()
+    session_service.update_archive_state = AsyncMock()
+    session_service.cleanup_partial_download_files = MagicMock()
+    feedback_service = MagicMock(spec=YouTubeFeedbackService)
+    feedback_service.start = AsyncMock(
+        return_value=SimpleNamespace(
+            updater=None, typing_ctx=None, completed_stages=[], stage_start=0
+        )
+    )
+    feedback_service.mark_transcript_ready = AsyncMock()
+    feedback_service.mark_subtitle_fallback = AsyncMock()
+    feedback_service.finalize_success = AsyncMock()
+    feedback_service.finalize_error = AsyncMock()
+    pipeline: Any = YouTubeDownloadPipeline(
+        cfg=_make_cfg(tmp_path),
+        audit_func=lambda *_args, **_kwargs: None,
+        feedback_service=feedback_service,
+        session_service=session_service,
+    )
+    return pipeline, session_service
+
+
+_VIDEO_INFO = {
+    "video_id": "dQw4w9WgXcQ",
+    "title": "Example video",
+    "channel": "Channel",
+    "duration": 123,
+    "resolution": "1080p",
+    "file_size": 0,
+    "thumbnail_url": "https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg",
+}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_returns_after_transcript_and_archives_in_background(
+    tmp_path: Path,
+) -> None:
+    pipeline, session_service = _make_pipeline(tmp_path)
+    pipeline._extract_transcript_api = AsyncMock(return_value=("api body", "en", False, "api"))
+    pipeline._fetch_video_info_sync = MagicMock(return_value=dict(_VIDEO_INFO))
+    pipeline._download_video_sync = MagicMock()
+    pipeline._archive_service.schedule = MagicMock()
+
+    result = await pipeline.run(
+        request=_make_request(),
+        video_id="dQw4w9WgXcQ",
+        req_id=500,
+        download_id=900,
+    )
+
+    assert "api body" in result.content_text
+    assert result.title == "Example video"
+    pipeline._download_video_sync.assert_not_called()
+    assert session_service.persist_success.await_args.kwargs["archive_status"] == "queued"
+    pipeline._archive_service.schedule.assert_called_once_with(
+        url=_make_request().url_text,
+        video_id="dQw4w9WgXcQ",
+        req_id=500,
+        download_id=900,
+        correlation_id="cid",
+    )
+
+
+@pytest.mark.asyncio
+async def test_pipeline_survives_metadata_lookup_failure(tmp_path: Path) -> None:
+    pipeline, session_service = _make_pipeline(tmp_path)
+    pipeline._extract_transcript_api = AsyncMock(return_value=("api body", "en", False, "api"))
+    pipeline._fetch_video_info_sync = MagicMock(side_effect=ValueError("age-restricted"))
+    pipeline._archive_service.schedule = MagicMock()
+
+    result = await pipeline.run(
+        request=_make_request(),
+        video_id="dQw4w9WgXcQ",
+        req_id=500,
+        download_id=900,
+    )
+
+    assert "api body" in result.content_text
+    session_service.persist_success.assert_awaited_once()
+    session_service.handle_failure.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_archive_service_limits_concurrency_and_bandwidth(tmp_path: Path) -> None:
+    pipeline, session_service = _make_pipeline(tmp_path)
+    archive = pipeline._archive_service
+    running = 0
+    peak = 0
+    seen_opts: list[dict[str, Any]] = []
+
+    def _download(_url: str, ydl_opts: dict[str, Any], _cid: str | None) -> dict[str, Any]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        seen_opts.append(ydl_opts)
+        ydl_opts["progress_hooks"][0](
+            {"status": "downloading", "downloaded_bytes": 50, "total_bytes": 100}
+        )
+        time.sleep(0.05)
+        running -= 1
+        return {"video_file_path": "/videos/a.mp4", "file_size": 100}
+
+    archive.download_video_sync = _download
+    tasks = [
+        archive.schedule(
+            url=f"https://youtu.be/video{i}",
+            video_id=f"video{i}",
+            req_id=i,
+            download_id=i,
+            correlation_id="cid",
+        )
+        for i in range(3)
+    ]
+    assert archive.progress(0) is not None
+
+    await asyncio.gather(*tasks)
+
+    assert peak == 1
+    assert all(opts["ratelimit"] == 512 * 1024 for opts in seen_opts)
+    assert archive.progress(0) is None
+    statuses = [
+        call.kwargs["archive_status"]
+        for call in session_service.update_archive_state.await_args_list
+    ]
+    assert statuses.count("downloading") == 3
+    assert statuses.count("completed") == 3
+
+
+@pytest.mark.asyncio
+async def test_archive_service_records_failure_without_failing_request(tmp_path: Path) -> None:
+    pipeline, session_service = _make_pipeline(tmp_path)
+    archive = pipeline._archive_service
+    archive.download_video_sync = MagicMock(side_effect=ValueError("HTTP Error 429"))
+
+    task = archive.schedule(
+        url="https://youtu.be/video0",
+        video_id="video0",
+        req_id=1,
+        download_id=7,
+        correlation_id="cid",
+    )
+    await task
+
+    session_service.update_archive_state.assert_awaited_with(
+        7, archive_status="error", error_text="HTTP Error 429"
+    )
+    session_service.cleanup_partial_download_files.assert_called_once()
+    session_service.handle_failure.assert_not_awaited()
+
+
+def _hook_until_cancelled(stopped: list[str]) -> Any:
+    """Fake download that feeds the progress hook until the hook aborts it."""
+
+    def _download(_url: str, ydl_opts: dict[str, Any], _cid: str | None) -> dict[str, Any]:
+        try:
+            while True:
+                ydl_opts["progress_hooks"][0]({"status": "downloading", "downloaded_bytes": 1})
+                time.sleep(0.01)
+        finally:
+            stopped.append("thread")
+
+    return _download
+
+
+@pytest.mark.asyncio
+async def test_archive_timeout_stops_thread_before_cleanup(tmp_path: Path) -> None:
+    pipeline, session_service = _make_pipeline(tmp_path)
+    archive = pipeline._archive_service
+    archive._cfg.youtube.archive_timeout_sec = 0.05
+    stopped: list[str] = []
+    archive.download_video_sync = _hook_until_cancelled(stopped)
+    session_service.cleanup_partial_download_files.side_effect = lambda **_kwargs: stopped.append(
+        "cleanup"
+    )
+
+    task = archive.schedule(
+        url="https://youtu.be/video0",
+        video_id="video0",
+        req_id=1,
+        download_id=7,
+        correlation_id="cid",
+    )
+    await task
+
+    assert stopped == ["thread", "cleanup"]
+    assert session_service.update_archive_state.await_args.kwargs["archive_status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_archive_aclose_cancels_jobs_and_leaves_rows_for_resume(tmp_path: Path) -> None:
+    pipeline, session_service = _make_pipeline(tmp_path)
+    archive = pipeline._archive_service
+    stopped: list[str] = []
+    archive.download_video_sync = _hook_until_cancelled(stopped)
+
+    archive.schedule(
+        url="https://youtu.be/video0",
+        video_id="video0",
+        req_id=1,
+        download_id=7,
+        correlation_id="cid",
+    )
+    await asyncio.sleep(0.05)
+    await pipeline.aclose(timeout=1.0)
+
+    assert stopped == ["thread"]
+    statuses = [
+        call.kwargs["archive_status"]
+        for call in session_service.update_archive_state.await_args_list
+    ]
+    assert statuses == ["downloading"]
+    session_service.cleanup_partial_download_files.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_archive_resume_requeues_interrupted_rows(tmp_path: Path) -> None:
+    pipeline, session_service = _make_pipeline(tmp_path)
+    archive = pipeline._archive_service
+    session_service.video_repo = MagicMock()
+    session_service.video_repo.async_list_video_downloads_by_archive_status = AsyncMock(
+        return_value=[
+            {"id": 3, "request_id": 30, "video_id": "queued0", "archive_status": "queued"},
+            {"id": 4, "request_id": 40, "video_id": "partial", "archive_status": "downloading"},
+        ]
+    )
+    archive.schedule = MagicMock(return_value=MagicMock())
+
+    assert await pipeline.resume_archives() == 2
+
+    session_service.video_repo.async_list_video_downloads_by_archive_status.assert_awaited_once_with(
+        ["queued", "downloading"]
+    )
+    session_service.update_archive_state.assert_awaited_once_with(4, archive_status="queued")
+    assert [call.kwargs["url"] for call in archive.schedule.call_args_list] == [
+        "https://www.youtube.com/watch?v=queued0",
+        "https://www.youtube.com/watch?v=partial",
+    ]
+    assert archive.schedule.call_args_list[1].kwargs["req_id"] == 40
+
+
 @pytest.mark.asyncio
 async def test_session_service_rejects_when_storage_limit_still_exceeded(tmp_path: Path) -> None:
     cfg = _make_cfg(tmp_path)
@@ -397,3 +655,33 @@ async def test_feedback_service_uses_typing_indicator_without_progress_tracker(
 
     assert state.typing_ctx is typing_ctx
     typing_ctx.__aenter__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_service_quota_check_reads_ledger_after_bootstrap(tmp_path: Path) -> None:
+    session: Any = YouTubeDownloadSessionService(
+        cfg=_make_cfg(tmp_path),
+        db=MagicMock(),
+        response_formatter=_make_response_formatter(),
+        audit_func=lambda *_args, **_kwargs: None,
+        lifecycle=_make_lifecycle(),
+        **_youtube_repo_kwargs(),
+    )
+    day_dir = session.storage_path / "20260101"
+    day_dir.mkdir()
+    (day_dir / "abc_title.mp4").write_bytes(b"x" * 64)
+
+    await session.check_storage_limits()
+    assert session.calculate_storage_usage() == 64
+
+    # Downloads are recorded incrementally; untracked files wait for reconciliation.
+    (day_dir / "def_title.mp4").write_bytes(b"x" * 32)
+    (day_dir / "ghi_title.mp4").write_bytes(b"x" * 16)
+    session.record_stored_files({"video_file_path": str(day_dir / "def_title.mp4")})
+    await session.check_storage_limits()
+
+    assert session.calculate_storage_usage() == 96
+
+    session.cleanup_partial_download_files(output_dir=day_dir, video_id="def", correlation_id="cid")
+
+    assert session.calculate_storage_usage() == 64
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from app.adapters.youtube.youtube_downloader_parts.storage_ledger import StorageLedger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_DAY = 86_400
+
+
+def _write(path: Path, size: int, *, age_days: float = 0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age_days * _DAY
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_record_and_forget_keep_running_total(tmp_path: Path) -> None:
+    ledger = StorageLedger(tmp_path)
+    video = _write(tmp_path / "20260101" / "abc_title.mp4", 300)
+    thumb = _write(tmp_path / "20260101" / "abc_title.jpg", 20)
+    part = _write(tmp_path / "20260101" / "abc_title.mp4.part", 999)
+
+    ledger.record([video, thumb, part])
+    ledger.record([video])  # re-recording does not double count
+
+    assert ledger.total_bytes == 320
+
+    thumb.unlink()
+    ledger.forget([thumb, tmp_path / "never-recorded.mp4"])
+
+    assert ledger.total_bytes == 300
+
+
+def test_total_survives_reopen(tmp_path: Path) -> None:
+    ledger = StorageLedger(tmp_path)
+    ledger.record([_write(tmp_path / "a_x.mp4", 128)])
+    ledger.close()
+
+    assert StorageLedger(tmp_path).total_bytes == 128
+
+
+def test_evict_removes_oldest_expired_files_until_target(tmp_path: Path) -> None:
+    ledger = StorageLedger(tmp_path)
+    oldest = _write(tmp_path / "d1" / "a_x.mp4", 100, age_days=40)
+    older = _write(tmp_path / "d1" / "b_x.mp4", 100, age_days=35)
+    expired_but_kept = _write(tmp_path / "d2" / "c_x.mp4", 100, age_days=31)
+    recent = _write(tmp_path / "d3" / "d_x.mp4", 100, age_days=1)
+    ledger.record([oldest, older, expired_but_kept, recent])
+
+    reclaimed = ledger.evict(target_bytes=200, retention_days=30, now=datetime.now(UTC))
+
+    assert reclaimed == 200
+    assert not oldest.exists()
+    assert not older.exists()
+    assert expired_but_kept.exists()
+    assert recent.exists()
+    assert ledger.total_bytes == 200
+
+
+def test_evict_never_touches_files_within_retention(tmp_path: Path) -> None:
+    ledger = StorageLedger(tmp_path)
+    recent = _write(tmp_path / "d1" / "a_x.mp4", 500, age_days=2)
+    ledger.record([recent])
+
+    assert ledger.evict(target_bytes=0, retention_days=30) == 0
+    assert recent.exists()
+
+
+def test_reconcile_corrects_drift(tmp_path: Path) -> None:
+    ledger = StorageLedger(tmp_path)
+    tracked = _write(tmp_path / "d1" / "a_x.mp4", 100)
+    ledger.record([tracked])
+    assert ledger.reconcile_due(3600)
+
+    tracked.unlink()
+    _write(tmp_path / "d2" / "b_x.vtt", 40)
+    _write(tmp_path / "d2" / "notes.txt", 1000)
+
+    assert ledger.reconcile() == -60
+    assert ledger.total_bytes == 40
+    assert not ledger.reconcile_due(3600)
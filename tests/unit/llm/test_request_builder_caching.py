@@ -0,0 +1,101 @@
+"""Unit tests for prompt-prefix cache breakpoints in ``RequestBuilder``."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.adapters.openrouter.request_builder import RequestBuilder
+
+pytestmark = pytest.mark.no_network
+
+_LONG_PROMPT = "You are a careful summarizer. " * 400  # ~3000 estimated tokens
+_SHORT_PROMPT = "Be brief."
+
+
+def _builder(**kwargs: object) -> RequestBuilder:
+    return RequestBuilder(api_key="test-key", **kwargs)  # type: ignore[arg-type]
+
+
+def _breakpoints(messages: list[dict]) -> list[int]:
+    return [
+        i
+        for i, msg in enumerate(messages)
+        if isinstance(msg["content"], list)
+        and any("cache_control" in part for part in msg["content"])
+    ]
+
+
+def test_single_breakpoint_closes_the_system_prefix() -> None:
+    messages = [
+        {"role": "system", "content": _LONG_PROMPT},
+        {"role": "system", "content": "Respond in English."},
+        {"role": "user", "content": "Summarize this article."},
+    ]
+
+    result = _builder().build_cacheable_messages(messages, "anthropic/claude-sonnet-4")
+
+    assert _breakpoints(result) == [1]
+    assert result[1]["content"][0]["cache_control"] == {"type": "1h"}
+    assert result[0] is messages[0]
+    assert result[2] is messages[2]
+
+
+def test_short_system_prefix_gets_no_breakpoint() -> None:
+    messages = [
+        {"role": "system", "content": _SHORT_PROMPT},
+        {"role": "user", "content": "hello"},
+    ]
+
+    result = _builder().build_cacheable_messages(messages, "anthropic/claude-sonnet-4")
+
+    assert _breakpoints(result) == []
+
+
+def test_large_user_content_still_gets_a_breakpoint() -> None:
+    messages = [
+        {"role": "system", "content": _LONG_PROMPT},
+        {"role": "user", "content": "x" * (4096 * 4)},
+    ]
+
+    result = _builder().build_cacheable_messages(messages, "anthropic/claude-sonnet-4")
+
+    assert _breakpoints(result) == [0, 1]
+
+
+def test_google_keeps_only_the_prefix_breakpoint() -> None:
+    messages = [
+        {"role": "system", "content": _LONG_PROMPT},
+        {"role": "user", "content": "x" * (4096 * 4)},
+    ]
+
+    result = _builder().build_cacheable_messages(messages, "google/gemini-2.5-pro")
+
+    assert _breakpoints(result) == [0]
+    assert result[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_automatic_caching_providers_are_untouched() -> None:
+    messages = [{"role": "system", "content": _LONG_PROMPT}, {"role": "user", "content": "hi"}]
+
+    assert _builder().build_cacheable_messages(messages, "openai/gpt-4o") is messages
+
+
+def test_prompt_cache_key_depends_only_on_system_prefix() -> None:
+    builder = _builder()
+    first = [
+        {"role": "system", "content": _LONG_PROMPT},
+        {"role": "user", "content": "article one"},
+    ]
+    second = [
+        {"role": "system", "content": [{"type": "text", "text": _LONG_PROMPT}]},
+        {"role": "user", "content": "article two"},
+    ]
+    other = [{"role": "system", "content": _SHORT_PROMPT}, {"role": "user", "content": "x"}]
+
+    key = builder.prompt_cache_key(first)
+
+    assert key is not None
+    assert len(key) == 16
+    assert builder.prompt_cache_key(second) == key
+    assert builder.prompt_cache_key(other) != key
+    assert builder.prompt_cache_key([{"role": "user", "content": "no system"}]) is None
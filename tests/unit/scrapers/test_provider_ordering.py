@@ -0,0 +1,202 @@
+"""Unit tests for the per-domain learned provider ordering engine. All offline."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.adapters.content.scraper.attempt_log import ScraperAttemptEntry
+from app.adapters.content.scraper.chain import ContentScraperChain
+from app.adapters.content.scraper.provider_ordering import (
+    ProviderOrderingEngine,
+    domain_key,
+    replay_attempt_logs,
+)
+from tests.helpers.scraper_helpers import _error_result, _MockProvider, _ok_result
+
+pytestmark = pytest.mark.no_network
+
+_NOW = 1_800_000_000.0
+_URL = "https://www.example.com/post/1"
+
+
+def _entry(provider: str, status: str = "success", *, latency_ms: int = 500, error=None):
+    return ScraperAttemptEntry(
+        provider=provider, status=status, latency_ms=latency_ms, error_class=error
+    )
+
+
+def _providers(*names: str) -> list[_MockProvider]:
+    return [_MockProvider(name=name, result=_ok_result()) for name in names]
+
+
+def _names(providers) -> list[str]:
+    return [provider.provider_name for provider in providers]
+
+
+def test_domain_key_strips_www_and_ignores_paths() -> None:
+    assert domain_key("https://www.Example.com/a?b=1") == "example.com"
+    assert domain_key("https://blog.example.com/") == "blog.example.com"
+    assert domain_key("not a url") is None
+
+
+def test_unknown_domain_keeps_static_order() -> None:
+    engine = ProviderOrderingEngine()
+    providers = _providers("scrapling", "firecrawl", "playwright")
+
+    assert _names(engine.order(_URL, providers)) == ["scrapling", "firecrawl", "playwright"]
+
+
+def test_single_failure_is_not_enough_evidence() -> None:
+    engine = ProviderOrderingEngine()
+    engine.observe(_URL, _entry("scrapling", "error", error="RuntimeError"), now=_NOW)
+
+    order = engine.order(_URL, _providers("scrapling", "firecrawl"), now=_NOW)
+
+    assert _names(order) == ["scrapling", "firecrawl"]
+
+
+def test_reliable_provider_moves_ahead_of_failing_one() -> None:
+    engine = ProviderOrderingEngine()
+    for _ in range(4):
+        engine.observe(_URL, _entry("scrapling", "timeout", error="TimeoutError"), now=_NOW)
+        engine.observe(_URL, _entry("firecrawl"), now=_NOW)
+
+    order = engine.order(_URL, _providers("scrapling", "firecrawl", "playwright"), now=_NOW)
+
+    assert _names(order) == ["firecrawl", "playwright", "scrapling"]
+
+
+def test_low_value_provider_is_demoted_behind_everything() -> None:
+    engine = ProviderOrderingEngine()
+    for _ in range(3):
+        engine.observe(_URL, _entry("scrapling", "error", error="low_value"), now=_NOW)
+
+    stats = engine.stats_for("example.com")["scrapling"]
+    order = engine.order(_URL, _providers("scrapling", "firecrawl", "playwright"), now=_NOW)
+
+    assert stats.demoted
+    assert _names(order) == ["firecrawl", "playwright", "scrapling"]
+
+
+def test_faster_provider_wins_between_equally_reliable_ones() -> None:
+    engine = ProviderOrderingEngine()
+    for _ in range(5):
+        engine.observe(_URL, _entry("playwright", latency_ms=25_000), now=_NOW)
+        engine.observe(_URL, _entry("firecrawl", latency_ms=800), now=_NOW)
+
+    order = engine.order(_URL, _providers("playwright", "firecrawl"), now=_NOW)
+
+    assert _names(order) == ["firecrawl", "playwright"]
+
+
+def test_history_decays_with_half_life() -> None:
+    engine = ProviderOrderingEngine(half_life_sec=3600)
+    for _ in range(4):
+        engine.observe(_URL, _entry("scrapling", "error", error="RuntimeError"), now=_NOW)
+        engine.observe(_URL, _entry("firecrawl"), now=_NOW)
+
+    later = _NOW + 10 * 3600
+    order = engine.order(_URL, _providers("scrapling", "firecrawl"), now=later)
+
+    assert engine.stats_for("example.com")["scrapling"].attempts < 0.01
+    assert _names(order) == ["scrapling", "firecrawl"]
+
+
+def test_domains_are_bounded_by_lru() -> None:
+    engine = ProviderOrderingEngine(max_domains=2)
+    engine.observe("https://a.test/", _entry("scrapling"), now=_NOW)
+    engine.observe("https://b.test/", _entry("scrapling"), now=_NOW)
+    engine.order("https://a.test/", _providers("scrapling", "firecrawl"), now=_NOW)
+    engine.observe("https://c.test/", _entry("scrapling"), now=_NOW)
+
+    assert len(engine) == 2
+    assert engine.stats_for("a.test")
+    assert not engine.stats_for("b.test")
+
+
+def test_state_round_trips_through_disk(tmp_path) -> None:
+    path = tmp_path / "stats.json"
+    engine = ProviderOrderingEngine(state_path=path)
+    replay_attempt_logs(
+        engine,
+        [(_URL, [_entry("scrapling", "error", error="low_value"), _entry("firecrawl")], _NOW)] * 3,
+    )
+    engine.save()
+
+    restored = ProviderOrderingEngine(state_path=path)
+    assert restored.load()
+    assert restored.stats_for("example.com") == engine.stats_for("example.com")
+    assert json.loads(path.read_text())["version"] == 1
+
+
+def test_processes_sharing_a_state_file_merge_their_saves(tmp_path) -> None:
+    path = tmp_path / "stats.json"
+    first = ProviderOrderingEngine(state_path=path)
+    second = ProviderOrderingEngine(state_path=path)
+    first.observe("https://a.test/", _entry("scrapling"), now=_NOW)
+    first.observe(_URL, _entry("scrapling", "error"), now=_NOW)
+    second.observe("https://b.test/", _entry("firecrawl"), now=_NOW)
+    second.observe(_URL, _entry("scrapling"), now=_NOW + 60)
+
+    first.save()
+    second.save()
+
+    merged = ProviderOrderingEngine(state_path=path)
+    assert merged.load()
+    assert merged.stats_for("a.test")
+    assert merged.stats_for("b.test")
+    assert merged.stats_for("example.com")["scrapling"].successes == 1.0
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_unreadable_state_is_ignored(tmp_path) -> None:
+    path = tmp_path / "stats.json"
+    path.write_text("{broken")
+
+    engine = ProviderOrderingEngine(state_path=path)
+
+    assert engine.load() is False
+    assert len(engine) == 0
+
+
+@pytest.mark.asyncio
+async def test_chain_learns_to_skip_provider_with_low_value_content() -> None:
+    boilerplate = _ok_result(markdown="Subscribe to read. " * 40)
+    article = _ok_result(
+        markdown=(
+            "This article contains useful context, complete sentences, and enough "
+            "distinct words to pass the content quality guard. " * 5
+        )
+    )
+    scrapling = _MockProvider(name="scrapling", result=boilerplate)
+    firecrawl = _MockProvider(name="firecrawl", result=article)
+    chain = ContentScraperChain(
+        [scrapling, firecrawl], min_content_length=400, ordering=ProviderOrderingEngine()
+    )
+
+    for _ in range(4):
+        result = await chain.scrape_markdown(_URL)
+        assert result.content_markdown == article.content_markdown
+
+    assert len(scrapling.calls) == 3
+    assert len(firecrawl.calls) == 4
+    # Other domains are unaffected.
+    await chain.scrape_markdown("https://other.test/")
+    assert len(scrapling.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_chain_saves_learned_state_on_close(tmp_path) -> None:
+    path = tmp_path / "stats.json"
+    chain = ContentScraperChain(
+        [_MockProvider(name="scrapling", result=_error_result()), *_providers("firecrawl")],
+        ordering=ProviderOrderingEngine(state_path=path),
+    )
+
+    await chain.scrape_markdown(_URL)
+    await chain.aclose()
+
+    saved = json.loads(path.read_text())["domains"]["example.com"]
+    assert set(saved) == {"scrapling", "firecrawl"}
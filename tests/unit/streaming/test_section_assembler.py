@@ -10,10 +10,14 @@ New cases added here:
 - JSON split mid-token across multiple chunks merges correctly
 - Malformed JSON is tolerated without raising
 - Each section is emitted exactly once even when partial JSON repeats
+- Any chunking of a document (including escapes split mid-sequence) yields
+  the same final sections
 """
 
 from __future__ import annotations
 
+import json
+
 from app.adapters.content.streaming.section_assembler import SummarySectionStreamAssembler
 
 
@@ -96,3 +100,62 @@ def test_new_value_for_same_section_is_re_emitted() -> None:
 
     assert "summary_250" in sections
     assert sections["summary_250"] == "Final version with more content"
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_chunking_does_not_change_final_sections() -> None:
+    """Any split of the same document yields the sections of the parsed whole."""
+    document = json.dumps(
+        {
+            "summary_250": 'Says "hi" \\ to café \U0001f600\nthen stops. ',
+            "summary_1000": "Not tracked.",
+            "entities": {"tldr": "nested keys are ignored", "key_ideas": ["no"]},
+            "tldr": "  Short TLDR  ",
+            "key_ideas": ["First", "  ", "Second", 3, {"x": 1}],
+            "topic_tags": ["#ai", "ml"],
+        },
+        ensure_ascii=True,
+    )
+    expected = {
+        "summary_250": 'Says "hi" \\ to café \U0001f600\nthen stops.',
+        "tldr": "Short TLDR",
+        "key_ideas": ["First", "Second", "3", "{'x': 1}"],
+        "topic_tags": ["#ai", "ml"],
+    }
+
+    for size in (1, 2, 3, 5, 7, len(document)):
+        assembler = SummarySectionStreamAssembler()
+        for chunk in _chunks(f"```json\n{document}\n```", size):
+            assembler.add_delta(chunk)
+        assert assembler.sections == expected, size
+
+
+def test_surrogate_pair_split_across_deltas_is_not_emitted_half() -> None:
+    assembler = SummarySectionStreamAssembler()
+
+    first = assembler.add_delta('{"tldr": "ok \\ud83d')
+    second = assembler.add_delta('\\ude00"}')
+
+    assert [s.value for s in first] == ["ok"]
+    assert [s.value for s in second] == ["ok \U0001f600"]
+
+
+def test_unchanged_deltas_emit_nothing() -> None:
+    """Deltas that only touch untracked fields or whitespace emit no snapshots."""
+    assembler = SummarySectionStreamAssembler()
+    assembler.add_delta('{"tldr": "Done"')
+
+    assert assembler.add_delta(', "summary_1000": "long text ') == []
+    assert assembler.add_delta('more"}') == []
+
+
+def test_replace_draft_restarts_parsing() -> None:
+    assembler = SummarySectionStreamAssembler()
+    assembler.add_delta('{"tldr": "Partial draft')
+
+    snapshots = assembler.replace_draft(json.dumps({"tldr": "Merged draft"}))
+
+    assert [(s.section, s.value) for s in snapshots] == [("tldr", "Merged draft")]